@@ -44,8 +44,6 @@ hiddenimports += [
     'websockets',
     'websockets.legacy',
     'websockets.legacy.client',
-    'scipy',
-    'scipy.interpolate',
     'numpy',
     'asyncio',
 ]
@@ -61,6 +59,7 @@ a = Analysis(
     runtime_hooks=[],
     excludes=[
         'matplotlib',  # 사용하지 않는 큰 라이브러리 제외
+        'scipy',
         'pandas',
         'IPython',
         'tkinter',
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""GUI 스레드 지연(stall) 벤치마크: 직접 그리기 vs 백그라운드 렌더링
+
+많은 라인이 계속 다시 그려지는 동안 (모든 라인이 페이드되는 상황),
+짧은 주기의 QTimer(= 네트워크 수신 처리 자리)가 얼마나 늦게 실행되는지 측정합니다.
+GUI 스레드가 paintEvent에 오래 묶여 있을수록 지연이 커집니다.
+
+Usage:
+    uv run --directory client python scripts/bench_gui_stall.py [options]
+
+Example:
+    uv run --directory client python scripts/bench_gui_stall.py
+    uv run --directory client python scripts/bench_gui_stall.py --lines 1000 --seconds 5
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# client/src를 Python path에 추가
+client_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(client_dir / "src"))
+
+# 화면 없이 실행 가능하도록 (이미 지정되어 있으면 그대로 사용)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QElapsedTimer, QEventLoop, QTimer  # noqa: E402
+from PyQt6.QtGui import QColor  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+from screen_party_client.drawing.canvas import DrawingCanvas  # noqa: E402
+
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="GUI 스레드 지연 벤치마크")
+    parser.add_argument("--lines", type=int, default=500, help="라인 수")
+    parser.add_argument("--segments", type=int, default=20, help="라인당 세그먼트 수")
+    parser.add_argument("--users", type=int, default=4, help="사용자 수 (= 색상 수)")
+    parser.add_argument("--seconds", type=float, default=3.0, help="측정 시간 (초)")
+    parser.add_argument("--tick", type=int, default=5, help="수신 처리 타이머 주기 (ms)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    return parser.parse_args()
+
+
+def make_canvas(args, threaded: bool) -> DrawingCanvas:
+    """무작위 완성 스트로크가 들어 있는 전체 화면 크기 캔버스 생성"""
+    rng = random.Random(args.seed)
+    canvas = DrawingCanvas(threaded_rendering=threaded)
+    canvas.resize(SCREEN_WIDTH, SCREEN_HEIGHT)
+    canvas.animation_scheduler.stop()
+
+    for user_no in range(args.users):
+        canvas.set_user_color(
+            f"user-{user_no}", QColor.fromHsv(user_no * 360 // args.users, 160, 255)
+        )
+
+    for line_no in range(args.lines):
+        user_id = f"user-{line_no % args.users}"
+        line_id = f"line-{line_no}"
+        x, y = rng.random(), rng.random()
+        seg_dicts = []
+        for _ in range(args.segments):
+            dx, dy = rng.uniform(-0.01, 0.01), rng.uniform(-0.01, 0.01)
+            seg_dicts.append(
+                {
+                    "p0": (x, y),
+                    "p1": (x + dx / 3, y + dy / 3),
+                    "p2": (x + 2 * dx / 3, y + 2 * dy / 3),
+                    "p3": (x + dx, y + dy),
+                }
+            )
+            x, y = x + dx, y + dy
+        canvas.handle_drawing_start(line_id, user_id, {})
+        canvas.handle_drawing_update(line_id, user_id, {"new_finalized_segments": seg_dicts})
+        canvas.handle_drawing_end(line_id, user_id)
+    canvas.animation_scheduler.stop()
+    canvas.show()
+    return canvas
+
+
+def run(args, threaded: bool):
+    """측정 실행
+
+    Returns:
+        (수신 타이머 지연 목록 (ms), 화면에 반영된 프레임 수)
+    """
+    canvas = make_canvas(args, threaded)
+    store = canvas.store
+    lateness = []
+    frames = [0]
+
+    original_paint = canvas.paintEvent
+
+    def counting_paint(event):
+        frames[0] += 1
+        original_paint(event)
+
+    canvas.paintEvent = counting_paint
+
+    # 페이드 애니메이션처럼 매 16ms 모든 라인의 알파값 변경
+    def fade_tick():
+        for line_data in store.lines.values():
+            line_data.alpha = 0.3 + 0.7 * ((line_data.alpha + 0.05) % 1.0)
+        store._notify_all()
+
+    fade_timer = QTimer()
+    fade_timer.timeout.connect(fade_tick)
+    fade_timer.start(16)
+
+    # 수신 처리 자리: 주기 대비 얼마나 늦게 실행되는지 기록
+    clock = QElapsedTimer()
+    clock.start()
+    last = [clock.nsecsElapsed()]
+
+    def network_tick():
+        now = clock.nsecsElapsed()
+        lateness.append(max(0.0, (now - last[0]) / 1e6 - args.tick))
+        last[0] = now
+
+    tick_timer = QTimer()
+    tick_timer.timeout.connect(network_tick)
+    tick_timer.start(args.tick)
+
+    loop = QEventLoop()
+    QTimer.singleShot(int(args.seconds * 1000), loop.quit)
+    loop.exec()
+
+    fade_timer.stop()
+    tick_timer.stop()
+    canvas.set_threaded_rendering(False)
+    canvas.deleteLater()
+    return lateness, frames[0]
+
+
+def main():
+    """벤치마크 실행"""
+    args = parse_args()
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+
+    print("=" * 72)
+    print(
+        f"GUI stall benchmark: {SCREEN_WIDTH}x{SCREEN_HEIGHT}, {args.lines} lines fading, "
+        f"{args.tick}ms receive tick, {args.seconds:g}s"
+    )
+    print("=" * 72)
+    print(
+        f"  {'mode':>10s} {'ticks':>7s} {'late p50':>9s} {'late p95':>9s} {'late max':>9s} "
+        f"{'paints/s':>9s}"
+    )
+
+    for label, threaded in (("direct", False), ("threaded", True)):
+        start = time.perf_counter()
+        lateness, frames = run(args, threaded)
+        elapsed = time.perf_counter() - start
+        quantiles = statistics.quantiles(lateness, n=20)
+        print(
+            f"  {label:>10s} {len(lateness):>7d} {statistics.median(lateness):>7.2f}ms "
+            f"{quantiles[18]:>7.2f}ms {max(lateness):>7.2f}ms {frames / elapsed:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
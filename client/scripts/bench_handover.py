@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""서버 무중단 교대 중 중계 공백 측정
+
+--handover-socket으로 서버 프로세스를 띄우고 두 클라이언트를 연결합니다. 참여자1이 일정 간격으로
+드로잉 업데이트를 보내는 동안 같은 소켓 경로로 새 서버 프로세스를 띄워 교대시키기를 반복하며
+- 참여자2가 받는 드로잉 사이의 최대 간격 (교대로 생긴 중계 공백)
+- 보낸 시각 → 참여자2가 받은 시각의 최대 지연
+- 교대 동안 유실/중복된 메시지 수
+를 측정합니다. (프로세스 시작 시간은 공백에 포함되지 않음 - 이전 프로세스는 새 프로세스가
+accept를 시작한 뒤에 드레인합니다)
+
+Usage:
+    uv run --directory client python scripts/bench_handover.py [options]
+
+Example:
+    uv run --directory client python scripts/bench_handover.py
+    uv run --directory client python scripts/bench_handover.py --handovers 10 --interval 0.005
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# client/src를 Python path에 추가
+client_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(client_dir / "src"))
+
+from screen_party_client.network.client import WebSocketClient  # noqa: E402
+
+SERVER_MAIN = client_dir.parent / "server" / "scripts" / "main.py"
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="서버 무중단 교대 중 중계 공백 측정")
+    parser.add_argument("--port", type=int, default=8798, help="서버 포트")
+    parser.add_argument("--handovers", type=int, default=5, help="교대 반복 횟수")
+    parser.add_argument("--interval", type=float, default=0.01, help="참여자1 송신 간격 (초)")
+    parser.add_argument("--settle", type=float, default=0.5, help="교대 사이 대기 시간 (초)")
+    return parser.parse_args()
+
+
+def spawn_server(port: int, handover_socket: str) -> subprocess.Popen:
+    """서버 프로세스 시작 (같은 경로에 이전 프로세스가 있으면 교대)"""
+    return subprocess.Popen(
+        [
+            sys.executable,
+            str(SERVER_MAIN),
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--handover-socket",
+            handover_socket,
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_for_port(port: int):
+    """서버가 accept를 시작할 때까지 대기"""
+    for _ in range(100):
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        return
+    raise RuntimeError(f"Server did not start on port {port}")
+
+
+async def run(args, handover_socket: str):
+    """측정 실행
+
+    Returns:
+        [(최대 수신 간격 초, 최대 중계 지연 초)] 교대마다, 유실 수, 중복 수, 보낸 수
+    """
+    url = f"ws://127.0.0.1:{args.port}"
+    process = spawn_server(args.port, handover_socket)
+    await wait_for_port(args.port)
+    sender = WebSocketClient(url)
+    receiver = WebSocketClient(url)
+    await sender.connect()
+    session_id = (await sender.create_session("Sender"))["session_id"]
+    await receiver.connect()
+    await receiver.join_session(session_id, "Receiver")
+    await sender.receive_message()  # participant_joined
+
+    sent_at = {}
+    arrivals = []  # (받은 시각, index)
+
+    async def on_message(message):
+        if message.get("type") == "drawing_update":
+            arrivals.append((time.perf_counter(), message["index"]))
+
+    receiver.set_message_handler(on_message)
+    sender.set_message_handler(lambda message: asyncio.sleep(0))
+    listeners = [asyncio.create_task(receiver.listen()), asyncio.create_task(sender.listen())]
+
+    stop = asyncio.Event()
+
+    async def draw():
+        index = 0
+        while not stop.is_set():
+            sent_at[index] = time.perf_counter()
+            await sender.send_message(
+                {"type": "drawing_update", "line_id": "bench", "index": index}
+            )
+            index += 1
+            await asyncio.sleep(args.interval)
+
+    draw_task = asyncio.create_task(draw())
+    results = []
+    try:
+        for _ in range(args.handovers):
+            await asyncio.sleep(args.settle)
+            start = len(arrivals)
+            previous, process = process, spawn_server(args.port, handover_socket)
+            # 이전 프로세스는 넘겨준 뒤 종료
+            await asyncio.to_thread(previous.wait)
+            await asyncio.sleep(args.settle)
+
+            window = arrivals[start:]
+            gap = max(b[0] - a[0] for a, b in zip(window[:-1], window[1:], strict=True))
+            delay = max(at - sent_at[index] for at, index in window)
+            results.append((gap, delay))
+    finally:
+        stop.set()
+        await draw_task
+        await asyncio.sleep(0.3)
+        await sender.disconnect()
+        await receiver.disconnect()
+        for task in listeners:
+            task.cancel()
+        process.terminate()
+        process.wait()
+
+    indexes = [index for _, index in arrivals]
+    lost = len(set(sent_at) - set(indexes))
+    duplicated = len(indexes) - len(set(indexes))
+    return results, lost, duplicated, len(sent_at)
+
+
+def main():
+    """측정 실행 및 결과 출력"""
+    args = parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        handover_socket = str(Path(directory) / "handover.sock")
+        results, lost, duplicated, sent = asyncio.run(run(args, handover_socket))
+
+    gaps = [r[0] * 1000 for r in results]
+    delays = [r[1] * 1000 for r in results]
+    print("=" * 64)
+    print(
+        f"Server handover: {args.handovers} handovers between processes, "
+        f"sender every {args.interval * 1000:g}ms (localhost)"
+    )
+    print("=" * 64)
+    print(f"  {'':>22s} {'p50':>9s} {'max':>9s}")
+    print(f"  {'relay gap':>22s} {statistics.median(gaps):>7.1f}ms {max(gaps):>7.1f}ms")
+    print(
+        f"  {'send -> receive delay':>22s} {statistics.median(delays):>7.1f}ms "
+        f"{max(delays):>7.1f}ms"
+    )
+    print(f"  sent {sent}, lost {lost}, duplicated {duplicated}")
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
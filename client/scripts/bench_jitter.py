@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""원격 스트로크 재생 부드러움 시뮬레이션: 즉시 적용 vs 지터 버퍼
+
+송신 측이 일정 속도로 그리는 직선을 50ms마다 묶어서 보내고,
+네트워크 지연 + 지터를 거쳐 도착한다고 가정합니다 (가상 시계).
+수신 측 16ms 프레임마다 화면에 보이는 펜 위치를 기록해서
+- 프레임당 전진 거리의 표준편차/최댓값 (작을수록 부드러움)
+- 송신 측 펜 위치 대비 지연
+을 비교합니다.
+
+Usage:
+    uv run --directory client python scripts/bench_jitter.py [options]
+
+Example:
+    uv run --directory client python scripts/bench_jitter.py
+    uv run --directory client python scripts/bench_jitter.py --jitter 0.08 --seconds 20
+"""
+
+import argparse
+import heapq
+import random
+import statistics
+import sys
+from pathlib import Path
+
+# client/src를 Python path에 추가
+client_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(client_dir / "src"))
+
+from PyQt6.QtCore import QCoreApplication  # noqa: E402
+from screen_party_client.drawing.jitter_buffer import JitterBuffer  # noqa: E402
+
+FRAME = 1 / 60
+
+
+class VirtualClock:
+    """가상 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="원격 스트로크 재생 부드러움 시뮬레이션")
+    parser.add_argument("--seconds", type=float, default=10.0, help="그리는 시간 (초)")
+    parser.add_argument("--interval", type=float, default=0.05, help="송신 간격 (초)")
+    parser.add_argument("--rate", type=float, default=120.0, help="초당 입력 점 수")
+    parser.add_argument("--latency", type=float, default=0.02, help="최소 네트워크 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.04, help="추가 지연 최댓값 (초, 균등)")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    return parser.parse_args()
+
+
+def make_packets(args, rng: random.Random):
+    """(도착 시각, 송신 시각, raw 점들) 목록 - 펜은 x축을 따라 초당 rate 점 속도로 이동"""
+    packets = []
+    sent = 0
+    t = args.interval
+    while t <= args.seconds:
+        count = int(t * args.rate)
+        points = [(i / args.rate, 0.0) for i in range(sent, count + 1)]
+        sent = count
+        arrival = t + args.latency + rng.uniform(0, args.jitter)
+        packets.append((arrival, t, points))
+        t += args.interval
+    return sorted(packets)
+
+
+def simulate(args, packets, buffered: bool):
+    """수신 측 프레임마다 보이는 펜 위치 기록
+
+    Returns:
+        (프레임당 전진 거리 목록, 지연 목록) - 거리 단위는 입력 점 개수
+    """
+    clock = VirtualClock()
+    pen = [0.0]
+
+    def apply_update(line_id, user_id, data):
+        points = data.get("current_raw_points")
+        if points:
+            pen[0] = max(pen[0], points[-1][0])
+
+    buffer = JitterBuffer(apply_update, lambda line_id, user_id: None, clock=clock)
+    buffer.scheduler.stop()  # 가상 시계로 직접 틱
+    buffer.start("line", "user", (0.0, 0.0))
+
+    queue = list(packets)
+    heapq.heapify(queue)
+    steps, lags = [], []
+    last = 0.0
+    frame = FRAME
+    while frame < args.seconds + 1.0:
+        clock.now = frame
+        while queue and queue[0][0] <= frame:
+            _, sent_at, points = heapq.heappop(queue)
+            data = {"current_raw_points": points}
+            if buffered:
+                buffer.push("line", "user", sent_at, data)
+            else:
+                apply_update("line", "user", data)
+        if buffered:
+            buffer._tick(frame)
+
+        if 0.5 < frame < args.seconds:  # 시작/끝 과도 구간 제외
+            steps.append((pen[0] - last) * args.rate)
+            lags.append(frame - pen[0])
+        last = pen[0]
+        frame += FRAME
+    return steps, lags
+
+
+def main():
+    """시뮬레이션 실행"""
+    args = parse_args()
+    app = QCoreApplication.instance() or QCoreApplication(sys.argv)  # noqa: F841
+    packets = make_packets(args, random.Random(args.seed))
+
+    print("=" * 70)
+    print(
+        f"Playback smoothness: {args.interval * 1000:g}ms send interval, {args.rate:g} points/s, "
+        f"latency {args.latency * 1000:g}ms + 0~{args.jitter * 1000:g}ms jitter"
+    )
+    print("=" * 70)
+    print(
+        f"  {'mode':>10s} {'step mean':>10s} {'step sd':>8s} {'step max':>9s} "
+        f"{'idle frames':>12s} {'lag p50':>8s} {'lag max':>8s}"
+    )
+    for label, buffered in (("immediate", False), ("buffered", True)):
+        steps, lags = simulate(args, packets, buffered)
+        idle = sum(1 for step in steps if step == 0) / len(steps) * 100
+        print(
+            f"  {label:>10s} {statistics.mean(steps):>10.2f} {statistics.pstdev(steps):>8.2f} "
+            f"{max(steps):>9.1f} {idle:>11.1f}% {statistics.median(lags) * 1000:>6.0f}ms "
+            f"{max(lags) * 1000:>6.0f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
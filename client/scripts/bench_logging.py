@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""드로잉 부하에서 로깅이 이벤트 루프에 쓰는 시간 측정
+
+asyncio 루프에서 drawing_update 프레임을 받아 디코딩하고 로그를 남기는 수신 경로를
+흉내 내서, 메시지 하나를 처리하는 동안 루프가 점유되는 시간을 설정별로 비교합니다.
+
+    sync     - 이전 방식: 프레임마다 f-string INFO/DEBUG 로그, 루프에서 바로 스트림에 씀
+    queued   - 같은 로그 호출, 출력만 setup_logging()의 큐 + 리스너 스레드
+    sampled  - 현재 방식: 큐 + SampledLogger(%-스타일 인자, 100개 중 1개)
+    (none    - 로그 없이 디코딩만, 기준값)
+
+--write-delay로 느린 출력(터미널/콘솔, 파이프를 읽는 쪽이 느린 경우)을 흉내 냅니다.
+
+Usage:
+    uv run --directory client python scripts/bench_logging.py [options]
+
+Example:
+    uv run --directory client python scripts/bench_logging.py
+    uv run --directory client python scripts/bench_logging.py --messages 20000 --write-delay 0
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# client/src를 Python path에 추가
+client_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(client_dir / "src"))
+
+from screen_party_common.log_pipeline import (  # noqa: E402
+    LOG_FORMAT,
+    SampledLogger,
+    setup_logging,
+    shutdown_logging,
+)
+
+logger = logging.getLogger("bench.receive")
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(
+        description="드로잉 부하에서 로깅이 이벤트 루프에 쓰는 시간 측정"
+    )
+    parser.add_argument("--messages", type=int, default=5000, help="처리할 drawing_update 수")
+    parser.add_argument("--points", type=int, default=20, help="메시지당 raw 점 개수")
+    parser.add_argument(
+        "--write-delay", type=float, default=0.2, help="로그 한 줄 쓰기 지연 (ms, 0이면 버리기만)"
+    )
+    return parser.parse_args()
+
+
+class SlowSink(io.TextIOBase):
+    """쓰기마다 지연이 있는 출력 (느린 콘솔 흉내)"""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    def write(self, text: str) -> int:
+        if self.delay:
+            time.sleep(self.delay)
+        return len(text)
+
+
+def make_frames(count: int, points: int) -> list:
+    """다른 참여자의 drawing_update 프레임"""
+    frames = []
+    for index in range(count):
+        message = {
+            "type": "drawing_update",
+            "line_id": f"line-{index // 50}",
+            "user_id": "other-user-0001",
+            "current_raw_points": [[0.001 * i, 0.002 * i] for i in range(points)],
+            "seq": index + 1,
+        }
+        frames.append(json.dumps(message).encode())
+    return frames
+
+
+def handle_sync(frame: bytes):
+    """이전 수신 경로의 로그 호출"""
+    message = json.loads(frame)
+    logger.debug(f"Received: {message}")
+    logger.info(f"Received message: {message.get('type')}")
+
+
+sampled_logger = SampledLogger(logger, every=100)
+
+
+def handle_sampled(frame: bytes):
+    """현재 수신 경로의 로그 호출"""
+    message = json.loads(frame)
+    sampled_logger.debug("Received: %s", message)
+    sampled_logger.debug("Received message: %s", message.get("type"))
+
+
+def handle_none(frame: bytes):
+    """로그 없는 수신 경로 (기준값)"""
+    json.loads(frame)
+
+
+async def drive(frames: list, handle) -> list:
+    """루프에서 프레임을 하나씩 처리하고 처리별 루프 점유 시간(초) 반환"""
+    busy = []
+    for frame in frames:
+        start = time.perf_counter()
+        handle(frame)
+        busy.append(time.perf_counter() - start)
+        await asyncio.sleep(0)
+    return busy
+
+
+def run_mode(mode: str, frames: list, sink: SlowSink) -> list:
+    """설정 하나로 측정"""
+    root = logging.getLogger()
+    if mode == "none":
+        return asyncio.run(drive(frames, handle_none))
+    if mode == "sync":
+        handler = logging.StreamHandler(sink)
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        for existing in list(root.handlers):
+            root.removeHandler(existing)
+        root.addHandler(handler)
+        root.setLevel(logging.INFO)
+        try:
+            return asyncio.run(drive(frames, handle_sync))
+        finally:
+            root.removeHandler(handler)
+
+    setup_logging(logging.INFO, stream=sink, max_queue=len(frames) * 2 + 10)
+    try:
+        handle = handle_sync if mode == "queued" else handle_sampled
+        return asyncio.run(drive(frames, handle))
+    finally:
+        shutdown_logging()
+
+
+def main():
+    """측정 실행 및 결과 출력"""
+    args = parse_args()
+    frames = make_frames(args.messages, args.points)
+    sink = SlowSink(args.write_delay / 1000)
+
+    print("=" * 64)
+    print(
+        f"Receive-path logging: {args.messages} drawing_update messages, "
+        f"{args.points} points, write delay {args.write_delay:g}ms"
+    )
+    print("=" * 64)
+    print(f"  {'':>8s} {'mean':>9s} {'p99':>9s} {'max':>9s} {'loop busy':>11s}")
+    for mode in ("none", "sync", "queued", "sampled"):
+        busy = run_mode(mode, frames, sink)
+        busy_us = sorted(b * 1e6 for b in busy)
+        p99 = busy_us[min(len(busy_us) - 1, int(0.99 * len(busy_us)))]
+        print(
+            f"  {mode:>8s} {statistics.mean(busy_us):>7.1f}us {p99:>7.1f}us "
+            f"{busy_us[-1]:>7.0f}us {sum(busy) * 1000:>9.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
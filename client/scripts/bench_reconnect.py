@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""강제 연결 끊김 후 복구 시간 측정
+
+같은 프로세스에서 서버를 띄우고 두 클라이언트를 연결합니다. 참여자1이 일정 간격으로
+드로잉 업데이트를 보내는 동안 참여자2의 연결을 close 없이 강제로 끊고(transport 중단),
+--outage 동안은 재연결 시도가 실패하도록 해서 (네트워크 단절 흉내)
+- 끊김 → 세션 이어가기(session_resumed)까지 걸린 시간
+- 끊김 → 놓친 메시지를 모두 다시 받을 때까지 걸린 시간
+- 끊겨 있는 동안 보낸 (재전송으로 받아야 하는) 메시지 수 / 유실 여부
+를 반복 측정합니다.
+
+Usage:
+    uv run --directory client python scripts/bench_reconnect.py [options]
+
+Example:
+    uv run --directory client python scripts/bench_reconnect.py
+    uv run --directory client python scripts/bench_reconnect.py --trials 20 --interval 0.02
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# client/src, server/src를 Python path에 추가
+client_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(client_dir / "src"))
+sys.path.insert(0, str(client_dir.parent / "server" / "src"))
+
+from screen_party_client.network.client import WebSocketClient  # noqa: E402
+from screen_party_server.server import ScreenPartyServer  # noqa: E402
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="강제 연결 끊김 후 복구 시간 측정")
+    parser.add_argument("--port", type=int, default=8799, help="서버 포트")
+    parser.add_argument("--trials", type=int, default=10, help="끊김 반복 횟수")
+    parser.add_argument("--interval", type=float, default=0.05, help="참여자1 송신 간격 (초)")
+    parser.add_argument(
+        "--outage", type=float, default=0.3, help="재연결이 실패하는 단절 시간 (초)"
+    )
+    parser.add_argument("--settle", type=float, default=0.5, help="끊김 사이 대기 시간 (초)")
+    return parser.parse_args()
+
+
+async def run(args):
+    """측정 실행
+
+    Returns:
+        [(이어가기까지 초, 복구 완료까지 초, 끊겨 있는 동안 보낸 메시지 수)] 와 유실 메시지 수
+    """
+    server = ScreenPartyServer("localhost", args.port)
+    server_task = asyncio.create_task(server.start())
+    await asyncio.sleep(0.3)
+
+    url = f"ws://localhost:{args.port}"
+    sender = WebSocketClient(url)
+    receiver = WebSocketClient(url)
+    await sender.connect()
+    session_id = (await sender.create_session("Sender"))["session_id"]
+    await receiver.connect()
+    await receiver.join_session(session_id, "Receiver")
+    await sender.receive_message()  # participant_joined
+
+    received = set()
+    resumed_at = [0.0]
+
+    async def on_message(message):
+        if message.get("type") == "session_resumed":
+            resumed_at[0] = time.perf_counter()
+        elif "index" in message:
+            received.add(message["index"])
+
+    # 단절 중에는 연결 시도가 실패
+    outage_until = [0.0]
+    open_connection = receiver._open
+
+    async def open_after_outage():
+        if time.perf_counter() < outage_until[0]:
+            raise OSError("simulated outage")
+        return await open_connection()
+
+    receiver._open = open_after_outage
+    receiver.set_message_handler(on_message)
+    receiver.connection_state_callback = lambda state: None
+    listen_task = asyncio.create_task(receiver.listen())
+
+    sent = [0]
+    stop = asyncio.Event()
+
+    async def draw():
+        while not stop.is_set():
+            await sender.send_message(
+                {"type": "drawing_update", "line_id": "bench", "index": sent[0]}
+            )
+            sent[0] += 1
+            await asyncio.sleep(args.interval)
+
+    draw_task = asyncio.create_task(draw())
+    results = []
+    try:
+        for _ in range(args.trials):
+            await asyncio.sleep(args.settle)
+            resumed_at[0] = 0.0
+            dropped_at = time.perf_counter()
+            outage_until[0] = dropped_at + args.outage
+            sent_before = sent[0]
+            receiver.websocket.transport.abort()
+
+            # 끊기 직전까지 보낸 것 + 이어가기 직후 보낸 것까지 모두 받으면 복구 완료
+            while not resumed_at[0]:
+                await asyncio.sleep(0.001)
+            target = sent[0]
+            missed = target - sent_before
+            while not all(index in received for index in range(target)):
+                await asyncio.sleep(0.001)
+            recovered_at = time.perf_counter()
+            results.append((resumed_at[0] - dropped_at, recovered_at - dropped_at, missed))
+    finally:
+        stop.set()
+        await draw_task
+        await asyncio.sleep(0.2)
+        lost = sum(1 for index in range(sent[0]) if index not in received)
+        listen_task.cancel()
+        await sender.disconnect()
+        await receiver.disconnect()
+        server_task.cancel()
+        try:
+            await server_task
+        except asyncio.CancelledError:
+            pass
+    return results, lost
+
+
+def main():
+    """측정 실행 및 결과 출력"""
+    args = parse_args()
+    results, lost = asyncio.run(run(args))
+
+    resume = [r[0] * 1000 for r in results]
+    recover = [r[1] * 1000 for r in results]
+    missed = [r[2] for r in results]
+    print("=" * 64)
+    print(
+        f"Forced disconnect recovery: {args.trials} trials, "
+        f"sender every {args.interval * 1000:g}ms, outage {args.outage * 1000:g}ms (localhost)"
+    )
+    print("=" * 64)
+    print(f"  {'':>18s} {'p50':>9s} {'max':>9s}")
+    print(f"  {'resume':>18s} {statistics.median(resume):>7.1f}ms {max(resume):>7.1f}ms")
+    print(f"  {'all missed back':>18s} {statistics.median(recover):>7.1f}ms {max(recover):>7.1f}ms")
+    print(f"  {'sent while down':>18s} {statistics.median(missed):>9g} {max(missed):>9d}")
+    print(f"  lost messages: {lost}")
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    main()
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""DrawingCanvas 렌더링 프레임 시간 벤치마크
+
+라인 수를 늘려가며 전체 화면 한 프레임을 그리는 시간을 측정합니다.
+(세 방식 모두 같은 공간 인덱스 질의/세그먼트 그리기 코드를 사용하고 펜 처리만 다름)
+- per-line: 라인마다 setPen, 세그먼트마다 drawPath (이전 방식)
+- grouped: 펜 상태(색상+알파, 두께)별로 setPen 한 번, 세그먼트마다 drawPath
+- merged: 펜 상태별로 모든 세그먼트를 path 하나로 합쳐 drawPath 한 번 (비교용)
+- polyline: grouped + 완성된 라인은 캐시된 polyline을 drawPolyline
+  (현재 DrawingCanvas.paintEvent)
+
+Usage:
+    uv run --directory client python scripts/bench_render.py [options]
+
+Example:
+    uv run --directory client python scripts/bench_render.py
+    uv run --directory client python scripts/bench_render.py --users 8 --lines 10 100 1000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+# client/src를 Python path에 추가
+client_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(client_dir / "src"))
+
+# 화면 없이 실행 가능하도록 (이미 지정되어 있으면 그대로 사용)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QColor, QImage, QPainter, QPainterPath, QPen  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+from screen_party_client.drawing.canvas import DrawingCanvas  # noqa: E402
+
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="DrawingCanvas 렌더링 프레임 시간 벤치마크")
+    parser.add_argument(
+        "--lines", type=int, nargs="+", default=[10, 50, 100, 200, 500], help="라인 수 목록"
+    )
+    parser.add_argument("--segments", type=int, default=20, help="라인당 세그먼트 수")
+    parser.add_argument("--users", type=int, default=4, help="사용자 수 (= 색상 수)")
+    parser.add_argument("--frames", type=int, default=30, help="측정 프레임 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    return parser.parse_args()
+
+
+def make_canvas(line_count: int, segments: int, users: int, rng: random.Random) -> DrawingCanvas:
+    """무작위 스트로크가 들어 있는 전체 화면 크기 캔버스 생성 (상대 좌표)"""
+    canvas = DrawingCanvas()
+    canvas.resize(SCREEN_WIDTH, SCREEN_HEIGHT)
+    canvas.animation_scheduler.stop()
+
+    for user_no in range(users):
+        canvas.set_user_color(f"user-{user_no}", QColor.fromHsv(user_no * 360 // users, 160, 255))
+
+    for line_no in range(line_count):
+        user_id = f"user-{line_no % users}"
+        line_id = f"line-{line_no}"
+        x, y = rng.random(), rng.random()
+        seg_dicts = []
+        for _ in range(segments):
+            dx, dy = rng.uniform(-0.01, 0.01), rng.uniform(-0.01, 0.01)
+            seg_dicts.append(
+                {
+                    "p0": (x, y),
+                    "p1": (x + dx / 3, y + dy / 3),
+                    "p2": (x + 2 * dx / 3, y + 2 * dy / 3),
+                    "p3": (x + dx, y + dy),
+                }
+            )
+            x, y = x + dx, y + dy
+        canvas.handle_drawing_start(line_id, user_id, {})
+        canvas.handle_drawing_update(line_id, user_id, {"new_finalized_segments": seg_dicts})
+        canvas.handle_drawing_end(line_id, user_id)
+    canvas.animation_scheduler.stop()
+    return canvas
+
+
+def _begin(canvas: DrawingCanvas, image: QImage) -> QPainter:
+    """paintEvent와 같은 설정의 QPainter"""
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    painter.setTransform(canvas._view_transform())
+    return painter
+
+
+def _cosmetic_pen(canvas: DrawingCanvas, color: QColor) -> QPen:
+    pen = canvas._make_pen(color, canvas.pen_width)
+    pen.setCosmetic(True)
+    return pen
+
+
+def paint_per_line(canvas: DrawingCanvas, image: QImage):
+    """이전 방식: 라인마다 펜 생성/설정, 세그먼트마다 drawPath"""
+    visible = canvas.spatial_index.query_segments((0.0, 0.0, 1.0, 1.0))
+    painter = _begin(canvas, image)
+    for line_id, line_data in canvas.remote_lines.items():
+        color = QColor(line_data.color)
+        color.setAlphaF(line_data.alpha)
+        painter.setPen(_cosmetic_pen(canvas, color))
+        canvas._draw_line_paths(painter, line_data, visible[line_id])
+    painter.end()
+
+
+def paint_grouped(canvas: DrawingCanvas, image: QImage):
+    """펜 상태별로 묶어서 그룹당 setPen 한 번, 세그먼트마다 베지어 path"""
+    visible = canvas.spatial_index.query_segments((0.0, 0.0, 1.0, 1.0))
+    painter = _begin(canvas, image)
+    for (rgba, _width), runs in canvas._batch_remote_lines(visible).items():
+        painter.setPen(_cosmetic_pen(canvas, QColor.fromRgba(rgba)))
+        for line_data, hit_indices in runs:
+            canvas._draw_line_paths(painter, line_data, hit_indices)
+    painter.end()
+
+
+def paint_polyline(canvas: DrawingCanvas, image: QImage):
+    """현재 방식: grouped + 캐시된 polyline (DrawingCanvas.paintEvent와 동일)"""
+    visible = canvas.spatial_index.query_segments((0.0, 0.0, 1.0, 1.0))
+    painter = _begin(canvas, image)
+    for (rgba, width), runs in canvas._batch_remote_lines(visible).items():
+        canvas._draw_batch(painter, QColor.fromRgba(rgba), width, runs)
+    painter.end()
+
+
+def paint_merged(canvas: DrawingCanvas, image: QImage):
+    """펜 상태별로 모든 세그먼트를 path 하나로 합쳐서 drawPath 한 번"""
+    visible = canvas.spatial_index.query_segments((0.0, 0.0, 1.0, 1.0))
+    painter = _begin(canvas, image)
+    for (rgba, _width), runs in canvas._batch_remote_lines(visible).items():
+        painter.setPen(_cosmetic_pen(canvas, QColor.fromRgba(rgba)))
+        merged = QPainterPath()
+        for line_data, _ in runs:
+            for segment in line_data.finalized_segments:
+                merged.addPath(canvas._bezier_path(segment))
+        painter.drawPath(merged)
+    painter.end()
+
+
+def measure(paint, canvas: DrawingCanvas, frames: int) -> float:
+    """프레임당 평균 시간 (ms)"""
+    image = QImage(SCREEN_WIDTH, SCREEN_HEIGHT, QImage.Format.Format_ARGB32_Premultiplied)
+    paint(canvas, image)  # warm-up
+    start = time.perf_counter()
+    for _ in range(frames):
+        image.fill(0)
+        paint(canvas, image)
+    return (time.perf_counter() - start) / frames * 1e3
+
+
+def main():
+    """벤치마크 실행"""
+    args = parse_args()
+    app = QApplication.instance() or QApplication(sys.argv)  # noqa: F841
+
+    print("=" * 64)
+    print(
+        f"Render benchmark: {SCREEN_WIDTH}x{SCREEN_HEIGHT}, {args.segments} segments/line, "
+        f"{args.users} users, {args.frames} frames"
+    )
+    print("=" * 64)
+    print(
+        f"  {'lines':>6s} {'per-line (ms)':>14s} {'grouped (ms)':>13s} {'merged (ms)':>12s} "
+        f"{'polyline (ms)':>14s}"
+    )
+
+    for line_count in args.lines:
+        canvas = make_canvas(line_count, args.segments, args.users, random.Random(args.seed))
+        per_line = measure(paint_per_line, canvas, args.frames)
+        grouped = measure(paint_grouped, canvas, args.frames)
+        merged = measure(paint_merged, canvas, args.frames)
+        polyline = measure(paint_polyline, canvas, args.frames)  # 첫 프레임(warm-up)에 캐시 생성
+        print(
+            f"  {line_count:>6d} {per_line:>14.2f} {grouped:>13.2f} {merged:>12.2f} "
+            f"{polyline:>14.2f}"
+        )
+        canvas.deleteLater()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""SegmentGridIndex 벤치마크
+
+화면 크기 좌표계에 무작위 스트로크를 생성하여 공간 인덱스의
+삽입/질의/삭제 비용을 선형 탐색(remote_lines 전체 순회)과 비교합니다.
+
+Usage:
+    uv run --directory client python scripts/bench_spatial_index.py [options]
+
+Example:
+    uv run --directory client python scripts/bench_spatial_index.py
+    uv run --directory client python scripts/bench_spatial_index.py --segments 50000 --cell-size 32
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# client/src를 Python path에 추가
+client_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(client_dir / "src"))
+
+from PyQt6.QtGui import QColor  # noqa: E402
+from screen_party_client.drawing.bezier_fitter import BezierSegment  # noqa: E402
+from screen_party_client.drawing.line_data import LineData, bounds_intersect  # noqa: E402
+from screen_party_client.drawing.spatial_index import SegmentGridIndex  # noqa: E402
+
+SCREEN_WIDTH = 1920
+SCREEN_HEIGHT = 1080
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="SegmentGridIndex 벤치마크")
+    parser.add_argument("--segments", type=int, default=10_000, help="전체 세그먼트 수")
+    parser.add_argument("--per-line", type=int, default=20, help="라인당 세그먼트 수")
+    parser.add_argument("--cell-size", type=float, default=64.0, help="격자 셀 크기 (픽셀)")
+    parser.add_argument("--queries", type=int, default=1_000, help="질의 반복 횟수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    return parser.parse_args()
+
+
+def make_strokes(total_segments: int, per_line: int, rng: random.Random):
+    """무작위 스트로크 생성 (라인마다 연속된 짧은 세그먼트들)"""
+    strokes = {}
+    line_count = max(1, total_segments // per_line)
+    for line_no in range(line_count):
+        x = rng.uniform(0, SCREEN_WIDTH)
+        y = rng.uniform(0, SCREEN_HEIGHT)
+        segments = []
+        for _ in range(per_line):
+            dx, dy = rng.uniform(-15, 15), rng.uniform(-15, 15)
+            p0 = (x, y)
+            p3 = (x + dx, y + dy)
+            p1 = (x + dx / 3 + rng.uniform(-3, 3), y + dy / 3 + rng.uniform(-3, 3))
+            p2 = (x + 2 * dx / 3 + rng.uniform(-3, 3), y + 2 * dy / 3 + rng.uniform(-3, 3))
+            segments.append(BezierSegment(p0=p0, p1=p1, p2=p2, p3=p3))
+            x, y = p3
+        strokes[f"line-{line_no}"] = segments
+    return strokes
+
+
+def random_rect(size: float, rng: random.Random):
+    """화면 안의 무작위 정사각형 질의 영역"""
+    x = rng.uniform(0, SCREEN_WIDTH - size)
+    y = rng.uniform(0, SCREEN_HEIGHT - size)
+    return (x, y, x + size, y + size)
+
+
+def linear_query(lines: dict, bounds) -> set:
+    """인덱스 없이 모든 라인/세그먼트를 순회하는 기준 구현"""
+    hits = set()
+    for line_id, line_data in lines.items():
+        if not bounds_intersect(line_data.bounds, bounds):
+            continue
+        for seg_bounds in line_data.segment_bounds:
+            if bounds_intersect(seg_bounds, bounds):
+                hits.add(line_id)
+                break
+    return hits
+
+
+def report(label: str, total_seconds: float, count: int):
+    """결과 한 줄 출력"""
+    per_op_us = total_seconds / count * 1e6
+    print(f"  {label:<36s} {total_seconds * 1e3:9.2f} ms total  {per_op_us:9.2f} µs/op")
+
+
+def main():
+    """벤치마크 실행"""
+    args = parse_args()
+    rng = random.Random(args.seed)
+    strokes = make_strokes(args.segments, args.per_line, rng)
+    total_segments = sum(len(segments) for segments in strokes.values())
+
+    print("=" * 72)
+    print(
+        f"SegmentGridIndex benchmark: {total_segments} segments, {len(strokes)} lines, "
+        f"cell={args.cell_size:g}px"
+    )
+    print("=" * 72)
+
+    # 1. 증분 삽입 (네트워크 delta update처럼 세그먼트를 한 개씩 추가)
+    index = SegmentGridIndex(cell_size=args.cell_size)
+    lines = {}
+    start = time.perf_counter()
+    for line_id, segments in strokes.items():
+        line_data = LineData(
+            line_id=line_id, user_id="bench", color=QColor(0, 0, 0), spatial_index=index
+        )
+        for segment in segments:
+            line_data.add_finalized_segments([segment])
+        lines[line_id] = line_data
+    insert_with_index = time.perf_counter() - start
+
+    plain_lines = {}
+    start = time.perf_counter()
+    for line_id, segments in strokes.items():
+        line_data = LineData(line_id=line_id, user_id="bench", color=QColor(0, 0, 0))
+        for segment in segments:
+            line_data.add_finalized_segments([segment])
+        plain_lines[line_id] = line_data
+    insert_without_index = time.perf_counter() - start
+
+    print("Update cost")
+    report("add_finalized_segments (no index)", insert_without_index, total_segments)
+    report("add_finalized_segments (+ index)", insert_with_index, total_segments)
+
+    # 2. 영역 질의 (작은 dirty rect ~ 전체 화면)
+    print("Query cost")
+    for size in (32, 128, 512):
+        rects = [random_rect(size, rng) for _ in range(args.queries)]
+
+        start = time.perf_counter()
+        for rect in rects:
+            linear_query(lines, rect)
+        linear = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for rect in rects:
+            index.query_lines(rect)
+        indexed = time.perf_counter() - start
+
+        report(f"{size}x{size} linear scan", linear, len(rects))
+        report(f"{size}x{size} grid index", indexed, len(rects))
+
+    full_screen = (0.0, 0.0, float(SCREEN_WIDTH), float(SCREEN_HEIGHT))
+    repeats = max(1, args.queries // 20)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        linear_query(lines, full_screen)
+    report("full screen linear scan", time.perf_counter() - start, repeats)
+    start = time.perf_counter()
+    for _ in range(repeats):
+        index.query_lines(full_screen)
+    report("full screen grid index", time.perf_counter() - start, repeats)
+
+    # 3. 라인 삭제 (페이드아웃 완료 / 타임아웃)
+    print("Delete cost")
+    line_ids = list(lines)
+    start = time.perf_counter()
+    for line_id in line_ids:
+        index.remove_line(line_id)
+    report("remove_line", time.perf_counter() - start, len(line_ids))
+    assert len(index) == 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""클라이언트 콜드 스타트 시간 측정 (첫 화면까지)
+
+scripts/main.py를 --exit-after-first-paint로 여러 번 새 프로세스로 실행하고,
+프로세스 생성 직전부터 메인 윈도우가 처음 그려질 때까지의 시간을 측정합니다.
+(인터프리터 시작 + import + QApplication/MainWindow 생성 + 첫 paint)
+
+--max-ms를 주면 중앙값이 그보다 느릴 때 종료 코드 1로 끝나므로
+시작 시간 회귀를 막는 검사로 쓸 수 있습니다.
+기본으로 QT_QPA_PLATFORM=offscreen에서 실행합니다. (화면 없는 환경에서도 반복 가능)
+
+Usage:
+    uv run --directory client python scripts/bench_startup.py [options]
+
+Example:
+    uv run --directory client python scripts/bench_startup.py
+    uv run --directory client python scripts/bench_startup.py --runs 20 --max-ms 800
+    uv run --directory client python scripts/bench_startup.py --trace
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+client_dir = Path(__file__).parent.parent
+MAIN_SCRIPT = client_dir / "scripts" / "main.py"
+FIRST_PAINT_PREFIX = "first_paint_at="
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="클라이언트 콜드 스타트 시간 측정 (첫 화면까지)")
+    parser.add_argument("--runs", type=int, default=10, help="측정 횟수")
+    parser.add_argument(
+        "--warmup", type=int, default=1, help="버리는 첫 실행 횟수 (디스크 캐시 준비)"
+    )
+    parser.add_argument(
+        "--max-ms", type=float, default=None, help="중앙값이 이보다 느리면 실패 (회귀 검사)"
+    )
+    parser.add_argument(
+        "--platform", default="offscreen", help="QT_QPA_PLATFORM 값 (빈 문자열이면 기본 플랫폼)"
+    )
+    parser.add_argument(
+        "--trace", action="store_true", help="마지막 실행의 단계별/import별 시간도 출력"
+    )
+    parser.add_argument("--timeout", type=float, default=30.0, help="실행 한 번의 제한 시간 (초)")
+    return parser.parse_args()
+
+
+def run_once(args, trace: bool = False) -> tuple:
+    """클라이언트를 한 번 실행하고 (첫 화면까지 시간(ms), stderr) 반환"""
+    env = dict(os.environ)
+    if args.platform:
+        env["QT_QPA_PLATFORM"] = args.platform
+    command = [sys.executable, str(MAIN_SCRIPT), "--exit-after-first-paint"]
+    if trace:
+        command.append("--startup-trace")
+
+    spawned_at = time.time()
+    result = subprocess.run(command, env=env, capture_output=True, text=True, timeout=args.timeout)
+    for line in result.stdout.splitlines():
+        if line.startswith(FIRST_PAINT_PREFIX):
+            painted_at = float(line[len(FIRST_PAINT_PREFIX) :])
+            return (painted_at - spawned_at) * 1000, result.stderr
+
+    raise RuntimeError(
+        f"client exited with {result.returncode} before first paint:\n{result.stderr[-2000:]}"
+    )
+
+
+def main():
+    """측정 실행 및 결과 출력"""
+    args = parse_args()
+
+    for _ in range(args.warmup):
+        run_once(args)
+    times = [run_once(args)[0] for _ in range(args.runs)]
+    times.sort()
+    p95 = times[min(len(times) - 1, round(0.95 * (len(times) - 1)))]
+
+    print("=" * 64)
+    print(f"Cold start to first paint: {args.runs} runs, platform={args.platform or 'default'}")
+    print("=" * 64)
+    print(f"  {'min':>9s} {'p50':>9s} {'p95':>9s} {'max':>9s}")
+    print(
+        f"  {times[0]:>7.1f}ms {statistics.median(times):>7.1f}ms "
+        f"{p95:>7.1f}ms {times[-1]:>7.1f}ms"
+    )
+
+    if args.trace:
+        print()
+        print(run_once(args, trace=True)[1], end="")
+
+    if args.max_ms is not None:
+        median = statistics.median(times)
+        if median > args.max_ms:
+            print(f"FAIL: median {median:.1f}ms > --max-ms {args.max_ms:g}ms")
+            sys.exit(1)
+        print(f"OK: median {median:.1f}ms <= --max-ms {args.max_ms:g}ms")
+
+
+if __name__ == "__main__":
+    main()
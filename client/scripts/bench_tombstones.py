@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""삭제된 라인 ID 저장소 soak 벤치마크
+
+장시간 세션을 시뮬레이션하여 (가상 시계로) 스트로크가 계속 삭제될 때
+TombstoneSet과 기존 방식(정리하지 않는 set)의 항목 수/메모리 사용량을 비교합니다.
+
+Usage:
+    uv run --directory client python scripts/bench_tombstones.py [options]
+
+Example:
+    uv run --directory client python scripts/bench_tombstones.py
+    uv run --directory client python scripts/bench_tombstones.py --strokes 500000 --rate 50
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+import uuid
+from pathlib import Path
+
+# client/src를 Python path에 추가
+client_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(client_dir / "src"))
+
+from screen_party_client.drawing.tombstones import TombstoneSet  # noqa: E402
+
+
+class VirtualClock:
+    """가상 시계 (실제로 기다리지 않고 세션 시간을 진행)"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="삭제된 라인 ID 저장소 soak 벤치마크")
+    parser.add_argument("--strokes", type=int, default=100_000, help="삭제되는 스트로크 수")
+    parser.add_argument("--rate", type=float, default=10.0, help="초당 삭제되는 스트로크 수")
+    parser.add_argument("--ttl", type=float, default=60.0, help="tombstone TTL (초)")
+    parser.add_argument("--checkpoints", type=int, default=10, help="중간 측정 횟수")
+    return parser.parse_args()
+
+
+def soak(label: str, container, clock: VirtualClock, args) -> None:
+    """스트로크 삭제를 시뮬레이션하며 크기/메모리 측정"""
+    print(f"{label}")
+    print(f"  {'strokes':>9s} {'session':>10s} {'entries':>9s} {'memory':>12s}")
+
+    interval = 1.0 / args.rate
+    step = max(1, args.strokes // args.checkpoints)
+    # 늦은 메시지 확인 (라인마다 한 번)
+    lookups = 0
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    start = time.perf_counter()
+    for i in range(1, args.strokes + 1):
+        line_id = str(uuid.uuid4())
+        container.add(line_id)
+        lookups += line_id in container
+        clock.now += interval
+        if i % step == 0:
+            current, _ = tracemalloc.get_traced_memory()
+            print(
+                f"  {i:>9d} {clock.now / 3600:>9.2f}h {len(container):>9d} "
+                f"{(current - baseline) / 1024:>9.1f} KiB"
+            )
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+
+    assert lookups == args.strokes
+    print(f"  add + lookup: {elapsed / args.strokes * 1e6:.2f} µs/stroke")
+
+
+def main():
+    """벤치마크 실행"""
+    args = parse_args()
+
+    print("=" * 60)
+    print(
+        f"Tombstone soak: {args.strokes} strokes at {args.rate:g}/s "
+        f"({args.strokes / args.rate / 3600:.1f}h session), ttl={args.ttl:g}s"
+    )
+    print("=" * 60)
+
+    soak("set (previous behaviour)", set(), VirtualClock(), args)
+
+    clock = VirtualClock()
+    soak("TombstoneSet", TombstoneSet(ttl=args.ttl, clock=clock), clock, args)
+
+
+if __name__ == "__main__":
+    main()
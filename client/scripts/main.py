@@ -7,6 +7,7 @@ Usage:
 Example:
     uv run client
     uv run client --fullscreen
+    uv run client --startup-trace     # 시작 단계/import 시간 출력
 """
 
 import sys
@@ -14,25 +15,19 @@ import os
 import asyncio
 import argparse
 import logging
+import time
 from pathlib import Path
 
 # client/src를 Python path에 추가
 client_dir = Path(__file__).parent.parent
 sys.path.insert(0, str(client_dir / "src"))
 
-from PyQt6.QtWidgets import QApplication  # noqa: E402
-from PyQt6.QtGui import QIcon  # noqa: E402
-from qasync import QEventLoop  # noqa: E402
-from screen_party_client.gui.main_window import MainWindow  # noqa: E402
+# PyQt6 / MainWindow는 main()에서 import (--startup-trace로 import 시간을 측정할 수 있도록)
+from screen_party_client.startup import StartupTrace, call_on_first_paint  # noqa: E402
+from screen_party_common.log_pipeline import setup_logging  # noqa: E402
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+# 이 환경 변수가 설정되어 있으면 --startup-trace와 같음 (패키징된 실행 파일용)
+STARTUP_TRACE_ENV = "SCREEN_PARTY_STARTUP_TRACE"
 
 logger = logging.getLogger(__name__)
 
@@ -89,6 +84,19 @@ def parse_args():
         help="자세한 로그 출력"
     )
 
+    parser.add_argument(
+        "--startup-trace",
+        action="store_true",
+        default=bool(os.environ.get(STARTUP_TRACE_ENV)),
+        help=f"시작 단계별/모듈 import별 소요 시간 출력 (또는 {STARTUP_TRACE_ENV}=1)"
+    )
+
+    parser.add_argument(
+        "--exit-after-first-paint",
+        action="store_true",
+        help="첫 화면을 그린 직후 종료하고 시각 출력 (시작 시간 벤치마크용)"
+    )
+
     return parser.parse_args()
 
 
@@ -96,9 +104,20 @@ def main():
     """클라이언트 진입점"""
     args = parse_args()
 
-    # verbose 모드 처리
+    trace = StartupTrace()
+    if args.startup_trace:
+        trace.install_import_hook()
+
+    with trace.phase("import Qt"):
+        from PyQt6.QtWidgets import QApplication
+        from PyQt6.QtGui import QIcon
+        from qasync import QEventLoop
+    with trace.phase("import MainWindow"):
+        from screen_party_client.gui.main_window import MainWindow
+
+    # 로깅 설정 (출력은 백그라운드 스레드에서, GUI/asyncio 루프를 막지 않도록)
+    setup_logging(logging.DEBUG if args.verbose else logging.INFO)
     if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
         logger.debug("Verbose mode enabled")
 
     # 클라이언트 시작 메시지
@@ -120,8 +139,9 @@ def main():
             logger.warning(f"Failed to set AppUserModelID: {e}")
 
     # PyQt6 애플리케이션 생성
-    app = QApplication(sys.argv)
-    app.setApplicationName("Screen Party")
+    with trace.phase("create QApplication"):
+        app = QApplication(sys.argv)
+        app.setApplicationName("Screen Party")
 
     # 애플리케이션 아이콘 설정 (작업 표시줄 아이콘)
     app_icon = None
@@ -146,17 +166,33 @@ def main():
     asyncio.set_event_loop(loop)
 
     # 메인 윈도우 생성
-    window = MainWindow()
+    with trace.phase("create MainWindow"):
+        window = MainWindow()
+
+    def on_first_paint():
+        trace.mark("first paint")
+        if args.startup_trace:
+            trace.uninstall_import_hook()
+            trace.report()
+        if args.exit_after_first_paint:
+            # bench_startup.py가 읽는 줄 (프로세스 밖에서 비교할 수 있도록 벽시계 시각)
+            print(f"first_paint_at={time.time():.6f}", flush=True)
+            loop.stop()
+
+    call_on_first_paint(window, on_first_paint)
+    # 이벤트 루프 지연 측정은 루프가 돌기 시작한 뒤에
+    loop.call_soon(window.start_loop_monitor)
 
     # MainWindow에도 명시적으로 아이콘 설정
     if app_icon and not app_icon.isNull():
         window.setWindowIcon(app_icon)
         logger.info("✓ MainWindow icon set")
 
-    if args.fullscreen:
-        window.showFullScreen()
-    else:
-        window.show()
+    with trace.phase("show window"):
+        if args.fullscreen:
+            window.showFullScreen()
+        else:
+            window.show()
 
     # 이벤트 루프 실행
     with loop:
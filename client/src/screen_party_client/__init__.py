@@ -2,6 +2,13 @@
 
 __version__ = "0.1.0"
 
-from .network.client import WebSocketClient
-
 __all__ = ["WebSocketClient"]
+
+
+def __getattr__(name: str):
+    # 네트워크 모듈(websockets)은 처음 사용할 때 로드 (GUI 시작 시간 단축)
+    if name == "WebSocketClient":
+        from .network.client import WebSocketClient
+
+        return WebSocketClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
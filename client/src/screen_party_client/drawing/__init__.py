@@ -1,8 +1,35 @@
-"""실시간 드로잉 및 베지어 커브 피팅 모듈"""
+"""실시간 드로잉 및 베지어 커브 피팅 모듈
 
-from .bezier_fitter import BezierFitter, BezierSegment
-from .incremental_fitter import IncrementalFitter
-from .line_data import LineData
-from .canvas import DrawingCanvas
+하위 모듈은 이름을 처음 사용할 때 로드합니다.
+(패키지 import만으로 캔버스/래스터라이저/피팅 코드를 모두 로드하지 않도록)
+"""
 
-__all__ = ["BezierFitter", "BezierSegment", "IncrementalFitter", "LineData", "DrawingCanvas"]
+import importlib
+
+_EXPORTS = {
+    "BezierFitter": ".bezier_fitter",
+    "BezierSegment": ".bezier_fitter",
+    "IncrementalFitter": ".incremental_fitter",
+    "LineData": ".line_data",
+    "SegmentGridIndex": ".spatial_index",
+    "AnimationScheduler": ".animation_scheduler",
+    "TombstoneSet": ".tombstones",
+    "StrokeStore": ".stroke_store",
+    "ThreadedRasterizer": ".rasterizer",
+    "DrawingCanvas": ".canvas",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
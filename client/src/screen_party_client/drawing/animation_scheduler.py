@@ -0,0 +1,90 @@
+"""
+데드라인 기반 애니메이션 스케줄러
+
+항상 16ms마다 깨어나는 타이머 대신, 다음에 무언가가 바뀌는 시각
+(페이드 시작, 페이드 종료, 타임아웃)에만 깨어납니다.
+페이드가 진행 중인 동안에만 프레임 간격으로 틱합니다.
+"""
+
+import math
+import time
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, Qt, QTimer
+
+
+class AnimationScheduler(QObject):
+    """
+    데드라인 기반 단일 타이머 스케줄러
+
+    tick 콜백은 현재 시각(time.time())을 받아 다음 데드라인을 반환합니다.
+    - None: 더 이상 예정된 일이 없음 → 타이머 정지 (idle)
+    - 현재 시각 이하: 애니메이션 진행 중 → 다음 프레임에 다시 틱
+    - 미래 시각: 해당 시각까지 잠들었다가 깨어남
+    """
+
+    def __init__(
+        self,
+        tick: Callable[[float], Optional[float]],
+        frame_interval: int = 16,
+        parent: Optional[QObject] = None,
+    ):
+        """
+        Args:
+            tick: 애니메이션 갱신 콜백 (now -> 다음 데드라인 또는 None)
+            frame_interval: 애니메이션 진행 중 틱 간격 (ms, 기본: 16ms ≈ 60fps)
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self._tick = tick
+        self.frame_interval = frame_interval
+
+        # 예약된 다음 깨어날 시각 (time.time() 기준, None이면 idle)
+        self._deadline: Optional[float] = None
+
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.timer.timeout.connect(self._on_timeout)
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """예약된 다음 깨어날 시각 (idle이면 None)"""
+        return self._deadline
+
+    def is_idle(self) -> bool:
+        """예약된 틱이 없는지 확인"""
+        return not self.timer.isActive()
+
+    def request_at(self, deadline: float):
+        """지정 시각까지 틱 예약 (이미 더 이른 틱이 예약되어 있으면 무시)
+
+        Args:
+            deadline: 깨어날 시각 (time.time() 기준)
+        """
+        if self.timer.isActive() and self._deadline is not None and self._deadline <= deadline:
+            return
+        self._start(deadline, time.time())
+
+    def stop(self):
+        """예약된 틱 취소"""
+        self.timer.stop()
+        self._deadline = None
+
+    def _start(self, deadline: float, now: float):
+        """타이머를 deadline에 맞춰 시작"""
+        self._deadline = deadline
+        delay_ms = max(0, math.ceil((deadline - now) * 1000))
+        self.timer.start(delay_ms)
+
+    def _on_timeout(self):
+        """타이머 만료: tick 실행 후 다음 데드라인 예약"""
+        self._deadline = None
+        now = time.time()
+        next_deadline = self._tick(now)
+
+        if next_deadline is None:
+            return  # idle: 다음 request_at()까지 잠듦
+
+        # 애니메이션 진행 중이면 프레임 간격, 아니면 다음 데드라인까지 대기
+        self._start(max(next_deadline, now + self.frame_interval / 1000.0), now)
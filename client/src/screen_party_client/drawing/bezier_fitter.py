@@ -5,10 +5,20 @@ Schneider 알고리즘 기반 큐빅 베지어 커브 피팅
 https://github.com/erich666/GraphicsGems/blob/master/gems/FitCurves.c
 """
 
+from __future__ import annotations
+
 from dataclasses import dataclass
-from typing import List, Tuple
-import numpy as np
-from numpy.typing import NDArray
+from typing import TYPE_CHECKING, List, Tuple
+import math
+
+from ..startup import lazy_import
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import NDArray
+else:
+    # numpy는 첫 피팅 때 로드 (시작 시간 단축)
+    np = lazy_import("numpy")
 
 
 @dataclass
@@ -73,6 +83,52 @@ class BezierSegment:
             p3=(self.p3[0] * width, self.p3[1] * height),
         )
 
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """세그먼트의 바운딩 박스 (min_x, min_y, max_x, max_y)
+
+        큐빅 베지어 곡선은 항상 4개 제어점의 convex hull 안에 있으므로
+        제어점의 최소/최대값만으로 곡선 전체를 덮는 박스를 얻을 수 있습니다.
+
+        Returns:
+            (min_x, min_y, max_x, max_y)
+        """
+        xs = (self.p0[0], self.p1[0], self.p2[0], self.p3[0])
+        ys = (self.p0[1], self.p1[1], self.p2[1], self.p3[1])
+        return (min(xs), min(ys), max(xs), max(ys))
+
+    def flatten(
+        self, scale_x: float = 1.0, scale_y: float = 1.0, tolerance: float = 0.25
+    ) -> List[Tuple[float, float]]:
+        """곡선을 꺾은선(polyline) 점들로 근사
+
+        균일한 t 간격 n개 구간으로 나눌 때 오차는 max|B''| / (8 n²) 이하이고,
+        |B''| ≤ 6·max(|P0 - 2P1 + P2|, |P1 - 2P2 + P3|) 이므로
+        오차가 tolerance 이하가 되는 최소 n을 사용합니다.
+
+        Args:
+            scale_x: 오차를 잴 좌표계로의 X 배율 (예: 상대 좌표 → 디바이스 픽셀)
+            scale_y: 오차를 잴 좌표계로의 Y 배율
+            tolerance: 허용 오차 (배율을 적용한 좌표계 단위)
+
+        Returns:
+            P0부터 P3까지의 점들 (세그먼트와 같은 좌표계)
+        """
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = self.p0, self.p1, self.p2, self.p3
+        dd = max(
+            math.hypot((x0 - 2 * x1 + x2) * scale_x, (y0 - 2 * y1 + y2) * scale_y),
+            math.hypot((x1 - 2 * x2 + x3) * scale_x, (y1 - 2 * y2 + y3) * scale_y),
+        )
+        steps = max(1, math.ceil(math.sqrt(0.75 * dd / tolerance)))
+
+        points = [self.p0]
+        for i in range(1, steps):
+            t = i / steps
+            mt = 1.0 - t
+            a, b, c, d = mt * mt * mt, 3 * mt * mt * t, 3 * mt * t * t, t * t * t
+            points.append((a * x0 + b * x1 + c * x2 + d * x3, a * y0 + b * y1 + c * y2 + d * y3))
+        points.append(self.p3)
+        return points
+
 
 class BezierFitter:
     """
@@ -5,25 +5,48 @@
 여러 사용자의 드로잉을 line_id별로 관리합니다.
 """
 
-from typing import Optional, Dict, Any, Tuple, Set, TYPE_CHECKING
-import uuid
+from typing import Optional, Dict, Any, List, Set, Tuple, TYPE_CHECKING
 import time
+import uuid
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtCore import Qt, QTimer, QPointF, pyqtSignal
-from PyQt6.QtGui import QPainter, QPen, QPainterPath, QMouseEvent, QPaintEvent, QColor
+from PyQt6.QtCore import Qt, QTimer, QPointF, QRect, QRectF, pyqtSignal
+from PyQt6.QtGui import (
+    QPainter,
+    QPen,
+    QPainterPath,
+    QPolygonF,
+    QMouseEvent,
+    QPaintEvent,
+    QResizeEvent,
+    QColor,
+    QTransform,
+)
 
 from screen_party_common import DrawingStartMessage, DrawingUpdateMessage
 from .incremental_fitter import IncrementalFitter
 from .bezier_fitter import BezierSegment
-from .line_data import LineData
+from .line_data import LineData, Bounds, union_bounds, points_bounds
+from .spatial_index import SegmentGridIndex, RAW_RUN_INDEX
+from .animation_scheduler import AnimationScheduler
+from .stroke_store import StrokeStore, default_pen_color
+from .tombstones import TombstoneSet
+from .rasterizer import (
+    RenderJob,
+    StrokeBatch,
+    ThreadedRasterizer,
+    bezier_path,
+    make_pen,
+    raw_points_path,
+)
 
 if TYPE_CHECKING:
     pass
 
+# 완성된 라인을 polyline으로 평탄화할 때의 허용 오차 (디바이스 픽셀)
+POLYLINE_TOLERANCE = 0.25
 
-def _get_default_pen_color() -> QColor:
-    """기본 펜 색상 반환 (파스텔 핑크)"""
-    return QColor(255, 182, 193)  # 첫 번째 프리셋 색상과 동일
+# 평탄화된 polyline 구간 (첫 세그먼트 인덱스, 마지막 세그먼트 인덱스, 점들)
+PolylineRun = Tuple[int, int, QPolygonF]
 
 
 class DrawingCanvas(QWidget):
@@ -36,6 +59,14 @@ class DrawingCanvas(QWidget):
     - 렌더링 (finalized: 곡선, current: 직선)
     - 네트워크 전송 (50ms throttling)
     - 다른 사용자의 드로잉 수신 및 렌더링
+
+    라인 데이터와 페이드 상태는 StrokeStore가 소유합니다 (상대 좌표).
+    같은 store를 공유하는 여러 캔버스는 paintEvent에서 각자의 QTransform
+    (상대 좌표 → 위젯 좌표) 하나만 적용해서 그립니다. 따라서 수신 시 좌표 변환이 없고,
+    창 크기를 바꿔도 저장된 geometry는 그대로입니다.
+
+    threaded_rendering을 켜면 다른 사용자의 스트로크는 작업 스레드(ThreadedRasterizer)가
+    QImage로 그리고, paintEvent는 최신 프레임을 복사한 뒤 내 드로잉만 직접 그립니다.
     """
 
     # 네트워크 전송 시그널 (line_id, user_id, packet)
@@ -55,6 +86,8 @@ class DrawingCanvas(QWidget):
         fade_hold_duration: float = 2.0,
         fade_duration: float = 1.0,
         timeout_duration: float = 10.0,
+        store: Optional[StrokeStore] = None,
+        threaded_rendering: bool = False,
     ):
         """
         Args:
@@ -68,12 +101,15 @@ class DrawingCanvas(QWidget):
             fade_hold_duration: 페이드아웃 전 유지 시간 (초)
             fade_duration: 페이드아웃 시간 (초)
             timeout_duration: 강제 삭제 타임아웃 (초)
+            store: 공유할 스트로크 저장소 (None이면 이 캔버스 전용으로 생성,
+                이 경우에만 fade_*/timeout_duration이 사용됨)
+            threaded_rendering: 다른 사용자의 스트로크를 작업 스레드에서 래스터화
         """
         super().__init__(parent)
 
         # 사용자 정보
         self.user_id = user_id or str(uuid.uuid4())
-        self.pen_color = pen_color if pen_color is not None else _get_default_pen_color()
+        self.pen_color = pen_color if pen_color is not None else default_pen_color()
         self.pen_width = pen_width
         self.pen_alpha = pen_alpha
 
@@ -86,35 +122,32 @@ class DrawingCanvas(QWidget):
             max_error=max_error,
         )
         self.my_line_id: Optional[str] = None
-
-        # 다른 사용자의 드로잉 (line_id -> LineData)
-        self.remote_lines: Dict[str, LineData] = {}
-
-        # 사용자별 색상 (user_id -> QColor)
-        self.user_colors: Dict[str, QColor] = {}
-        self.user_colors[self.user_id] = pen_color
-
-        # 사용자별 알파값 (user_id -> float, 0.0 ~ 1.0)
-        self.user_alphas: Dict[str, float] = {}
-        self.user_alphas[self.user_id] = pen_alpha
-
-        # 페이드아웃 설정
-        self.fade_hold_duration = fade_hold_duration
-        self.fade_duration = fade_duration
-        self.timeout_duration = timeout_duration
-
-        # 삭제된 라인 추적 (타임아웃으로 삭제된 라인은 이후 이벤트 무시)
-        self.deleted_line_ids: Set[str] = set()
+        self._my_raw_bounds: Optional[Bounds] = None  # 그리는 중인 raw 점들의 영역
+        self._trace_input: Optional[float] = None  # 아직 전송 안 된 첫 입력 시각 (지연 측정 시)
+
+        # 백그라운드 래스터라이저 (threaded_rendering일 때만)
+        self._rasterizer: Optional[ThreadedRasterizer] = None
+
+        # 라인 데이터/사용자 색상/페이드 상태 저장소 (여러 캔버스가 공유 가능)
+        self.store: Optional[StrokeStore] = None
+        self.set_store(
+            store
+            if store is not None
+            else StrokeStore(
+                fade_hold_duration=fade_hold_duration,
+                fade_duration=fade_duration,
+                timeout_duration=timeout_duration,
+                parent=self,
+            )
+        )
+        self.user_colors.setdefault(self.user_id, self.pen_color)
+        self.user_alphas.setdefault(self.user_id, pen_alpha)
 
         # 네트워크 전송 타이머 (50ms)
         self.network_timer = QTimer(self)
         self.network_timer.timeout.connect(self._send_network_update)
-        self.network_interval = 50  # ms
-
-        # 페이드아웃 애니메이션 타이머 (60fps, 16ms)
-        self.animation_timer = QTimer(self)
-        self.animation_timer.timeout.connect(self._update_animations)
-        self.animation_timer.start(16)  # ~60 FPS
+        self.network_interval = 50  # ms (링크 상태에 따라 set_network_interval로 조절)
+        self.raw_point_stride = 1  # raw 점을 몇 개마다 하나씩 보낼지 (혼잡할 때 솎음)
 
         # 마우스 추적 활성화
         self.setMouseTracking(True)
@@ -122,6 +155,130 @@ class DrawingCanvas(QWidget):
         # 배경 투명
         self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
 
+        self.set_threaded_rendering(threaded_rendering)
+
+    def set_store(self, store: StrokeStore):
+        """스트로크 저장소 교체 (이 캔버스는 store의 변경 알림을 구독해서 다시 그림)
+
+        Args:
+            store: 새 저장소
+        """
+        if store is self.store:
+            return
+        if self.store is not None:
+            self.store.region_changed.disconnect(self._on_store_changed)
+        self.store = store
+        store.region_changed.connect(self._on_store_changed)
+        self._invalidate_all()
+
+    # === 백그라운드 렌더링 ===
+
+    @property
+    def threaded_rendering(self) -> bool:
+        """다른 사용자의 스트로크를 작업 스레드에서 래스터화하는지 여부"""
+        return self._rasterizer is not None
+
+    def set_threaded_rendering(self, enabled: bool):
+        """백그라운드 렌더링 모드 설정
+
+        Args:
+            enabled: True이면 작업 QThread가 더블 버퍼 QImage에 그리고
+                paintEvent는 완성된 프레임만 복사, False이면 paintEvent에서 직접 그림
+        """
+        if enabled == self.threaded_rendering:
+            return
+        if enabled:
+            self._rasterizer = ThreadedRasterizer(self._render_job, parent=self)
+            self._rasterizer.frame_ready.connect(self.update)
+        else:
+            self._rasterizer.stop()
+            self._rasterizer.deleteLater()
+            self._rasterizer = None
+        self._invalidate_all()
+
+    def _render_job(self) -> RenderJob:
+        """현재 라인들의 스냅샷 (GUI 스레드에서 호출, 작업 스레드는 이것만 읽음)"""
+        polylines: Dict[Tuple[int, int], List[QPolygonF]] = {}
+        segments: Dict[Tuple[int, int], List[BezierSegment]] = {}
+        raw_runs: Dict[Tuple[int, int], List[Tuple[Tuple[float, float], ...]]] = {}
+        keys: Dict[Tuple[int, int], None] = {}  # 처음 등장한 순서 유지
+        for line_data in self.remote_lines.values():
+            if self.hide_my_drawings and line_data.user_id == self.user_id:
+                continue
+            key = self._pen_key(line_data)
+            keys[key] = None
+            if line_data.is_complete:
+                polylines.setdefault(key, []).extend(
+                    polygon for _, _, polygon in self._line_polylines(line_data)
+                )
+            else:
+                segments.setdefault(key, []).extend(line_data.finalized_segments)
+                if len(line_data.current_raw_points) >= 2:
+                    raw_runs.setdefault(key, []).append(tuple(line_data.current_raw_points))
+
+        return RenderJob(
+            width=self.width(),
+            height=self.height(),
+            device_pixel_ratio=self.devicePixelRatioF(),
+            batches=tuple(
+                StrokeBatch(
+                    rgba=key[0],
+                    width=key[1],
+                    polylines=tuple(polylines.get(key, ())),
+                    segments=tuple(segments.get(key, ())),
+                    raw_runs=tuple(raw_runs.get(key, ())),
+                )
+                for key in keys
+            ),
+        )
+
+    # === 저장소 위임 속성 ===
+
+    @property
+    def remote_lines(self) -> Dict[str, LineData]:
+        """화면에 있는 라인들 (line_id -> LineData, 상대 좌표)"""
+        return self.store.lines
+
+    @property
+    def spatial_index(self) -> SegmentGridIndex:
+        """라인 세그먼트 공간 인덱스 (상대 좌표)"""
+        return self.store.spatial_index
+
+    @property
+    def user_colors(self) -> Dict[str, QColor]:
+        """사용자별 색상 (user_id -> QColor)"""
+        return self.store.user_colors
+
+    @property
+    def user_alphas(self) -> Dict[str, float]:
+        """사용자별 알파값 (user_id -> float, 0.0 ~ 1.0)"""
+        return self.store.user_alphas
+
+    @property
+    def deleted_line_ids(self) -> TombstoneSet:
+        """삭제된 라인 ID (이후 이벤트 무시, TTL이 지나면 만료)"""
+        return self.store.deleted_line_ids
+
+    @property
+    def fade_hold_duration(self) -> float:
+        """페이드아웃 전 유지 시간 (초)"""
+        return self.store.fade_hold_duration
+
+    @property
+    def fade_duration(self) -> float:
+        """페이드아웃 시간 (초)"""
+        return self.store.fade_duration
+
+    @property
+    def timeout_duration(self) -> float:
+        """강제 삭제 타임아웃 (초)"""
+        return self.store.timeout_duration
+
+    @property
+    def animation_scheduler(self) -> AnimationScheduler:
+        """페이드아웃 애니메이션 스케줄러 (store당 하나)"""
+        return self.store.animation_scheduler
+
     def set_user_id(self, user_id: str):
         """사용자 ID 설정"""
         # 이전 user_id 제거 (중복 방지)
@@ -140,11 +297,11 @@ class DrawingCanvas(QWidget):
 
     def set_user_color(self, user_id: str, color: QColor):
         """사용자별 색상 설정"""
-        self.user_colors[user_id] = color
+        self.store.set_user_color(user_id, color)
 
     def set_user_alpha(self, user_id: str, alpha: float):
         """사용자별 알파값 설정"""
-        self.user_alphas[user_id] = max(0.0, min(1.0, alpha))
+        self.store.set_user_alpha(user_id, alpha)
 
     # === 좌표 변환 메서드 ===
 
@@ -184,6 +341,66 @@ class DrawingCanvas(QWidget):
 
         return (x, y)
 
+    # === 부분 다시 그리기 (dirty rect) ===
+
+    def _dirty_margin(self) -> float:
+        """바운딩 박스에 더할 여유 (펜 두께 절반 + 안티앨리어싱 여유)"""
+        return self.pen_width / 2.0 + 2.0
+
+    def _bounds_to_rect(self, bounds: Bounds) -> QRect:
+        """바운딩 박스를 펜 두께만큼 확장한 위젯 좌표 QRect로 변환"""
+        margin = self._dirty_margin()
+        rect = QRectF(
+            bounds[0] - margin,
+            bounds[1] - margin,
+            bounds[2] - bounds[0] + 2 * margin,
+            bounds[3] - bounds[1] + 2 * margin,
+        )
+        return rect.toAlignedRect()
+
+    def _invalidate(self, bounds: Optional[Bounds]):
+        """변경된 영역만 다시 그리도록 요청
+
+        Args:
+            bounds: 변경된 영역의 바운딩 박스 (None이면 아무것도 하지 않음)
+        """
+        if bounds is None:
+            return
+        self.update(self._bounds_to_rect(bounds))
+
+    def _view_transform(self) -> QTransform:
+        """상대 좌표(0.0 ~ 1.0) → 위젯 좌표 변환 (크기가 0이면 0으로 나누기 방지용 1)"""
+        return QTransform.fromScale(self.width() or 1, self.height() or 1)
+
+    def _to_widget_bounds(self, bounds: Bounds) -> Bounds:
+        """상대 좌표 바운딩 박스를 위젯 좌표로 변환"""
+        rect = self._view_transform().mapRect(
+            QRectF(bounds[0], bounds[1], bounds[2] - bounds[0], bounds[3] - bounds[1])
+        )
+        return (rect.left(), rect.top(), rect.right(), rect.bottom())
+
+    def _to_relative_bounds(self, bounds: Bounds) -> Bounds:
+        """위젯 좌표 바운딩 박스를 상대 좌표로 변환"""
+        inverse, _ = self._view_transform().inverted()
+        rect = inverse.mapRect(
+            QRectF(bounds[0], bounds[1], bounds[2] - bounds[0], bounds[3] - bounds[1])
+        )
+        return (rect.left(), rect.top(), rect.right(), rect.bottom())
+
+    def _invalidate_all(self):
+        """다른 사용자의 스트로크 전체 다시 그리기 (백그라운드 렌더링이면 새 프레임 요청)"""
+        if self._rasterizer is not None:
+            self._rasterizer.request()  # 프레임이 완성되면 update
+        else:
+            self.update()
+
+    def _on_store_changed(self, bounds: Optional[Bounds]):
+        """store 변경 알림 처리 (상대 좌표 영역 → 이 캔버스의 dirty rect)"""
+        if bounds is None or self._rasterizer is not None:
+            self._invalidate_all()
+        else:
+            self._invalidate(self._to_widget_bounds(bounds))
+
     def mousePressEvent(self, event: QMouseEvent):
         """마우스 눌림: 드로잉 시작"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -211,7 +428,9 @@ class DrawingCanvas(QWidget):
             # 네트워크 전송 타이머 시작
             self.network_timer.start(self.network_interval)
 
-            self.update()  # 화면 갱신
+            # 현재 그리는 raw 점들의 영역 추적
+            self._my_raw_bounds = points_bounds(self.my_fitter.raw_buffer)
+            self._invalidate(self._my_raw_bounds)  # 시작 점 영역만 갱신
 
     def mouseMoveEvent(self, event: QMouseEvent):
         """마우스 이동: 점 추가"""
@@ -219,16 +438,40 @@ class DrawingCanvas(QWidget):
             pos = event.position()
             abs_point = (pos.x(), pos.y())
 
+            # 지연 측정: 다음 패킷에 담길 첫 입력 시각
+            if self.store.tracer is not None and self._trace_input is None:
+                self._trace_input = self.store.tracer.now()
+
             # 내부적으로는 절대 좌표로 드로잉 (렌더링용)
-            self.my_fitter.add_point(abs_point)
-            self.update()  # 화면 갱신
+            prev_bounds = self._my_raw_bounds
+            prev_count = len(self.my_fitter.finalized_segments)
+            if self.my_fitter.add_point(abs_point):
+                # 피팅 발생: raw 점이 세그먼트로 대체됨
+                self._my_raw_bounds = points_bounds(self.my_fitter.raw_buffer)
+            else:
+                self._my_raw_bounds = union_bounds(
+                    prev_bounds, (abs_point[0], abs_point[1], abs_point[0], abs_point[1])
+                )
+
+            # 이전 raw 영역 + 새 raw 영역 + 새 세그먼트 영역만 갱신
+            dirty = union_bounds(prev_bounds, self._my_raw_bounds)
+            for segment in self.my_fitter.finalized_segments[prev_count:]:
+                dirty = union_bounds(dirty, segment.bounds())
+            self._invalidate(dirty)
 
     def mouseReleaseEvent(self, event: QMouseEvent):
         """마우스 떼기: 드로잉 종료"""
         if event.button() == Qt.MouseButton.LeftButton:
             if self.my_fitter.is_drawing and self.my_line_id:
+                prev_count = len(self.my_fitter.finalized_segments)
                 self.my_fitter.end_drawing()
 
+                # 최종 피팅으로 바뀐 영역 (남은 raw 점 → 세그먼트)
+                dirty = self._my_raw_bounds
+                for segment in self.my_fitter.finalized_segments[prev_count:]:
+                    dirty = union_bounds(dirty, segment.bounds())
+                self._my_raw_bounds = None
+
                 # 네트워크 전송 타이머 중지
                 self.network_timer.stop()
 
@@ -244,83 +487,247 @@ class DrawingCanvas(QWidget):
                 # 초기화
                 self.my_line_id = None
 
-                self.update()  # 화면 갱신
+                self._invalidate(dirty)  # 바뀐 영역만 갱신
+
+    def resizeEvent(self, event: QResizeEvent):
+        """크기 변경: 저장된 geometry는 상대 좌표이므로 다시 그리기만 하면 됨 (O(1))"""
+        super().resizeEvent(event)
+        self._invalidate_all()
 
     def paintEvent(self, event: QPaintEvent):
         """렌더링"""
         painter = QPainter(self)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
-        # 1. 다른 사용자의 드로잉 렌더링
-        for line_id, line_data in self.remote_lines.items():
-            # 본인 그림 숨김 옵션이 활성화되어 있고, 이 라인이 본인 것이면 스킵
-            if self.hide_my_drawings and line_data.user_id == self.user_id:
-                continue
-
-            # 알파값 적용
-            color = QColor(line_data.color)
-            color.setAlphaF(line_data.alpha)
-
-            pen = QPen(color, self.pen_width)
-            pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-            pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-            painter.setPen(pen)
+        if self._rasterizer is not None:
+            # 1. 다른 사용자의 드로잉: 작업 스레드가 완성한 최신 프레임 복사
+            # (크기 변경 직후에는 새 프레임이 올 때까지 이전 프레임을 늘려서 표시)
+            if self._rasterizer.front is not None:
+                painter.drawImage(QRectF(self.rect()), self._rasterizer.front)
+        else:
+            self._paint_remote_lines(painter, event)
 
-            # finalized_segments: 베지어 곡선
-            for segment in line_data.finalized_segments:
-                self._draw_bezier_segment(painter, segment)
-
-            # current_raw_points: 직선 (완료되지 않은 경우)
-            if not line_data.is_complete and len(line_data.current_raw_points) >= 2:
-                self._draw_raw_points(painter, line_data.current_raw_points)
-
-        # 2. 내 드로잉 렌더링 (본인 그림 숨김 옵션이 비활성화되어 있을 때만)
+        # 2. 내 드로잉 렌더링 (위젯 좌표, 본인 그림 숨김 옵션이 비활성화되어 있을 때만)
+        # 입력 지연을 줄이기 위해 백그라운드 렌더링 모드에서도 GUI 스레드에서 직접 그림
         if not self.hide_my_drawings:
             if self.my_fitter.is_drawing or len(self.my_fitter.finalized_segments) > 0:
                 # user_colors에서 내 색상 참조 (색상 변경 시 즉시 반영됨)
                 my_color = self.user_colors.get(self.user_id, self.pen_color)
                 # None 체크 (만약 user_colors와 pen_color 모두 None이면 기본값 사용)
                 if my_color is None:
-                    my_color = _get_default_pen_color()
-                pen = QPen(my_color, self.pen_width)
-                pen.setCapStyle(Qt.PenCapStyle.RoundCap)
-                pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-                painter.setPen(pen)
+                    my_color = default_pen_color()
+
+                painter.setPen(self._make_pen(my_color, self.pen_width))
 
                 # finalized_segments: 베지어 곡선
                 for segment in self.my_fitter.finalized_segments:
-                    self._draw_bezier_segment(painter, segment)
+                    painter.drawPath(self._bezier_path(segment))
 
                 # current_raw_points: 직선
                 if len(self.my_fitter.raw_buffer) >= 2:
-                    self._draw_raw_points(painter, self.my_fitter.raw_buffer)
+                    painter.drawPath(self._raw_points_path(self.my_fitter.raw_buffer))
+
+        # 지연 측정: 적용 후 처음 그려진 원격 업데이트들의 paint 시각 기록
+        if self.store.tracer is not None:
+            self.store.tracer.on_paint()
+
+    def _paint_remote_lines(self, painter: QPainter, event: QPaintEvent):
+        """다른 사용자의 드로잉을 GUI 스레드에서 직접 그리기 (dirty rect만)"""
+        # 다시 그릴 영역 (펜 두께만큼 확장해서 라인 바운딩 박스와 비교)
+        margin = self._dirty_margin()
+        dirty_rect = QRectF(event.rect())
+        dirty: Bounds = (
+            dirty_rect.left() - margin,
+            dirty_rect.top() - margin,
+            dirty_rect.right() + margin,
+            dirty_rect.bottom() + margin,
+        )
 
-    def _draw_bezier_segment(self, painter: QPainter, segment: BezierSegment):
-        """베지어 세그먼트를 매끄러운 곡선으로 렌더링"""
-        path = QPainterPath()
+        # 다시 그릴 영역과 겹치는 세그먼트만 공간 인덱스에서 조회 (상대 좌표)
+        visible = self.spatial_index.query_segments(self._to_relative_bounds(dirty))
+
+        # 1. 다른 사용자의 드로잉: 같은 펜 상태(색상+알파, 두께)끼리 묶어서 그룹당 setPen 한 번
+        # 그룹의 세그먼트들을 path 하나로 합치면 Qt raster 엔진이 합쳐진 외곽선 전체를 다각형
+        # 하나로 채우느라 훨씬 느려지므로 drawPath는 세그먼트/raw 구간 단위로 유지합니다.
+        # scripts/bench_render.py (1080p, 라인당 세그먼트 20개, 사용자 4명) 한 프레임:
+        #   라인 50: 세그먼트별 drawPath 14.7ms / 그룹별 path 하나 34.4ms
+        #   라인 500: 세그먼트별 drawPath 97.7ms / 그룹별 path 하나 887.7ms
+        batches = self._batch_remote_lines(visible)
+
+        # 저장된 geometry는 상대 좌표: 변환 하나로 위젯 크기에 맞춤
+        painter.save()
+        painter.setTransform(self._view_transform())
+        for (rgba, width), runs in batches.items():
+            self._draw_batch(painter, QColor.fromRgba(rgba), width, runs)
+        painter.restore()
+
+    def _batch_remote_lines(
+        self, visible: Dict[str, Set[int]]
+    ) -> Dict[Tuple[int, int], List[Tuple[LineData, Set[int]]]]:
+        """다시 그릴 라인들을 펜 상태별로 묶기
 
-        p0 = QPointF(*segment.p0)
-        p1 = QPointF(*segment.p1)
-        p2 = QPointF(*segment.p2)
-        p3 = QPointF(*segment.p3)
+        Args:
+            visible: line_id -> 다시 그릴 영역과 겹치는 세그먼트 인덱스들
 
-        path.moveTo(p0)
-        path.cubicTo(p1, p2, p3)
+        Returns:
+            (알파가 적용된 RGBA, 펜 두께) -> 해당 펜으로 그릴 (LineData, 세그먼트 인덱스들).
+            그룹 순서는 처음 등장한 라인 순서 (remote_lines 순서 = 그리기 순서)
+        """
+        batches: Dict[Tuple[int, int], List[Tuple[LineData, Set[int]]]] = {}
+        for line_id, line_data in self.remote_lines.items():
+            # 다시 그릴 영역과 겹치지 않는 라인은 스킵
+            hit_indices = visible.get(line_id)
+            if hit_indices is None:
+                continue
 
-        painter.drawPath(path)
+            # 본인 그림 숨김 옵션이 활성화되어 있고, 이 라인이 본인 것이면 스킵
+            if self.hide_my_drawings and line_data.user_id == self.user_id:
+                continue
 
-    def _draw_raw_points(self, painter: QPainter, points):
-        """raw 점들을 직선으로 렌더링"""
-        if len(points) < 2:
-            return
+            batches.setdefault(self._pen_key(line_data), []).append((line_data, hit_indices))
+        return batches
+
+    def _pen_key(self, line_data: LineData) -> Tuple[int, int]:
+        """라인을 그릴 펜 상태 (알파가 적용된 RGBA, 펜 두께)
+
+        알파값이 적용되므로 같은 사용자의 같은 페이드 단계 라인들은 같은 그룹이 됩니다.
+        """
+        color = QColor(line_data.color)
+        color.setAlphaF(line_data.alpha)
+        return (color.rgba(), self.pen_width)
+
+    def _draw_batch(
+        self,
+        painter: QPainter,
+        color: QColor,
+        width: float,
+        runs: List[Tuple[LineData, Set[int]]],
+    ):
+        """같은 펜 상태의 라인들 그리기 (상대 좌표 변환이 설정된 painter)
+
+        완성된 라인은 캐시된 polyline으로, 그리는 중인 라인은 베지어 path로 그립니다.
+        같은 색상끼리는 그리는 순서가 결과에 영향을 주지 않으므로 둘을 나눠서 그립니다.
+        """
+        in_progress = []
+
+        # 완성된 라인: 평탄화된 점 사이 꺾임이 매우 작아 bevel 이음으로 충분
+        # (round 이음보다 래스터화 비용이 훨씬 적음)
+        pen = self._make_pen(color, width, Qt.PenJoinStyle.BevelJoin)
+        pen.setCosmetic(True)  # 변환과 무관하게 두께는 픽셀 단위
+        painter.setPen(pen)
+        for line_data, hit_indices in runs:
+            if line_data.is_complete:
+                self._draw_line_polylines(painter, line_data, hit_indices)
+            else:
+                in_progress.append((line_data, hit_indices))
+
+        if in_progress:
+            pen = self._make_pen(color, width)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            for line_data, hit_indices in in_progress:
+                self._draw_line_paths(painter, line_data, hit_indices)
+
+    def _draw_line_paths(self, painter: QPainter, line_data: LineData, hit_indices: Set[int]):
+        """세그먼트마다 베지어 path로 그리기 (Qt가 매 프레임 곡선을 평탄화)"""
+        # finalized_segments: 베지어 곡선 (영역 밖 세그먼트는 스킵)
+        segments = line_data.finalized_segments
+        for index in sorted(hit_indices):
+            if index != RAW_RUN_INDEX:
+                painter.drawPath(self._bezier_path(segments[index]))
+
+        # current_raw_points: 직선 (완료되지 않은 경우)
+        if (
+            RAW_RUN_INDEX in hit_indices
+            and not line_data.is_complete
+            and len(line_data.current_raw_points) >= 2
+        ):
+            painter.drawPath(self._raw_points_path(line_data.current_raw_points))
+
+    def _draw_line_polylines(self, painter: QPainter, line_data: LineData, hit_indices: Set[int]):
+        """캐시된 polyline으로 그리기 (영역과 겹치는 세그먼트를 포함한 구간만)"""
+        for first, last, polygon in self._line_polylines(line_data):
+            if any(first <= index <= last for index in hit_indices):
+                painter.drawPolyline(polygon)
+
+    def _polyline_scale_key(self) -> Tuple[int, int, float]:
+        """polyline 캐시 키 (위젯 크기 + 디바이스 픽셀 비율)"""
+        return (self.width(), self.height(), self.devicePixelRatioF())
+
+    def _line_polylines(self, line_data: LineData) -> List[PolylineRun]:
+        """완성된 라인의 평탄화된 polyline 구간들 (스케일이 바뀔 때만 다시 계산)
+
+        이어진 세그먼트들은 하나의 polyline으로 합쳐지고, 끊긴 곳에서 새 구간이 시작됩니다.
+        점들은 상대 좌표이며 paintEvent의 변환으로 그려집니다.
+        """
+        key = self._polyline_scale_key()
+        runs = line_data.polyline_cache.get(key)
+        if runs is not None:
+            return runs
+
+        # 상대 좌표 → 디바이스 픽셀 배율 (이 좌표계에서 허용 오차를 잼)
+        dpr = key[2]
+        scale_x = (key[0] or 1) * dpr
+        scale_y = (key[1] or 1) * dpr
+
+        runs = []
+        polygon: Optional[QPolygonF] = None
+        first = 0
+        last_point: Optional[Tuple[float, float]] = None
+        for index, segment in enumerate(line_data.finalized_segments):
+            points = segment.flatten(scale_x, scale_y, POLYLINE_TOLERANCE)
+            connected = (
+                last_point is not None
+                and abs(points[0][0] - last_point[0]) * scale_x < POLYLINE_TOLERANCE
+                and abs(points[0][1] - last_point[1]) * scale_y < POLYLINE_TOLERANCE
+            )
+            if connected:
+                points = points[1:]
+            else:
+                if polygon is not None:
+                    runs.append((first, index - 1, polygon))
+                polygon = QPolygonF()
+                first = index
+            for x, y in points:
+                polygon.append(QPointF(x, y))
+            last_point = points[-1]
+        if polygon is not None:
+            runs.append((first, len(line_data.finalized_segments) - 1, polygon))
+
+        # 스케일이 다른 뷰 두 개까지만 유지 (크기 변경 시 오래된 캐시 제거)
+        if len(line_data.polyline_cache) >= 2:
+            line_data.polyline_cache.clear()
+        line_data.polyline_cache[key] = runs
+        return runs
+
+    def _make_pen(
+        self,
+        color: QColor,
+        width: float,
+        join_style: Qt.PenJoinStyle = Qt.PenJoinStyle.RoundJoin,
+    ) -> QPen:
+        """둥근 끝 펜 생성 (이음은 기본적으로 둥글게)"""
+        return make_pen(color, width, join_style)
 
-        path = QPainterPath()
-        path.moveTo(QPointF(*points[0]))
+    def _bezier_path(self, segment: BezierSegment) -> QPainterPath:
+        """베지어 세그먼트를 매끄러운 곡선 path로 변환"""
+        return bezier_path(segment)
 
-        for point in points[1:]:
-            path.lineTo(QPointF(*point))
+    def _raw_points_path(self, points) -> QPainterPath:
+        """raw 점들을 직선 path로 변환"""
+        return raw_points_path(points)
 
-        painter.drawPath(path)
+    def set_network_interval(self, interval_ms: int, raw_point_stride: int = 1):
+        """업데이트 전송 간격 / raw 점 솎기 간격 변경 (그리는 중이면 바로 적용)
+
+        Args:
+            interval_ms: 전송 간격 (ms)
+            raw_point_stride: raw 점을 몇 개마다 하나씩 보낼지 (1이면 모두)
+        """
+        self.network_interval = interval_ms
+        self.raw_point_stride = max(1, raw_point_stride)
+        if self.network_timer.isActive():
+            self.network_timer.setInterval(interval_ms)
 
     def _send_network_update(self):
         """네트워크 업데이트 전송 (Delta Update) - 상대 좌표로 변환"""
@@ -341,8 +748,17 @@ class DrawingCanvas(QWidget):
             rel_seg = seg.to_relative(width, height)
             rel_segments.append(rel_seg.to_dict())
 
-        # current_raw_points를 상대 좌표로 변환
-        rel_raw_points = [self._to_relative_point(x, y) for x, y in packet["current_raw_points"]]
+        # current_raw_points를 상대 좌표로 변환 (혼잡할 때는 솎되 처음/마지막 점은 유지)
+        raw_points = packet["current_raw_points"]
+        if self.raw_point_stride > 1 and len(raw_points) > 2:
+            raw_points = raw_points[: -1 : self.raw_point_stride] + raw_points[-1:]
+        rel_raw_points = [self._to_relative_point(x, y) for x, y in raw_points]
+
+        # 지연 측정 중이면 입력/송신 시각 기록
+        trace = None
+        if self.store.tracer is not None and self._trace_input is not None:
+            trace = self.store.tracer.outgoing_trace(self._trace_input)
+        self._trace_input = None
 
         # 메시지 생성 (상대 좌표)
         msg = DrawingUpdateMessage(
@@ -350,78 +766,53 @@ class DrawingCanvas(QWidget):
             user_id=self.user_id,
             new_finalized_segments=rel_segments,
             current_raw_points=rel_raw_points,
+            sent_at=time.time(),  # 수신 측 지터 버퍼가 송신 간격대로 재생
+            trace=trace,
         )
 
         # 시그널 emit
         self.drawing_updated.emit(self.my_line_id, self.user_id, msg.to_dict())
 
-    def _update_animations(self):
-        """페이드아웃 애니메이션 업데이트 (60fps)"""
-        current_time = time.time()
-        lines_to_delete = []
+    def _update_animations(self, current_time: Optional[float] = None) -> Optional[float]:
+        """페이드아웃 애니메이션 업데이트 (store에 위임)"""
+        return self.store.update_animations(current_time)
 
-        for line_id, line_data in self.remote_lines.items():
-            # 1. 타임아웃 체크 (마지막 업데이트로부터 10초)
-            time_since_last_update = current_time - line_data.last_update_time
-            if time_since_last_update >= self.timeout_duration:
-                # 타임아웃 - 강제 삭제
-                lines_to_delete.append(line_id)
-                self.deleted_line_ids.add(line_id)
-                continue
+    def _remove_line(self, line_id: str) -> Optional[LineData]:
+        """store에서 라인을 제거 (해당 영역은 store 알림으로 갱신)
 
-            # 2. 페이드아웃 계산 (drawing_end 이후)
-            if line_data.end_time is not None:
-                elapsed_since_end = current_time - line_data.end_time
-
-                if elapsed_since_end < self.fade_hold_duration:
-                    # 유지 단계 (초기 alpha 유지)
-                    line_data.alpha = line_data.initial_alpha
-                elif elapsed_since_end < self.fade_hold_duration + self.fade_duration:
-                    # 페이드아웃 단계 (초기 alpha → 0.0)
-                    fade_progress = (
-                        elapsed_since_end - self.fade_hold_duration
-                    ) / self.fade_duration
-                    line_data.alpha = max(0.0, line_data.initial_alpha * (1.0 - fade_progress))
-                else:
-                    # 완전히 사라짐 - 삭제
-                    line_data.alpha = 0.0
-                    lines_to_delete.append(line_id)
-                    self.deleted_line_ids.add(line_id)
-
-        # 삭제할 라인 제거
-        for line_id in lines_to_delete:
-            del self.remote_lines[line_id]
-
-        # 변경사항이 있으면 화면 갱신
-        if lines_to_delete or any(
-            line_data.alpha < 1.0 for line_data in self.remote_lines.values()
-        ):
-            self.update()
+        Returns:
+            제거된 LineData (없으면 None)
+        """
+        return self.store.remove_line(line_id)
+
+    def lines_in_region(self, bounds: Bounds) -> List[str]:
+        """영역과 겹치는 라인 ID 목록 (렌더링 순서 유지)
+
+        Args:
+            bounds: 질의 영역 (min_x, min_y, max_x, max_y), 위젯 좌표
+
+        Returns:
+            겹치는 line_id 리스트
+        """
+        return self.store.lines_in_region(self._to_relative_bounds(bounds))
 
     def _save_my_drawing(self):
-        """내 드로잉을 remote_lines에 저장 (렌더링 유지용)"""
+        """내 드로잉을 store에 저장 (렌더링 유지용, 상대 좌표로 변환)"""
         if not self.my_line_id:
             return
 
-        # LineData 생성 (초기 alpha 값 적용)
         # user_colors에서 현재 색상을 가져와야 함 (그리는 동안 사용한 색상과 동일)
         my_color = self.user_colors.get(self.user_id, self.pen_color)
-        line_data = LineData(
+        width = self.width() or 1
+        height = self.height() or 1
+        self.store.add_completed_line(
             line_id=self.my_line_id,
             user_id=self.user_id,
             color=my_color,
-            finalized_segments=self.my_fitter.finalized_segments.copy(),
-            current_raw_points=[],
-            is_complete=True,
+            segments=[seg.to_relative(width, height) for seg in self.my_fitter.finalized_segments],
             alpha=self.pen_alpha,  # 초기 alpha 값 적용
-            initial_alpha=self.pen_alpha,  # 초기 alpha 값 저장
         )
 
-        # 페이드아웃 시작을 위해 end_time 설정
-        line_data.finalize()
-
-        self.remote_lines[self.my_line_id] = line_data
-
         # my_fitter 초기화
         self.my_fitter.clear()
 
@@ -435,16 +826,19 @@ class DrawingCanvas(QWidget):
             lid for lid, ldata in self.remote_lines.items() if ldata.user_id == self.user_id
         ]
         for line_id in my_lines:
-            del self.remote_lines[line_id]
+            self._remove_line(line_id)
 
-        self.update()
+        # 그리는 중이던 raw 점 영역도 갱신
+        self._invalidate(self._my_raw_bounds)
+        self._my_raw_bounds = None
 
     def clear_all_drawings(self):
         """모든 드로잉 초기화"""
         self.my_fitter.clear()
         self.my_line_id = None
-        self.remote_lines.clear()
-        self.update()
+        self._my_raw_bounds = None
+        self.store.clear()
+        self.update()  # store가 비어 있어도 내 드로잉 영역은 갱신
 
     def set_pen_color(self, color: QColor):
         """펜 색상 변경 (신규 곡선에만 적용)"""
@@ -455,6 +849,7 @@ class DrawingCanvas(QWidget):
     def set_pen_width(self, width: int):
         """펜 두께 변경"""
         self.pen_width = width
+        self._invalidate_all()
         self.update()
 
     def set_pen_alpha(self, alpha: float):
@@ -469,9 +864,10 @@ class DrawingCanvas(QWidget):
             hide: True이면 본인 그림 숨김, False이면 표시
         """
         self.hide_my_drawings = hide
-        self.update()  # 화면 갱신
+        self._invalidate_all()
+        self.update()  # 화면 갱신 (내 드로잉)
 
-    # === 수신 메시지 처리 ===
+    # === 수신 메시지 처리 (store에 위임) ===
 
     def handle_drawing_start(self, line_id: str, user_id: str, data: Dict[str, Any]):
         """
@@ -482,31 +878,7 @@ class DrawingCanvas(QWidget):
             user_id: 사용자 ID
             data: 시작 데이터 (start_point 등) - start_point는 상대 좌표
         """
-        # 삭제된 라인 무시
-        if line_id in self.deleted_line_ids:
-            return
-
-        # 사용자별 색상 가져오기 (없으면 기본값)
-        color = self.user_colors.get(user_id, _get_default_pen_color())
-
-        # 사용자별 알파값 가져오기 (없으면 1.0)
-        user_alpha = self.user_alphas.get(user_id, 1.0)
-
-        # 상대 좌표 start_point (참고용, LineData 생성에는 사용하지 않음)
-        # start_point = data.get("start_point")  # 필요 시 사용
-
-        # LineData 생성 (사용자의 알파값 적용)
-        line_data = LineData(
-            line_id=line_id,
-            user_id=user_id,
-            color=color,
-            alpha=user_alpha,
-            initial_alpha=user_alpha,
-        )
-
-        self.remote_lines[line_id] = line_data
-
-        self.update()
+        self.store.handle_drawing_start(line_id, user_id, data)
 
     def handle_drawing_update(self, line_id: str, user_id: str, data: Dict[str, Any]):
         """
@@ -515,47 +887,10 @@ class DrawingCanvas(QWidget):
         Args:
             line_id: 라인 ID
             user_id: 사용자 ID
-            data: 업데이트 데이터 (new_finalized_segments, current_raw_points) - 상대 좌표
+            data: 업데이트 데이터 (new_finalized_segments, current_raw_points) - 상대 좌표,
+                sent_at이 있으면 store의 지터 버퍼를 거쳐 송신 간격대로 보간 재생
         """
-        # 삭제된 라인 무시
-        if line_id in self.deleted_line_ids:
-            return
-
-        # LineData 가져오기 (없으면 생성)
-        if line_id not in self.remote_lines:
-            color = self.user_colors.get(user_id, QColor(255, 0, 0))
-            user_alpha = self.user_alphas.get(user_id, 1.0)
-            self.remote_lines[line_id] = LineData(
-                line_id=line_id,
-                user_id=user_id,
-                color=color,
-                alpha=user_alpha,
-                initial_alpha=user_alpha,
-            )
-
-        line_data = self.remote_lines[line_id]
-
-        # 상대 좌표를 절대 좌표로 변환
-        width = self.width()
-        height = self.height()
-
-        # 새로운 finalized segments 추가 (상대 좌표 → 절대 좌표)
-        if "new_finalized_segments" in data:
-            new_segments = []
-            for seg_dict in data["new_finalized_segments"]:
-                rel_segment = BezierSegment.from_dict(seg_dict)
-                abs_segment = rel_segment.to_absolute(width, height)
-                new_segments.append(abs_segment)
-            line_data.add_finalized_segments(new_segments)
-
-        # current raw points 업데이트 (상대 좌표 → 절대 좌표)
-        if "current_raw_points" in data:
-            abs_raw_points = [
-                self._to_absolute_point(rel_x, rel_y) for rel_x, rel_y in data["current_raw_points"]
-            ]
-            line_data.update_raw_points(abs_raw_points)
-
-        self.update()
+        self.store.handle_drawing_update(line_id, user_id, data)
 
     def handle_drawing_end(self, line_id: str, user_id: str):
         """
@@ -565,13 +900,7 @@ class DrawingCanvas(QWidget):
             line_id: 라인 ID
             user_id: 사용자 ID
         """
-        # 삭제된 라인 무시
-        if line_id in self.deleted_line_ids:
-            return
-
-        if line_id in self.remote_lines:
-            self.remote_lines[line_id].finalize()
-            self.update()
+        self.store.handle_drawing_end(line_id, user_id)
 
     def handle_line_remove(self, line_id: str):
         """
@@ -580,9 +909,7 @@ class DrawingCanvas(QWidget):
         Args:
             line_id: 제거할 라인 ID
         """
-        if line_id in self.remote_lines:
-            del self.remote_lines[line_id]
-            self.update()
+        self.store.remove_line(line_id)
 
     def remove_user_lines(self, user_id: str):
         """
@@ -591,13 +918,5 @@ class DrawingCanvas(QWidget):
         Args:
             user_id: 사용자 ID
         """
-        lines_to_remove = [
-            lid for lid, ldata in self.remote_lines.items() if ldata.user_id == user_id
-        ]
-        for line_id in lines_to_remove:
-            del self.remote_lines[line_id]
-
-        if user_id in self.user_colors:
-            del self.user_colors[user_id]
-
-        self.update()
+        self.store.remove_user_lines(user_id)
+        self.user_colors.pop(user_id, None)
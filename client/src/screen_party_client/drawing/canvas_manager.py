@@ -1,26 +1,36 @@
 """Canvas manager - handles dual-canvas synchronization"""
 
-from typing import Optional, Dict, Any
+import logging
+from typing import Optional, Dict, Any, List
 from PyQt6.QtGui import QColor
+from screen_party_common import MessageType
 
 from .canvas import DrawingCanvas
+from .stroke_store import StrokeStore
+
+logger = logging.getLogger(__name__)
 
 
 class CanvasManager:
     """Manages main canvas and overlay canvas synchronization
 
-    This class eliminates the need for scattered dual-canvas update logic
-    by providing a single place to update both canvases.
+    Both canvases are views over a single shared StrokeStore, so every remote
+    message is decoded and stored once, and one animation scheduler drives the
+    fade-out for all views. Each canvas only maps the store's relative
+    coordinates to its own size at paint time.
     """
 
     def __init__(self, main_canvas: DrawingCanvas):
         """Initialize canvas manager
 
         Args:
-            main_canvas: The main drawing canvas
+            main_canvas: The main drawing canvas (its store becomes the shared store)
         """
         self.main_canvas = main_canvas
+        self.store: StrokeStore = main_canvas.store
         self.overlay_canvas: Optional[DrawingCanvas] = None
+        self.network_interval = main_canvas.network_interval
+        self.raw_point_stride = main_canvas.raw_point_stride
 
     def set_overlay_canvas(self, canvas: Optional[DrawingCanvas]):
         """Set overlay canvas
@@ -30,10 +40,10 @@ class CanvasManager:
         """
         self.overlay_canvas = canvas
 
-        # Sync user_colors and user_alphas to overlay
-        if canvas and self.main_canvas:
-            canvas.user_colors = self.main_canvas.user_colors.copy()
-            canvas.user_alphas = self.main_canvas.user_alphas.copy()
+        # Attach overlay to the shared store (user colors/alphas come with it)
+        if canvas is not None:
+            canvas.set_store(self.store)
+            canvas.set_network_interval(self.network_interval, self.raw_point_stride)
 
     def get_canvases(self) -> list[DrawingCanvas]:
         """Get list of active canvases
@@ -49,90 +59,126 @@ class CanvasManager:
     # === Participant Management ===
 
     def add_participant(self, user_id: str, color: QColor, alpha: float = 1.0):
-        """Add participant to all canvases
+        """Add participant to the shared store
 
         Args:
             user_id: User ID
             color: User color
             alpha: User alpha (0.0 - 1.0)
         """
-        for canvas in self.get_canvases():
-            canvas.user_colors[user_id] = color
-            canvas.user_alphas[user_id] = alpha
+        self.store.set_user_color(user_id, color)
+        self.store.set_user_alpha(user_id, alpha)
 
     def remove_participant(self, user_id: str):
-        """Remove participant from all canvases
+        """Remove participant from the shared store
 
         Args:
             user_id: User ID
         """
-        for canvas in self.get_canvases():
-            if user_id in canvas.user_colors:
-                del canvas.user_colors[user_id]
-            if user_id in canvas.user_alphas:
-                del canvas.user_alphas[user_id]
+        self.store.remove_user(user_id)
 
     def update_participant_color(self, user_id: str, color: QColor):
-        """Update participant color in all canvases
+        """Update participant color in the shared store
 
         Args:
             user_id: User ID
             color: New color
         """
-        for canvas in self.get_canvases():
-            canvas.user_colors[user_id] = color
+        self.store.set_user_color(user_id, color)
 
     def update_participant_alpha(self, user_id: str, alpha: float):
-        """Update participant alpha in all canvases
+        """Update participant alpha in the shared store
 
         Args:
             user_id: User ID
             alpha: New alpha (0.0 - 1.0)
         """
-        for canvas in self.get_canvases():
-            canvas.user_alphas[user_id] = max(0.0, min(1.0, alpha))
+        self.store.set_user_alpha(user_id, alpha)
 
     # === Drawing Events ===
 
     def handle_drawing_start(self, line_id: str, user_id: str, message: Dict[str, Any]):
-        """Handle drawing start on all canvases
+        """Handle drawing start once in the shared store
 
         Args:
             line_id: Line ID
             user_id: User ID
             message: Drawing start message
         """
-        for canvas in self.get_canvases():
-            canvas.handle_drawing_start(line_id, user_id, message)
+        self.store.handle_drawing_start(line_id, user_id, message)
 
     def handle_drawing_update(self, line_id: str, user_id: str, message: Dict[str, Any]):
-        """Handle drawing update on all canvases
+        """Handle drawing update once in the shared store
 
         Args:
             line_id: Line ID
             user_id: User ID
             message: Drawing update message
         """
-        for canvas in self.get_canvases():
-            canvas.handle_drawing_update(line_id, user_id, message)
+        self.store.handle_drawing_update(line_id, user_id, message)
 
     def handle_drawing_end(self, line_id: str, user_id: str):
-        """Handle drawing end on all canvases
+        """Handle drawing end once in the shared store
 
         Args:
             line_id: Line ID
             user_id: User ID
         """
-        for canvas in self.get_canvases():
-            canvas.handle_drawing_end(line_id, user_id)
+        self.store.handle_drawing_end(line_id, user_id)
+
+    def handle_drawing_batch(self, messages: List[Dict[str, Any]]):
+        """Apply a batch of drawing messages in order, coalescing store notifications
+
+        Every stroke touched by the batch is invalidated once, so a burst of
+        updates from many drawers costs a single repaint per canvas. Each
+        message is applied on its own, so a malformed one is logged and
+        skipped without dropping the rest of the batch (this runs from a
+        timer slot, where an exception would abort the process).
+
+        Args:
+            messages: drawing_start / drawing_update / drawing_end messages
+        """
+        with self.store.batched_notifications():
+            for message in messages:
+                try:
+                    self._apply_drawing_message(message)
+                except Exception as e:
+                    logger.error(f"Error applying drawing message: {e}")
+
+    def _apply_drawing_message(self, message: Dict[str, Any]):
+        """Apply one drawing message to the shared store"""
+        msg_type = message.get("type")
+        line_id = message["line_id"]
+        user_id = message["user_id"]
+        if msg_type == MessageType.DRAWING_START.value:
+            self.store.handle_drawing_start(line_id, user_id, message)
+        elif msg_type == MessageType.DRAWING_UPDATE.value:
+            self.store.handle_drawing_update(line_id, user_id, message)
+        elif msg_type == MessageType.DRAWING_END.value:
+            self.store.handle_drawing_end(line_id, user_id)
 
     # === Canvas Operations ===
 
     def clear_all_drawings(self):
-        """Clear all drawings on overlay canvas only"""
+        """Clear all drawings (shared store + overlay's in-progress line)
+
+        Only acts while an overlay exists, matching the overlay-only clear button.
+        """
         if self.overlay_canvas:
             self.overlay_canvas.clear_all_drawings()
 
+    def set_network_interval(self, interval_ms: int, raw_point_stride: int = 1):
+        """Set the drawing update send interval on all canvases
+
+        Args:
+            interval_ms: Send interval in ms
+            raw_point_stride: Send every Nth raw point (1 = all)
+        """
+        self.network_interval = interval_ms
+        self.raw_point_stride = raw_point_stride
+        for canvas in self.get_canvases():
+            canvas.set_network_interval(interval_ms, raw_point_stride)
+
     def set_user_id(self, user_id: str):
         """Set user ID on all canvases
 
@@ -0,0 +1,357 @@
+"""
+원격 스트로크 지터 버퍼 (보간 재생)
+
+송신 측은 50ms마다 묶어서 업데이트를 보내므로, 받은 즉시 적용하면
+다른 참가자의 화면에서는 스트로크가 계단식으로 전진하고 네트워크 지터만큼 더 흔들립니다.
+
+이 모듈은 업데이트를 송신 시각(sent_at) 기준으로 재생합니다.
+- 패킷 k가 담고 있는 잉크는 송신 측에서 (sent_{k-1}, sent_k] 동안 그려진 것이므로
+  수신 측에서는 [sent_{k-1} + 지연, sent_k + 지연] 동안 조금씩 드러냅니다 (보간).
+- 지연(playout delay)은 송신자별로 측정한 최소 전송 시간 + 버퍼 깊이이며,
+  버퍼 깊이는 송신 간격 + 도착 간격 지터(RFC 3550 방식 추정)에 맞춰 조절됩니다.
+
+송신 시각은 송신자의 시계 기준이지만 같은 송신자의 차이만 사용하므로
+시계 동기화가 필요 없습니다. sent_at이 없는 업데이트는 즉시 적용됩니다.
+"""
+
+import math
+import time
+from collections import deque
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import Any, Callable, ContextManager, Deque, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject
+
+from .animation_scheduler import AnimationScheduler
+from .bezier_fitter import BezierSegment
+
+Point = Tuple[float, float]
+
+# 보간 재생용 곡선 평탄화 허용 오차 (상대 좌표, 1920px 화면에서 약 1px)
+PLAYBACK_TOLERANCE = 0.0005
+
+
+class JitterEstimator:
+    """송신자 하나의 전송 시간/지터/송신 간격 추정
+
+    - 최소 전송 시간: 최근 window개 패킷의 (도착 시각 - 송신 시각) 최솟값
+      (두 시계의 차이 + 네트워크 최소 지연)
+    - 지터: 연속 패킷의 전송 시간 차이의 지수 이동 평균 (RFC 3550, 이득 1/16)
+    - 송신 간격: 송신 시각 차이의 지수 이동 평균 (이득 1/8)
+    """
+
+    def __init__(
+        self,
+        default_interval: float = 0.05,
+        jitter_factor: float = 3.0,
+        min_depth: float = 0.0,
+        max_depth: float = 0.3,
+        window: int = 64,
+    ):
+        """
+        Args:
+            default_interval: 송신 간격 초기값 (초, 첫 패킷들용)
+            jitter_factor: 버퍼 깊이에 더할 지터 배수
+            min_depth: 최소 버퍼 깊이 (초)
+            max_depth: 최대 버퍼 깊이 (초, 지연 상한)
+            window: 최소 전송 시간을 구할 최근 패킷 수
+        """
+        self.interval = default_interval
+        self.jitter = 0.0
+        self.jitter_factor = jitter_factor
+        self.min_depth = min_depth
+        self.max_depth = max_depth
+        self._transits: Deque[float] = deque(maxlen=window)
+        self._last_transit: Optional[float] = None
+        self._last_sent_at: Optional[float] = None
+
+    def observe(self, sent_at: float, arrival: float):
+        """패킷 도착 기록
+
+        Args:
+            sent_at: 송신 시각 (송신자 시계)
+            arrival: 도착 시각 (수신자 시계)
+        """
+        transit = arrival - sent_at
+        if self._last_transit is not None:
+            self.jitter += (abs(transit - self._last_transit) - self.jitter) / 16.0
+        self._last_transit = transit
+        self._transits.append(transit)
+
+        if self._last_sent_at is not None:
+            gap = sent_at - self._last_sent_at
+            if 0.0 < gap < 1.0:  # 획 사이의 휴지 기간은 송신 간격이 아님
+                self.interval += (gap - self.interval) / 8.0
+        self._last_sent_at = sent_at
+
+    @property
+    def depth(self) -> float:
+        """버퍼 깊이 (초): 송신 간격 한 번 + 지터 여유"""
+        depth = self.interval + self.jitter_factor * self.jitter
+        return max(self.min_depth, min(self.max_depth, depth))
+
+    def playout_offset(self) -> float:
+        """송신 시각에 더할 재생 지연 (송신자 시계 → 수신자 시계)"""
+        base = min(self._transits) if self._transits else 0.0
+        return base + self.depth
+
+
+@dataclass
+class _Packet:
+    """재생 대기 중인 업데이트 (end이면 drawing_end)"""
+
+    due: float  # 완전히 적용할 시각 (수신자 시계)
+    start: float  # 보간을 시작할 시각
+    data: Optional[Dict[str, Any]] = None
+    # 보간용 새 잉크 (패킷이 재생 대상이 될 때 계산)
+    ink: Optional[List[Point]] = None
+
+
+@dataclass
+class _LinePlayback:
+    """라인 하나의 재생 상태"""
+
+    user_id: str
+    packets: Deque[_Packet] = field(default_factory=deque)
+    # 현재 화면에 반영된 상태 (적용이 끝난 패킷 기준)
+    raw_points: List[Point] = field(default_factory=list)
+    pen: Optional[Point] = None  # 마지막으로 그려진 점
+    last_due: Optional[float] = None
+
+
+class JitterBuffer(QObject):
+    """
+    원격 라인별 지터 버퍼
+
+    업데이트를 송신 시각 + 재생 지연에 맞춰 apply_update로 전달하고,
+    그 사이에는 새 잉크를 현재 raw 점 뒤에 조금씩 이어 붙여 전달합니다.
+    (apply_update에는 일반 drawing_update와 같은 형식의 데이터가 전달됨)
+    """
+
+    def __init__(
+        self,
+        apply_update: Callable[[str, str, Dict[str, Any]], None],
+        apply_end: Callable[[str, str], None],
+        clock: Callable[[], float] = time.time,
+        frame_interval: int = 16,
+        batch: Callable[[], ContextManager[Any]] = nullcontext,
+        parent: Optional[QObject] = None,
+    ):
+        """
+        Args:
+            apply_update: 업데이트 적용 콜백 (line_id, user_id, data)
+            apply_end: drawing_end 적용 콜백 (line_id, user_id)
+            clock: 현재 시각 함수 (AnimationScheduler와 같은 time.time 기준)
+            frame_interval: 보간 중 틱 간격 (ms)
+            batch: 틱 하나의 적용을 감쌀 컨텍스트 매니저 팩토리 (변경 알림 묶음용)
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+        self._apply_update = apply_update
+        self._apply_end = apply_end
+        self._clock = clock
+        self._batch = batch
+        self.estimators: Dict[str, JitterEstimator] = {}
+        self._lines: Dict[str, _LinePlayback] = {}
+        self.scheduler = AnimationScheduler(self._tick, frame_interval=frame_interval, parent=self)
+
+    def __contains__(self, line_id: str) -> bool:
+        return line_id in self._lines and bool(self._lines[line_id].packets)
+
+    def estimator(self, user_id: str) -> JitterEstimator:
+        """송신자별 추정기 (없으면 생성)"""
+        estimator = self.estimators.get(user_id)
+        if estimator is None:
+            estimator = self.estimators[user_id] = JitterEstimator()
+        return estimator
+
+    # === 입력 ===
+
+    def start(self, line_id: str, user_id: str, start_point: Optional[Point] = None):
+        """라인 재생 상태 생성 (시작 점은 첫 잉크의 기준점)"""
+        playback = _LinePlayback(user_id=user_id)
+        if start_point is not None:
+            playback.pen = (start_point[0], start_point[1])
+        self._lines[line_id] = playback
+
+    def push(self, line_id: str, user_id: str, sent_at: float, data: Dict[str, Any]):
+        """업데이트를 재생 대기열에 추가
+
+        Args:
+            line_id: 라인 ID
+            user_id: 송신자 ID
+            sent_at: 송신 시각 (송신자 시계)
+            data: drawing_update 데이터
+
+        Raises:
+            ValueError: 송신 시각, 세그먼트, 점의 형식이 잘못됨 (대기열에 넣지 않음)
+        """
+        # 재생은 타이머 슬롯에서 일어나므로 형식 오류는 여기(수신 경로)에서 걸러 냄
+        if isinstance(sent_at, bool) or not isinstance(sent_at, (int, float)):
+            raise ValueError(f"Invalid sent_at: {sent_at!r}")
+        _validate_update(data)
+        now = self._clock()
+        estimator = self.estimator(user_id)
+        estimator.observe(sent_at, now)
+
+        playback = self._lines.get(line_id)
+        if playback is None:
+            playback = self._lines[line_id] = _LinePlayback(user_id=user_id)
+
+        # 라인 안에서는 재생 순서 유지 (지연이 줄어도 앞 패킷을 앞지르지 않음)
+        due = sent_at + estimator.playout_offset()
+        if playback.last_due is not None:
+            due = max(due, playback.last_due)
+        start = playback.last_due if playback.last_due is not None else due - estimator.interval
+        playback.last_due = due
+        playback.packets.append(_Packet(due=due, start=start, data=data))
+        self._tick_soon(now)
+
+    def end(self, line_id: str, user_id: str) -> bool:
+        """drawing_end를 대기 중인 업데이트 뒤에 예약
+
+        Returns:
+            예약했으면 True, 대기 중인 업데이트가 없으면 False (호출자가 즉시 적용)
+        """
+        playback = self._lines.get(line_id)
+        if playback is None or not playback.packets:
+            self._lines.pop(line_id, None)
+            return False
+        playback.packets.append(_Packet(due=playback.last_due, start=playback.last_due))
+        return True
+
+    def discard(self, line_id: str):
+        """라인의 대기 중인 업데이트 버리기 (라인 삭제 시)"""
+        self._lines.pop(line_id, None)
+
+    def forget_sender(self, user_id: str):
+        """송신자의 추정기 제거 (참여자가 나갔을 때, 다시 오면 처음부터 추정)"""
+        self.estimators.pop(user_id, None)
+
+    def clear(self):
+        """모든 대기 중인 업데이트와 송신자별 추정기 버리기"""
+        self._lines.clear()
+        self.estimators.clear()
+        self.scheduler.stop()
+
+    # === 재생 ===
+
+    def _tick_soon(self, now: float):
+        """다음 틱 예약 (가장 이른 보간 시작/적용 시각)"""
+        deadline = self._next_deadline(now)
+        if deadline is not None:
+            self.scheduler.request_at(deadline)
+
+    def _next_deadline(self, now: float) -> Optional[float]:
+        deadline = None
+        for playback in self._lines.values():
+            if playback.packets:
+                head = playback.packets[0]
+                # 보간 중이면 다음 프레임, 아니면 보간 시작 시각
+                line_deadline = now if head.start <= now else head.start
+                if deadline is None or line_deadline < deadline:
+                    deadline = line_deadline
+        return deadline
+
+    def _tick(self, now: float) -> Optional[float]:
+        """재생 진행: 적용할 시각이 된 패킷 적용, 나머지는 보간
+
+        Args:
+            now: 현재 시각
+
+        Returns:
+            다음 데드라인 (AnimationScheduler 규약)
+        """
+        finished = []
+        with self._batch():
+            for line_id, playback in self._lines.items():
+                while playback.packets and playback.packets[0].due <= now:
+                    packet = playback.packets.popleft()
+                    if packet.data is None:
+                        self._apply_end(line_id, playback.user_id)
+                        finished.append(line_id)
+                        break
+                    self._commit(line_id, playback, packet.data)
+
+                if playback.packets and playback.packets[0].data is not None:
+                    head = playback.packets[0]
+                    if head.start <= now:
+                        self._interpolate(line_id, playback, head, now)
+
+        for line_id in finished:
+            self._lines.pop(line_id, None)
+        return self._next_deadline(now)
+
+    def _commit(self, line_id: str, playback: _LinePlayback, data: Dict[str, Any]):
+        """패킷을 그대로 적용하고 화면 상태 갱신"""
+        self._apply_update(line_id, playback.user_id, data)
+        raw_points = [(x, y) for x, y in data.get("current_raw_points", ())]
+        playback.raw_points = raw_points
+        if raw_points:
+            playback.pen = raw_points[-1]
+        elif data.get("new_finalized_segments"):
+            playback.pen = tuple(data["new_finalized_segments"][-1]["p3"])
+
+    def _interpolate(self, line_id: str, playback: _LinePlayback, packet: _Packet, now: float):
+        """패킷의 새 잉크 중 진행률만큼을 현재 raw 점 뒤에 이어서 적용"""
+        if packet.ink is None:
+            packet.ink = _new_ink(packet.data, playback.pen)
+        if not packet.ink:
+            return
+
+        span = packet.due - packet.start
+        progress = 1.0 if span <= 0 else (now - packet.start) / span
+        count = min(len(packet.ink), math.floor(progress * len(packet.ink)))
+        if count <= 0:
+            return
+
+        base = playback.raw_points or ([playback.pen] if playback.pen is not None else [])
+        self._apply_update(
+            line_id, playback.user_id, {"current_raw_points": base + packet.ink[:count]}
+        )
+
+
+def _validate_point(value: Any):
+    """(x, y) 숫자 쌍인지 검사"""
+    if (
+        not isinstance(value, (list, tuple))
+        or len(value) != 2
+        or any(isinstance(v, bool) or not isinstance(v, (int, float)) for v in value)
+    ):
+        raise ValueError(f"Invalid point: {value!r}")
+
+
+def _validate_update(data: Dict[str, Any]):
+    """drawing_update의 세그먼트/raw 점 형식 검사 (재생할 때 예외가 나지 않도록)"""
+    segments = data.get("new_finalized_segments", ())
+    points = data.get("current_raw_points", ())
+    if not isinstance(segments, (list, tuple)) or not isinstance(points, (list, tuple)):
+        raise ValueError("Invalid drawing update")
+    for seg_dict in segments:
+        if not isinstance(seg_dict, dict):
+            raise ValueError(f"Invalid segment: {seg_dict!r}")
+        for key in ("p0", "p1", "p2", "p3"):
+            _validate_point(seg_dict.get(key))
+    for point in points:
+        _validate_point(point)
+
+
+def _new_ink(data: Dict[str, Any], pen: Optional[Point]) -> List[Point]:
+    """패킷이 그리는 전체 경로 중 현재 펜 위치 이후 부분 (보간용 점들)
+
+    새 세그먼트들은 이전 raw 점들을 포함해서 다시 피팅한 것이므로,
+    평탄화한 경로에서 현재 펜 위치와 가장 가까운 점 이후가 새로 그려진 잉크입니다.
+    """
+    path: List[Point] = []
+    for seg_dict in data.get("new_finalized_segments", ()):
+        points = BezierSegment.from_dict(seg_dict).flatten(tolerance=PLAYBACK_TOLERANCE)
+        path.extend(points[1:] if path else points)
+    path.extend((x, y) for x, y in data.get("current_raw_points", ()))
+    if not path or pen is None:
+        return path
+
+    nearest = min(
+        range(len(path)), key=lambda i: (path[i][0] - pen[0]) ** 2 + (path[i][1] - pen[1]) ** 2
+    )
+    return path[nearest + 1 :]
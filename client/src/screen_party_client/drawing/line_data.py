@@ -4,13 +4,45 @@
 각 사용자의 드로잉을 line_id별로 관리합니다.
 """
 
-from typing import List, Tuple, Optional
+from typing import Any, Dict, Hashable, Iterable, List, Tuple, Optional, TYPE_CHECKING
 from dataclasses import dataclass, field
 import time
 from PyQt6.QtGui import QColor
 
 from .bezier_fitter import BezierSegment
 
+if TYPE_CHECKING:
+    from .spatial_index import SegmentGridIndex
+
+# 바운딩 박스 (min_x, min_y, max_x, max_y)
+Bounds = Tuple[float, float, float, float]
+
+
+def union_bounds(a: Optional[Bounds], b: Optional[Bounds]) -> Optional[Bounds]:
+    """두 바운딩 박스의 합집합 (None은 빈 영역으로 취급)"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return (min(a[0], b[0]), min(a[1], b[1]), max(a[2], b[2]), max(a[3], b[3]))
+
+
+def points_bounds(points: Iterable[Tuple[float, float]]) -> Optional[Bounds]:
+    """점 목록의 바운딩 박스 (점이 없으면 None)"""
+    points = list(points)
+    if not points:
+        return None
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def bounds_intersect(a: Optional[Bounds], b: Optional[Bounds]) -> bool:
+    """두 바운딩 박스가 겹치는지 확인 (경계 접촉 포함)"""
+    if a is None or b is None:
+        return False
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
 
 @dataclass
 class LineData:
@@ -28,6 +60,11 @@ class LineData:
         initial_alpha: 초기 투명도 (페이드아웃 시 기준값)
         end_time: 드로잉 종료 시각 (time.time(), None이면 아직 그리는 중)
         last_update_time: 마지막 업데이트 시각 (타임아웃 감지용)
+        segment_bounds: 세그먼트별 바운딩 박스 (finalized_segments와 같은 순서)
+        segments_bounds: 전체 finalized_segments의 바운딩 박스
+        raw_bounds: current_raw_points의 바운딩 박스
+        spatial_index: 세그먼트/raw 구간 바운딩 박스를 등록할 공간 인덱스 (선택)
+        polyline_cache: 뷰 스케일별 평탄화된 polyline 캐시 (세그먼트가 바뀌면 비워짐)
     """
 
     line_id: str
@@ -40,27 +77,89 @@ class LineData:
     initial_alpha: float = 1.0  # 초기 alpha 값 저장
     end_time: Optional[float] = None
     last_update_time: float = field(default_factory=time.time)
+    spatial_index: Optional["SegmentGridIndex"] = field(default=None, repr=False, compare=False)
+    segment_bounds: List[Bounds] = field(default_factory=list, init=False, repr=False)
+    segments_bounds: Optional[Bounds] = field(default=None, init=False, repr=False)
+    raw_bounds: Optional[Bounds] = field(default=None, init=False, repr=False)
+    polyline_cache: Dict[Hashable, Any] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        """생성 시 전달된 세그먼트/점의 바운딩 박스 계산"""
+        self.segment_bounds = [seg.bounds() for seg in self.finalized_segments]
+        for seg_bounds in self.segment_bounds:
+            self.segments_bounds = union_bounds(self.segments_bounds, seg_bounds)
+        self.raw_bounds = points_bounds(self.current_raw_points)
+
+        if self.spatial_index is not None:
+            self.spatial_index.insert_segments(self.line_id, 0, self.segment_bounds)
+            self.spatial_index.set_raw_run(self.line_id, self.raw_bounds)
+
+    @property
+    def bounds(self) -> Optional[Bounds]:
+        """라인 전체 바운딩 박스 (세그먼트 + raw 점)"""
+        return union_bounds(self.segments_bounds, self.raw_bounds)
 
-    def add_finalized_segments(self, segments: List[BezierSegment]):
-        """확정된 세그먼트 추가"""
+    def add_finalized_segments(self, segments: List[BezierSegment]) -> Optional[Bounds]:
+        """확정된 세그먼트 추가
+
+        Returns:
+            새로 추가된 세그먼트들의 바운딩 박스 (없으면 None)
+        """
+        start_index = len(self.finalized_segments)
+        new_bounds = [seg.bounds() for seg in segments]
+        added_bounds = None
+        for seg_bounds in new_bounds:
+            added_bounds = union_bounds(added_bounds, seg_bounds)
+        self.segment_bounds.extend(new_bounds)
         self.finalized_segments.extend(segments)
+        self.polyline_cache.clear()
+        if self.spatial_index is not None:
+            self.spatial_index.insert_segments(self.line_id, start_index, new_bounds)
+        self.segments_bounds = union_bounds(self.segments_bounds, added_bounds)
         self.last_update_time = time.time()
+        return added_bounds
+
+    def update_raw_points(self, points: List[Tuple[float, float]]) -> Optional[Bounds]:
+        """raw 점들 업데이트
 
-    def update_raw_points(self, points: List[Tuple[float, float]]):
-        """raw 점들 업데이트"""
+        Returns:
+            변경된 영역 (이전 raw 점 + 새 raw 점의 바운딩 박스)
+        """
+        old_bounds = self.raw_bounds
         self.current_raw_points = points.copy()
+        self.raw_bounds = points_bounds(self.current_raw_points)
+        if self.spatial_index is not None:
+            self.spatial_index.set_raw_run(self.line_id, self.raw_bounds)
         self.last_update_time = time.time()
+        return union_bounds(old_bounds, self.raw_bounds)
+
+    def finalize(self) -> Optional[Bounds]:
+        """드로잉 완료 (raw points 제거)
 
-    def finalize(self):
-        """드로잉 완료 (raw points 제거)"""
+        Returns:
+            제거된 raw 점들의 바운딩 박스 (없으면 None)
+        """
+        old_bounds = self.raw_bounds
         self.is_complete = True
         self.current_raw_points = []
+        self.raw_bounds = None
+        if self.spatial_index is not None:
+            self.spatial_index.set_raw_run(self.line_id, None)
         self.end_time = time.time()
+        return old_bounds
 
     def clear(self):
         """모든 데이터 초기화"""
         self.finalized_segments = []
         self.current_raw_points = []
+        self.segment_bounds = []
+        self.segments_bounds = None
+        self.raw_bounds = None
+        self.polyline_cache.clear()
+        if self.spatial_index is not None:
+            self.spatial_index.remove_line(self.line_id)
         self.is_complete = False
         self.alpha = 1.0
         self.initial_alpha = 1.0
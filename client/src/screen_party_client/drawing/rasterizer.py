@@ -0,0 +1,243 @@
+"""
+백그라운드 스레드 래스터라이저
+
+GUI 스레드는 qasync의 asyncio 루프와 함께 돌기 때문에, 무거운 paintEvent는
+웹소켓 수신을 지연시키고 느린 수신은 다시 그리기를 지연시킵니다.
+이 모듈은 다른 사용자의 스트로크를 작업 QThread에서 QImage로 래스터화합니다.
+
+- GUI 스레드: StrokeStore에서 불변 스냅샷(RenderJob)만 만들어 전달하고,
+  paintEvent에서는 완성된 최신 프레임을 복사(blit)만 함
+- 작업 스레드: 두 개의 QImage를 번갈아 쓰며(더블 버퍼) 스냅샷을 그림
+
+LineData/StrokeStore는 GUI 스레드에서만 변경되므로 작업 스레드는 이를 직접 읽지 않습니다.
+스냅샷에는 불변 객체(BezierSegment, 튜플)와 암시적 공유되는 Qt 값 타입(QPolygonF)만 담깁니다.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from PyQt6.QtCore import QCoreApplication, QObject, QPointF, QThread, Qt, pyqtSignal, pyqtSlot
+from PyQt6.QtGui import QColor, QImage, QPainter, QPainterPath, QPen, QPolygonF, QTransform
+from PyQt6 import sip
+
+from .bezier_fitter import BezierSegment
+
+
+def make_pen(
+    color: QColor,
+    width: float,
+    join_style: Qt.PenJoinStyle = Qt.PenJoinStyle.RoundJoin,
+) -> QPen:
+    """둥근 끝 펜 생성 (이음은 기본적으로 둥글게)"""
+    pen = QPen(color, width)
+    pen.setCapStyle(Qt.PenCapStyle.RoundCap)
+    pen.setJoinStyle(join_style)
+    return pen
+
+
+def bezier_path(segment: BezierSegment) -> QPainterPath:
+    """베지어 세그먼트를 매끄러운 곡선 path로 변환"""
+    path = QPainterPath()
+    path.moveTo(QPointF(*segment.p0))
+    path.cubicTo(QPointF(*segment.p1), QPointF(*segment.p2), QPointF(*segment.p3))
+    return path
+
+
+def raw_points_path(points) -> QPainterPath:
+    """raw 점들을 직선 path로 변환"""
+    path = QPainterPath()
+    path.moveTo(QPointF(*points[0]))
+    for point in points[1:]:
+        path.lineTo(QPointF(*point))
+    return path
+
+
+@dataclass(frozen=True)
+class StrokeBatch:
+    """같은 펜 상태(색상+알파, 두께)로 그릴 스트로크들 (상대 좌표)
+
+    Attributes:
+        rgba: 알파가 적용된 색상 (QColor.rgba())
+        width: 펜 두께 (픽셀)
+        polylines: 완성된 라인의 평탄화된 점들
+        segments: 그리는 중인 라인의 베지어 세그먼트들
+        raw_runs: 그리는 중인 라인의 raw 점들 (점 2개 이상)
+    """
+
+    rgba: int
+    width: float
+    polylines: Tuple[QPolygonF, ...] = ()
+    segments: Tuple[BezierSegment, ...] = ()
+    raw_runs: Tuple[Tuple[Tuple[float, float], ...], ...] = ()
+
+
+@dataclass(frozen=True)
+class RenderJob:
+    """작업 스레드가 그릴 한 프레임의 스냅샷
+
+    Attributes:
+        width: 위젯 너비 (논리 픽셀)
+        height: 위젯 높이 (논리 픽셀)
+        device_pixel_ratio: 디바이스 픽셀 비율
+        batches: 그리기 순서대로의 펜 상태별 스트로크들
+    """
+
+    width: int
+    height: int
+    device_pixel_ratio: float
+    batches: Tuple[StrokeBatch, ...]
+
+
+def rasterize(job: RenderJob, image: QImage):
+    """스냅샷을 이미지에 그리기 (이미지는 투명하게 지운 뒤 그림)
+
+    Args:
+        job: 그릴 스냅샷
+        image: 대상 이미지 (job 크기 × 디바이스 픽셀 비율, devicePixelRatio 설정됨)
+    """
+    image.fill(Qt.GlobalColor.transparent)
+    painter = QPainter(image)
+    painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+    # 저장된 geometry는 상대 좌표: 변환 하나로 위젯 크기에 맞춤
+    painter.setTransform(QTransform.fromScale(job.width or 1, job.height or 1))
+    for batch in job.batches:
+        color = QColor.fromRgba(batch.rgba)
+        if batch.polylines:
+            pen = make_pen(color, batch.width, Qt.PenJoinStyle.BevelJoin)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            for polygon in batch.polylines:
+                painter.drawPolyline(polygon)
+        if batch.segments or batch.raw_runs:
+            pen = make_pen(color, batch.width)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            for segment in batch.segments:
+                painter.drawPath(bezier_path(segment))
+            for points in batch.raw_runs:
+                painter.drawPath(raw_points_path(points))
+    painter.end()
+
+
+class RasterWorker(QObject):
+    """작업 스레드에서 RenderJob을 그리는 객체 (더블 버퍼)"""
+
+    # 완성된 프레임 (frame_id, image)
+    frame_ready = pyqtSignal(int, QImage)
+
+    def __init__(self):
+        super().__init__()
+        self._buffers: List[Optional[QImage]] = [None, None]
+        self._back = 0
+
+    @pyqtSlot(int, object)
+    def render(self, frame_id: int, job: RenderJob):
+        """back 버퍼에 그린 뒤 내보내고 버퍼를 교체"""
+        dpr = job.device_pixel_ratio
+        width = max(1, round(job.width * dpr))
+        height = max(1, round(job.height * dpr))
+
+        image = self._buffers[self._back]
+        if image is None or image.width() != width or image.height() != height:
+            image = QImage(width, height, QImage.Format.Format_ARGB32_Premultiplied)
+            self._buffers[self._back] = image
+        image.setDevicePixelRatio(dpr)
+
+        rasterize(job, image)
+        self.frame_ready.emit(frame_id, image)
+        self._back ^= 1
+
+
+class ThreadedRasterizer(QObject):
+    """GUI 스레드 쪽 래스터라이저 제어 (작업 스레드 소유, 요청 합치기)
+
+    프레임은 한 번에 하나만 작업 스레드에 보냅니다. 그리는 동안 들어온 요청들은
+    하나로 합쳐지고, 프레임이 끝나면 그 시점의 최신 스냅샷으로 한 번 더 그립니다.
+    (오래된 스냅샷이 작업 큐에 쌓이지 않음)
+    """
+
+    # 새 프레임이 front로 교체됨
+    frame_ready = pyqtSignal()
+
+    _render_requested = pyqtSignal(int, object)
+
+    def __init__(self, build_job: Callable[[], RenderJob], parent: Optional[QObject] = None):
+        """
+        Args:
+            build_job: 현재 상태의 스냅샷을 만드는 함수 (GUI 스레드에서 호출)
+            parent: 부모 객체
+        """
+        super().__init__(parent)
+        self._build_job = build_job
+        self.front: Optional[QImage] = None  # 가장 최근에 완성된 프레임
+        self.frames_rendered = 0
+
+        self._next_frame_id = 0
+        self._in_flight: Optional[int] = None  # 그리는 중인 frame_id
+        self._dirty = False  # 그리는 중에 요청이 들어옴
+
+        # 스레드와 worker는 C++ 소유로 넘기고 스레드가 끝나면 Qt가 정리
+        # (실행 중인 QThread가 Python GC로 소멸되면 프로세스가 중단됨)
+        self._thread = QThread()
+        self._thread.setObjectName("screen-party-raster")
+        self._worker = RasterWorker()
+        self._worker.moveToThread(self._thread)
+        sip.transferto(self._thread, None)
+        sip.transferto(self._worker, None)
+        self._thread.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+        self._render_requested.connect(self._worker.render)
+        self._worker.frame_ready.connect(self._on_frame_ready)
+        self._thread.start()
+        self._running = True
+
+        # 부모 위젯이 삭제되거나 앱이 종료되면 작업 스레드도 종료
+        self.destroyed.connect(self._thread.quit)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop)
+
+    @property
+    def is_running(self) -> bool:
+        """작업 스레드 실행 여부"""
+        return self._running
+
+    @property
+    def is_idle(self) -> bool:
+        """그리는 중인 프레임도, 대기 중인 요청도 없음"""
+        return self._in_flight is None and not self._dirty
+
+    def request(self):
+        """다시 그리기 요청 (그리는 중이면 끝난 뒤 한 번만 다시 그림)"""
+        if not self.is_running:
+            return
+        if self._in_flight is not None:
+            self._dirty = True
+            return
+        self._submit()
+
+    def _submit(self):
+        self._dirty = False
+        self._in_flight = self._next_frame_id
+        self._next_frame_id += 1
+        self._render_requested.emit(self._in_flight, self._build_job())
+
+    def _on_frame_ready(self, frame_id: int, image: QImage):
+        """작업 스레드에서 프레임 완성 (GUI 스레드에서 실행)"""
+        if frame_id != self._in_flight:
+            return
+        self._in_flight = None
+        self.front = image  # 이전 front는 해제되어 작업 스레드가 다시 사용
+        self.frames_rendered += 1
+        if self._dirty:
+            self._submit()
+        self.frame_ready.emit()
+
+    def stop(self):
+        """작업 스레드 종료 (그리는 중인 프레임이 끝날 때까지 대기)"""
+        if self._running:
+            self._running = False
+            self._thread.quit()
+            self._thread.wait()
+        self._in_flight = None
+        self._dirty = False
@@ -0,0 +1,239 @@
+"""
+세그먼트 공간 인덱스 (Uniform Grid)
+
+화면에 있는 베지어 세그먼트와 raw 점 구간의 바운딩 박스를 균일 격자에 등록하여,
+특정 영역과 겹치는 라인/세그먼트를 전체 순회 없이 찾을 수 있게 합니다.
+(부분 다시 그리기 컬링, 영역 지우기, 히트 테스트 등에 사용)
+"""
+
+import math
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from .line_data import Bounds, bounds_intersect
+
+# 격자 셀 좌표 (col, row)
+Cell = Tuple[int, int]
+
+# raw 점 구간을 나타내는 세그먼트 인덱스 (finalized 세그먼트는 0 이상)
+RAW_RUN_INDEX = -1
+
+
+class SegmentGridIndex:
+    """
+    세그먼트 바운딩 박스에 대한 균일 격자 인덱스
+
+    각 항목은 (line_id, segment_index)로 식별되며, segment_index가
+    RAW_RUN_INDEX(-1)이면 해당 라인의 현재 raw 점 구간을 의미합니다.
+
+    - 삽입: 바운딩 박스가 걸치는 셀 개수에 비례 (O(k))
+    - 라인 삭제: 라인이 등록된 셀 개수에 비례
+    - 영역 질의: 질의 영역과 겹치는 셀의 항목 수에 비례
+    """
+
+    def __init__(self, cell_size: float = 64.0):
+        """
+        Args:
+            cell_size: 격자 셀 한 변의 길이 (좌표 단위, 기본: 64 픽셀)
+        """
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+
+        self.cell_size = cell_size
+
+        # cell -> line_id -> 해당 셀에 걸친 세그먼트 인덱스들
+        self._cells: Dict[Cell, Dict[str, Set[int]]] = {}
+
+        # line_id -> segment_index -> 바운딩 박스
+        self._entries: Dict[str, Dict[int, Bounds]] = {}
+
+        # line_id -> 라인 항목이 등록된 셀들 (빠른 라인 삭제용)
+        self._line_cells: Dict[str, Set[Cell]] = {}
+
+    def __len__(self) -> int:
+        """등록된 항목 (세그먼트 + raw 구간) 개수"""
+        return sum(len(entries) for entries in self._entries.values())
+
+    def __contains__(self, line_id: str) -> bool:
+        """라인이 인덱스에 등록되어 있는지 확인"""
+        return line_id in self._entries
+
+    def _cells_for(self, bounds: Bounds) -> Iterator[Cell]:
+        """바운딩 박스가 걸치는 셀 좌표들"""
+        size = self.cell_size
+        col0 = math.floor(bounds[0] / size)
+        row0 = math.floor(bounds[1] / size)
+        col1 = math.floor(bounds[2] / size)
+        row1 = math.floor(bounds[3] / size)
+        for col in range(col0, col1 + 1):
+            for row in range(row0, row1 + 1):
+                yield (col, row)
+
+    def _candidate_cells(self, bounds: Bounds) -> Iterator[Cell]:
+        """질의 영역과 겹치는 셀들 중 항목이 있을 수 있는 셀들
+
+        질의 영역이 등록된 셀 수보다 많은 셀에 걸치면 (예: 전체 화면 다시 그리기)
+        빈 셀까지 모두 훑는 대신 사용 중인 셀만 범위 검사합니다.
+        """
+        size = self.cell_size
+        col0 = math.floor(bounds[0] / size)
+        row0 = math.floor(bounds[1] / size)
+        col1 = math.floor(bounds[2] / size)
+        row1 = math.floor(bounds[3] / size)
+        if (col1 - col0 + 1) * (row1 - row0 + 1) <= len(self._cells):
+            return self._cells_for(bounds)
+        return (
+            cell
+            for cell in list(self._cells)
+            if col0 <= cell[0] <= col1 and row0 <= cell[1] <= row1
+        )
+
+    def insert(self, line_id: str, segment_index: int, bounds: Bounds):
+        """항목 등록 (같은 키가 있으면 교체)
+
+        Args:
+            line_id: 라인 ID
+            segment_index: 세그먼트 인덱스 (raw 구간은 RAW_RUN_INDEX)
+            bounds: 바운딩 박스 (min_x, min_y, max_x, max_y)
+        """
+        entries = self._entries.setdefault(line_id, {})
+        if segment_index in entries:
+            self.remove(line_id, segment_index)
+            entries = self._entries.setdefault(line_id, {})
+
+        entries[segment_index] = bounds
+        line_cells = self._line_cells.setdefault(line_id, set())
+        for cell in self._cells_for(bounds):
+            self._cells.setdefault(cell, {}).setdefault(line_id, set()).add(segment_index)
+            line_cells.add(cell)
+
+    def insert_segments(self, line_id: str, start_index: int, bounds_list: List[Bounds]):
+        """연속된 세그먼트들을 한 번에 등록
+
+        Args:
+            line_id: 라인 ID
+            start_index: 첫 세그먼트의 인덱스
+            bounds_list: 세그먼트별 바운딩 박스
+        """
+        for offset, bounds in enumerate(bounds_list):
+            self.insert(line_id, start_index + offset, bounds)
+
+    def remove(self, line_id: str, segment_index: int) -> bool:
+        """항목 하나 제거
+
+        Returns:
+            제거되었으면 True, 없었으면 False
+        """
+        entries = self._entries.get(line_id)
+        if entries is None or segment_index not in entries:
+            return False
+
+        bounds = entries.pop(segment_index)
+        for cell in self._cells_for(bounds):
+            cell_lines = self._cells.get(cell)
+            if cell_lines is None or line_id not in cell_lines:
+                continue
+            indices = cell_lines[line_id]
+            indices.discard(segment_index)
+            if not indices:
+                del cell_lines[line_id]
+                self._line_cells[line_id].discard(cell)
+                if not cell_lines:
+                    del self._cells[cell]
+
+        if not entries:
+            del self._entries[line_id]
+            self._line_cells.pop(line_id, None)
+        return True
+
+    def set_raw_run(self, line_id: str, bounds: Optional[Bounds]):
+        """라인의 raw 점 구간 바운딩 박스 갱신 (None이면 제거)"""
+        if bounds is None:
+            self.remove(line_id, RAW_RUN_INDEX)
+        else:
+            self.insert(line_id, RAW_RUN_INDEX, bounds)
+
+    def remove_line(self, line_id: str) -> bool:
+        """라인의 모든 항목 제거
+
+        Returns:
+            제거되었으면 True, 없었으면 False
+        """
+        if self._entries.pop(line_id, None) is None:
+            return False
+
+        for cell in self._line_cells.pop(line_id, ()):
+            cell_lines = self._cells.get(cell)
+            if cell_lines is None:
+                continue
+            cell_lines.pop(line_id, None)
+            if not cell_lines:
+                del self._cells[cell]
+        return True
+
+    def clear(self):
+        """모든 항목 제거"""
+        self._cells.clear()
+        self._entries.clear()
+        self._line_cells.clear()
+
+    def _cell_inside(self, cell: Cell, bounds: Bounds) -> bool:
+        """셀이 질의 영역 안에 완전히 포함되는지 확인
+
+        완전히 포함된 셀에 등록된 항목은 바운딩 박스 검사 없이 겹친다고 볼 수 있습니다.
+        """
+        size = self.cell_size
+        x0 = cell[0] * size
+        y0 = cell[1] * size
+        return (
+            bounds[0] <= x0
+            and bounds[1] <= y0
+            and x0 + size <= bounds[2]
+            and y0 + size <= bounds[3]
+        )
+
+    def query_segments(self, bounds: Bounds) -> Dict[str, Set[int]]:
+        """영역과 겹치는 세그먼트 조회
+
+        Args:
+            bounds: 질의 영역 (min_x, min_y, max_x, max_y)
+
+        Returns:
+            line_id -> 겹치는 세그먼트 인덱스들 (raw 구간은 RAW_RUN_INDEX)
+        """
+        result: Dict[str, Set[int]] = {}
+        for cell in self._candidate_cells(bounds):
+            cell_lines = self._cells.get(cell)
+            if not cell_lines:
+                continue
+            inside = self._cell_inside(cell, bounds)
+            for line_id, indices in cell_lines.items():
+                found = result.get(line_id)
+                if found is None:
+                    found = result[line_id] = set()
+                if inside:
+                    found |= indices
+                    continue
+                # 경계 셀: 셀 단위 후보를 실제 바운딩 박스로 한 번 더 검사
+                entries = self._entries[line_id]
+                for index in indices:
+                    if index not in found and bounds_intersect(entries[index], bounds):
+                        found.add(index)
+        return {line_id: found for line_id, found in result.items() if found}
+
+    def query_lines(self, bounds: Bounds) -> Set[str]:
+        """영역과 겹치는 라인 ID 조회 (세그먼트 인덱스가 필요 없을 때)"""
+        result: Set[str] = set()
+        for cell in self._candidate_cells(bounds):
+            cell_lines = self._cells.get(cell)
+            if not cell_lines:
+                continue
+            if self._cell_inside(cell, bounds):
+                result.update(cell_lines)
+                continue
+            for line_id, indices in cell_lines.items():
+                if line_id in result:
+                    continue
+                entries = self._entries[line_id]
+                if any(bounds_intersect(entries[index], bounds) for index in indices):
+                    result.add(line_id)
+        return result
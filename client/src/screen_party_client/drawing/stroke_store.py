@@ -0,0 +1,429 @@
+"""
+공유 스트로크 저장소
+
+메인 캔버스와 오버레이 캔버스가 함께 사용하는 스트로크 모델입니다.
+수신 메시지 디코딩, LineData 생성, 페이드/타임아웃 수명 관리를 한 번만 수행하고,
+geometry는 상대 좌표(0.0 ~ 1.0)로 저장합니다.
+각 뷰(DrawingCanvas)는 region_changed 시그널을 구독하여 자신의 좌표계로 변환해 그립니다.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtGui import QColor
+
+from .animation_scheduler import AnimationScheduler
+from .bezier_fitter import BezierSegment
+from .jitter_buffer import JitterBuffer
+from .line_data import Bounds, LineData, bounds_intersect, union_bounds
+from .spatial_index import SegmentGridIndex
+from .tombstones import TombstoneSet
+
+if TYPE_CHECKING:
+    from ..network.latency_tracer import LatencyTracer
+
+
+def default_pen_color() -> QColor:
+    """기본 펜 색상 반환 (파스텔 핑크)"""
+    return QColor(255, 182, 193)  # 첫 번째 프리셋 색상과 동일
+
+
+class StrokeStore(QObject):
+    """
+    여러 뷰가 공유하는 스트로크 저장소
+
+    - lines: line_id -> LineData (상대 좌표, 삽입 순서 = 그리기 순서)
+    - 사용자별 색상/알파값
+    - 삭제된 라인 추적 (이후 이벤트 무시, TTL 기반)
+    - 세그먼트 공간 인덱스 (상대 좌표)
+    - 페이드아웃/타임아웃 애니메이션 스케줄러 (저장소당 하나)
+    - 원격 업데이트 지터 버퍼 (sent_at이 있는 업데이트를 송신 시각에 맞춰 보간 재생)
+    """
+
+    # 변경된 영역 (상대 좌표 Bounds, None이면 전체 다시 그리기)
+    region_changed = pyqtSignal(object)
+
+    def __init__(
+        self,
+        fade_hold_duration: float = 2.0,
+        fade_duration: float = 1.0,
+        timeout_duration: float = 10.0,
+        cell_size: float = 1.0 / 32,
+        tombstone_ttl: float = 60.0,
+        parent: Optional[QObject] = None,
+    ):
+        """
+        Args:
+            fade_hold_duration: 페이드아웃 전 유지 시간 (초)
+            fade_duration: 페이드아웃 시간 (초)
+            timeout_duration: 강제 삭제 타임아웃 (초)
+            cell_size: 공간 인덱스 셀 크기 (상대 좌표 단위, 기본: 화면의 1/32)
+            tombstone_ttl: 삭제된 라인 ID를 기억하는 시간 (초, 늦게 도착하는 메시지 무시용)
+            parent: 부모 QObject
+        """
+        super().__init__(parent)
+
+        # 라인 데이터 (line_id -> LineData)
+        self.lines: Dict[str, LineData] = {}
+
+        # 세그먼트 공간 인덱스 (상대 좌표)
+        self.spatial_index = SegmentGridIndex(cell_size=cell_size)
+
+        # 사용자별 색상 / 알파값
+        self.user_colors: Dict[str, QColor] = {}
+        self.user_alphas: Dict[str, float] = {}
+
+        # 페이드아웃 설정
+        self.fade_hold_duration = fade_hold_duration
+        self.fade_duration = fade_duration
+        self.timeout_duration = timeout_duration
+
+        # 삭제된 라인 추적 (타임아웃으로 삭제된 라인은 이후 이벤트 무시)
+        # TTL이 지나면 잊어버려 장시간 세션에서도 크기가 제한됨
+        self.deleted_line_ids = TombstoneSet(ttl=tombstone_ttl)
+
+        # 페이드아웃 애니메이션 스케줄러 (뷰 개수와 무관하게 하나)
+        self.animation_scheduler = AnimationScheduler(
+            self.update_animations, frame_interval=16, parent=self
+        )
+
+        # 원격 업데이트 지터 버퍼 (재생 시각이 되면 _apply_* 로 적용)
+        self.jitter_buffer = JitterBuffer(
+            self._apply_drawing_update,
+            self._apply_drawing_end,
+            batch=self.batched_notifications,
+            parent=self,
+        )
+
+        # 종단 간 지연 측정 (측정할 때만 설정, 적용된 업데이트의 trace를 첫 paint까지 보관)
+        self.tracer: Optional["LatencyTracer"] = None
+
+        # 묶음 적용 중 모아 둔 변경 영역 (batched_notifications 블록이 끝날 때 알림)
+        self._batch_depth = 0
+        self._batch_regions: List[Bounds] = []
+        self._batch_full = False
+
+    # === 사용자 색상/알파값 ===
+
+    def set_user_color(self, user_id: str, color: QColor):
+        """사용자별 색상 설정"""
+        self.user_colors[user_id] = color
+
+    def set_user_alpha(self, user_id: str, alpha: float):
+        """사용자별 알파값 설정"""
+        self.user_alphas[user_id] = max(0.0, min(1.0, alpha))
+
+    def remove_user(self, user_id: str):
+        """사용자 색상/알파값과 지터 추정기 제거"""
+        self.user_colors.pop(user_id, None)
+        self.user_alphas.pop(user_id, None)
+        self.jitter_buffer.forget_sender(user_id)
+
+    # === 변경 알림 ===
+
+    def _notify(self, bounds: Optional[Bounds]):
+        """변경된 영역을 뷰들에 알림 (None이면 아무것도 하지 않음)"""
+        if bounds is None:
+            return
+        if self._batch_depth:
+            self._collect_region(bounds)
+        else:
+            self.region_changed.emit(bounds)
+
+    def _notify_all(self):
+        """전체 다시 그리기 알림"""
+        if self._batch_depth:
+            self._batch_full = True
+        else:
+            self.region_changed.emit(None)
+
+    def _collect_region(self, bounds: Bounds):
+        """묶음 중 변경 영역 기록 (겹치는 영역끼리 합쳐서 떨어진 획은 따로 유지)"""
+        for index, region in enumerate(self._batch_regions):
+            if bounds_intersect(region, bounds):
+                self._batch_regions[index] = union_bounds(region, bounds)
+                return
+        self._batch_regions.append(bounds)
+
+    @contextmanager
+    def batched_notifications(self) -> Iterator[None]:
+        """블록 안의 변경 알림을 모았다가 끝날 때 한 번에 알림 (중첩 가능)
+
+        같은 획을 여러 번 갱신하는 메시지 묶음도 획마다 한 번만 알리므로
+        뷰의 dirty rect 계산과 (백그라운드 렌더링이면) 프레임 요청이 한 번으로 줄어듭니다.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                regions, full = self._batch_regions, self._batch_full
+                self._batch_regions, self._batch_full = [], False
+                if full:
+                    self.region_changed.emit(None)
+                else:
+                    for bounds in regions:
+                        self.region_changed.emit(bounds)
+
+    # === 라인 추가/제거 ===
+
+    def _create_line(self, line_id: str, user_id: str, default_color: QColor) -> LineData:
+        """사용자 색상/알파값을 적용한 빈 LineData 생성 및 등록"""
+        user_alpha = self.user_alphas.get(user_id, 1.0)
+        line_data = LineData(
+            line_id=line_id,
+            user_id=user_id,
+            color=self.user_colors.get(user_id, default_color),
+            alpha=user_alpha,
+            initial_alpha=user_alpha,
+            spatial_index=self.spatial_index,
+        )
+        self.lines[line_id] = line_data
+        self._schedule_line_animation(line_data)
+        return line_data
+
+    def add_completed_line(
+        self,
+        line_id: str,
+        user_id: str,
+        color: QColor,
+        segments: List[BezierSegment],
+        alpha: float,
+    ) -> LineData:
+        """완성된 라인 추가 (내 드로잉 저장용)
+
+        Args:
+            line_id: 라인 ID
+            user_id: 사용자 ID
+            color: 라인 색상
+            segments: 베지어 세그먼트 (상대 좌표)
+            alpha: 초기 알파값
+
+        Returns:
+            추가된 LineData
+        """
+        line_data = LineData(
+            line_id=line_id,
+            user_id=user_id,
+            color=color,
+            finalized_segments=list(segments),
+            current_raw_points=[],
+            is_complete=True,
+            alpha=alpha,
+            initial_alpha=alpha,
+            spatial_index=self.spatial_index,
+        )
+
+        # 페이드아웃 시작을 위해 end_time 설정
+        line_data.finalize()
+
+        self.lines[line_id] = line_data
+        self._notify(line_data.bounds)
+        self._schedule_line_animation(line_data)
+        return line_data
+
+    def remove_line(self, line_id: str) -> Optional[LineData]:
+        """라인과 공간 인덱스 항목을 제거하고 해당 영역 알림
+
+        Returns:
+            제거된 LineData (없으면 None)
+        """
+        self.jitter_buffer.discard(line_id)
+        line_data = self.lines.pop(line_id, None)
+        if line_data is None:
+            return None
+        self.spatial_index.remove_line(line_id)
+        self._notify(line_data.bounds)
+        return line_data
+
+    def remove_user_lines(self, user_id: str):
+        """특정 사용자의 모든 라인 제거"""
+        lines_to_remove = [lid for lid, ldata in self.lines.items() if ldata.user_id == user_id]
+        for line_id in lines_to_remove:
+            self.remove_line(line_id)
+
+    def clear(self):
+        """모든 라인 제거"""
+        self.jitter_buffer.clear()
+        self.lines.clear()
+        self.spatial_index.clear()
+        self._notify_all()
+
+    def lines_in_region(self, bounds: Bounds) -> List[str]:
+        """영역과 겹치는 라인 ID 목록 (렌더링 순서 유지)
+
+        Args:
+            bounds: 질의 영역 (min_x, min_y, max_x, max_y), 상대 좌표
+
+        Returns:
+            겹치는 line_id 리스트
+        """
+        hits = self.spatial_index.query_lines(bounds)
+        return [line_id for line_id in self.lines if line_id in hits]
+
+    # === 수신 메시지 처리 ===
+
+    def handle_drawing_start(self, line_id: str, user_id: str, data: Dict[str, Any]):
+        """
+        드로잉 시작 처리
+
+        Args:
+            line_id: 라인 ID
+            user_id: 사용자 ID
+            data: 시작 데이터 (start_point 등, 상대 좌표)
+        """
+        # 삭제된 라인 무시
+        if line_id in self.deleted_line_ids:
+            return
+
+        # 아직 그릴 geometry가 없으므로 화면 갱신 불필요
+        self._create_line(line_id, user_id, default_pen_color())
+        self.jitter_buffer.start(line_id, user_id, data.get("start_point"))
+
+    def handle_drawing_update(self, line_id: str, user_id: str, data: Dict[str, Any]):
+        """
+        드로잉 업데이트 처리
+
+        송신 시각(sent_at)이 있으면 지터 버퍼를 거쳐 재생 시각에 적용하고,
+        없으면 (이전 버전 클라이언트 등) 즉시 적용합니다.
+
+        Args:
+            line_id: 라인 ID
+            user_id: 사용자 ID
+            data: 업데이트 데이터 (new_finalized_segments, current_raw_points, sent_at)
+        """
+        # 삭제된 라인 무시
+        if line_id in self.deleted_line_ids:
+            return
+
+        sent_at = data.get("sent_at")
+        if sent_at is not None:
+            self.jitter_buffer.push(line_id, user_id, sent_at, data)
+        else:
+            self._apply_drawing_update(line_id, user_id, data)
+
+    def _apply_drawing_update(self, line_id: str, user_id: str, data: Dict[str, Any]):
+        """드로잉 업데이트 적용 (상대 좌표 그대로 저장)"""
+        if line_id in self.deleted_line_ids:
+            return
+
+        # LineData 가져오기 (없으면 생성)
+        line_data = self.lines.get(line_id)
+        if line_data is None:
+            line_data = self._create_line(line_id, user_id, QColor(255, 0, 0))
+
+        # 변경된 영역 (새 세그먼트 + 이전/새 raw 점)
+        dirty: Optional[Bounds] = None
+
+        if "new_finalized_segments" in data:
+            new_segments = [
+                BezierSegment.from_dict(seg_dict) for seg_dict in data["new_finalized_segments"]
+            ]
+            dirty = union_bounds(dirty, line_data.add_finalized_segments(new_segments))
+
+        if "current_raw_points" in data:
+            raw_points = [(x, y) for x, y in data["current_raw_points"]]
+            dirty = union_bounds(dirty, line_data.update_raw_points(raw_points))
+
+        if self.tracer is not None and data.get("trace"):
+            self.tracer.on_applied(data["trace"])
+
+        self._notify(dirty)
+
+    def handle_drawing_end(self, line_id: str, user_id: str):
+        """
+        드로잉 종료 처리
+
+        Args:
+            line_id: 라인 ID
+            user_id: 사용자 ID
+        """
+        # 삭제된 라인 무시
+        if line_id in self.deleted_line_ids:
+            return
+
+        # 재생 대기 중인 업데이트가 있으면 그 뒤에 종료
+        if self.jitter_buffer.end(line_id, user_id):
+            return
+        self._apply_drawing_end(line_id, user_id)
+
+    def _apply_drawing_end(self, line_id: str, user_id: str):
+        """드로잉 종료 적용 (raw 점 정리 후 페이드아웃 예약)"""
+        line_data = self.lines.get(line_id)
+        if line_data is not None:
+            # raw 점이 사라진 영역만 갱신
+            self._notify(line_data.finalize())
+            self._schedule_line_animation(line_data)
+
+    # === 페이드아웃 애니메이션 ===
+
+    def update_animations(self, current_time: Optional[float] = None) -> Optional[float]:
+        """페이드아웃 애니메이션 업데이트
+
+        Args:
+            current_time: 현재 시각 (time.time(), None이면 지금)
+
+        Returns:
+            다음으로 무언가 바뀌는 시각 (페이드 중이면 current_time, 예정된 일이 없으면 None)
+        """
+        if current_time is None:
+            current_time = time.time()
+        lines_to_delete = []
+        next_deadline: Optional[float] = None
+
+        for line_id, line_data in self.lines.items():
+            # 1. 타임아웃 체크 (마지막 업데이트로부터 10초)
+            timeout_at = line_data.last_update_time + self.timeout_duration
+            if current_time >= timeout_at:
+                # 타임아웃 - 강제 삭제
+                lines_to_delete.append(line_id)
+                self.deleted_line_ids.add(line_id)
+                continue
+            line_deadline = timeout_at
+
+            # 2. 페이드아웃 계산 (drawing_end 이후)
+            if line_data.end_time is not None:
+                elapsed_since_end = current_time - line_data.end_time
+                old_alpha = line_data.alpha
+
+                if elapsed_since_end < self.fade_hold_duration:
+                    # 유지 단계 (초기 alpha 유지) - 페이드 시작 시각에 깨어남
+                    line_data.alpha = line_data.initial_alpha
+                    line_deadline = min(line_deadline, line_data.end_time + self.fade_hold_duration)
+                elif elapsed_since_end < self.fade_hold_duration + self.fade_duration:
+                    # 페이드아웃 단계 (초기 alpha → 0.0)
+                    fade_progress = (
+                        elapsed_since_end - self.fade_hold_duration
+                    ) / self.fade_duration
+                    line_data.alpha = max(0.0, line_data.initial_alpha * (1.0 - fade_progress))
+                    line_deadline = current_time  # 페이드 진행 중: 다음 프레임에 다시 틱
+                else:
+                    # 완전히 사라짐 - 삭제
+                    line_data.alpha = 0.0
+                    lines_to_delete.append(line_id)
+                    self.deleted_line_ids.add(line_id)
+                    continue
+
+                # 알파값이 바뀐 라인 영역만 갱신
+                if line_data.alpha != old_alpha:
+                    self._notify(line_data.bounds)
+
+            if next_deadline is None or line_deadline < next_deadline:
+                next_deadline = line_deadline
+
+        # 삭제할 라인 제거 (사라진 영역 갱신)
+        for line_id in lines_to_delete:
+            self.remove_line(line_id)
+
+        return next_deadline
+
+    def _schedule_line_animation(self, line_data: LineData):
+        """라인의 다음 데드라인(페이드 시작 또는 타임아웃)에 애니메이션 틱 예약"""
+        if line_data.end_time is not None:
+            deadline = line_data.end_time + self.fade_hold_duration
+        else:
+            deadline = line_data.last_update_time + self.timeout_duration
+        self.animation_scheduler.request_at(deadline)
@@ -0,0 +1,93 @@
+"""
+삭제된 라인 ID 추적 (TTL 기반 tombstone)
+
+페이드아웃/타임아웃으로 삭제된 라인에 대해 늦게 도착한 메시지를 무시하기 위해
+line_id를 기억하되, 늦은 메시지가 더 이상 올 수 없는 시간(TTL)이 지나면 잊어버립니다.
+장시간 세션에서도 메모리가 삭제된 라인 수에 비례해 계속 늘어나지 않습니다.
+"""
+
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Iterator, Optional, Tuple
+
+
+class TombstoneSet:
+    """
+    만료 시간이 있는 집합
+
+    - add / 포함 여부 확인: O(1)
+    - 만료 정리: 추가 순서대로 쌓인 큐의 앞부분만 확인 (분할 상환 O(1))
+
+    크기는 "TTL 동안 삭제된 라인 수"로 제한됩니다.
+    """
+
+    def __init__(self, ttl: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            ttl: 항목 유지 시간 (초)
+            clock: 현재 시각 함수 (기본: time.monotonic, 테스트/벤치마크용 주입 가능)
+        """
+        if ttl <= 0:
+            raise ValueError("ttl must be positive")
+
+        self.ttl = ttl
+        self._clock = clock
+
+        # key -> 만료 시각
+        self._expires: Dict[str, float] = {}
+
+        # (만료 시각, key) - 추가 순서 = 만료 순서 (TTL이 모두 같으므로)
+        self._queue: Deque[Tuple[float, str]] = deque()
+
+    def add(self, key: str):
+        """항목 추가 (이미 있으면 만료 시각 연장)"""
+        now = self._clock()
+        self.prune(now)
+        expires_at = now + self.ttl
+        self._expires[key] = expires_at
+        self._queue.append((expires_at, key))
+
+    def discard(self, key: str):
+        """항목 제거 (없으면 무시, 큐 항목은 만료 시 정리됨)"""
+        self._expires.pop(key, None)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """만료된 항목 정리
+
+        Args:
+            now: 현재 시각 (None이면 clock())
+
+        Returns:
+            제거된 항목 수
+        """
+        if now is None:
+            now = self._clock()
+        removed = 0
+        queue = self._queue
+        while queue and queue[0][0] <= now:
+            expires_at, key = queue.popleft()
+            # 재추가로 연장된 항목은 큐에 더 늦은 항목이 따로 있음
+            if self._expires.get(key) == expires_at:
+                del self._expires[key]
+                removed += 1
+        return removed
+
+    def clear(self):
+        """모든 항목 제거"""
+        self._expires.clear()
+        self._queue.clear()
+
+    def __contains__(self, key: object) -> bool:
+        """항목이 있고 아직 만료되지 않았는지 확인"""
+        expires_at = self._expires.get(key)  # type: ignore[arg-type]
+        return expires_at is not None and expires_at > self._clock()
+
+    def __len__(self) -> int:
+        """만료되지 않은 항목 수"""
+        self.prune()
+        return len(self._expires)
+
+    def __iter__(self) -> Iterator[str]:
+        """만료되지 않은 항목들"""
+        self.prune()
+        return iter(list(self._expires))
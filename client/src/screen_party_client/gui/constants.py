@@ -1,5 +1,7 @@
 """GUI 상수 정의"""
 
+import os
+
 from PyQt6.QtGui import QColor
 
 
@@ -14,6 +16,34 @@ PRESET_COLORS = [
 ]
 
 
+# 오버레이 캔버스의 백그라운드 렌더링 (다른 사용자의 스트로크를 작업 스레드에서 래스터화)
+OVERLAY_THREADED_RENDERING = False
+
+
+# 스트로크 종단 간 지연 측정 (입력 → 송신 → 서버 중계 → 수신 → 첫 paint)
+# 끄면 메시지에 trace를 싣지 않고 측정 코드도 실행되지 않음
+LATENCY_TRACING = os.environ.get("SCREEN_PARTY_LATENCY_TRACE", "") == "1"
+
+# 링크 측정 주기 (ms): RTT/서버 시계 ping, 송신 버퍼 확인, 전송 간격/지연 통계 갱신
+LINK_PROBE_INTERVAL = 1000
+
+# 드로잉 업데이트 전송 간격 (ms): 기본값에서 시작해서 링크 상태에 따라 범위 안에서 조절
+NETWORK_INTERVAL_DEFAULT = 50
+NETWORK_INTERVAL_MIN = 16
+NETWORK_INTERVAL_MAX = 200
+
+# 수신 드로잉 메시지 적용 주기 (ms): 한 프레임 동안 도착한 메시지를 모아 한 번에 적용
+DRAWING_BATCH_INTERVAL = 16
+
+# 이벤트 루프 지연 측정 (qasync 루프: GUI 그리기 + asyncio 네트워크)
+# 이 시간(ms) 넘게 루프가 막히면 막고 있던 콜백의 스택을 남김
+LOOP_LAG_THRESHOLD = 100
+
+# 디버그 패널 (클라이언트/서버 루프 지연, 느린 콜백 스택) 처음부터 표시 여부
+# 실행 중에는 Ctrl+Shift+D로 켜고 끔
+DEBUG_PANEL = os.environ.get("SCREEN_PARTY_DEBUG_PANEL", "") == "1"
+
+
 def get_default_pen_color() -> QColor:
     """기본 펜 색상 반환 (첫 번째 프리셋)"""
     return PRESET_COLORS[0]
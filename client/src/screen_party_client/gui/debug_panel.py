@@ -0,0 +1,63 @@
+"""디버그 패널 (이벤트 루프 지연)"""
+
+from typing import Any, Dict, Optional
+
+from PyQt6.QtWidgets import QGroupBox, QLabel, QPlainTextEdit, QVBoxLayout, QWidget
+from screen_party_common.loop_lag import format_slow_callbacks
+
+from .widget_updates import set_text
+
+
+class DebugPanel(QGroupBox):
+    """클라이언트/서버 이벤트 루프 지연과 최근 느린 콜백 스택 표시
+
+    값은 LoopLagMonitor.summary() 형식이며, MainWindow가 state에서 읽어 show_stats()로 넘깁니다.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None):
+        super().__init__("디버그", parent)
+        layout = QVBoxLayout(self)
+
+        self.client_label = QLabel("")
+        layout.addWidget(self.client_label)
+        self.server_label = QLabel("")
+        layout.addWidget(self.server_label)
+
+        self.slow_callbacks_view = QPlainTextEdit()
+        self.slow_callbacks_view.setReadOnly(True)
+        self.slow_callbacks_view.setLineWrapMode(QPlainTextEdit.LineWrapMode.NoWrap)
+        self.slow_callbacks_view.setMinimumHeight(120)
+        layout.addWidget(self.slow_callbacks_view)
+
+        self.show_stats({}, {})
+
+    def show_stats(self, client: Dict[str, Any], server: Dict[str, Any]):
+        """루프 지연 요약 표시
+
+        Args:
+            client: 이 클라이언트의 LoopLagMonitor.summary() (없으면 빈 dict)
+            server: 서버 통계의 loop_lag (없으면 빈 dict)
+        """
+        set_text(self.client_label, _format_lag("클라이언트 루프", client))
+        set_text(self.server_label, _format_lag("서버 루프", server))
+
+        lines = []
+        for title, summary in (("클라이언트", client), ("서버", server)):
+            slow = format_slow_callbacks(summary)
+            if slow:
+                lines.append(f"--- {title} 느린 콜백 ---")
+                lines.extend(slow)
+        text = "\n".join(lines) or "느린 콜백 없음"
+        if self.slow_callbacks_view.toPlainText() != text:
+            self.slow_callbacks_view.setPlainText(text)
+
+
+def _format_lag(title: str, summary: Dict[str, Any]) -> str:
+    """한 줄 요약 (예: 클라이언트 루프: p50 1ms / p95 4ms / max 130ms, 느린 콜백 2)"""
+    lag = summary.get("lag")
+    if not lag or not lag.get("count"):
+        return f"{title}: 측정 중..."
+    return (
+        f"{title}: p50 {lag['p50_ms']:g}ms / p95 {lag['p95_ms']:g}ms / max {lag['max_ms']:g}ms, "
+        f"느린 콜백 {summary.get('slow_callbacks', 0)}"
+    )
@@ -3,22 +3,48 @@
 import asyncio
 import logging
 import sys
-from typing import Optional
+from typing import TYPE_CHECKING, AbstractSet, Optional
 
 from PyQt6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QApplication
-from PyQt6.QtCore import Qt, pyqtSignal, QSettings
+from PyQt6.QtCore import Qt, pyqtSignal, QSettings, QTimer
+from PyQt6.QtGui import QKeySequence, QShortcut
+from screen_party_common import MessageType
+from screen_party_common.latency import TOTAL_HOP, format_hops
+from screen_party_common.loop_lag import LoopLagMonitor
 
-from ..network.client import WebSocketClient
 from ..drawing.canvas_manager import CanvasManager
 from ..network.message_handler import MessageHandler
+from ..network.latency_tracer import LatencyTracer
+from ..network.send_rate import AdaptiveSendInterval
+from .constants import (
+    LATENCY_TRACING,
+    LINK_PROBE_INTERVAL,
+    LOOP_LAG_THRESHOLD,
+    NETWORK_INTERVAL_DEFAULT,
+    NETWORK_INTERVAL_MAX,
+    NETWORK_INTERVAL_MIN,
+)
 from .state import AppState
 from .ui_builder import UIBuilder
 from .session_manager import SessionManager
 from .overlay_manager import OverlayManager
 from .drawing_handler import DrawingHandler
+from .widget_updates import set_enabled, set_style_sheet, set_text, set_tool_tip, set_visible
+
+if TYPE_CHECKING:
+    # websockets는 세션 생성/참여 때 로드 (SessionManager 참고)
+    from ..network.client import WebSocketClient
 
 logger = logging.getLogger(__name__)
 
+# 그리기 모드 활성화 중인 버튼 테두리
+DRAWING_ACTIVE_STYLE = """
+QPushButton {
+    border: 3px solid #4CAF50;
+    border-radius: 4px;
+}
+"""
+
 
 def get_version() -> str:
     """실행 파일의 버전 정보를 가져옵니다.
@@ -73,6 +99,19 @@ class MainWindow(QMainWindow):
         # Message handler (created after canvas manager)
         self.message_handler: Optional[MessageHandler] = None
 
+        # 링크 상태(RTT, 송신 버퍼)에 따른 드로잉 업데이트 전송 간격
+        self.send_rate = AdaptiveSendInterval(
+            initial_ms=NETWORK_INTERVAL_DEFAULT,
+            min_ms=NETWORK_INTERVAL_MIN,
+            max_ms=NETWORK_INTERVAL_MAX,
+        )
+
+        # 스트로크 종단 간 지연 측정 (끄면 None)
+        self.latency_tracer: Optional[LatencyTracer] = LatencyTracer() if LATENCY_TRACING else None
+
+        # 이벤트 루프(GUI + 네트워크) 지연 측정 (루프가 돌기 시작하면 start_loop_monitor())
+        self.loop_lag = LoopLagMonitor(threshold=LOOP_LAG_THRESHOLD / 1000)
+
         # Helper classes
         self.ui_builder = UIBuilder(self)
         self.session_manager = SessionManager(self)
@@ -85,6 +124,11 @@ class MainWindow(QMainWindow):
         # State observer 등록 (UI 업데이트)
         self.state.add_observer(self._on_state_changed)
 
+        # 링크 측정 타이머 (ping, 전송 간격 조절, 지연 통계 갱신)
+        self.link_timer = QTimer(self)
+        self.link_timer.timeout.connect(self._on_link_timer)
+        self.link_timer.start(LINK_PROBE_INTERVAL)
+
     def init_ui(self):
         """UI 초기화"""
         self.setWindowTitle("Screen Party")
@@ -102,77 +146,105 @@ class MainWindow(QMainWindow):
         # 시작 화면과 메인 화면 생성
         self.ui_builder.create_start_screen()
         self.ui_builder.create_main_screen()
+        self.ui_builder.create_debug_panel()
+        QShortcut(QKeySequence("Ctrl+Shift+D"), self, activated=self.toggle_debug_panel)
 
         # 시작 화면 표시
         self.show_start_screen()
 
-    def _on_state_changed(self):
+    def _on_state_changed(self, changed: AbstractSet[str]):
         """State 변경 시 호출되는 Observer 메서드
 
-        이 메서드는 state가 변경될 때마다 호출되어 UI를 업데이트합니다.
-        모든 UI 업데이트는 이 메서드에서 state를 읽어서 declarative하게 처리합니다.
+        이벤트 루프 한 바퀴 동안 바뀐 필드 이름을 모아서 한 번 호출되며,
+        그 필드에 영향을 받는 UI 요소만 declarative하게 다시 처리합니다.
         """
-        self.update_ui_from_state()
+        self.update_ui_from_state(changed)
 
-    def update_ui_from_state(self):
-        """State를 읽어서 모든 UI 요소를 업데이트
+    def update_ui_from_state(self, changed: Optional[AbstractSet[str]] = None):
+        """State를 읽어서 UI 요소를 업데이트
 
         이 메서드는 state를 읽어서 UI를 업데이트하는 유일한 장소입니다.
         비즈니스 로직에서는 state만 변경하고, UI는 이 메서드에서만 업데이트합니다.
+
+        Args:
+            changed: 바뀐 state 필드 이름 (None이면 모든 UI 요소)
         """
+
+        def affected(*fields: str) -> bool:
+            return changed is None or not changed.isdisjoint(fields)
+
         # === 화면 전환 ===
-        if self.state.current_screen == "main" and not self.main_scroll.isVisible():
-            self._show_main_screen_ui()
-        elif self.state.current_screen == "start" and not self.start_scroll.isVisible():
-            self._show_start_screen_ui()
+        if affected("current_screen", "server_url", "session_id"):
+            if self.state.current_screen == "main" and not self.main_scroll.isVisible():
+                self._show_main_screen_ui()
+            elif self.state.current_screen == "start" and not self.start_scroll.isVisible():
+                self._show_start_screen_ui()
 
         # === 상태 메시지 ===
-        if self.state.is_connected:
-            self.status_label.setText(self.state.status_message)
+        if affected("status_message", "is_connected") and self.state.is_connected:
+            set_text(self.status_label, self.state.status_message)
 
         # === 참여자 정보 ===
-        self.update_users_colors_display()
+        if affected("user_colors", "user_id", "is_connected"):
+            self.update_users_colors_display()
+
+        # === 링크 상태 / 스트로크 지연 ===
+        if affected("send_interval_ms", "rtt_ms"):
+            self.update_link_display()
+        if affected("latency_stats"):
+            self.update_latency_display()
+        if affected("loop_lag_stats", "server_loop_lag_stats"):
+            self.debug_panel.show_stats(
+                self.state.loop_lag_stats, self.state.server_loop_lag_stats
+            )
 
         # === 시작 화면 버튼 상태 ===
-        self.create_button.setEnabled(self.state.start_buttons_enabled)
-        self.join_button.setEnabled(
-            self.state.start_buttons_enabled and len(self.session_input.text().strip()) > 0
-        )
-        self.server_input.setEnabled(self.state.start_buttons_enabled)
-        self.session_input.setEnabled(self.state.start_buttons_enabled)
+        if affected("start_buttons_enabled"):
+            self._update_start_buttons()
 
         # === 오버레이 생성/삭제 버튼 ===
-        if self.state.overlay_created:
-            self.setup_overlay_button.hide()
-            self.overlay_control_widget.show()
-            self.toggle_drawing_button.setEnabled(True)
-            self.clear_drawings_button.setEnabled(True)
-        else:
-            self.overlay_control_widget.hide()
-            self.setup_overlay_button.show()
-            self.toggle_drawing_button.setEnabled(False)
-            self.clear_drawings_button.setEnabled(False)
+        if affected("overlay_created"):
+            self._update_overlay_buttons()
 
         # === 리사이즈 모드 버튼 ===
+        if affected("resize_mode_active"):
+            self._update_resize_button()
+
+        # === 그리기 모드 버튼 ===
+        if affected("drawing_mode_active"):
+            self._update_drawing_button()
+
+    def _update_start_buttons(self):
+        """시작 화면 버튼/입력 활성화 상태"""
+        enabled = self.state.start_buttons_enabled
+        set_enabled(self.create_button, enabled)
+        set_enabled(self.join_button, enabled and len(self.session_input.text().strip()) > 0)
+        set_enabled(self.server_input, enabled)
+        set_enabled(self.session_input, enabled)
+
+    def _update_overlay_buttons(self):
+        """오버레이 생성/삭제 버튼"""
+        created = self.state.overlay_created
+        set_visible(self.setup_overlay_button, not created)
+        set_visible(self.overlay_control_widget, created)
+        set_enabled(self.toggle_drawing_button, created)
+        set_enabled(self.clear_drawings_button, created)
+
+    def _update_resize_button(self):
+        """리사이즈 모드 버튼"""
         if self.state.resize_mode_active:
-            self.resize_overlay_button.setText("그림 영역 크기 조정 완료 (Enter)")
+            set_text(self.resize_overlay_button, "그림 영역 크기 조정 완료 (Enter)")
         else:
-            self.resize_overlay_button.setText("그림 영역 크기 조정")
+            set_text(self.resize_overlay_button, "그림 영역 크기 조정")
 
-        # === 그리기 모드 버튼 ===
+    def _update_drawing_button(self):
+        """그리기 모드 버튼"""
         if self.state.drawing_mode_active:
-            self.toggle_drawing_button.setText("그리기 비활성화 (ESC로 비활성화)")
-            self.toggle_drawing_button.setStyleSheet(
-                """
-                QPushButton {
-                    border: 3px solid #4CAF50;
-                    border-radius: 4px;
-                }
-                """
-            )
+            set_text(self.toggle_drawing_button, "그리기 비활성화 (ESC로 비활성화)")
+            set_style_sheet(self.toggle_drawing_button, DRAWING_ACTIVE_STYLE)
         else:
-            self.toggle_drawing_button.setText("그리기 활성화")
-            self.toggle_drawing_button.setStyleSheet("")
+            set_text(self.toggle_drawing_button, "그리기 활성화")
+            set_style_sheet(self.toggle_drawing_button, "")
 
     def show_start_screen(self):
         """시작 화면 표시 (상태 업데이트)"""
@@ -193,8 +265,8 @@ class MainWindow(QMainWindow):
         self.main_scroll.show()
 
         # 서버 주소와 세션 번호 표시
-        self.server_info_label.setText(f"서버 주소: {self.state.server_url}")
-        self.session_info_label.setText(f"세션 번호: {self.state.session_id}")
+        set_text(self.server_info_label, f"서버 주소: {self.state.server_url}")
+        set_text(self.session_info_label, f"세션 번호: {self.state.session_id}")
 
         # 참여자 색상 정보 표시
         self.update_users_colors_display()
@@ -235,33 +307,97 @@ class MainWindow(QMainWindow):
         logger.info(f"Start Status: {status}")
 
     def update_users_colors_display(self):
-        """참여자별 색상 정보 UI 업데이트"""
-        if not self.state.is_connected:
-            self.users_colors_label.setText("")
-            return
+        """참여자별 색상 정보 UI 업데이트 (바뀐 참여자 항목만)"""
+        user_colors = self.state.user_colors if self.state.is_connected else {}
+        self.participant_panel.sync(user_colors, self.state.user_id)
 
-        # State에서 user_colors 가져오기
-        user_colors = self.state.user_colors
+    def on_connection_state(self, connection_state: str):
+        """WebSocket 재연결 상태 표시 (이어가기 성공 메시지는 MessageHandler가 표시)
 
-        if not user_colors:
-            self.users_colors_label.setText("")
+        Args:
+            connection_state: "reconnecting", "resumed", "lost"
+        """
+        if connection_state == "reconnecting":
+            self.state.set_status("서버 연결이 끊겨 재연결 중...")
+        elif connection_state == "resumed":
+            # 새 연결의 링크 상태는 처음부터 측정
+            self._reset_link_state()
+        elif connection_state == "lost":
+            self.state.set_status("서버 연결이 끊어졌습니다. 세션에 다시 참여해주세요")
+
+    def update_link_display(self):
+        """선택된 전송 간격과 RTT 표시"""
+        rtt = "측정 중" if self.state.rtt_ms is None else f"{self.state.rtt_ms:.0f}ms"
+        set_text(self.link_label, f"전송 간격: {self.state.send_interval_ms}ms (RTT {rtt})")
+
+    def update_latency_display(self):
+        """스트로크 지연 (입력 → 다른 클라이언트 화면) p50/p95 표시, 구간별 값은 툴팁"""
+        if self.latency_tracer is None:
             return
 
-        # HTML로 색상 인디케이터 생성
-        color_indicators = []
-        for user_id, color in user_colors.items():
-            # 자신인 경우 "나 (ID)"로 표시, 다른 사람은 ID 앞 8자리만 표시
-            if user_id == self.state.user_id:
-                user_label = f"나 ({user_id[:8]})"
-            else:
-                user_label = user_id[:8]
-            # 색상 원 표시
-            color_html = f'<span style="color: {color.name()};">●</span> {user_label}'
-            color_indicators.append(color_html)
-
-        # HTML 문자열로 조합
-        display_text = "참여자: " + " | ".join(color_indicators)
-        self.users_colors_label.setText(display_text)
+        stats = self.state.latency_stats
+        total = stats.get(TOTAL_HOP)
+        if total:
+            set_text(
+                self.latency_label,
+                f"스트로크 지연: p50 {total['p50_ms']:.0f}ms / p95 {total['p95_ms']:.0f}ms",
+            )
+        else:
+            set_text(self.latency_label, "스트로크 지연: 측정 중...")
+        set_tool_tip(self.latency_label, "\n".join(format_hops(stats)))
+
+    def start_loop_monitor(self):
+        """이벤트 루프 지연 측정 시작 (실행 중인 루프 안에서 호출)"""
+        self.loop_lag.start()
+
+    def toggle_debug_panel(self):
+        """디버그 패널 표시/숨김 (Ctrl+Shift+D)"""
+        self.debug_panel.setVisible(self.debug_panel.isHidden())
+        if not self.debug_panel.isHidden():
+            self._refresh_debug_stats()
+
+    def _refresh_debug_stats(self):
+        """디버그 패널용 루프 지연 갱신, 연결 중이면 서버 통계 요청 (응답은 MessageHandler)"""
+        self.state.set_loop_lag_stats(self.loop_lag.summary())
+        if self.client and self.state.is_connected:
+            asyncio.create_task(self._send_stats_request())
+
+    def _on_link_timer(self):
+        """링크 측정: 전송 간격 조절 후 state 반영, 다음 RTT 측정용 ping 전송"""
+        if self.latency_tracer is not None:
+            self.state.set_latency_stats(self.latency_tracer.summary())
+        if not self.debug_panel.isHidden():
+            self._refresh_debug_stats()
+
+        if not (self.client and self.state.is_connected) or self.client.reconnecting:
+            return
+
+        interval = self.send_rate.update(self.client.outgoing_buffer_size())
+        self.canvas_manager.set_network_interval(interval, self.send_rate.raw_point_stride)
+        srtt = self.send_rate.srtt
+        self.state.set_link_state(interval, None if srtt is None else round(srtt * 1000))
+        asyncio.create_task(self._send_link_ping())
+
+    async def _send_link_ping(self):
+        """RTT 측정 ping 전송 (pong은 MessageHandler가 send_rate/tracer에 전달)"""
+        try:
+            await self.client.send_message(self.send_rate.ping_message())
+        except Exception as e:
+            logger.warning(f"Failed to send link ping: {e}")
+
+    def _reset_link_state(self):
+        """링크 측정값을 버리고 기본 전송 간격으로"""
+        self.send_rate.reset()
+        if self.canvas_manager:
+            self.canvas_manager.set_network_interval(self.send_rate.interval_ms)
+        self.state.set_link_state(self.send_rate.interval_ms, None)
+
+    async def _send_stats_request(self):
+        """서버 통계 요청 (디버그 패널의 서버 루프 지연)"""
+        try:
+            await self.client.send_message({"type": MessageType.STATS.value})
+        except Exception as e:
+            logger.warning(f"Failed to request server stats: {e}")
 
     async def disconnect(self):
         """서버 연결 종료"""
@@ -281,6 +417,9 @@ class MainWindow(QMainWindow):
             await self.client.disconnect()
             self.client = None
 
+        # 링크 측정값 초기화 (다음 연결은 기본 간격부터)
+        self._reset_link_state()
+
         # State 초기화
         self.state.set_disconnected()
         self.state.set_screen("start")
@@ -294,6 +433,7 @@ class MainWindow(QMainWindow):
 
     def closeEvent(self, event):
         """윈도우 종료 시 호출"""
+        self.loop_lag.stop()
         if self.client:
             # 비동기 disconnect를 동기적으로 실행
             loop = asyncio.get_event_loop()
@@ -3,7 +3,7 @@
 import logging
 from typing import TYPE_CHECKING
 
-from .constants import get_default_pen_color
+from .constants import OVERLAY_THREADED_RENDERING, get_default_pen_color
 
 if TYPE_CHECKING:
     from .main_window import MainWindow
@@ -30,6 +30,8 @@ class OverlayManager:
             overlay_window = OverlayWindow(
                 user_id=self.window.state.user_id,
                 pen_color=get_default_pen_color(),  # 첫 번째 프리셋 색상 (파스텔 핑크)
+                store=self.window.canvas_manager.store,  # 메인 캔버스와 스트로크 저장소 공유
+                threaded_rendering=OVERLAY_THREADED_RENDERING,
             )
 
             # Canvas Manager에 오버레이 캔버스 등록
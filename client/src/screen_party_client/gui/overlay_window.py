@@ -7,6 +7,7 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QPainter, QColor
 
 from ..drawing.canvas import DrawingCanvas
+from ..drawing.stroke_store import StrokeStore
 
 
 class OverlayWindow(QWidget):
@@ -21,10 +22,16 @@ class OverlayWindow(QWidget):
         user_id: str,
         pen_color: Optional[QColor] = None,
         parent: Optional[QWidget] = None,
+        store: Optional[StrokeStore] = None,
+        threaded_rendering: bool = False,
     ):
         super().__init__(parent)
 
         self.user_id = user_id
+        # Shared stroke store (None: the canvas creates its own)
+        self._store = store
+        # Rasterize remote strokes on a worker thread
+        self._threaded_rendering = threaded_rendering
         # Start with drawing disabled (click passthrough)
         self._drawing_enabled = False
 
@@ -71,6 +78,8 @@ class OverlayWindow(QWidget):
             user_id=self.user_id,
             pen_color=pen_color,
             pen_width=3,
+            store=self._store,
+            threaded_rendering=self._threaded_rendering,
         )
         layout.addWidget(self.drawing_canvas)
 
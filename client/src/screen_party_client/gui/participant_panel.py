@@ -0,0 +1,79 @@
+"""참여자 목록 패널"""
+
+from typing import Dict, List, Mapping, Optional, Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
+
+from .widget_updates import set_visible
+
+
+class ParticipantPanel(QWidget):
+    """참여자별 색상 표시 (참여자마다 라벨 하나)
+
+    sync()는 현재 표시 중인 목록과 비교해서 나간 참여자의 라벨만 제거하고,
+    새 참여자의 라벨만 추가하고, 색상/표시 이름이 바뀐 라벨만 다시 설정합니다.
+    참여자가 많아도 한 명의 색상 변경은 라벨 하나만 건드립니다.
+    """
+
+    def __init__(self, placeholder: str = "연결 대기 중...", parent: Optional[QWidget] = None):
+        """
+        Args:
+            placeholder: 참여자가 없을 때 표시할 문구
+            parent: 부모 위젯
+        """
+        super().__init__(parent)
+        self._layout = QVBoxLayout(self)
+        self._layout.setContentsMargins(0, 0, 0, 0)
+
+        self.placeholder_label = QLabel(placeholder)
+        self.placeholder_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._layout.addWidget(self.placeholder_label)
+
+        # user_id -> (라벨, 표시 중인 (색상 이름, 표시 이름))
+        self._entries: Dict[str, Tuple[QLabel, Tuple[str, str]]] = {}
+
+    def user_ids(self) -> List[str]:
+        """표시 중인 참여자 (표시 순서)"""
+        return list(self._entries)
+
+    def entry_text(self, user_id: str) -> str:
+        """참여자 라벨 텍스트 (없으면 빈 문자열)"""
+        entry = self._entries.get(user_id)
+        return entry[0].text() if entry else ""
+
+    def sync(self, user_colors: Mapping[str, QColor], my_user_id: Optional[str]):
+        """참여자 목록을 표시에 반영 (바뀐 항목만)
+
+        Args:
+            user_colors: user_id -> 색상 (삽입 순서 = 표시 순서)
+            my_user_id: 내 user_id ("나"로 표시)
+        """
+        for user_id in [uid for uid in self._entries if uid not in user_colors]:
+            label, _ = self._entries.pop(user_id)
+            self._layout.removeWidget(label)
+            label.deleteLater()
+
+        for user_id, color in user_colors.items():
+            shown = (color.name(), _display_name(user_id, my_user_id))
+            entry = self._entries.get(user_id)
+            if entry is None:
+                label = QLabel()
+                label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+                self._layout.addWidget(label)
+            elif entry[1] == shown:
+                continue
+            else:
+                label = entry[0]
+            label.setText(f'<span style="color: {shown[0]};">●</span> {shown[1]}')
+            self._entries[user_id] = (label, shown)
+
+        set_visible(self.placeholder_label, not self._entries)
+
+
+def _display_name(user_id: str, my_user_id: Optional[str]) -> str:
+    """자신인 경우 "나 (ID)", 다른 사람은 ID 앞 8자리"""
+    if user_id == my_user_id:
+        return f"나 ({user_id[:8]})"
+    return user_id[:8]
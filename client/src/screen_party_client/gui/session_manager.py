@@ -7,9 +7,8 @@ from PyQt6.QtCore import QTimer
 from PyQt6.QtGui import QColor
 from screen_party_common.models import DEFAULT_COLOR
 
-from ..network.client import WebSocketClient
-
 if TYPE_CHECKING:
+    from ..network.client import WebSocketClient
     from .main_window import MainWindow
 
 logger = logging.getLogger(__name__)
@@ -21,6 +20,18 @@ class SessionManager:
     def __init__(self, window: "MainWindow"):
         self.window = window
 
+    def _create_client(self, server_url: str) -> "WebSocketClient":
+        """WebSocket 클라이언트 생성 및 콜백 연결
+
+        네트워크 모듈(websockets)은 처음 연결할 때 로드합니다. (GUI 시작 시간 단축)
+        """
+        from ..network.client import WebSocketClient
+
+        client = WebSocketClient(server_url)
+        client.set_message_handler(self.window.handle_message)
+        client.connection_state_callback = self.window.on_connection_state
+        return client
+
     async def on_create_session(self):
         """세션 생성 (호스트)"""
         try:
@@ -39,8 +50,7 @@ class SessionManager:
 
             # WebSocket 클라이언트 생성 및 연결
             logger.info("Step 1: Creating WebSocket client...")
-            self.window.client = WebSocketClient(server_url)
-            self.window.client.set_message_handler(self.window.handle_message)
+            self.window.client = self._create_client(server_url)
 
             logger.info("Step 2: Connecting to server...")
             await self.window.client.connect()
@@ -130,8 +140,7 @@ class SessionManager:
 
             # WebSocket 클라이언트 생성 및 연결
             logger.info("Step 1: Creating WebSocket client...")
-            self.window.client = WebSocketClient(server_url)
-            self.window.client.set_message_handler(self.window.handle_message)
+            self.window.client = self._create_client(server_url)
 
             logger.info("Step 2: Connecting to server...")
             await self.window.client.connect()
@@ -1,10 +1,14 @@
 """Application state management - single source of truth"""
 
-from typing import Optional, Dict, Callable, List
+from typing import Any, Optional, Dict, Callable, FrozenSet, List, Set
 from dataclasses import dataclass, field
+from PyQt6.QtCore import QCoreApplication, QTimer
 from PyQt6.QtGui import QColor
 from screen_party_common.models import DEFAULT_COLOR
 
+# Observer callback: receives the names of the fields that changed
+StateObserver = Callable[[FrozenSet[str]], None]
+
 
 @dataclass
 class AppState:
@@ -12,6 +16,10 @@ class AppState:
 
     This is the single source of truth for all application state.
     UI components should read from this state and update UI accordingly.
+
+    Setters only record fields whose value actually changed. Observers are
+    notified once per event-loop turn with the names of every field changed
+    during that turn, so a burst of setter calls costs a single UI update.
     """
 
     # Connection state
@@ -43,19 +51,34 @@ class AppState:
     drawing_mode_active: bool = False
     hide_my_drawings: bool = False
 
+    # Link state (drawing update send interval chosen from RTT / send buffer)
+    send_interval_ms: int = 50
+    rtt_ms: Optional[float] = None
+
+    # Latency tracing (hop -> count/p50_ms/p95_ms/max_ms, empty when disabled)
+    latency_stats: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    # Event loop lag (LoopLagMonitor.summary() of this client / of the server)
+    loop_lag_stats: Dict[str, Any] = field(default_factory=dict)
+    server_loop_lag_stats: Dict[str, Any] = field(default_factory=dict)
+
     # Observers (callbacks when state changes)
-    _observers: List[Callable[[], None]] = field(default_factory=list, repr=False)
+    _observers: List[StateObserver] = field(default_factory=list, repr=False)
+
+    # Fields changed since observers were last notified
+    _changed: Set[str] = field(default_factory=set, repr=False)
+    _flush_scheduled: bool = field(default=False, repr=False)
 
-    def add_observer(self, callback: Callable[[], None]):
+    def add_observer(self, callback: StateObserver):
         """Add a state change observer
 
         Args:
-            callback: Function to call when state changes
+            callback: Function called with the names of the changed fields
         """
         if callback not in self._observers:
             self._observers.append(callback)
 
-    def remove_observer(self, callback: Callable[[], None]):
+    def remove_observer(self, callback: StateObserver):
         """Remove a state change observer
 
         Args:
@@ -64,10 +87,39 @@ class AppState:
         if callback in self._observers:
             self._observers.remove(callback)
 
-    def notify_observers(self):
-        """Notify all observers that state has changed"""
-        for observer in self._observers:
-            observer()
+    def notify_observers(self, *fields: str):
+        """Mark fields as changed and notify observers at the end of this event-loop turn
+
+        Args:
+            fields: Names of the changed fields
+        """
+        self._changed.update(fields)
+        if self._flush_scheduled or not self._changed:
+            return
+        if QCoreApplication.instance() is None:
+            # No event loop to defer to (headless use)
+            self.flush_notifications()
+            return
+        self._flush_scheduled = True
+        QTimer.singleShot(0, self.flush_notifications)
+
+    def flush_notifications(self):
+        """Notify observers of all pending changes now"""
+        self._flush_scheduled = False
+        if not self._changed:
+            return
+        changed = frozenset(self._changed)
+        self._changed.clear()
+        for observer in list(self._observers):
+            observer(changed)
+
+    def _update(self, **values: Any):
+        """Assign fields, notifying only the ones whose value changed"""
+        changed = [name for name, value in values.items() if getattr(self, name) != value]
+        for name in changed:
+            setattr(self, name, values[name])
+        if changed:
+            self.notify_observers(*changed)
 
     # === Participant Management ===
 
@@ -79,9 +131,8 @@ class AppState:
             color: User color
             alpha: User alpha (0.0 - 1.0)
         """
-        self.user_colors[user_id] = color
-        self.user_alphas[user_id] = alpha
-        self.notify_observers()
+        self.update_participant_color(user_id, color)
+        self.update_participant_alpha(user_id, alpha)
 
     def remove_participant(self, user_id: str):
         """Remove a participant
@@ -89,11 +140,10 @@ class AppState:
         Args:
             user_id: User ID to remove
         """
-        if user_id in self.user_colors:
-            del self.user_colors[user_id]
-        if user_id in self.user_alphas:
-            del self.user_alphas[user_id]
-        self.notify_observers()
+        if self.user_colors.pop(user_id, None) is not None:
+            self.notify_observers("user_colors")
+        if self.user_alphas.pop(user_id, None) is not None:
+            self.notify_observers("user_alphas")
 
     def update_participant_color(self, user_id: str, color: QColor):
         """Update participant color
@@ -102,8 +152,9 @@ class AppState:
             user_id: User ID
             color: New color
         """
-        self.user_colors[user_id] = color
-        self.notify_observers()
+        if self.user_colors.get(user_id) != color:
+            self.user_colors[user_id] = color
+            self.notify_observers("user_colors")
 
     def update_participant_alpha(self, user_id: str, alpha: float):
         """Update participant alpha
@@ -112,8 +163,10 @@ class AppState:
             user_id: User ID
             alpha: New alpha (0.0 - 1.0)
         """
-        self.user_alphas[user_id] = max(0.0, min(1.0, alpha))
-        self.notify_observers()
+        alpha = max(0.0, min(1.0, alpha))
+        if self.user_alphas.get(user_id) != alpha:
+            self.user_alphas[user_id] = alpha
+            self.notify_observers("user_alphas")
 
     def initialize_participants(self, participants: List[Dict]):
         """Initialize participants from server response
@@ -138,20 +191,19 @@ class AppState:
             user_id: User ID
             server_url: Server URL
         """
-        self.session_id = session_id
-        self.user_id = user_id
-        self.is_connected = True
-        self.server_url = server_url
-        self.notify_observers()
+        self._update(
+            session_id=session_id, user_id=user_id, is_connected=True, server_url=server_url
+        )
 
     def set_disconnected(self):
         """Reset connection state"""
-        self.session_id = None
-        self.user_id = None
-        self.is_connected = False
-        self.user_colors.clear()
-        self.user_alphas.clear()
-        self.notify_observers()
+        self._update(session_id=None, user_id=None, is_connected=False)
+        if self.user_colors:
+            self.user_colors.clear()
+            self.notify_observers("user_colors")
+        if self.user_alphas:
+            self.user_alphas.clear()
+            self.notify_observers("user_alphas")
 
     # === Overlay State ===
 
@@ -161,21 +213,23 @@ class AppState:
         Args:
             overlay_window: OverlayWindow instance
         """
-        self.overlay_window = overlay_window
-        self.is_sharing = True
-        self.overlay_created = True
-        self.resize_mode_active = True  # Start in resize mode
-        self.drawing_mode_active = False
-        self.notify_observers()
+        self._update(
+            overlay_window=overlay_window,
+            is_sharing=True,
+            overlay_created=True,
+            resize_mode_active=True,  # Start in resize mode
+            drawing_mode_active=False,
+        )
 
     def clear_overlay(self):
         """Clear overlay window"""
-        self.overlay_window = None
-        self.is_sharing = False
-        self.overlay_created = False
-        self.resize_mode_active = False
-        self.drawing_mode_active = False
-        self.notify_observers()
+        self._update(
+            overlay_window=None,
+            is_sharing=False,
+            overlay_created=False,
+            resize_mode_active=False,
+            drawing_mode_active=False,
+        )
 
     def set_resize_mode(self, active: bool):
         """Set resize mode state
@@ -183,8 +237,7 @@ class AppState:
         Args:
             active: True if resize mode is active
         """
-        self.resize_mode_active = active
-        self.notify_observers()
+        self._update(resize_mode_active=active)
 
     def set_drawing_mode(self, active: bool):
         """Set drawing mode state
@@ -192,8 +245,7 @@ class AppState:
         Args:
             active: True if drawing mode is active
         """
-        self.drawing_mode_active = active
-        self.notify_observers()
+        self._update(drawing_mode_active=active)
 
     # === Drawing State ===
 
@@ -203,7 +255,7 @@ class AppState:
         Args:
             color: New pen color
         """
-        self.pen_color = color
+        self._update(pen_color=color)
         if self.user_id:
             self.update_participant_color(self.user_id, color)
 
@@ -213,7 +265,7 @@ class AppState:
         Args:
             alpha: Alpha value (0.0 - 1.0)
         """
-        self.current_alpha = max(0.0, min(1.0, alpha))
+        self._update(current_alpha=max(0.0, min(1.0, alpha)))
         if self.user_id:
             self.update_participant_alpha(self.user_id, alpha)
 
@@ -223,8 +275,7 @@ class AppState:
         Args:
             hide: True to hide user's own drawings
         """
-        self.hide_my_drawings = hide
-        self.notify_observers()
+        self._update(hide_my_drawings=hide)
 
     # === UI State ===
 
@@ -234,8 +285,7 @@ class AppState:
         Args:
             screen: "start" or "main"
         """
-        self.current_screen = screen
-        self.notify_observers()
+        self._update(current_screen=screen)
 
     def set_status(self, message: str):
         """Set status message
@@ -243,8 +293,7 @@ class AppState:
         Args:
             message: Status message
         """
-        self.status_message = message
-        self.notify_observers()
+        self._update(status_message=message)
 
     def set_start_buttons_enabled(self, enabled: bool):
         """Set start buttons enabled state
@@ -252,5 +301,37 @@ class AppState:
         Args:
             enabled: True to enable buttons, False to disable
         """
-        self.start_buttons_enabled = enabled
-        self.notify_observers()
+        self._update(start_buttons_enabled=enabled)
+
+    def set_link_state(self, send_interval_ms: int, rtt_ms: Optional[float]):
+        """Set send interval and smoothed round trip time
+
+        Args:
+            send_interval_ms: Drawing update send interval in ms
+            rtt_ms: Smoothed RTT in ms (None until measured)
+        """
+        self._update(send_interval_ms=send_interval_ms, rtt_ms=rtt_ms)
+
+    def set_latency_stats(self, stats: Dict[str, Dict[str, float]]):
+        """Set per-hop latency summary
+
+        Args:
+            stats: Hop name -> latency summary
+        """
+        self._update(latency_stats=stats)
+
+    def set_loop_lag_stats(self, stats: Dict[str, Any]):
+        """Set this client's event loop lag summary
+
+        Args:
+            stats: LoopLagMonitor.summary()
+        """
+        self._update(loop_lag_stats=stats)
+
+    def set_server_loop_lag_stats(self, stats: Dict[str, Any]):
+        """Set the server's event loop lag summary (from a stats response)
+
+        Args:
+            stats: LoopLagMonitor.summary() reported by the server
+        """
+        self._update(server_loop_lag_stats=stats)
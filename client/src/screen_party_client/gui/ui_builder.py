@@ -16,7 +16,9 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
-from .constants import PRESET_COLORS, get_default_pen_color
+from .constants import DEBUG_PANEL, DRAWING_BATCH_INTERVAL, PRESET_COLORS, get_default_pen_color
+from .debug_panel import DebugPanel
+from .participant_panel import ParticipantPanel
 from ..drawing import DrawingCanvas
 
 if TYPE_CHECKING:
@@ -194,6 +196,12 @@ class UIBuilder:
         # Drawing Canvas 생성 (오버레이용으로만 사용)
         self._create_main_canvas()
 
+    def create_debug_panel(self):
+        """디버그 패널 생성 (시작/메인 화면 아래, DEBUG_PANEL이 아니면 숨김)"""
+        self.window.debug_panel = DebugPanel()
+        self.window.debug_panel.setVisible(DEBUG_PANEL)
+        self.window.main_layout.addWidget(self.window.debug_panel)
+
     def _create_main_title(self, layout: QVBoxLayout):
         """메인 화면 타이틀 생성"""
         title = QLabel("Screen Party")
@@ -352,9 +360,9 @@ class UIBuilder:
         participants_layout = QVBoxLayout()
         participants_group.setLayout(participants_layout)
 
-        self.window.users_colors_label = QLabel("연결 대기 중...")
-        self.window.users_colors_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        participants_layout.addWidget(self.window.users_colors_label)
+        # 참여자마다 라벨 하나 (바뀐 참여자만 추가/제거/갱신)
+        self.window.participant_panel = ParticipantPanel("연결 대기 중...")
+        participants_layout.addWidget(self.window.participant_panel)
 
         layout.addWidget(participants_group)
 
@@ -386,6 +394,15 @@ class UIBuilder:
         session_info_layout.addWidget(self.window.copy_session_button)
         info_layout.addLayout(session_info_layout)
 
+        # 링크 상태 (전송 간격, RTT)
+        self.window.link_label = QLabel("")
+        info_layout.addWidget(self.window.link_label)
+
+        # 스트로크 지연 표시 (지연 측정을 켰을 때만)
+        self.window.latency_label = QLabel("")
+        self.window.latency_label.setVisible(self.window.latency_tracer is not None)
+        info_layout.addWidget(self.window.latency_label)
+
         # 세션 나가기 버튼
         self.window.leave_session_button = QPushButton("세션 나가기")
         self.window.leave_session_button.setMinimumHeight(40)
@@ -442,4 +459,10 @@ class UIBuilder:
             state=self.window.state,
             canvas_manager=self.window.canvas_manager,
             disconnect_callback=self.window.disconnect,
+            tracer=self.window.latency_tracer,
+            send_rate=self.window.send_rate,
+            frame_interval=DRAWING_BATCH_INTERVAL,
         )
+
+        # 지연 측정: 적용된 원격 업데이트의 첫 paint 시각은 store를 공유하는 캔버스가 기록
+        self.window.canvas_manager.store.tracer = self.window.latency_tracer
@@ -0,0 +1,39 @@
+"""위젯 값 비교 후 갱신 헬퍼
+
+state → UI 반영은 자주 호출되므로, 위젯의 현재 값과 같으면 아무것도 하지 않습니다.
+(특히 setStyleSheet는 같은 값이어도 스타일을 다시 계산하고 위젯을 다시 그림)
+비교 기준은 캐시가 아니라 위젯 자신의 현재 값이라서, 다른 곳에서 위젯을 바꿔도 어긋나지 않습니다.
+"""
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QAbstractButton, QLabel, QWidget
+
+
+def set_text(widget: QLabel | QAbstractButton, text: str):
+    """텍스트가 다를 때만 설정"""
+    if widget.text() != text:
+        widget.setText(text)
+
+
+def set_tool_tip(widget: QWidget, tool_tip: str):
+    """툴팁이 다를 때만 설정"""
+    if widget.toolTip() != tool_tip:
+        widget.setToolTip(tool_tip)
+
+
+def set_style_sheet(widget: QWidget, style_sheet: str):
+    """스타일시트가 다를 때만 설정 (같은 값으로 다시 설정해도 스타일 재계산이 일어남)"""
+    if widget.styleSheet() != style_sheet:
+        widget.setStyleSheet(style_sheet)
+
+
+def set_enabled(widget: QWidget, enabled: bool):
+    """위젯 자신의 활성화 상태가 다를 때만 설정 (부모 상태와 무관)"""
+    if widget.testAttribute(Qt.WidgetAttribute.WA_ForceDisabled) == enabled:
+        widget.setEnabled(enabled)
+
+
+def set_visible(widget: QWidget, visible: bool):
+    """명시적 표시/숨김 상태가 다를 때만 설정 (부모 표시 여부와 무관)"""
+    if widget.isHidden() == visible:
+        widget.setVisible(visible)
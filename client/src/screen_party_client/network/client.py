@@ -1,32 +1,94 @@
 """WebSocket 클라이언트"""
 
+import asyncio
 import json
 import logging
-from typing import Optional, Callable
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
 
 import websockets
 from websockets.asyncio.client import ClientConnection
-from websockets.exceptions import ConnectionClosed
+from websockets.exceptions import ConnectionClosed, InvalidHandshake
+from screen_party_common import MessageType
+from screen_party_common.log_pipeline import SampledLogger
 
 logger = logging.getLogger(__name__)
+# 메시지마다 지나가는 디버그 로그는 샘플링 (송수신 경로에서 dict 전체를 매번 문자열로 만들지 않도록)
+sampled_logger = SampledLogger(logger, every=100)
+
+
+def decode_frames(frames: List[bytes]) -> List[dict]:
+    """수신 프레임 묶음 디코딩 (디코딩 스레드에서 실행, 잘못된 프레임은 건너뜀)
+
+    Args:
+        frames: UTF-8 JSON 프레임들
+
+    Returns:
+        디코딩된 메시지 (수신 순서)
+    """
+    messages = []
+    for frame in frames:
+        try:
+            messages.append(json.loads(frame))
+        except ValueError as e:
+            logger.error(f"Dropping undecodable frame: {e}")
+    sampled_logger.debug("Decoded %d messages", len(messages))
+    return messages
 
 
 class WebSocketClient:
     """Screen Party WebSocket 클라이언트"""
 
-    def __init__(self, url: str = "ws://localhost:8765"):
+    def __init__(
+        self,
+        url: str = "ws://localhost:8765",
+        reconnect_timeout: float = 30.0,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 4.0,
+        keepalive_interval: float = 5.0,
+        max_pending_frames: int = 256,
+        max_queued_sends: int = 512,
+    ):
+        """
+        Args:
+            url: 서버 주소
+            reconnect_timeout: 연결이 끊긴 뒤 재연결을 시도하는 시간 (초, 서버의 resume_grace 이하)
+            initial_backoff: 첫 재연결 재시도 대기 (초, 실패할 때마다 두 배)
+            max_backoff: 재시도 대기 상한 (초)
+            keepalive_interval: keepalive ping 간격/타임아웃 (초, 응답 없는 연결을 끊김으로 감지)
+            max_pending_frames: 디코딩을 기다리는 수신 프레임 상한 (넘으면 읽기를 멈춤)
+            max_queued_sends: 재연결 중에 보낸 메시지를 모아 두는 상한 (이어가기 후 순서대로 전송)
+        """
         self.url = url
         self.websocket: Optional[ClientConnection] = None
         self.running = False
         self.message_handler: Optional[Callable] = None
 
+        # 세션 이어가기 (create/join 응답의 resume_token, 마지막으로 받은 중계 seq)
+        self.resume_info: Optional[dict] = None
+        self.last_seq = 0
+        self.reconnect_timeout = reconnect_timeout
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.keepalive_interval = keepalive_interval
+        self.max_pending_frames = max_pending_frames
+        self.max_queued_sends = max_queued_sends
+        # 재연결 중에 보낸 메시지 (서버 교대/짧은 끊김 동안의 드로잉이 사라지지 않도록)
+        self._reconnecting = False
+        self._queued_sends: List[dict] = []
+        # 연결 상태 변경 콜백 ("reconnecting", "resumed", "lost")
+        self.connection_state_callback: Optional[Callable[[str], None]] = None
+
     async def connect(self):
         """서버 연결"""
         logger.info(f"Attempting to connect to WebSocket server: {self.url}")
         try:
             logger.debug(f"Opening WebSocket connection to {self.url}...")
-            self.websocket = await websockets.connect(self.url)
+            self.websocket = await self._open()
             self.running = True
+            self._reconnecting = False
+            self._queued_sends.clear()
             logger.info(f"✓ Successfully connected to {self.url}")
         except ConnectionRefusedError as e:
             logger.error(f"✗ Connection refused by server at {self.url}: {e}")
@@ -36,26 +98,59 @@ class WebSocketClient:
             logger.error(f"✗ Connection failed to {self.url}: {type(e).__name__}: {e}")
             raise
 
+    async def _open(self) -> ClientConnection:
+        """WebSocket 연결 (keepalive로 응답 없는 연결도 빨리 끊김으로 감지)"""
+        return await websockets.connect(
+            self.url, ping_interval=self.keepalive_interval, ping_timeout=self.keepalive_interval
+        )
+
     async def disconnect(self):
         """서버 연결 종료"""
         self.running = False
+        self.resume_info = None
         if self.websocket:
             await self.websocket.close()
             self.websocket = None
             logger.info("Disconnected from server")
 
+    @property
+    def reconnecting(self) -> bool:
+        """연결이 끊겨 세션 이어가기를 시도하는 중인지"""
+        return self._reconnecting
+
     async def send_message(self, message: dict):
         """메시지 전송
 
+        이어갈 세션이 있는 동안 연결이 끊겼으면 보내지 않고 모아 두었다가 이어가기에
+        성공하면 순서대로 보냅니다 (max_queued_sends를 넘으면 RuntimeError).
+        RTT 측정 ping은 모아 두지 않고 버립니다 (나중에 보내면 끊긴 시간이 RTT로 측정됨).
+
         Args:
             message: 전송할 메시지 (dict)
         """
+        if self._reconnecting:
+            self._queue_send(message)
+            return
         if not self.websocket:
             raise RuntimeError("Not connected to server")
 
         message_json = json.dumps(message)
-        await self.websocket.send(message_json)
-        logger.debug(f"Sent: {message}")
+        try:
+            await self.websocket.send(message_json)
+        except ConnectionClosed:
+            # 수신 루프가 아직 끊김을 처리하기 전 (곧 재연결)
+            if not (self.running and self.resume_info):
+                raise
+            self._queue_send(message)
+            return
+        sampled_logger.debug("Sent: %s", message)
+
+    def _queue_send(self, message: dict):
+        if message.get("type") == MessageType.PING.value:
+            return
+        if len(self._queued_sends) >= self.max_queued_sends:
+            raise RuntimeError("Reconnecting to server, send queue is full")
+        self._queued_sends.append(message)
 
     async def receive_message(self) -> dict:
         """메시지 수신
@@ -68,29 +163,174 @@ class WebSocketClient:
 
         message_json = await self.websocket.recv()
         message = json.loads(message_json)
-        logger.debug(f"Received: {message}")
+        sampled_logger.debug("Received: %s", message)
         return message
 
     async def listen(self):
-        """메시지 수신 루프 (백그라운드 태스크용)"""
+        """메시지 수신 루프 (백그라운드 태스크용)
+
+        수신 태스크는 프레임을 바이트 그대로 받아 쌓기만 하고, 쌓인 프레임은 디코딩
+        스레드에서 한꺼번에 UTF-8/JSON 디코딩한 뒤 순서대로 핸들러에 전달합니다.
+        디코딩하는 동안 도착한 프레임은 다음 묶음이 되므로 메시지가 몰릴수록 묶음이 커지고,
+        GUI 루프는 프레임마다가 아니라 묶음마다 한 번 깨어납니다.
+        """
+        decoder = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ws-decode")
         try:
             while self.running and self.websocket:
+                frames: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending_frames)
+                reader = asyncio.create_task(self._read_frames(self.websocket, frames))
                 try:
-                    message = await self.receive_message()
-                    if self.message_handler:
-                        await self.message_handler(message)
-                except ConnectionClosed:
-                    logger.info("Connection closed by server")
+                    closed = await self._deliver_frames(frames, decoder)
+                finally:
+                    reader.cancel()
+
+                if not isinstance(closed, ConnectionClosed):
+                    logger.error(f"Error receiving message: {closed}")
                     break
-                except Exception as e:
-                    logger.error(f"Error receiving message: {e}")
-                    if self.running:
-                        continue
-                    else:
-                        break
+                logger.info("Connection closed by server")
+                if self.running and self.resume_info and await self.reconnect():
+                    continue
+                break
         finally:
+            decoder.shutdown(wait=False)
             self.running = False
 
+    async def _read_frames(self, websocket: ClientConnection, frames: asyncio.Queue):
+        """수신 프레임(바이트)을 큐에 쌓기, 연결이 끝나면 그 예외를 마지막으로 넣음
+
+        큐가 가득 차면 읽기를 멈추므로 websockets의 수신 흐름 제어가 그대로 동작합니다.
+        """
+        try:
+            while True:
+                await frames.put(await websocket.recv(decode=False))
+        except Exception as e:
+            await frames.put(e)
+
+    async def _deliver_frames(
+        self, frames: asyncio.Queue, decoder: ThreadPoolExecutor
+    ) -> Exception:
+        """쌓인 프레임을 묶음으로 디코딩해서 전달, 연결이 끝나면 그 예외를 반환"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await frames.get()]
+            while not frames.empty():
+                batch.append(frames.get_nowait())
+
+            closed = batch.pop() if isinstance(batch[-1], Exception) else None
+            if batch:
+                for message in await loop.run_in_executor(decoder, decode_frames, batch):
+                    try:
+                        await self._dispatch(message)
+                    except Exception as e:
+                        logger.error(f"Error handling message: {e}")
+            if closed is not None:
+                return closed
+
+    def outgoing_buffer_size(self) -> int:
+        """전송 대기 중인 바이트 수 (소켓 쓰기 버퍼, 늘어나면 링크가 밀리는 중)"""
+        if not self.websocket:
+            return 0
+        transport = getattr(self.websocket, "transport", None)
+        return transport.get_write_buffer_size() if transport else 0
+
+    async def _dispatch(self, message: dict):
+        """수신 메시지를 핸들러에 전달 (중계 메시지의 seq 기록)"""
+        seq = message.get("seq")
+        if seq is not None:
+            self.last_seq = max(self.last_seq, seq)
+        if self.message_handler:
+            await self.message_handler(message)
+
+    def _notify_connection_state(self, state: str):
+        if self.connection_state_callback:
+            self.connection_state_callback(state)
+
+    async def reconnect(self) -> bool:
+        """끊긴 연결을 지수 백오프로 다시 맺고 세션 이어가기
+
+        성공하면 session_resumed 응답과 그 안에 담긴 놓친 중계 메시지들을 순서대로
+        핸들러에 전달합니다. reconnect_timeout 안에 실패하거나 서버가 거절하면
+        (참여자가 이미 정리됨 등) False.
+
+        Returns:
+            이어가기 성공 여부
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.reconnect_timeout
+        delay = self.initial_backoff
+        attempt = 0
+        self._reconnecting = True
+        self._notify_connection_state("reconnecting")
+
+        while self.running and self.resume_info:
+            attempt += 1
+            try:
+                self.websocket = await self._open()
+                await self.websocket.send(
+                    json.dumps(
+                        {
+                            "type": MessageType.RESUME_SESSION.value,
+                            **self.resume_info,
+                            "last_seq": self.last_seq,
+                        }
+                    )
+                )
+                response = await self.receive_message()
+            except (OSError, ConnectionClosed, InvalidHandshake, asyncio.TimeoutError) as e:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                # equal jitter: 여러 클라이언트가 동시에 재시도하지 않도록
+                wait = min(remaining, delay / 2 + random.uniform(0, delay / 2))
+                logger.warning(f"Reconnect attempt {attempt} failed ({e}), retrying in {wait:.2f}s")
+                await asyncio.sleep(wait)
+                delay = min(delay * 2, self.max_backoff)
+                continue
+
+            if response.get("type") != MessageType.SESSION_RESUMED.value:
+                logger.error(f"Session resume refused: {response.get('message', response)}")
+                self.resume_info = None
+                break
+
+            logger.info(
+                f"Session resumed after {attempt} attempt(s), "
+                f"{len(response.get('missed', []))} missed messages replayed"
+            )
+            self._notify_connection_state("resumed")
+            await self._dispatch({k: v for k, v in response.items() if k != "missed"})
+            for message in response.get("missed", []):
+                await self._dispatch(message)
+            # 서버 seq가 기준 (서버 재시작 등으로 더 작아졌으면 그 값에서 다시 셈)
+            self.last_seq = response.get("last_seq", self.last_seq)
+            await self._flush_queued_sends()
+            return True
+
+        self._reconnecting = False
+        self._queued_sends.clear()
+        self._notify_connection_state("lost")
+        return False
+
+    async def _flush_queued_sends(self):
+        """재연결 중에 모아 둔 메시지를 순서대로 전송 (전송 중에 새로 보낸 메시지는 뒤에 붙음)"""
+        try:
+            while self._queued_sends:
+                await self.websocket.send(json.dumps(self._queued_sends[0]))
+                self._queued_sends.pop(0)
+        except ConnectionClosed:
+            # 또 끊김 - 남은 메시지는 다음 이어가기에서 보냄
+            return
+        self._reconnecting = False
+
+    def _remember_session(self, response: dict, user_id_key: str):
+        """create/join 응답에서 세션 이어가기 정보 저장"""
+        if response.get("resume_token"):
+            self.resume_info = {
+                "session_id": response["session_id"],
+                "user_id": response[user_id_key],
+                "resume_token": response["resume_token"],
+            }
+            self.last_seq = 0
+
     def set_message_handler(self, handler: Callable):
         """메시지 핸들러 설정
 
@@ -113,6 +353,7 @@ class WebSocketClient:
         await self.send_message({"type": "create_session", "host_name": host_name})
         response = await self.receive_message()
         logger.info(f"Session creation response: {response.get('type')}")
+        self._remember_session(response, "host_id")
         return response
 
     async def join_session(self, session_id: str, guest_name: str) -> dict:
@@ -131,6 +372,25 @@ class WebSocketClient:
         )
         response = await self.receive_message()
         logger.info(f"Join session response: {response.get('type')}")
+        self._remember_session(response, "user_id")
+        return response
+
+    async def watch_session(self, session_id: str) -> dict:
+        """관전자로 세션 보기 요청 (참여자 목록에 들어가지 않고 중계 메시지를 받기만 함)
+
+        관전자는 이어갈 자리가 없으므로 연결이 끊기면 다시 watch_session을 보내야 합니다.
+
+        Args:
+            session_id: 세션 ID
+
+        Returns:
+            서버 응답 메시지 (session_watching)
+        """
+        logger.info(f"Requesting to watch session {session_id}")
+        await self.send_message({"type": MessageType.WATCH_SESSION.value, "session_id": session_id})
+        response = await self.receive_message()
+        logger.info(f"Watch session response: {response.get('type')}")
+        self.resume_info = None
         return response
 
     async def ping(self) -> dict:
@@ -0,0 +1,76 @@
+"""End-to-end stroke latency tracer (optional)"""
+
+from typing import Any, Dict, List, Mapping, Optional
+
+from screen_party_common import ClockSync, HopLatencyStats
+
+
+class LatencyTracer:
+    """Stamps drawing update traces and aggregates per-hop latency
+
+    All stamps are in the server's monotonic clock, estimated by adding the
+    ClockSync offset (from ping/pong round trips) to the local monotonic clock.
+    The tracer only exists while tracing is enabled, so call sites check
+    ``tracer is not None`` and pay nothing otherwise.
+    """
+
+    def __init__(self, clock_sync: Optional[ClockSync] = None):
+        """Initialize latency tracer
+
+        Args:
+            clock_sync: Server clock offset estimator (default: local monotonic)
+        """
+        self.clock = clock_sync or ClockSync()
+        self.stats = HopLatencyStats()
+        # Traces applied to the store but not painted yet
+        self._unpainted: List[Dict[str, float]] = []
+
+    def now(self) -> float:
+        """Current time in the server clock"""
+        return self.clock.now()
+
+    # === Sender ===
+
+    def outgoing_trace(self, input_time: float) -> Dict[str, float]:
+        """Trace for an outgoing drawing update
+
+        Args:
+            input_time: Server-clock time of the first input in this packet
+        """
+        return {"input": input_time, "send": self.now()}
+
+    # === Receiver ===
+
+    def on_receive(self, message: Mapping[str, Any]):
+        """Stamp the receive time on a decoded drawing update"""
+        trace = message.get("trace")
+        if trace:
+            trace["receive"] = self.now()
+
+    def on_applied(self, trace: Dict[str, float]):
+        """Remember a trace whose update is now in the store (paint pending)"""
+        self._unpainted.append(trace)
+
+    def on_paint(self):
+        """Stamp first paint on all pending traces and record them"""
+        if not self._unpainted:
+            return
+        painted = self.now()
+        for trace in self._unpainted:
+            trace["paint"] = painted
+            self.stats.record(trace)
+        self._unpainted.clear()
+
+    # === Clock sync ===
+
+    def on_pong(self, message: Mapping[str, Any]):
+        """Update the clock offset from a pong that echoes client_time
+
+        The ping's client_time must come from the same monotonic clock.
+        """
+        if "client_time" in message and "server_time" in message:
+            self.clock.observe(message["client_time"], message["server_time"], self.clock.local())
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-hop latency summary (hop -> count/p50_ms/p95_ms/max_ms)"""
+        return self.stats.summary()
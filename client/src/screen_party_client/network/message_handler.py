@@ -1,16 +1,29 @@
 """Message handler - processes server messages"""
 
 import logging
-from typing import Dict, Any, Callable, Awaitable
+import time
+from typing import Dict, Any, Callable, Awaitable, List, Optional
 
 from PyQt6.QtGui import QColor
 from screen_party_common import MessageType
+from screen_party_common.log_pipeline import SampledLogger
 from screen_party_common.models import DEFAULT_COLOR
 
 from ..gui.state import AppState
+from ..drawing.animation_scheduler import AnimationScheduler
 from ..drawing.canvas_manager import CanvasManager
+from .latency_tracer import LatencyTracer
+from .send_rate import AdaptiveSendInterval
 
 logger = logging.getLogger(__name__)
+# 메시지마다 지나가는 디버그 로그는 샘플링 (전부 남기면 수신 루프가 느려짐)
+sampled_logger = SampledLogger(logger, every=100)
+
+DRAWING_MESSAGE_TYPES = {
+    MessageType.DRAWING_START.value,
+    MessageType.DRAWING_UPDATE.value,
+    MessageType.DRAWING_END.value,
+}
 
 
 class MessageHandler:
@@ -25,6 +38,9 @@ class MessageHandler:
         state: AppState,
         canvas_manager: CanvasManager,
         disconnect_callback: Callable[[], Awaitable[None]],
+        tracer: Optional[LatencyTracer] = None,
+        send_rate: Optional[AdaptiveSendInterval] = None,
+        frame_interval: Optional[int] = None,
     ):
         """Initialize message handler
 
@@ -32,10 +48,25 @@ class MessageHandler:
             state: Application state
             canvas_manager: Canvas manager
             disconnect_callback: Async function to call on disconnect
+            tracer: Latency tracer (None when latency tracing is disabled)
+            send_rate: Send interval controller fed with ping round trips
+            frame_interval: Queue drawing messages and hand them to the canvas
+                manager at most once per this many ms (None = apply each one
+                as it arrives)
         """
         self.state = state
         self.canvas_manager = canvas_manager
         self.disconnect_callback = disconnect_callback
+        self.tracer = tracer
+        self.send_rate = send_rate
+
+        # Drawing messages waiting for the next frame flush
+        self._pending_drawing: List[Dict[str, Any]] = []
+        self._last_flush = 0.0
+        self.frame_interval = frame_interval
+        self._flush_scheduler: Optional[AnimationScheduler] = None
+        if frame_interval is not None:
+            self._flush_scheduler = AnimationScheduler(self._flush_tick, frame_interval)
 
     async def handle_message(self, message: Dict[str, Any]):
         """Handle incoming message from server
@@ -44,12 +75,18 @@ class MessageHandler:
             message: Message dictionary
         """
         msg_type = message.get("type")
-        logger.info(f"Received message: {msg_type}")
+        sampled_logger.debug("Received message: %s", msg_type)
+
+        # Anything else may depend on earlier drawing traffic (participants, colors)
+        if msg_type not in DRAWING_MESSAGE_TYPES:
+            self.flush()
 
         if msg_type in ("guest_joined", "participant_joined"):
             await self._handle_participant_joined(message)
         elif msg_type in ("guest_left", "participant_left"):
             await self._handle_participant_left(message)
+        elif msg_type == MessageType.SESSION_RESUMED.value:
+            await self._handle_session_resumed(message)
         elif msg_type == "session_expired":
             await self._handle_session_expired(message)
         elif msg_type == "error":
@@ -62,6 +99,37 @@ class MessageHandler:
             await self._handle_drawing_end(message)
         elif msg_type == MessageType.COLOR_CHANGE.value:
             await self._handle_color_change(message)
+        elif msg_type == MessageType.PONG.value:
+            await self._handle_pong(message)
+        elif msg_type == MessageType.STATS.value:
+            self.state.set_server_loop_lag_stats(message.get("loop_lag", {}))
+
+    # === Frame Batching ===
+
+    def flush(self):
+        """Hand all queued drawing messages to the canvas manager now"""
+        if self._flush_scheduler is not None:
+            self._flush_scheduler.stop()
+        if not self._pending_drawing:
+            return
+        batch, self._pending_drawing = self._pending_drawing, []
+        self._last_flush = time.time()
+        self.canvas_manager.handle_drawing_batch(batch)
+
+    def _deliver_drawing(self, message: Dict[str, Any]):
+        """Queue a drawing message for the next frame (or apply it right away)"""
+        self._pending_drawing.append(message)
+        if self._flush_scheduler is None:
+            self.flush()
+        elif self._flush_scheduler.is_idle():
+            # No added latency when idle; at most one flush per frame under load
+            next_frame = self._last_flush + self.frame_interval / 1000.0
+            self._flush_scheduler.request_at(max(time.time(), next_frame))
+
+    def _flush_tick(self, now: float) -> Optional[float]:
+        """Frame timer: flush the queue (idle until the next message arrives)"""
+        self.flush()
+        return None
 
     # === Participant Messages ===
 
@@ -107,12 +175,45 @@ class MessageHandler:
         self.state.set_status(f"Session expired: {reason}")
         await self.disconnect_callback()
 
+    async def _handle_session_resumed(self, message: Dict[str, Any]):
+        """Handle session resumed after a reconnect
+
+        Reconciles participants that joined or left while disconnected; the
+        missed drawing traffic follows as regular messages.
+        """
+        participants = {
+            p["user_id"]: p.get("color", DEFAULT_COLOR)
+            for p in message.get("participants", [])
+            if p.get("user_id")
+        }
+        for user_id in list(self.state.user_colors):
+            if user_id not in participants:
+                self.state.remove_participant(user_id)
+                self.canvas_manager.remove_participant(user_id)
+        for user_id, color_str in participants.items():
+            if user_id not in self.state.user_colors:
+                color = QColor(color_str)
+                self.state.add_participant(user_id, color, alpha=1.0)
+                self.canvas_manager.add_participant(user_id, color, alpha=1.0)
+
+        if message.get("replay_complete", True):
+            self.state.set_status("Reconnected")
+        else:
+            self.state.set_status("Reconnected (some drawings were missed)")
+
     async def _handle_error(self, message: Dict[str, Any]):
         """Handle error message"""
         error_msg = message.get("message", "Unknown error")
         self.state.set_status(f"Error: {error_msg}")
         logger.error(f"Server error: {error_msg}")
 
+    async def _handle_pong(self, message: Dict[str, Any]):
+        """Handle pong (round trip for send interval, clock offset for tracing)"""
+        if self.send_rate is not None:
+            self.send_rate.on_pong(message)
+        if self.tracer is not None:
+            self.tracer.on_pong(message)
+
     # === Drawing Messages ===
 
     async def _handle_drawing_start(self, message: Dict[str, Any]):
@@ -121,15 +222,18 @@ class MessageHandler:
         user_id = message.get("user_id")
 
         if line_id and user_id and user_id != self.state.user_id:
-            self.canvas_manager.handle_drawing_start(line_id, user_id, message)
+            self._deliver_drawing(message)
 
     async def _handle_drawing_update(self, message: Dict[str, Any]):
         """Handle drawing update message"""
+        if self.tracer is not None:
+            self.tracer.on_receive(message)
+
         line_id = message.get("line_id")
         user_id = message.get("user_id")
 
         if line_id and user_id and user_id != self.state.user_id:
-            self.canvas_manager.handle_drawing_update(line_id, user_id, message)
+            self._deliver_drawing(message)
 
     async def _handle_drawing_end(self, message: Dict[str, Any]):
         """Handle drawing end message"""
@@ -137,7 +241,7 @@ class MessageHandler:
         user_id = message.get("user_id")
 
         if line_id and user_id and user_id != self.state.user_id:
-            self.canvas_manager.handle_drawing_end(line_id, user_id)
+            self._deliver_drawing(message)
 
     async def _handle_color_change(self, message: Dict[str, Any]):
         """Handle color change message"""
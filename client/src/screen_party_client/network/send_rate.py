@@ -0,0 +1,139 @@
+"""링크 상태에 따른 드로잉 업데이트 전송 간격 조절"""
+
+import logging
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Mapping, Optional
+
+from screen_party_common import MessageType
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveSendInterval:
+    """RTT와 송신 버퍼 증가량으로 전송 간격과 raw 점 간격을 조절
+
+    주기적으로 (update 호출마다) 링크가 혼잡한지 판단합니다.
+    - 혼잡: 송신 버퍼가 이전보다 늘었거나, 평활 RTT가 최근 최소 RTT보다
+      queue_delay_threshold 이상 큼 (경로 어딘가에 큐가 쌓이는 중)
+      → 간격을 increase_factor배로 늘림 (상한 max_ms)
+    - 여유: 간격을 decrease_step_ms씩 줄임 (하한 min_ms, LAN에서는 하한까지 내려감)
+
+    간격이 기본 간격보다 길어지면 그만큼 raw 점(아직 피팅 전인 꼬리)을 솎아서 보냅니다.
+    raw 점은 매 패킷마다 통째로 교체되므로 솎아도 최종 획 모양은 바뀌지 않습니다.
+    """
+
+    def __init__(
+        self,
+        initial_ms: int = 50,
+        min_ms: int = 16,
+        max_ms: int = 200,
+        queue_delay_threshold: float = 0.03,
+        increase_factor: float = 1.5,
+        decrease_step_ms: int = 5,
+        max_raw_point_stride: int = 4,
+        rtt_window: int = 30,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            initial_ms: 시작 간격이자 raw 점을 솎지 않는 기준 간격 (ms)
+            min_ms: 간격 하한 (ms)
+            max_ms: 간격 상한 (ms)
+            queue_delay_threshold: 혼잡으로 보는 큐 지연 (평활 RTT - 최소 RTT, 초)
+            increase_factor: 혼잡할 때 간격 배율
+            decrease_step_ms: 여유 있을 때 줄이는 간격 (ms)
+            max_raw_point_stride: raw 점 솎기 간격 상한 (1이면 솎지 않음)
+            rtt_window: 최소 RTT를 찾을 최근 샘플 수
+            clock: monotonic 시계 (ping 송신/pong 수신 시각)
+        """
+        self.initial_ms = initial_ms
+        self.min_ms = min_ms
+        self.max_ms = max_ms
+        self.queue_delay_threshold = queue_delay_threshold
+        self.increase_factor = increase_factor
+        self.decrease_step_ms = decrease_step_ms
+        self.max_raw_point_stride = max_raw_point_stride
+        self._clock = clock
+        self._rtt_samples: Deque[float] = deque(maxlen=rtt_window)
+        self.reset()
+
+    def reset(self):
+        """연결이 바뀌면 측정값을 버리고 기본 간격으로"""
+        self.interval_ms = self.initial_ms
+        self.srtt: Optional[float] = None
+        self._rtt_samples.clear()
+        self._last_backlog = 0
+
+    # === 측정 ===
+
+    def ping_message(self) -> Dict[str, Any]:
+        """RTT 측정용 ping (서버가 client_time을 pong에 그대로 돌려줌)"""
+        return {"type": MessageType.PING.value, "client_time": self._clock()}
+
+    def on_pong(self, message: Mapping[str, Any]):
+        """client_time을 돌려준 pong으로 RTT 샘플 추가"""
+        if "client_time" in message:
+            self.observe_rtt(self._clock() - message["client_time"])
+
+    def observe_rtt(self, rtt: float):
+        """RTT 샘플 반영 (평활 RTT는 TCP와 같은 1/8 이득)"""
+        if rtt < 0:
+            return
+        self._rtt_samples.append(rtt)
+        self.srtt = rtt if self.srtt is None else self.srtt + (rtt - self.srtt) / 8
+
+    @property
+    def min_rtt(self) -> Optional[float]:
+        """최근 최소 RTT (큐가 비었을 때의 경로 지연 추정)"""
+        return min(self._rtt_samples) if self._rtt_samples else None
+
+    @property
+    def queue_delay(self) -> float:
+        """평활 RTT 중 큐 대기로 보이는 부분 (초)"""
+        if self.srtt is None:
+            return 0.0
+        return max(0.0, self.srtt - self.min_rtt)
+
+    # === 조절 ===
+
+    def update(self, backlog: int) -> int:
+        """측정값으로 전송 간격 갱신
+
+        Args:
+            backlog: 현재 송신 버퍼 크기 (바이트)
+
+        Returns:
+            새 전송 간격 (ms)
+        """
+        grew = backlog > self._last_backlog
+        self._last_backlog = backlog
+
+        if self.srtt is None and not grew:
+            return self.interval_ms  # 아직 판단할 근거 없음
+
+        previous = self.interval_ms
+        if grew or self.queue_delay > self.queue_delay_threshold:
+            self.interval_ms = min(self.max_ms, math.ceil(self.interval_ms * self.increase_factor))
+        else:
+            self.interval_ms = max(self.min_ms, self.interval_ms - self.decrease_step_ms)
+
+        if self.interval_ms != previous:
+            logger.info(
+                f"Send interval {previous}ms -> {self.interval_ms}ms "
+                f"(rtt={self._ms(self.srtt)}, queue={self.queue_delay * 1000:.0f}ms, "
+                f"backlog={backlog}B, raw stride={self.raw_point_stride})"
+            )
+        return self.interval_ms
+
+    @property
+    def raw_point_stride(self) -> int:
+        """raw 점을 몇 개마다 하나씩 보낼지 (기준 간격 이하면 1 = 모두)"""
+        if self.interval_ms <= self.initial_ms:
+            return 1
+        return min(self.max_raw_point_stride, math.ceil(self.interval_ms / self.initial_ms))
+
+    @staticmethod
+    def _ms(seconds: Optional[float]) -> str:
+        return "?" if seconds is None else f"{seconds * 1000:.0f}ms"
@@ -0,0 +1,197 @@
+"""
+클라이언트 시작 시간 측정 및 지연 로딩
+
+StartupTrace는 시작 단계(phase)별 소요 시간과 모듈별 import 시간을 기록합니다.
+import 시간은 builtins.__import__를 감싸서 처음 로드되는 모듈만 측정하며,
+자기 자신(self)과 하위 import 포함(cumulative) 시간을 따로 보여줍니다.
+
+lazy_import()는 모듈 객체를 먼저 돌려주고 실제 로드는 첫 속성 접근 때 합니다.
+(numpy처럼 무겁고 시작 직후에는 필요 없는 모듈용)
+"""
+
+import builtins
+import importlib.util
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Optional, TextIO
+
+
+@dataclass
+class ImportRecord:
+    """모듈 하나의 import 시간 (초)"""
+
+    name: str
+    self_time: float
+    cumulative: float
+
+
+class StartupTrace:
+    """시작 단계/모듈 import 시간 기록기
+
+    사용 예:
+        trace = StartupTrace()
+        trace.install_import_hook()
+        with trace.phase("create window"):
+            window = MainWindow()
+        trace.report()
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        """
+        Args:
+            clock: 시간 함수 (테스트용 주입)
+        """
+        self.clock = clock
+        self.started_at = clock()
+        self.phases: List[tuple] = []  # (이름, 시작 오프셋, 소요 시간)
+        self.imports: Dict[str, ImportRecord] = {}
+        self._original_import: Optional[Callable] = None
+        self._thread_id = threading.get_ident()
+        # 진행 중인 import마다 [모듈 이름, 하위 import에 쓴 시간]
+        self._import_stack: List[list] = []
+
+    def elapsed(self) -> float:
+        """StartupTrace 생성 이후 경과 시간 (초)"""
+        return self.clock() - self.started_at
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """with 블록의 소요 시간을 단계로 기록"""
+        start = self.clock()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start - self.started_at, self.clock() - start))
+
+    def mark(self, name: str):
+        """현재 시점을 소요 시간 0인 단계로 기록 (예: 첫 화면 표시)"""
+        self.phases.append((name, self.elapsed(), 0.0))
+
+    def install_import_hook(self):
+        """이후 처음 로드되는 모듈의 import 시간 기록 시작"""
+        if self._original_import is not None:
+            return
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._traced_import
+
+    def uninstall_import_hook(self):
+        """import 시간 기록 중지"""
+        if self._original_import is None:
+            return
+        builtins.__import__ = self._original_import
+        self._original_import = None
+
+    def _traced_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._original_import
+        module_name = _resolve_name(name, globals, level)
+        # 다른 스레드(래스터라이저, 디코딩 풀)의 import는 기록하지 않음
+        if module_name is None or threading.get_ident() != self._thread_id:
+            return original(name, globals, locals, fromlist, level)
+
+        # "from pkg import submodule"은 pkg가 이미 로드되어 있어도 새 모듈을 로드할 수 있음
+        if module_name in sys.modules:
+            candidates = [
+                f"{module_name}.{item}"
+                for item in fromlist or ()
+                if item != "*" and f"{module_name}.{item}" not in sys.modules
+            ]
+            if not candidates:
+                return original(name, globals, locals, fromlist, level)
+        else:
+            candidates = [module_name]
+
+        frame = [module_name, 0.0]
+        self._import_stack.append(frame)
+        start = self.clock()
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            cumulative = self.clock() - start
+            self._import_stack.pop()
+            if self._import_stack:
+                self._import_stack[-1][1] += cumulative
+            loaded = [c for c in candidates if c in sys.modules and c not in self.imports]
+            if loaded:
+                label = ", ".join(loaded)
+                self.imports[label] = ImportRecord(label, cumulative - frame[1], cumulative)
+
+    def top_imports(self, limit: int = 15) -> List[ImportRecord]:
+        """하위 import 포함 시간이 긴 순서의 import 기록"""
+        records = sorted(self.imports.values(), key=lambda r: r.cumulative, reverse=True)
+        return records[:limit]
+
+    def report(self, stream: Optional[TextIO] = None, limit: int = 15):
+        """단계별 시간과 import 시간 상위 항목 출력"""
+        stream = stream or sys.stderr
+        print("[startup] phases (start offset / duration):", file=stream)
+        for name, offset, duration in self.phases:
+            print(
+                f"[startup]   {offset * 1000:8.1f} ms  {duration * 1000:8.1f} ms  {name}",
+                file=stream,
+            )
+
+        if self.imports:
+            print(f"[startup] slowest imports (self / cumulative, top {limit}):", file=stream)
+            for record in self.top_imports(limit):
+                print(
+                    f"[startup]   {record.self_time * 1000:8.1f} ms  "
+                    f"{record.cumulative * 1000:8.1f} ms  {record.name}",
+                    file=stream,
+                )
+
+
+def _resolve_name(name: str, globals: Optional[dict], level: int) -> Optional[str]:
+    """상대 import 이름을 절대 이름으로 변환 (실패하면 None)"""
+    if level == 0:
+        return name
+    package = (globals or {}).get("__package__")
+    if not package:
+        return None
+    try:
+        return importlib.util.resolve_name("." * level + name, package)
+    except ImportError:
+        return None
+
+
+def lazy_import(name: str) -> ModuleType:
+    """첫 속성 접근 때 로드되는 모듈 반환
+
+    이미 로드된 모듈이면 그대로 반환합니다.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def call_on_first_paint(widget, callback: Callable[[], None]):
+    """위젯이 처음 그려진 직후 callback 호출 (한 번만)
+
+    Paint 이벤트 처리가 끝난 다음 이벤트 루프 차례에 호출하므로
+    callback 시점에는 첫 화면이 실제로 그려진 상태입니다.
+    """
+    from PyQt6.QtCore import QEvent, QObject, QTimer
+
+    class _FirstPaintFilter(QObject):
+        def eventFilter(self, watched, event):
+            if event.type() == QEvent.Type.Paint:
+                watched.removeEventFilter(self)
+                QTimer.singleShot(0, callback)
+            return False
+
+    event_filter = _FirstPaintFilter(widget)
+    widget.installEventFilter(event_filter)
+    return event_filter
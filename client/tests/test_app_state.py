@@ -0,0 +1,100 @@
+"""
+AppState 변경 알림 묶음/필드 비교 테스트
+"""
+
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication
+
+from screen_party_client.gui.main_window import MainWindow
+from screen_party_client.gui.state import AppState
+
+
+def _observed(state: AppState) -> list:
+    calls = []
+    state.add_observer(calls.append)
+    return calls
+
+
+class TestStateNotifications:
+    """observer 알림 테스트"""
+
+    def test_coalesced_per_event_loop_turn(self, qtbot):
+        """한 바퀴 동안의 변경은 바뀐 필드 이름을 모아 한 번만 알림"""
+        state = AppState()
+        calls = _observed(state)
+
+        state.set_status("hello")
+        state.set_start_buttons_enabled(False)
+        state.set_link_state(80, 12.0)
+        assert calls == []
+
+        QApplication.processEvents()
+        assert calls == [{"status_message", "start_buttons_enabled", "send_interval_ms", "rtt_ms"}]
+
+    def test_unchanged_values_not_notified(self, qtbot):
+        """값이 그대로인 setter 호출은 알림 없음"""
+        state = AppState()
+        state.set_status("same")
+        state.add_participant("user", QColor(255, 0, 0))
+        QApplication.processEvents()
+        calls = _observed(state)
+
+        state.set_status("same")
+        state.update_participant_color("user", QColor(255, 0, 0))
+        state.update_participant_alpha("user", 1.0)
+        state.remove_participant("nobody")
+        QApplication.processEvents()
+
+        assert calls == []
+
+    def test_color_change_and_participants_batched(self, qtbot):
+        """색상+알파 변경, 참여자 목록 초기화는 각각 한 번의 알림"""
+        state = AppState()
+        calls = _observed(state)
+
+        state.initialize_participants(
+            [{"user_id": f"user-{index}", "color": "#FF0000"} for index in range(20)]
+        )
+        QApplication.processEvents()
+        state.update_participant_color("user-3", QColor(0, 0, 255))
+        state.update_participant_alpha("user-3", 0.5)
+        QApplication.processEvents()
+
+        assert calls == [{"user_colors", "user_alphas"}, {"user_colors", "user_alphas"}]
+        assert len(state.user_colors) == 20
+
+    def test_flush_notifications(self, qtbot):
+        """flush_notifications는 대기 중인 변경을 바로 알리고 예약된 알림은 비어 있음"""
+        state = AppState()
+        calls = _observed(state)
+
+        state.set_screen("main")
+        state.flush_notifications()
+        QApplication.processEvents()
+
+        assert calls == [{"current_screen"}]
+
+
+class TestMainWindowPartialUpdate:
+    """바뀐 필드에 해당하는 UI만 갱신하는지 테스트"""
+
+    def test_only_affected_widgets_updated(self, qtbot, monkeypatch):
+        """링크 상태 변경은 참여자 표시를 다시 만들지 않음"""
+        window = MainWindow()
+        qtbot.addWidget(window)
+        window.state.set_connected("TEST01", "user-001", "ws://localhost:8765")
+        QApplication.processEvents()
+
+        rebuilt = []
+        monkeypatch.setattr(window, "update_users_colors_display", lambda: rebuilt.append(1))
+
+        window.state.set_link_state(120, 30.0)
+        QApplication.processEvents()
+        assert rebuilt == []
+        assert "120ms" in window.link_label.text()
+
+        window.state.add_participant("user-002", QColor(0, 255, 0))
+        window.state.set_status("joined")
+        QApplication.processEvents()
+        assert rebuilt == [1]
+        assert window.status_label.text() == "joined"
@@ -40,6 +40,50 @@ class TestBezierSegment:
         assert segment.p2 == (30.0, 40.0)
         assert segment.p3 == (50.0, 60.0)
 
+    def test_flatten_straight_line(self):
+        """직선 세그먼트는 양 끝점만으로 근사"""
+        segment = BezierSegment(p0=(0.0, 0.0), p1=(1.0, 1.0), p2=(2.0, 2.0), p3=(3.0, 3.0))
+
+        assert segment.flatten() == [(0.0, 0.0), (3.0, 3.0)]
+
+    def test_flatten_within_tolerance(self):
+        """꺾은선과 곡선 사이 오차가 배율 적용 좌표계에서 tolerance 이하"""
+        import math
+
+        segment = BezierSegment(p0=(0.1, 0.1), p1=(0.3, 0.6), p2=(0.6, -0.2), p3=(0.9, 0.5))
+        scale_x, scale_y, tolerance = 1920.0, 1080.0, 0.25
+
+        points = segment.flatten(scale_x, scale_y, tolerance)
+        assert points[0] == segment.p0
+        assert points[-1] == segment.p3
+
+        def bezier(t):
+            mt = 1 - t
+            coeffs = (mt**3, 3 * mt * mt * t, 3 * mt * t * t, t**3)
+            ctrl = (segment.p0, segment.p1, segment.p2, segment.p3)
+            return (
+                sum(c * p[0] for c, p in zip(coeffs, ctrl)),
+                sum(c * p[1] for c, p in zip(coeffs, ctrl)),
+            )
+
+        # 각 구간 내부의 곡선 점과 해당 현(chord) 사이 거리
+        steps = len(points) - 1
+        for i in range(steps):
+            (ax, ay), (bx, by) = points[i], points[i + 1]
+            ax, ay, bx, by = ax * scale_x, ay * scale_y, bx * scale_x, by * scale_y
+            for k in range(1, 10):
+                x, y = bezier((i + k / 10) / steps)
+                x, y = x * scale_x, y * scale_y
+                cross = (bx - ax) * (ay - y) - (ax - x) * (by - ay)
+                dist = abs(cross) / math.hypot(bx - ax, by - ay)
+                assert dist <= tolerance
+
+    def test_flatten_more_points_at_larger_scale(self):
+        """배율이 클수록 더 많은 점 사용"""
+        segment = BezierSegment(p0=(0.1, 0.1), p1=(0.3, 0.6), p2=(0.6, -0.2), p3=(0.9, 0.5))
+
+        assert len(segment.flatten(3840, 2160)) > len(segment.flatten(400, 300))
+
 
 class TestBezierFitter:
     """BezierFitter (Schneider 알고리즘) 테스트"""
@@ -0,0 +1,59 @@
+"""
+디버그 패널 (이벤트 루프 지연) 테스트
+"""
+
+import asyncio
+
+from PyQt6.QtWidgets import QApplication
+
+from screen_party_client.gui.main_window import MainWindow
+from screen_party_client.network.message_handler import MessageHandler
+
+SLOW = {
+    "lag": {"count": 40, "p50_ms": 1.2, "p95_ms": 6.0, "max_ms": 180.0},
+    "threshold_ms": 100.0,
+    "slow_callbacks": 1,
+    "recent_slow": [
+        {
+            "at": 0.0,
+            "lag_ms": 180.0,
+            "stack": ['  File "canvas.py", line 10, in paintEvent\n    self.draw()\n'],
+        }
+    ],
+}
+
+
+class TestDebugPanel:
+    """디버그 패널 테스트"""
+
+    def test_toggle_shows_client_lag(self, qtbot):
+        """Ctrl+Shift+D 토글로 표시되고 이 클라이언트의 루프 지연을 보여줌"""
+        window = MainWindow()
+        qtbot.addWidget(window)
+        assert window.debug_panel.isHidden()
+
+        window.loop_lag.record(0.002)
+        window.toggle_debug_panel()
+        QApplication.processEvents()
+
+        assert not window.debug_panel.isHidden()
+        assert "클라이언트 루프: p50" in window.debug_panel.client_label.text()
+        assert window.debug_panel.server_label.text() == "서버 루프: 측정 중..."
+
+        window.toggle_debug_panel()
+        assert window.debug_panel.isHidden()
+
+    def test_server_stats_response_shown(self, qtbot):
+        """서버 stats 응답의 loop_lag는 state를 거쳐 패널에 표시 (느린 콜백 스택 포함)"""
+        window = MainWindow()
+        qtbot.addWidget(window)
+        handler = MessageHandler(window.state, window.canvas_manager, window.disconnect)
+
+        asyncio.run(handler.handle_message({"type": "stats", "sessions": 1, "loop_lag": SLOW}))
+        QApplication.processEvents()
+
+        panel = window.debug_panel
+        assert panel.server_label.text().endswith("max 180ms, 느린 콜백 1")
+        text = panel.slow_callbacks_view.toPlainText()
+        assert "--- 서버 느린 콜백 ---" in text
+        assert "in paintEvent" in text
@@ -2,6 +2,7 @@
 DrawingCanvas GUI 테스트 (pytest-qt 사용)
 """
 
+import pytest
 from PyQt6.QtCore import Qt, QPoint
 from PyQt6.QtGui import QColor
 from pytestqt.qtbot import QtBot
@@ -355,7 +356,8 @@ class TestDrawingCanvasFadeAnimation:
         assert canvas.fade_hold_duration == 3.0
         assert canvas.fade_duration == 2.0
         assert canvas.timeout_duration == 15.0
-        assert canvas.animation_timer.isActive()
+        # 라인이 없으면 애니메이션 스케줄러는 잠들어 있어야 함
+        assert canvas.animation_scheduler.is_idle()
 
     def test_fade_animation_default_parameters(self, qtbot: QtBot):
         """페이드아웃 기본 파라미터 테스트"""
@@ -596,3 +598,402 @@ class TestDrawingCanvasFadeAnimation:
         # 렌더링 (오류 없이 완료되어야 함)
         canvas.update()
         qtbot.wait(50)
+
+
+class TestDrawingCanvasDirtyRect:
+    """부분 다시 그리기 (dirty rect) 테스트"""
+
+    def test_line_data_tracks_bounds(self):
+        """LineData가 세그먼트/raw 점 바운딩 박스를 추적하는지 확인"""
+        from screen_party_client.drawing.bezier_fitter import BezierSegment
+        from screen_party_client.drawing.line_data import LineData
+
+        line_data = LineData(line_id="l", user_id="u", color=QColor(255, 0, 0))
+        assert line_data.bounds is None
+
+        added = line_data.add_finalized_segments(
+            [BezierSegment(p0=(10.0, 10.0), p1=(20.0, 5.0), p2=(30.0, 40.0), p3=(50.0, 20.0))]
+        )
+        assert added == (10.0, 5.0, 50.0, 40.0)
+        assert line_data.segment_bounds == [(10.0, 5.0, 50.0, 40.0)]
+
+        # raw 점 변경 영역은 이전 + 새 raw 점의 합집합
+        line_data.update_raw_points([(50.0, 20.0), (60.0, 25.0)])
+        changed = line_data.update_raw_points([(50.0, 20.0), (70.0, 30.0)])
+        assert changed == (50.0, 20.0, 70.0, 30.0)
+        assert line_data.bounds == (10.0, 5.0, 70.0, 40.0)
+
+        # finalize는 사라진 raw 점 영역을 반환
+        assert line_data.finalize() == (50.0, 20.0, 70.0, 30.0)
+        assert line_data.bounds == (10.0, 5.0, 50.0, 40.0)
+
+    def test_remote_update_invalidates_only_changed_region(self, qtbot: QtBot, monkeypatch):
+        """원격 업데이트 시 위젯 전체가 아닌 변경 영역만 갱신"""
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        canvas.resize(1000, 1000)
+
+        updates = []
+        monkeypatch.setattr(canvas, "update", lambda *args: updates.append(args))
+
+        canvas.handle_drawing_start("line", "other", {})
+        canvas.handle_drawing_update(
+            "line",
+            "other",
+            {
+                "new_finalized_segments": [
+                    {"p0": (0.1, 0.1), "p1": (0.12, 0.1), "p2": (0.14, 0.1), "p3": (0.15, 0.1)}
+                ],
+                "current_raw_points": [(0.15, 0.1), (0.16, 0.11)],
+            },
+        )
+
+        assert len(updates) == 1
+        (rect,) = updates[0]
+        assert rect.intersects(canvas.rect())
+        assert rect.width() < 100 and rect.height() < 100
+
+    def test_paint_event_skips_lines_outside_dirty_rect(self, qtbot: QtBot, monkeypatch):
+        """paintEvent가 다시 그릴 영역과 겹치지 않는 라인을 건너뛰는지 확인"""
+        from PyQt6.QtCore import QRect
+
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        canvas.resize(400, 400)
+        canvas.show()
+
+        for line_id, x in (("left", 0.05), ("right", 0.9)):
+            canvas.handle_drawing_start(line_id, "other", {})
+            canvas.handle_drawing_update(
+                line_id,
+                "other",
+                {
+                    "new_finalized_segments": [
+                        {"p0": (x, 0.1), "p1": (x, 0.2), "p2": (x, 0.3), "p3": (x, 0.4)}
+                    ],
+                    "current_raw_points": [],
+                },
+            )
+        qtbot.wait(50)
+
+        drawn = []
+        original = canvas._bezier_path
+        monkeypatch.setattr(
+            canvas,
+            "_bezier_path",
+            lambda segment: (drawn.append(segment), original(segment))[1],
+        )
+
+        canvas.repaint(QRect(0, 0, 50, 400))
+
+        assert len(drawn) == 1
+        assert drawn[0].p0[0] < 50 / 400  # 저장/렌더링 모두 상대 좌표 (QTransform으로 변환)
+
+    def test_line_removal_updates_spatial_index(self, qtbot: QtBot):
+        """라인 추가/삭제가 공간 인덱스에 반영되는지 확인"""
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        canvas.resize(100, 100)
+
+        canvas.handle_drawing_start("line", "other", {})
+        canvas.handle_drawing_update(
+            "line",
+            "other",
+            {
+                "new_finalized_segments": [
+                    {"p0": (0.1, 0.1), "p1": (0.2, 0.1), "p2": (0.3, 0.1), "p3": (0.4, 0.1)}
+                ],
+                "current_raw_points": [(0.4, 0.1), (0.5, 0.2)],
+            },
+        )
+
+        assert canvas.lines_in_region((0.0, 0.0, 100.0, 100.0)) == ["line"]
+        assert canvas.lines_in_region((80.0, 80.0, 100.0, 100.0)) == []
+
+        canvas.handle_line_remove("line")
+
+        assert "line" not in canvas.spatial_index
+        assert canvas.lines_in_region((0.0, 0.0, 100.0, 100.0)) == []
+
+
+class TestDrawingCanvasAnimationScheduler:
+    """데드라인 기반 애니메이션 스케줄러 테스트"""
+
+    def test_idle_without_lines(self, qtbot: QtBot):
+        """라인이 없으면 틱하지 않음"""
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+
+        ticks = []
+        original = canvas.animation_scheduler._tick
+        canvas.animation_scheduler._tick = lambda now: (ticks.append(now), original(now))[1]
+
+        qtbot.wait(100)
+
+        assert canvas.animation_scheduler.is_idle()
+        assert ticks == []
+
+    def test_sleeps_until_fade_start(self, qtbot: QtBot):
+        """hold 단계 동안은 페이드 시작 시각까지 잠듦"""
+        canvas = DrawingCanvas(fade_hold_duration=0.3, fade_duration=0.2)
+        qtbot.addWidget(canvas)
+
+        canvas.handle_drawing_start("line", "other", {})
+        canvas.handle_drawing_end("line", "other")
+
+        line_data = canvas.remote_lines["line"]
+        deadline = canvas.animation_scheduler.deadline
+        assert deadline == pytest.approx(line_data.end_time + 0.3)
+
+        ticks = []
+        original = canvas.animation_scheduler._tick
+        canvas.animation_scheduler._tick = lambda now: (ticks.append(now), original(now))[1]
+
+        # hold 단계 중에는 틱 없음
+        qtbot.wait(200)
+        assert ticks == []
+
+        # 페이드가 끝나면 라인이 삭제되고 다시 idle
+        qtbot.waitUntil(lambda: "line" not in canvas.remote_lines, timeout=2000)
+        qtbot.waitUntil(canvas.animation_scheduler.is_idle, timeout=1000)
+        assert len(ticks) >= 2  # 페이드 구간에는 프레임 간격으로 틱
+
+    def test_update_animations_returns_next_deadline(self, qtbot: QtBot):
+        """_update_animations가 다음 데드라인을 계산"""
+        canvas = DrawingCanvas(fade_hold_duration=2.0, fade_duration=1.0, timeout_duration=10.0)
+        qtbot.addWidget(canvas)
+        canvas.animation_scheduler.stop()
+
+        assert canvas._update_animations(1000.0) is None
+
+        canvas.handle_drawing_start("line", "other", {})
+        line_data = canvas.remote_lines["line"]
+        line_data.last_update_time = 1000.0
+
+        # 그리는 중: 타임아웃 시각
+        assert canvas._update_animations(1001.0) == pytest.approx(1010.0)
+
+        # hold 단계: 페이드 시작 시각
+        line_data.end_time = 1001.0
+        assert canvas._update_animations(1002.0) == pytest.approx(1003.0)
+
+        # 페이드 단계: 지금 (프레임 틱)
+        assert canvas._update_animations(1003.5) == pytest.approx(1003.5)
+
+
+class TestDrawingCanvasTransform:
+    """상대 좌표 저장 + paintEvent 변환 테스트"""
+
+    def _add_vertical_line(self, canvas: DrawingCanvas, x: float):
+        canvas.handle_drawing_start("line", "other", {})
+        canvas.handle_drawing_update(
+            "line",
+            "other",
+            {
+                "new_finalized_segments": [
+                    {"p0": (x, 0.1), "p1": (x, 0.4), "p2": (x, 0.6), "p3": (x, 0.9)}
+                ],
+                "current_raw_points": [],
+            },
+        )
+
+    def test_resize_keeps_stored_geometry(self, qtbot: QtBot):
+        """창 크기를 바꿔도 저장된 geometry는 변하지 않음"""
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        canvas.resize(200, 100)
+        self._add_vertical_line(canvas, 0.5)
+
+        segment = canvas.remote_lines["line"].finalized_segments[0]
+        canvas.resize(800, 600)
+
+        assert canvas.remote_lines["line"].finalized_segments[0] is segment
+        assert segment.p0 == (0.5, 0.1)
+
+    def test_render_follows_widget_size(self, qtbot: QtBot):
+        """같은 라인이 위젯 크기에 맞춰 다른 위치에 그려짐 (펜 두께는 픽셀 단위)"""
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        self._add_vertical_line(canvas, 0.25)
+
+        for width, height in ((200, 100), (400, 300)):
+            canvas.resize(width, height)
+            image = canvas.grab().toImage()
+            x = int(width * 0.25)
+            y = int(height * 0.5)
+            assert image.pixelColor(x, y).alpha() > 0
+            # 두께 3px 펜: 선에서 멀리 떨어진 곳은 비어 있음
+            assert image.pixelColor(x + 10, y).alpha() == 0
+
+    def test_store_bounds_map_to_widget(self, qtbot: QtBot):
+        """상대 좌표 영역 ↔ 위젯 좌표 영역 변환"""
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        canvas.resize(200, 100)
+
+        assert canvas._to_widget_bounds((0.25, 0.5, 0.5, 1.0)) == (50.0, 50.0, 100.0, 100.0)
+        assert canvas._to_relative_bounds((50.0, 50.0, 100.0, 100.0)) == (0.25, 0.5, 0.5, 1.0)
+
+
+class TestDrawingCanvasStyleBatching:
+    """펜 상태별 묶음 렌더링 테스트"""
+
+    def _add_line(self, canvas: DrawingCanvas, line_id: str, user_id: str, x: float):
+        canvas.handle_drawing_start(line_id, user_id, {})
+        canvas.handle_drawing_update(
+            line_id,
+            user_id,
+            {
+                "new_finalized_segments": [
+                    {"p0": (x, 0.1), "p1": (x, 0.2), "p2": (x, 0.3), "p3": (x, 0.4)},
+                    {"p0": (x, 0.4), "p1": (x, 0.5), "p2": (x, 0.6), "p3": (x, 0.7)},
+                ],
+                "current_raw_points": [(x, 0.7), (x, 0.8)],
+            },
+        )
+
+    def test_lines_grouped_by_color_and_alpha(self, qtbot: QtBot):
+        """같은 색상/알파값의 라인들은 하나의 path로 묶임"""
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        canvas.set_user_color("a", QColor(255, 0, 0))
+        canvas.set_user_color("b", QColor(0, 0, 255))
+
+        self._add_line(canvas, "a1", "a", 0.1)
+        self._add_line(canvas, "a2", "a", 0.2)
+        self._add_line(canvas, "b1", "b", 0.3)
+
+        visible = canvas.spatial_index.query_segments((0.0, 0.0, 1.0, 1.0))
+        batches = canvas._batch_remote_lines(visible)
+        assert len(batches) == 2
+
+        # 페이드로 알파값이 달라지면 다른 그룹
+        canvas.remote_lines["a2"].alpha = 0.5
+        batches = canvas._batch_remote_lines(visible)
+        assert len(batches) == 3
+
+        # 그룹 순서는 라인이 처음 등장한 순서
+        red_key, faded_key, blue_key = batches
+        assert QColor.fromRgba(red_key[0]).red() == 255
+        assert QColor.fromRgba(faded_key[0]).alpha() == 128
+        assert QColor.fromRgba(blue_key[0]).blue() == 255
+
+    def test_one_pen_change_per_group(self, qtbot: QtBot, monkeypatch):
+        """paintEvent는 라인 수와 무관하게 그룹당 setPen 한 번"""
+        from PyQt6.QtGui import QPainter
+
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        canvas.resize(200, 200)
+        canvas.set_user_color("a", QColor(255, 0, 0))
+        canvas.set_user_color("b", QColor(0, 0, 255))
+        for i in range(10):
+            self._add_line(canvas, f"line-{i}", "a" if i % 2 else "b", 0.05 + i * 0.09)
+
+        pens = []
+        draws = []
+        original_set_pen = QPainter.setPen
+        original_draw_path = QPainter.drawPath
+        monkeypatch.setattr(
+            QPainter,
+            "setPen",
+            lambda painter, pen: (pens.append(pen), original_set_pen(painter, pen)),
+        )
+        monkeypatch.setattr(
+            QPainter,
+            "drawPath",
+            lambda painter, path: (draws.append(path), original_draw_path(painter, path)),
+        )
+        canvas.grab()
+
+        # 그룹마다 완성된 라인용(polyline) 펜 + 그리는 중인 라인용(path) 펜
+        assert len(pens) == 2 * 2
+        assert len(draws) == 10 * 3  # 라인당 세그먼트 2개 + raw 구간 1개
+
+
+class TestDrawingCanvasPolylineCache:
+    """완성된 라인의 polyline 캐시 테스트"""
+
+    def _add_complete_line(self, canvas: DrawingCanvas, line_id: str, segments):
+        canvas.handle_drawing_start(line_id, "other", {})
+        canvas.handle_drawing_update(line_id, "other", {"new_finalized_segments": segments})
+        canvas.handle_drawing_end(line_id, "other")
+
+    def test_completed_line_drawn_as_polyline(self, qtbot: QtBot, monkeypatch):
+        """완성된 라인은 drawPolyline, 그리는 중인 라인은 drawPath"""
+        from PyQt6.QtGui import QPainter
+
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        canvas.resize(200, 200)
+        segment = {"p0": (0.1, 0.1), "p1": (0.3, 0.5), "p2": (0.5, 0.1), "p3": (0.7, 0.5)}
+        self._add_complete_line(canvas, "done", [segment])
+        canvas.handle_drawing_start("drawing", "other", {})
+        canvas.handle_drawing_update("drawing", "other", {"new_finalized_segments": [segment]})
+
+        polylines = []
+        paths = []
+        original_polyline = QPainter.drawPolyline
+        original_path = QPainter.drawPath
+        monkeypatch.setattr(
+            QPainter,
+            "drawPolyline",
+            lambda painter, poly: (polylines.append(poly), original_polyline(painter, poly)),
+        )
+        monkeypatch.setattr(
+            QPainter,
+            "drawPath",
+            lambda painter, path: (paths.append(path), original_path(painter, path)),
+        )
+        canvas.grab()
+
+        assert len(polylines) == 1
+        assert len(paths) == 1
+
+    def test_cache_reused_until_resize(self, qtbot: QtBot):
+        """스케일이 같으면 캐시 재사용, 크기가 바뀌면 다시 계산"""
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        canvas.resize(100, 100)
+        self._add_complete_line(
+            canvas,
+            "line",
+            [
+                {"p0": (0.1, 0.1), "p1": (0.3, 0.5), "p2": (0.5, 0.1), "p3": (0.7, 0.5)},
+                {"p0": (0.7, 0.5), "p1": (0.8, 0.6), "p2": (0.9, 0.6), "p3": (0.9, 0.9)},
+            ],
+        )
+        line_data = canvas.remote_lines["line"]
+
+        runs = canvas._line_polylines(line_data)
+        assert canvas._line_polylines(line_data) is runs
+        # 이어진 세그먼트는 하나의 polyline
+        assert len(runs) == 1
+        assert runs[0][:2] == (0, 1)
+
+        canvas.resize(1000, 1000)
+        large_runs = canvas._line_polylines(line_data)
+        assert large_runs is not runs
+        # 큰 화면에서는 같은 허용 오차를 위해 더 많은 점이 필요
+        assert large_runs[0][2].count() > runs[0][2].count()
+
+        # 세그먼트가 추가되면 캐시 무효화
+        line_data.add_finalized_segments([])
+        assert line_data.polyline_cache == {}
+
+    def test_disconnected_segments_split_runs(self, qtbot: QtBot):
+        """끊긴 세그먼트는 별도 polyline 구간"""
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        canvas.resize(100, 100)
+        self._add_complete_line(
+            canvas,
+            "line",
+            [
+                {"p0": (0.1, 0.1), "p1": (0.2, 0.1), "p2": (0.3, 0.1), "p3": (0.4, 0.1)},
+                {"p0": (0.6, 0.6), "p1": (0.7, 0.6), "p2": (0.8, 0.6), "p3": (0.9, 0.6)},
+            ],
+        )
+
+        runs = canvas._line_polylines(canvas.remote_lines["line"])
+        assert [run[:2] for run in runs] == [(0, 0), (1, 1)]
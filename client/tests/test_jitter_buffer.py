@@ -0,0 +1,271 @@
+"""
+지터 버퍼 (보간 재생) 테스트
+"""
+
+import random
+
+import pytest
+from pytestqt.qtbot import QtBot
+
+from screen_party_client.drawing.jitter_buffer import JitterBuffer, JitterEstimator
+from screen_party_client.drawing.stroke_store import StrokeStore
+
+
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Recorder:
+    """apply 콜백 기록"""
+
+    def __init__(self):
+        self.updates = []
+        self.ends = []
+
+    def update(self, line_id, user_id, data):
+        self.updates.append((line_id, data))
+
+    def end(self, line_id, user_id):
+        self.ends.append(line_id)
+
+
+def _packet(points, segments=()):
+    return {"new_finalized_segments": list(segments), "current_raw_points": points}
+
+
+class TestJitterEstimator:
+    """전송 시간/지터 추정 테스트"""
+
+    def test_steady_arrivals(self):
+        """일정한 간격/지연이면 버퍼 깊이 = 송신 간격"""
+        estimator = JitterEstimator()
+        for i in range(50):
+            estimator.observe(sent_at=i * 0.05, arrival=i * 0.05 + 0.02)
+
+        assert estimator.jitter == pytest.approx(0.0)
+        assert estimator.depth == pytest.approx(0.05)
+        assert estimator.playout_offset() == pytest.approx(0.02 + 0.05)
+
+    def test_depth_grows_with_jitter(self):
+        """도착 간격이 흔들릴수록 버퍼가 깊어짐 (상한 있음)"""
+        rng = random.Random(0)
+        calm = JitterEstimator()
+        noisy = JitterEstimator()
+        for i in range(200):
+            calm.observe(i * 0.05, i * 0.05 + 0.02 + rng.uniform(0, 0.002))
+            noisy.observe(i * 0.05, i * 0.05 + 0.02 + rng.uniform(0, 0.08))
+
+        assert noisy.depth > calm.depth + 0.03
+        assert noisy.depth <= noisy.max_depth
+
+    def test_independent_of_clock_offset(self):
+        """송신자/수신자 시계 차이는 재생 지연에 그대로 흡수됨"""
+        estimator = JitterEstimator()
+        for i in range(10):
+            estimator.observe(sent_at=5000.0 + i * 0.05, arrival=i * 0.05 + 0.01)
+
+        assert estimator.playout_offset() == pytest.approx(-5000.0 + 0.01 + 0.05)
+
+    def test_pause_not_counted_as_interval(self):
+        """획 사이 휴지 기간은 송신 간격 추정에서 제외"""
+        estimator = JitterEstimator()
+        estimator.observe(0.0, 0.0)
+        estimator.observe(10.0, 10.0)
+
+        assert estimator.interval == pytest.approx(0.05)
+
+
+class TestJitterBuffer:
+    """재생 스케줄링/보간 테스트"""
+
+    def _buffer(self, qtbot: QtBot):
+        clock = FakeClock()
+        recorder = Recorder()
+        buffer = JitterBuffer(recorder.update, recorder.end, clock=clock)
+        buffer.scheduler.stop()
+        return buffer, clock, recorder
+
+    def test_packet_applied_at_due_time(self, qtbot: QtBot):
+        """패킷은 도착 즉시가 아니라 송신 시각 + 재생 지연에 그대로 적용"""
+        buffer, clock, recorder = self._buffer(qtbot)
+        buffer.start("line", "user", (0.0, 0.0))
+        data = _packet([(0.0, 0.0), (0.1, 0.0)])
+
+        buffer.push("line", "user", sent_at=clock.now, data=data)
+        due = clock.now + 0.05  # 최소 전송 시간 0 + 깊이(송신 간격)
+        buffer._tick(due - 0.051)
+        assert recorder.updates == []
+
+        buffer._tick(due)
+        assert recorder.updates[-1] == ("line", data)
+        assert "line" not in buffer
+
+    def test_ink_revealed_progressively(self, qtbot: QtBot):
+        """재생 시각 전에는 새 잉크가 진행률만큼 조금씩 드러남"""
+        buffer, clock, recorder = self._buffer(qtbot)
+        buffer.start("line", "user", (0.0, 0.0))
+        points = [(i / 10, 0.0) for i in range(11)]
+        buffer.push("line", "user", sent_at=clock.now, data=_packet(points))
+        start = clock.now
+
+        revealed = []
+        for step in range(1, 5):
+            buffer._tick(start + step * 0.01)
+            revealed.append(len(recorder.updates[-1][1]["current_raw_points"]))
+
+        # 시작 점 + 진행률만큼의 점들, 점점 늘어남
+        assert revealed == sorted(revealed)
+        assert revealed[0] < revealed[-1] < len(points)
+        assert recorder.updates[-1][1]["current_raw_points"][0] == (0.0, 0.0)
+
+    def test_segments_revealed_along_curve(self, qtbot: QtBot):
+        """새 세그먼트도 평탄화해서 이전 펜 위치 이후부터 드러냄"""
+        buffer, clock, recorder = self._buffer(qtbot)
+        buffer.start("line", "user", (0.0, 0.0))
+        first = _packet([(0.0, 0.0), (0.2, 0.0)])
+        buffer.push("line", "user", sent_at=1000.0, data=first)
+        segment = {"p0": (0.0, 0.0), "p1": (0.1, 0.0), "p2": (0.3, 0.0), "p3": (0.4, 0.0)}
+        clock.now += 0.05
+        buffer.push("line", "user", sent_at=1000.05, data=_packet([], [segment]))
+
+        buffer._tick(1000.05)  # 첫 패킷 적용
+        buffer._tick(1000.08)  # 두 번째 패킷 보간 중
+
+        raw = recorder.updates[-1][1]["current_raw_points"]
+        assert "new_finalized_segments" not in recorder.updates[-1][1]
+        assert raw[:2] == [(0.0, 0.0), (0.2, 0.0)]
+        assert all(0.2 < x <= 0.4 for x, _ in raw[2:])
+
+    def test_end_after_pending_updates(self, qtbot: QtBot):
+        """drawing_end는 대기 중인 업데이트가 모두 적용된 뒤에 적용"""
+        buffer, clock, recorder = self._buffer(qtbot)
+        buffer.start("line", "user", (0.0, 0.0))
+        buffer.push("line", "user", sent_at=clock.now, data=_packet([(0.0, 0.0), (0.1, 0.0)]))
+
+        assert buffer.end("line", "user")
+        assert recorder.ends == []
+
+        buffer._tick(clock.now + 1.0)
+        assert recorder.ends == ["line"]
+        assert not buffer.end("line", "user")  # 더 이상 대기 중인 업데이트 없음
+
+    def test_late_packet_keeps_line_order(self, qtbot: QtBot):
+        """지연이 줄어도 같은 라인의 패킷 순서는 유지"""
+        buffer, clock, recorder = self._buffer(qtbot)
+        buffer.start("line", "user", (0.0, 0.0))
+        clock.now += 0.2  # 첫 패킷은 늦게 도착
+        buffer.push("line", "user", sent_at=1000.0, data=_packet([(0.0, 0.0), (0.1, 0.0)]))
+        clock.now += 0.01
+        buffer.push("line", "user", sent_at=1000.05, data=_packet([(0.1, 0.0), (0.2, 0.0)]))
+
+        first, second = buffer._lines["line"].packets
+        assert second.due >= first.due
+        assert second.start == first.due
+
+
+class TestStrokeStoreJitterBuffer:
+    """StrokeStore 연동 테스트"""
+
+    def test_timestamped_update_buffered(self, qtbot: QtBot):
+        """sent_at이 있는 업데이트는 재생 시각에 적용"""
+        store = StrokeStore()
+        clock = FakeClock()
+        store.jitter_buffer._clock = clock
+        store.handle_drawing_start("line", "user", {"start_point": (0.1, 0.1)})
+        store.handle_drawing_update(
+            "line",
+            "user",
+            {"current_raw_points": [[0.1, 0.1], [0.2, 0.2]], "sent_at": clock.now},
+        )
+        assert store.lines["line"].current_raw_points == []
+
+        store.jitter_buffer._tick(clock.now + 1.0)
+        assert store.lines["line"].current_raw_points == [(0.1, 0.1), (0.2, 0.2)]
+
+    def test_untimestamped_update_immediate(self, qtbot: QtBot):
+        """sent_at이 없으면 (이전 버전 클라이언트) 즉시 적용"""
+        store = StrokeStore()
+        store.handle_drawing_update(
+            "line", "user", {"current_raw_points": [[0.1, 0.1], [0.2, 0.2]]}
+        )
+
+        assert store.lines["line"].current_raw_points == [(0.1, 0.1), (0.2, 0.2)]
+
+    def test_remove_line_discards_pending(self, qtbot: QtBot):
+        """라인이 삭제되면 대기 중인 업데이트도 버림"""
+        store = StrokeStore()
+        store.handle_drawing_start("line", "user", {})
+        store.handle_drawing_update(
+            "line", "user", {"current_raw_points": [[0.1, 0.1], [0.2, 0.2]], "sent_at": 0.0}
+        )
+
+        store.remove_line("line")
+        assert "line" not in store.jitter_buffer
+        store.jitter_buffer._tick(1e12)
+        assert "line" not in store.lines
+
+    def test_tick_notifies_once_per_stroke(self, qtbot: QtBot):
+        """한 틱에 여러 라인이 적용돼도 변경 알림은 틱이 끝날 때 한 번에"""
+        store = StrokeStore()
+        clock = FakeClock()
+        store.jitter_buffer._clock = clock
+        changes = []
+        store.region_changed.connect(changes.append)
+        for line_id, x in (("a", 0.1), ("b", 0.8)):
+            store.handle_drawing_start(line_id, "user", {"start_point": (x, 0.1)})
+            for step in range(3):
+                store.handle_drawing_update(
+                    line_id,
+                    "user",
+                    {
+                        "current_raw_points": [[x, 0.1], [x + 0.01 * step, 0.2]],
+                        "sent_at": clock.now,
+                    },
+                )
+        changes.clear()
+
+        store.jitter_buffer._tick(clock.now + 1.0)
+        assert len(changes) == 2
+        assert changes[0][0] == 0.1 and changes[1][0] == 0.8
+
+    def test_malformed_update_rejected_on_push(self, qtbot: QtBot):
+        """형식이 잘못된 업데이트는 받을 때 거절하고 대기열에 넣지 않음 (틱에서 예외 없음)"""
+        store = StrokeStore()
+        clock = FakeClock()
+        store.jitter_buffer._clock = clock
+        store.handle_drawing_start("line", "user", {"start_point": (0.1, 0.1)})
+        for data in (
+            {"new_finalized_segments": [{"p0": [0, 0]}]},
+            {"current_raw_points": [[0.1, "x"]]},
+            {"current_raw_points": 5},
+        ):
+            with pytest.raises(ValueError):
+                store.handle_drawing_update("line", "user", {**data, "sent_at": clock.now})
+        assert "line" not in store.jitter_buffer
+
+        store.handle_drawing_update(
+            "line", "user", {"current_raw_points": [[0.1, 0.1], [0.2, 0.2]], "sent_at": clock.now}
+        )
+        store.jitter_buffer._tick(clock.now + 1.0)
+        assert store.lines["line"].current_raw_points == [(0.1, 0.1), (0.2, 0.2)]
+
+    def test_estimators_dropped_on_leave_and_clear(self, qtbot: QtBot):
+        """나간 참여자의 추정기는 제거, clear는 모든 추정기 제거 (긴 세션에서 쌓이지 않음)"""
+        store = StrokeStore()
+        for user_id in ("left", "stays"):
+            store.handle_drawing_update(
+                f"{user_id}-line", user_id, {"current_raw_points": [], "sent_at": 0.0}
+            )
+        assert set(store.jitter_buffer.estimators) == {"left", "stays"}
+
+        store.remove_user("left")
+        assert set(store.jitter_buffer.estimators) == {"stays"}
+
+        store.clear()
+        assert store.jitter_buffer.estimators == {}
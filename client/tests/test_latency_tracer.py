@@ -0,0 +1,150 @@
+"""
+종단 간 스트로크 지연 측정 테스트
+"""
+
+import asyncio
+
+from pytestqt.qtbot import QtBot
+from PyQt6.QtCore import QPoint, Qt
+from PyQt6.QtGui import QColor
+
+from screen_party_common import ClockSync
+from screen_party_client.drawing.canvas import DrawingCanvas
+from screen_party_client.drawing.canvas_manager import CanvasManager
+from screen_party_client.gui.state import AppState
+from screen_party_client.network.latency_tracer import LatencyTracer
+from screen_party_client.network.message_handler import MessageHandler
+
+
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 50.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _tracer(clock: FakeClock) -> LatencyTracer:
+    return LatencyTracer(ClockSync(clock=clock))
+
+
+class TestLatencyTracer:
+    """trace 기록/집계 테스트"""
+
+    def test_full_trace_recorded_on_paint(self):
+        """수신 → store 적용 → 첫 paint 순서로 단계가 채워지고 paint 때 집계"""
+        clock = FakeClock()
+        tracer = _tracer(clock)
+        message = {"trace": {"input": 49.90, "send": 49.95, "relay": 49.97}}
+
+        tracer.on_receive(message)
+        tracer.on_applied(message["trace"])
+        assert tracer.summary() == {}
+
+        clock.now += 0.01
+        tracer.on_paint()
+        tracer.on_paint()  # 다음 paint에서는 다시 기록하지 않음
+
+        trace = message["trace"]
+        assert trace["receive"] == 50.0
+        assert trace["paint"] == 50.01
+        summary = tracer.summary()
+        assert summary["input-paint"]["count"] == 1
+        assert summary["receive-paint"]["max_ms"] == 10.0
+
+    def test_stamps_in_server_clock(self):
+        """pong으로 추정한 서버 시계 차이만큼 보정해서 기록"""
+        clock = FakeClock()
+        tracer = _tracer(clock)
+
+        # ping은 같은 monotonic 시계로 client_time을 실어서 보냄 (서버가 pong에 그대로 돌려줌)
+        clock.now = 50.02
+        tracer.on_pong({"type": "pong", "client_time": 50.0, "server_time": 1000.01})
+
+        assert tracer.now() == 1000.02
+        assert tracer.outgoing_trace(1000.0) == {"input": 1000.0, "send": 1000.02}
+
+    def test_plain_pong_ignored(self):
+        """client_time이 없는 pong (이전 서버)은 무시"""
+        tracer = _tracer(FakeClock())
+        tracer.on_pong({"type": "pong"})
+
+        assert not tracer.clock.synced
+
+
+class TestCanvasLatencyTracing:
+    """캔버스/store 연동 테스트"""
+
+    def _canvas(self, qtbot: QtBot) -> DrawingCanvas:
+        canvas = DrawingCanvas(user_id="me")
+        qtbot.addWidget(canvas)
+        canvas.resize(200, 200)
+        return canvas
+
+    def test_update_carries_trace_when_enabled(self, qtbot: QtBot):
+        """측정 중이면 업데이트에 첫 입력/송신 시각을 실음"""
+        canvas = self._canvas(qtbot)
+        clock = FakeClock()
+        canvas.store.tracer = _tracer(clock)
+        sent = []
+        canvas.drawing_updated.connect(lambda line_id, user_id, data: sent.append(data))
+
+        qtbot.mousePress(canvas, Qt.MouseButton.LeftButton, pos=QPoint(10, 10))
+        qtbot.mouseMove(canvas, pos=QPoint(20, 20))
+        clock.now += 0.03
+        qtbot.mouseMove(canvas, pos=QPoint(30, 30))
+        canvas._send_network_update()
+
+        assert sent[-1]["trace"] == {"input": 50.0, "send": 50.03}
+
+        # 전송 후 새 입력이 없으면 다음 패킷에는 trace 없음
+        qtbot.mouseRelease(canvas, Qt.MouseButton.LeftButton, pos=QPoint(30, 30))
+        assert all(data["trace"] is None for data in sent[1:])
+
+    def test_no_trace_when_disabled(self, qtbot: QtBot):
+        """측정이 꺼져 있으면 trace 없음"""
+        canvas = self._canvas(qtbot)
+        sent = []
+        canvas.drawing_updated.connect(lambda line_id, user_id, data: sent.append(data))
+
+        qtbot.mousePress(canvas, Qt.MouseButton.LeftButton, pos=QPoint(10, 10))
+        qtbot.mouseMove(canvas, pos=QPoint(20, 20))
+        canvas._send_network_update()
+
+        assert sent[-1]["trace"] is None
+
+    def test_received_update_traced_until_paint(self, qtbot: QtBot):
+        """수신한 업데이트는 store에 적용된 뒤 첫 paint에서 집계"""
+        main_canvas = self._canvas(qtbot)
+        manager = CanvasManager(main_canvas)
+        state = AppState(user_id="me")
+        clock = FakeClock()
+        tracer = _tracer(clock)
+        manager.store.tracer = tracer
+        manager.add_participant("other", QColor(255, 0, 0))
+
+        async def disconnect():
+            pass
+
+        handler = MessageHandler(state, manager, disconnect, tracer=tracer)
+        message = {
+            "type": "drawing_update",
+            "line_id": "line",
+            "user_id": "other",
+            "current_raw_points": [[0.1, 0.1], [0.5, 0.5]],
+            "trace": {"input": 49.9, "send": 49.95, "relay": 49.97},
+        }
+        asyncio.run(handler.handle_message(message))
+
+        assert message["trace"]["receive"] == 50.0
+        assert tracer.summary() == {}
+
+        clock.now += 0.005
+        main_canvas.grab()
+
+        summary = tracer.summary()
+        assert summary["relay-receive"]["count"] == 1
+        assert summary["input-paint"]["count"] == 1
+        assert message["trace"]["paint"] == 50.005
@@ -250,6 +250,7 @@ class TestStatusMessages:
 
         status_message = "게스트가 참여했습니다"
         window.state.set_status(status_message)
+        QApplication.processEvents()  # state 변경 알림은 이벤트 루프 한 바퀴 뒤에 전달
 
         # 상태가 연결된 상태이므로 status_label에 메시지가 표시됨
         assert window.status_label.text() == status_message
@@ -306,6 +307,7 @@ class TestScreenTransition:
 
         # 메인 화면 표시
         window.show_main_screen()
+        QApplication.processEvents()
 
         # 레이블 업데이트 확인
         assert server_url in window.server_info_label.text()
@@ -502,7 +504,26 @@ class TestColorSystem:
         assert window.state.user_colors[user_a_id] == new_color
         assert window.canvas_manager.main_canvas.user_alphas[user_a_id] == 0.8
 
-        # 참여자 라벨 텍스트 확인
-        label_text = window.users_colors_label.text()
-        # User A의 user_id는 한 번만 나타나야 함
-        assert label_text.count(user_a_id[:8]) == 1
+        # 참여자 패널 확인: User A의 항목은 하나만 있고 새 색상으로 표시
+        panel = window.participant_panel
+        assert panel.user_ids() == [window.state.user_id, user_a_id]
+        assert sum(user_a_id[:8] in panel.entry_text(uid) for uid in panel.user_ids()) == 1
+        assert new_color.name() in panel.entry_text(user_a_id)
+
+
+class TestLinkState:
+    """링크 측정 상태 테스트"""
+
+    def test_resumed_resets_link_measurements(self, qtbot):
+        """세션을 이어가면 끊기기 전 측정값을 버리고 기본 전송 간격으로"""
+        window = MainWindow()
+        qtbot.addWidget(window)
+        window.send_rate.observe_rtt(0.3)
+        window.state.set_link_state(window.send_rate.update(backlog=100_000), 300)
+        assert window.state.send_interval_ms > 50
+
+        window.on_connection_state("resumed")
+
+        assert window.send_rate.srtt is None
+        assert window.state.send_interval_ms == 50
+        assert window.state.rtt_ms is None
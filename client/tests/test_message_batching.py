@@ -0,0 +1,177 @@
+"""
+수신 메시지 묶음 처리 테스트 (디코딩 스레드, 프레임 단위 적용)
+"""
+
+import asyncio
+import json
+
+from pytestqt.qtbot import QtBot
+from PyQt6.QtGui import QColor
+from websockets.exceptions import ConnectionClosedOK
+from websockets.frames import Close
+
+from screen_party_client.drawing.canvas import DrawingCanvas
+from screen_party_client.drawing.canvas_manager import CanvasManager
+from screen_party_client.drawing.stroke_store import StrokeStore
+from screen_party_client.gui.state import AppState
+from screen_party_client.network.client import WebSocketClient, decode_frames
+from screen_party_client.network.message_handler import MessageHandler
+
+
+def _update(line_id: str, x: float, user_id: str = "other") -> dict:
+    return {
+        "type": "drawing_update",
+        "line_id": line_id,
+        "user_id": user_id,
+        "current_raw_points": [[x, 0.1], [x + 0.05, 0.2]],
+    }
+
+
+class TestBatchedNotifications:
+    """StrokeStore 알림 묶음 테스트"""
+
+    def test_one_notification_per_stroke(self, qtbot: QtBot):
+        """블록 안의 알림은 끝날 때 획 영역마다 한 번 (겹치면 합치고 떨어지면 따로)"""
+        store = StrokeStore()
+        changes = []
+        store.region_changed.connect(changes.append)
+
+        with store.batched_notifications():
+            for step in range(5):
+                store.handle_drawing_update("a", "user", _update("a", 0.1 + step * 0.01))
+            store.handle_drawing_update("b", "user", _update("b", 0.8))
+            assert changes == []
+
+        assert len(changes) == 2
+        assert changes[0][0] == 0.1 and changes[0][2] == 0.19
+        assert changes[1][0] == 0.8
+
+    def test_nested_and_full_repaint(self, qtbot: QtBot):
+        """중첩 블록은 가장 바깥에서 알림, 전체 다시 그리기가 있으면 그것 하나만"""
+        store = StrokeStore()
+        changes = []
+        store.region_changed.connect(changes.append)
+
+        with store.batched_notifications():
+            with store.batched_notifications():
+                store.handle_drawing_update("a", "user", _update("a", 0.1))
+            assert changes == []
+            store.clear()
+
+        assert changes == [None]
+
+
+class TestFrameBatchedDelivery:
+    """MessageHandler 프레임 단위 적용 테스트"""
+
+    def _handler(self, qtbot: QtBot, frame_interval=16):
+        canvas = DrawingCanvas(user_id="me")
+        qtbot.addWidget(canvas)
+        manager = CanvasManager(canvas)
+        state = AppState(user_id="me")
+
+        async def disconnect():
+            pass
+
+        handler = MessageHandler(state, manager, disconnect, frame_interval=frame_interval)
+        return handler, manager
+
+    def test_burst_applied_in_one_batch(self, qtbot: QtBot):
+        """한 프레임 안에 도착한 메시지는 다음 프레임에 한 번에 적용"""
+        handler, manager = self._handler(qtbot)
+        batches = []
+        apply_batch = manager.handle_drawing_batch
+
+        def record_batch(messages):
+            batches.append(len(messages))
+            apply_batch(messages)
+
+        manager.handle_drawing_batch = record_batch
+
+        async def receive():
+            for index in range(10):
+                await handler.handle_message(_update(f"line-{index % 3}", index * 0.05))
+
+        asyncio.run(receive())
+        assert manager.store.lines == {}
+
+        qtbot.waitUntil(lambda: batches == [10], timeout=1000)
+        assert set(manager.store.lines) == {"line-0", "line-1", "line-2"}
+
+    def test_other_messages_flush_first(self, qtbot: QtBot):
+        """드로잉이 아닌 메시지 전에 대기 중인 드로잉을 먼저 적용 (순서 유지)"""
+        handler, manager = self._handler(qtbot)
+        manager.add_participant("other", QColor(255, 0, 0))
+
+        async def receive():
+            await handler.handle_message(_update("line", 0.1))
+            await handler.handle_message({"type": "participant_left", "user_id": "other"})
+
+        asyncio.run(receive())
+
+        # 떠나기 전 색상으로 생성됨
+        assert manager.store.lines["line"].color == QColor(255, 0, 0)
+        assert handler._flush_scheduler.is_idle()
+
+    def test_bad_message_skipped_in_batch(self, qtbot: QtBot):
+        """잘못된 메시지는 건너뛰고 같은 묶음의 다른 메시지는 적용 (타이머 슬롯에서 예외 없음)"""
+        handler, manager = self._handler(qtbot)
+        bad = {**_update("bad", 0.1), "new_finalized_segments": [{"p0": [0, 0]}]}
+
+        async def receive():
+            await handler.handle_message({"type": "drawing_start", "user_id": "other"})
+            await handler.handle_message(bad)
+            await handler.handle_message(_update("good", 0.5))
+
+        asyncio.run(receive())
+        qtbot.waitUntil(lambda: "good" in manager.store.lines, timeout=1000)
+        assert manager.store.lines["good"].current_raw_points == [(0.5, 0.1), (0.55, 0.2)]
+
+    def test_own_messages_ignored(self, qtbot: QtBot):
+        """내 드로잉 메시지는 대기열에 넣지 않음"""
+        handler, manager = self._handler(qtbot, frame_interval=None)
+        asyncio.run(handler.handle_message(_update("mine", 0.1, user_id="me")))
+        asyncio.run(handler.handle_message(_update("theirs", 0.1)))
+
+        assert list(manager.store.lines) == ["theirs"]
+
+
+class FakeWebSocket:
+    """프레임 목록을 돌려주고 끝나면 정상 종료하는 WebSocket"""
+
+    def __init__(self, frames):
+        self.frames = list(frames)
+
+    async def recv(self, decode=None):
+        if not self.frames:
+            raise ConnectionClosedOK(Close(1000, ""), Close(1000, ""), True)
+        await asyncio.sleep(0)
+        return self.frames.pop(0)
+
+
+class TestThreadedDecoding:
+    """수신 프레임 디코딩 스레드 테스트"""
+
+    def test_decode_frames_skips_bad_frames(self):
+        """잘못된 프레임은 건너뛰고 나머지는 순서대로"""
+        frames = [b'{"a": 1}', b"not json", '{"b": "한"}'.encode()]
+
+        assert decode_frames(frames) == [{"a": 1}, {"b": "한"}]
+
+    def test_listen_delivers_in_order(self):
+        """디코딩은 다른 스레드에서, 전달은 수신 순서대로 (seq 기록 포함)"""
+        messages = [{"type": "drawing_update", "index": i, "seq": i + 1} for i in range(50)]
+        client = WebSocketClient()
+        client.websocket = FakeWebSocket(json.dumps(m).encode() for m in messages)
+        client.running = True
+        received = []
+
+        async def handler(message):
+            received.append(message["index"])
+
+        client.set_message_handler(handler)
+        asyncio.run(client.listen())
+
+        assert received == list(range(50))
+        assert client.last_seq == 50
+        assert not client.running
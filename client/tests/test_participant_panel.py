@@ -0,0 +1,123 @@
+"""
+참여자 패널 증분 갱신 / 위젯 비교 갱신 테스트
+"""
+
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QApplication, QLabel, QPushButton, QWidget
+
+from screen_party_client.gui.main_window import MainWindow
+from screen_party_client.gui.participant_panel import ParticipantPanel
+from screen_party_client.gui.widget_updates import set_enabled, set_style_sheet, set_text
+
+
+def _count_calls(widget, method: str) -> list:
+    """위젯 메서드 호출 기록 (원래 동작은 유지)"""
+    calls = []
+    original = getattr(widget, method)
+
+    def record(*args):
+        calls.append(args)
+        original(*args)
+
+    setattr(widget, method, record)
+    return calls
+
+
+class TestParticipantPanel:
+    """참여자 패널 테스트"""
+
+    def _panel(self, qtbot) -> ParticipantPanel:
+        panel = ParticipantPanel()
+        qtbot.addWidget(panel)
+        return panel
+
+    def test_entries_added_and_removed_one_at_a_time(self, qtbot):
+        """새 참여자만 라벨 추가, 나간 참여자만 라벨 제거 (나머지 라벨은 그대로)"""
+        panel = self._panel(qtbot)
+        colors = {"me-123456789": QColor(255, 0, 0), "other-123456789": QColor(0, 255, 0)}
+        panel.sync(colors, "me-123456789")
+        first = panel.findChildren(QLabel)
+
+        colors["third-123456789"] = QColor(0, 0, 255)
+        panel.sync(colors, "me-123456789")
+        assert panel.user_ids() == ["me-123456789", "other-123456789", "third-123456789"]
+        assert set(first) < set(panel.findChildren(QLabel))
+        assert panel.entry_text("me-123456789").endswith("나 (me-12345)")
+
+        del colors["other-123456789"]
+        panel.sync(colors, "me-123456789")
+        assert panel.user_ids() == ["me-123456789", "third-123456789"]
+        assert panel.placeholder_label.isHidden()
+
+    def test_color_change_touches_one_label(self, qtbot):
+        """한 명의 색상 변경은 그 참여자 라벨만 다시 설정"""
+        panel = self._panel(qtbot)
+        colors = {f"user-{index}": QColor(255, 0, 0) for index in range(30)}
+        panel.sync(colors, None)
+        labels = {uid: panel._entries[uid][0] for uid in colors}
+        calls = {uid: _count_calls(label, "setText") for uid, label in labels.items()}
+
+        colors["user-7"] = QColor(0, 0, 255)
+        panel.sync(colors, None)
+
+        assert [uid for uid, c in calls.items() if c] == ["user-7"]
+        assert "#0000ff" in panel.entry_text("user-7")
+
+    def test_placeholder_when_empty(self, qtbot):
+        """참여자가 없으면 안내 문구 표시"""
+        panel = self._panel(qtbot)
+        panel.sync({"user": QColor(255, 0, 0)}, None)
+        panel.sync({}, None)
+
+        assert panel.user_ids() == []
+        assert not panel.placeholder_label.isHidden()
+
+
+class TestWidgetUpdates:
+    """값 비교 후 갱신 헬퍼 테스트"""
+
+    def test_same_value_not_reapplied(self, qtbot):
+        """같은 스타일시트/텍스트는 다시 설정하지 않음"""
+        button = QPushButton("a")
+        qtbot.addWidget(button)
+        style_calls = _count_calls(button, "setStyleSheet")
+        text_calls = _count_calls(button, "setText")
+
+        for _ in range(3):
+            set_style_sheet(button, "QPushButton { border: 1px solid red; }")
+            set_text(button, "b")
+
+        assert len(style_calls) == 1
+        assert len(text_calls) == 1
+
+    def test_enabled_compares_own_state(self, qtbot):
+        """부모가 비활성화여도 위젯 자신의 상태를 기준으로 비교"""
+        parent = QWidget()
+        qtbot.addWidget(parent)
+        child = QPushButton(parent)
+        parent.setEnabled(False)
+
+        set_enabled(child, False)
+        parent.setEnabled(True)
+
+        assert not child.isEnabled()
+
+
+class TestMainWindowDiffUpdate:
+    """MainWindow 전체 갱신도 바뀐 위젯만 건드리는지 테스트"""
+
+    def test_full_refresh_does_not_repolish(self, qtbot):
+        """그리기 모드가 그대로면 전체 갱신을 해도 버튼 스타일시트를 다시 설정하지 않음"""
+        window = MainWindow()
+        qtbot.addWidget(window)
+        window.state.set_drawing_mode(True)
+        QApplication.processEvents()
+        calls = _count_calls(window.toggle_drawing_button, "setStyleSheet")
+
+        window.update_ui_from_state()
+        window.update_ui_from_state()
+        assert calls == []
+
+        window.state.set_drawing_mode(False)
+        QApplication.processEvents()
+        assert calls == [("",)]
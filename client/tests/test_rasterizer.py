@@ -0,0 +1,190 @@
+"""
+백그라운드 래스터라이저 테스트
+"""
+
+import threading
+
+from pytestqt.qtbot import QtBot
+from PyQt6.QtGui import QColor, QImage, QPolygonF
+from PyQt6.QtCore import QPointF
+
+from screen_party_client.drawing import rasterizer
+from screen_party_client.drawing.bezier_fitter import BezierSegment
+from screen_party_client.drawing.canvas import DrawingCanvas
+from screen_party_client.drawing.rasterizer import (
+    RenderJob,
+    StrokeBatch,
+    ThreadedRasterizer,
+    rasterize,
+)
+
+SEGMENT = {"p0": (0.1, 0.5), "p1": (0.3, 0.5), "p2": (0.6, 0.5), "p3": (0.9, 0.5)}
+
+
+def _alpha_at(image: QImage, x: int, y: int) -> int:
+    return image.pixelColor(x, y).alpha()
+
+
+def _wait_idle(qtbot: QtBot, canvas: DrawingCanvas):
+    """요청한 프레임이 모두 완성될 때까지 대기"""
+    qtbot.waitUntil(
+        lambda: canvas._rasterizer.is_idle and canvas._rasterizer.front is not None, timeout=5000
+    )
+
+
+class TestRasterize:
+    """스냅샷 래스터화 테스트"""
+
+    def test_draws_all_stroke_kinds(self, qtbot: QtBot):
+        """polyline / 베지어 세그먼트 / raw 점들을 모두 그림"""
+        polygon = QPolygonF([QPointF(0.1, 0.2), QPointF(0.9, 0.2)])
+        job = RenderJob(
+            width=100,
+            height=100,
+            device_pixel_ratio=1.0,
+            batches=(
+                StrokeBatch(
+                    rgba=QColor(255, 0, 0).rgba(),
+                    width=3,
+                    polylines=(polygon,),
+                    segments=(BezierSegment.from_dict(SEGMENT),),
+                    raw_runs=(((0.1, 0.8), (0.9, 0.8)),),
+                ),
+            ),
+        )
+        image = QImage(100, 100, QImage.Format.Format_ARGB32_Premultiplied)
+        image.fill(QColor(0, 0, 255))
+
+        rasterize(job, image)
+
+        assert _alpha_at(image, 50, 20) > 0
+        assert _alpha_at(image, 50, 50) > 0
+        assert _alpha_at(image, 50, 80) > 0
+        # 이전 내용은 투명하게 지워짐
+        assert _alpha_at(image, 50, 35) == 0
+
+
+class TestThreadedRasterizer:
+    """작업 스레드 렌더링 테스트"""
+
+    def test_renders_on_worker_thread(self, qtbot: QtBot, monkeypatch):
+        """래스터화는 GUI 스레드가 아닌 작업 스레드에서 실행"""
+        threads = []
+        original = rasterizer.rasterize
+        monkeypatch.setattr(
+            rasterizer,
+            "rasterize",
+            lambda job, image: (threads.append(threading.get_ident()), original(job, image)),
+        )
+
+        raster = ThreadedRasterizer(lambda: RenderJob(10, 10, 1.0, ()))
+        with qtbot.waitSignal(raster.frame_ready, timeout=5000):
+            raster.request()
+        raster.stop()
+
+        assert threads and threads[0] != threading.get_ident()
+        assert raster.front is not None
+        assert raster.front.width() == 10
+
+    def test_requests_coalesced_while_rendering(self, qtbot: QtBot):
+        """그리는 동안 들어온 요청들은 최신 스냅샷 하나로 합쳐짐"""
+        built = []
+
+        def build_job():
+            built.append(len(built))
+            return RenderJob(10, 10, 1.0, ())
+
+        raster = ThreadedRasterizer(build_job)
+        for _ in range(5):
+            raster.request()
+        qtbot.waitUntil(lambda: raster.is_idle, timeout=5000)
+        raster.stop()
+
+        assert len(built) == 2
+        assert raster.frames_rendered == 2
+
+    def test_stop(self, qtbot: QtBot):
+        """stop 후에는 요청을 무시"""
+        raster = ThreadedRasterizer(lambda: RenderJob(10, 10, 1.0, ()))
+        raster.stop()
+
+        assert not raster.is_running
+        raster.request()
+        assert raster.is_idle
+
+
+class TestDrawingCanvasThreadedRendering:
+    """DrawingCanvas 백그라운드 렌더링 모드 테스트"""
+
+    def _canvas(self, qtbot: QtBot) -> DrawingCanvas:
+        canvas = DrawingCanvas(threaded_rendering=True)
+        qtbot.addWidget(canvas)
+        canvas.resize(200, 200)
+        canvas.show()  # 보이는 위젯만 resizeEvent를 바로 받음
+        canvas.set_user_color("other", QColor(255, 0, 0))
+        return canvas
+
+    def test_remote_lines_blitted_from_frame(self, qtbot: QtBot, monkeypatch):
+        """paintEvent는 직접 그리지 않고 완성된 프레임을 복사"""
+        canvas = self._canvas(qtbot)
+        canvas.handle_drawing_start("line", "other", {})
+        canvas.handle_drawing_update("line", "other", {"new_finalized_segments": [SEGMENT]})
+        canvas.handle_drawing_end("line", "other")
+        _wait_idle(qtbot, canvas)
+
+        painted = []
+        monkeypatch.setattr(canvas, "_paint_remote_lines", lambda *args: painted.append(args))
+        image = canvas.grab().toImage()
+
+        assert painted == []
+        assert _alpha_at(image, 100, 100) > 0
+        assert _alpha_at(image, 100, 20) == 0
+
+    def test_snapshot_groups_by_pen_state(self, qtbot: QtBot):
+        """스냅샷: 완성된 라인은 polyline, 그리는 중인 라인은 세그먼트 + raw 점"""
+        canvas = self._canvas(qtbot)
+        canvas.handle_drawing_start("done", "other", {})
+        canvas.handle_drawing_update("done", "other", {"new_finalized_segments": [SEGMENT]})
+        canvas.handle_drawing_end("done", "other")
+        canvas.handle_drawing_start("drawing", "other", {})
+        canvas.handle_drawing_update(
+            "drawing",
+            "other",
+            {"new_finalized_segments": [SEGMENT], "current_raw_points": [[0.9, 0.5], [0.9, 0.9]]},
+        )
+
+        job = canvas._render_job()
+
+        assert (job.width, job.height) == (200, 200)
+        (batch,) = job.batches
+        assert batch.rgba == QColor(255, 0, 0).rgba()
+        assert len(batch.polylines) == 1
+        assert len(batch.segments) == 1
+        assert batch.raw_runs == (((0.9, 0.5), (0.9, 0.9)),)
+
+    def test_store_changes_request_new_frame(self, qtbot: QtBot):
+        """store 변경과 크기 변경은 새 프레임을 요청"""
+        canvas = self._canvas(qtbot)
+        _wait_idle(qtbot, canvas)
+        frames = canvas._rasterizer.frames_rendered
+
+        canvas.handle_drawing_start("line", "other", {})
+        canvas.handle_drawing_update("line", "other", {"new_finalized_segments": [SEGMENT]})
+        _wait_idle(qtbot, canvas)
+        assert canvas._rasterizer.frames_rendered > frames
+
+        frames = canvas._rasterizer.frames_rendered
+        canvas.resize(400, 300)
+        _wait_idle(qtbot, canvas)
+        assert canvas._rasterizer.frames_rendered > frames
+        assert canvas._rasterizer.front.width() == round(400 * canvas.devicePixelRatioF())
+
+    def test_disable_stops_worker(self, qtbot: QtBot):
+        """백그라운드 렌더링을 끄면 작업 스레드 종료 후 직접 그리기로 복귀"""
+        canvas = self._canvas(qtbot)
+        raster = canvas._rasterizer
+
+        canvas.set_threaded_rendering(False)
+
+        assert not canvas.threaded_rendering
+        assert not raster.is_running
@@ -0,0 +1,145 @@
+"""
+링크 상태에 따른 전송 간격 조절 테스트
+"""
+
+import asyncio
+
+import pytest
+from pytestqt.qtbot import QtBot
+from PyQt6.QtCore import QPoint, Qt
+
+from screen_party_client.drawing.canvas import DrawingCanvas
+from screen_party_client.drawing.canvas_manager import CanvasManager
+from screen_party_client.network.client import WebSocketClient
+from screen_party_client.network.send_rate import AdaptiveSendInterval
+
+
+class TestAdaptiveSendInterval:
+    """전송 간격 조절 테스트"""
+
+    def test_waits_for_measurements(self):
+        """RTT 샘플도 버퍼 증가도 없으면 기본 간격 유지"""
+        rate = AdaptiveSendInterval()
+
+        assert rate.update(backlog=0) == 50
+        assert rate.raw_point_stride == 1
+
+    def test_fast_link_converges_to_min(self):
+        """큐 지연 없는 빠른 링크 (LAN): 하한까지 줄어듦"""
+        rate = AdaptiveSendInterval(min_ms=16)
+        for _ in range(20):
+            rate.observe_rtt(0.002)
+            rate.update(backlog=0)
+
+        assert rate.interval_ms == 16
+
+    def test_backlog_growth_backs_off(self):
+        """송신 버퍼가 늘어나면 간격을 늘리고 raw 점을 솎음 (상한 있음)"""
+        rate = AdaptiveSendInterval(max_ms=200, max_raw_point_stride=4)
+        rate.observe_rtt(0.02)
+
+        assert rate.update(backlog=4096) == 75
+        assert rate.raw_point_stride == 2
+        for backlog in range(8192, 80000, 4096):
+            rate.update(backlog)
+
+        assert rate.interval_ms == 200
+        assert rate.raw_point_stride == 4
+
+        # 버퍼가 줄기 시작하면 다시 천천히 줄어듦
+        assert rate.update(backlog=0) == 195
+
+    def test_queueing_delay_backs_off(self):
+        """평활 RTT가 최소 RTT보다 크게 늘면 (큐가 쌓임) 간격을 늘림"""
+        rate = AdaptiveSendInterval(queue_delay_threshold=0.03)
+        rate.observe_rtt(0.02)
+        for _ in range(10):
+            rate.observe_rtt(0.2)
+
+        assert rate.queue_delay > 0.03
+        assert rate.update(backlog=0) > 50
+
+    def test_pong_round_trip(self):
+        """ping의 client_time을 돌려준 pong으로 RTT 측정, 없으면 무시"""
+        now = [10.0]
+        rate = AdaptiveSendInterval(clock=lambda: now[0])
+        ping = rate.ping_message()
+        now[0] = 10.04
+
+        rate.on_pong({"type": "pong"})
+        assert rate.srtt is None
+        rate.on_pong({"type": "pong", "client_time": ping["client_time"]})
+        assert rate.srtt == pytest.approx(0.04)
+
+    def test_reset(self):
+        """연결이 바뀌면 기본 간격부터 다시"""
+        rate = AdaptiveSendInterval()
+        rate.observe_rtt(0.02)
+        rate.update(backlog=1000)
+        rate.reset()
+
+        assert rate.interval_ms == 50
+        assert rate.srtt is None
+        assert rate.min_rtt is None
+
+    def test_pings_not_queued_while_reconnecting(self):
+        """재연결 중의 ping은 모아 두지 않음 (이어가기 후 보내면 끊긴 시간이 RTT가 됨)"""
+        rate = AdaptiveSendInterval()
+        client = WebSocketClient()
+        client._reconnecting = True
+
+        asyncio.run(client.send_message(rate.ping_message()))
+        asyncio.run(client.send_message({"type": "drawing_end", "line_id": "line"}))
+
+        assert client.reconnecting
+        assert [m["type"] for m in client._queued_sends] == ["drawing_end"]
+
+
+class TestCanvasNetworkInterval:
+    """캔버스 전송 간격 / raw 점 솎기 테스트"""
+
+    def _canvas(self, qtbot: QtBot) -> DrawingCanvas:
+        canvas = DrawingCanvas(user_id="me")
+        qtbot.addWidget(canvas)
+        canvas.resize(200, 200)
+        return canvas
+
+    def test_interval_applied_while_drawing(self, qtbot: QtBot):
+        """그리는 중에 바뀐 간격은 전송 타이머에 바로 적용"""
+        canvas = self._canvas(qtbot)
+        qtbot.mousePress(canvas, Qt.MouseButton.LeftButton, pos=QPoint(10, 10))
+
+        canvas.set_network_interval(120, raw_point_stride=3)
+
+        assert canvas.network_timer.interval() == 120
+        assert canvas.raw_point_stride == 3
+
+    def test_raw_points_thinned_keeping_ends(self, qtbot: QtBot):
+        """솎을 때도 raw 점의 처음/마지막 점은 유지"""
+        canvas = self._canvas(qtbot)
+        canvas.set_network_interval(100, raw_point_stride=2)
+        sent = []
+        canvas.drawing_updated.connect(lambda line_id, user_id, data: sent.append(data))
+
+        qtbot.mousePress(canvas, Qt.MouseButton.LeftButton, pos=QPoint(10, 10))
+        for x in (11, 12, 13, 14):
+            qtbot.mouseMove(canvas, pos=QPoint(x, 10))
+        full = list(canvas.my_fitter.raw_buffer)
+        canvas._send_network_update()
+
+        raw = sent[-1]["current_raw_points"]
+        assert len(raw) < len(full)
+        assert raw[0] == list(canvas._to_relative_point(*full[0]))
+        assert raw[-1] == list(canvas._to_relative_point(*full[-1]))
+
+    def test_manager_applies_to_overlay(self, qtbot: QtBot):
+        """CanvasManager: 모든 캔버스에 적용, 나중에 붙는 오버레이도 현재 값으로"""
+        main_canvas = self._canvas(qtbot)
+        manager = CanvasManager(main_canvas)
+        manager.set_network_interval(30)
+
+        overlay = self._canvas(qtbot)
+        manager.set_overlay_canvas(overlay)
+
+        assert main_canvas.network_interval == 30
+        assert overlay.network_interval == 30
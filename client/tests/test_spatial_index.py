@@ -0,0 +1,117 @@
+"""
+SegmentGridIndex 테스트
+"""
+
+import pytest
+from PyQt6.QtGui import QColor
+
+from screen_party_client.drawing.bezier_fitter import BezierSegment
+from screen_party_client.drawing.line_data import LineData
+from screen_party_client.drawing.spatial_index import SegmentGridIndex, RAW_RUN_INDEX
+
+
+class TestSegmentGridIndex:
+    """SegmentGridIndex 기본 동작 테스트"""
+
+    def test_invalid_cell_size(self):
+        """셀 크기는 양수여야 함"""
+        with pytest.raises(ValueError):
+            SegmentGridIndex(cell_size=0)
+
+    def test_insert_and_query(self):
+        """등록한 항목이 겹치는 영역 질의에서만 조회되는지 확인"""
+        index = SegmentGridIndex(cell_size=10.0)
+        index.insert("a", 0, (0.0, 0.0, 5.0, 5.0))
+        index.insert("a", 1, (50.0, 50.0, 60.0, 60.0))
+        index.insert("b", 0, (100.0, 0.0, 120.0, 5.0))
+
+        assert len(index) == 3
+        assert index.query_segments((0.0, 0.0, 20.0, 20.0)) == {"a": {0}}
+        assert index.query_lines((55.0, 55.0, 200.0, 200.0)) == {"a"}
+        assert index.query_lines((0.0, 0.0, 200.0, 200.0)) == {"a", "b"}
+        assert index.query_lines((30.0, 30.0, 40.0, 40.0)) == set()
+
+    def test_same_cell_but_no_overlap(self):
+        """같은 셀에 있어도 바운딩 박스가 겹치지 않으면 제외"""
+        index = SegmentGridIndex(cell_size=100.0)
+        index.insert("a", 0, (0.0, 0.0, 5.0, 5.0))
+
+        assert index.query_lines((50.0, 50.0, 60.0, 60.0)) == set()
+
+    def test_negative_coordinates(self):
+        """음수 좌표도 올바른 셀에 등록"""
+        index = SegmentGridIndex(cell_size=10.0)
+        index.insert("a", 0, (-25.0, -25.0, -15.0, -15.0))
+
+        assert index.query_lines((-20.0, -20.0, -19.0, -19.0)) == {"a"}
+        assert index.query_lines((0.0, 0.0, 10.0, 10.0)) == set()
+
+    def test_remove_segment_and_line(self):
+        """세그먼트 단위 제거와 라인 단위 제거"""
+        index = SegmentGridIndex(cell_size=10.0)
+        index.insert_segments("a", 0, [(0.0, 0.0, 5.0, 5.0), (3.0, 3.0, 8.0, 8.0)])
+        index.insert("b", 0, (0.0, 0.0, 5.0, 5.0))
+
+        assert index.remove("a", 0) is True
+        assert index.remove("a", 0) is False
+        assert index.query_segments((0.0, 0.0, 10.0, 10.0)) == {"a": {1}, "b": {0}}
+
+        assert index.remove_line("a") is True
+        assert index.remove_line("a") is False
+        assert "a" not in index
+        assert index.query_lines((0.0, 0.0, 10.0, 10.0)) == {"b"}
+
+        index.remove_line("b")
+        assert len(index) == 0
+        assert index._cells == {}
+
+    def test_raw_run_replaced(self):
+        """raw 구간은 라인당 하나만 유지되고 갱신 시 교체됨"""
+        index = SegmentGridIndex(cell_size=10.0)
+        index.set_raw_run("a", (0.0, 0.0, 5.0, 5.0))
+        index.set_raw_run("a", (40.0, 40.0, 45.0, 45.0))
+
+        assert index.query_lines((0.0, 0.0, 10.0, 10.0)) == set()
+        assert index.query_segments((40.0, 40.0, 50.0, 50.0)) == {"a": {RAW_RUN_INDEX}}
+
+        index.set_raw_run("a", None)
+        assert "a" not in index
+
+    def test_large_query_scans_occupied_cells(self):
+        """질의 영역이 매우 커도 등록된 항목만 검사"""
+        index = SegmentGridIndex(cell_size=1.0)
+        index.insert("a", 0, (5.0, 5.0, 6.0, 6.0))
+
+        assert index.query_lines((-1e6, -1e6, 1e6, 1e6)) == {"a"}
+
+
+class TestLineDataSpatialIndex:
+    """LineData 변경이 공간 인덱스에 반영되는지 테스트"""
+
+    def _segment(self, x: float) -> BezierSegment:
+        return BezierSegment(p0=(x, 0.0), p1=(x + 1, 1.0), p2=(x + 2, 1.0), p3=(x + 3, 0.0))
+
+    def test_line_data_updates_index(self):
+        """add_finalized_segments / update_raw_points / finalize / clear 반영"""
+        index = SegmentGridIndex(cell_size=10.0)
+        line_data = LineData(
+            line_id="line",
+            user_id="user",
+            color=QColor(255, 0, 0),
+            finalized_segments=[self._segment(0.0)],
+            spatial_index=index,
+        )
+        assert index.query_segments((0.0, 0.0, 3.0, 3.0)) == {"line": {0}}
+
+        line_data.add_finalized_segments([self._segment(20.0), self._segment(40.0)])
+        assert index.query_segments((40.0, 0.0, 43.0, 3.0)) == {"line": {2}}
+
+        line_data.update_raw_points([(60.0, 0.0), (65.0, 5.0)])
+        assert index.query_segments((60.0, 0.0, 61.0, 1.0)) == {"line": {RAW_RUN_INDEX}}
+
+        line_data.finalize()
+        assert index.query_lines((60.0, 0.0, 61.0, 1.0)) == set()
+        assert len(index) == 3
+
+        line_data.clear()
+        assert "line" not in index
@@ -0,0 +1,109 @@
+"""
+시작 시간 측정 / 지연 로딩 테스트
+"""
+
+import io
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from screen_party_client.startup import StartupTrace, lazy_import
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+
+class FakeClock:
+    """호출할 때마다 step초씩 증가하는 시계"""
+
+    def __init__(self, step: float = 0.001):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+class TestStartupTrace:
+    """StartupTrace 테스트"""
+
+    def test_phases_recorded_in_order(self):
+        """단계는 시작 오프셋과 소요 시간으로 순서대로 기록"""
+        trace = StartupTrace(clock=FakeClock())
+        with trace.phase("first"):
+            pass
+        trace.mark("painted")
+
+        names = [name for name, _, _ in trace.phases]
+        assert names == ["first", "painted"]
+        assert trace.phases[0][2] > 0
+        assert trace.phases[1][2] == 0.0
+
+        output = io.StringIO()
+        trace.report(stream=output)
+        assert "first" in output.getvalue() and "painted" in output.getvalue()
+
+    def test_import_hook_records_new_modules_only(self):
+        """처음 로드되는 모듈만 기록하고, 해제하면 원래 __import__ 복원"""
+        import builtins
+
+        original = builtins.__import__
+        sys.modules.pop("xml.dom.minidom", None)
+        trace = StartupTrace()
+        trace.install_import_hook()
+        try:
+            import json  # noqa: F401  (이미 로드됨)
+            import xml.dom.minidom  # noqa: F401
+        finally:
+            trace.uninstall_import_hook()
+
+        assert builtins.__import__ is original
+        assert "json" not in trace.imports
+        record = trace.imports["xml.dom.minidom"]
+        assert 0 <= record.self_time <= record.cumulative
+
+
+class TestLazyLoading:
+    """지연 로딩 테스트"""
+
+    def test_lazy_import_loads_on_first_attribute(self):
+        """속성에 처음 접근할 때 모듈 실행"""
+        name = "tabnanny"
+        sys.modules.pop(name, None)
+        module = lazy_import(name)
+
+        assert type(module).__name__ == "_LazyModule"
+        assert callable(module.check)
+        assert type(module).__name__ == "module"
+        assert lazy_import(name) is module
+
+    def test_main_window_import_defers_numpy_and_websockets(self):
+        """메인 윈도우 import만으로는 numpy/websockets/오버레이를 로드하지 않음"""
+        code = (
+            "import sys\n"
+            "import screen_party_client.gui.main_window\n"
+            "numpy = sys.modules.get('numpy')\n"
+            "print(numpy is None or type(numpy).__name__ == '_LazyModule')\n"
+            "print('websockets' in sys.modules)\n"
+            "print('screen_party_client.gui.overlay_window' in sys.modules)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            env=dict(os.environ, PYTHONPATH=str(SRC_DIR), QT_QPA_PLATFORM="offscreen"),
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.split() == ["True", "False", "False"]
+
+    def test_package_exports_still_available(self):
+        """패키지 수준 이름은 처음 사용할 때 로드"""
+        import screen_party_client
+        from screen_party_client import drawing
+
+        assert screen_party_client.WebSocketClient.__name__ == "WebSocketClient"
+        assert drawing.BezierFitter.__name__ == "BezierFitter"
+        assert "DrawingCanvas" in dir(drawing)
@@ -0,0 +1,195 @@
+"""
+StrokeStore 및 캔버스 간 저장소 공유 테스트
+"""
+
+import pytest
+from pytestqt.qtbot import QtBot
+from PyQt6.QtGui import QColor
+
+from screen_party_client.drawing.canvas import DrawingCanvas
+from screen_party_client.drawing.canvas_manager import CanvasManager
+from screen_party_client.drawing.stroke_store import StrokeStore
+
+SEGMENT = {"p0": (0.1, 0.1), "p1": (0.2, 0.1), "p2": (0.3, 0.1), "p3": (0.4, 0.1)}
+
+
+class TestStrokeStore:
+    """StrokeStore 단독 동작 테스트"""
+
+    def test_stores_relative_coordinates(self, qtbot: QtBot):
+        """수신한 상대 좌표를 변환 없이 저장"""
+        store = StrokeStore()
+        store.handle_drawing_start("line", "user", {})
+        store.handle_drawing_update(
+            "line",
+            "user",
+            {"new_finalized_segments": [SEGMENT], "current_raw_points": [[0.4, 0.1], [0.5, 0.2]]},
+        )
+
+        line_data = store.lines["line"]
+        assert line_data.finalized_segments[0].p3 == (0.4, 0.1)
+        assert line_data.current_raw_points == [(0.4, 0.1), (0.5, 0.2)]
+        assert store.lines_in_region((0.0, 0.0, 0.2, 0.2)) == ["line"]
+
+    def test_region_changed_emits_relative_bounds(self, qtbot: QtBot):
+        """변경 영역을 상대 좌표로 알림"""
+        store = StrokeStore()
+        changes = []
+        store.region_changed.connect(changes.append)
+
+        store.handle_drawing_start("line", "user", {})
+        assert changes == []  # geometry가 없으면 알림 없음
+
+        store.handle_drawing_update("line", "user", {"new_finalized_segments": [SEGMENT]})
+        assert changes == [(0.1, 0.1, 0.4, 0.1)]
+
+        store.clear()
+        assert changes[-1] is None  # 전체 다시 그리기
+
+    def test_user_color_applied_to_new_lines(self, qtbot: QtBot):
+        """사용자 색상/알파값이 새 라인에 적용"""
+        store = StrokeStore()
+        store.set_user_color("user", QColor(0, 0, 255))
+        store.set_user_alpha("user", 1.5)
+
+        store.handle_drawing_start("line", "user", {})
+
+        assert store.lines["line"].color == QColor(0, 0, 255)
+        assert store.lines["line"].alpha == 1.0
+
+        store.remove_user("user")
+        assert "user" not in store.user_colors
+        assert "user" not in store.user_alphas
+
+    def test_deleted_line_ids_expire(self, qtbot: QtBot):
+        """삭제된 라인은 TTL 동안만 이후 메시지를 무시"""
+        from screen_party_client.drawing.tombstones import TombstoneSet
+
+        now = [0.0]
+        store = StrokeStore()
+        store.deleted_line_ids = TombstoneSet(ttl=30.0, clock=lambda: now[0])
+        store.deleted_line_ids.add("line")
+
+        store.handle_drawing_update("line", "user", {"new_finalized_segments": [SEGMENT]})
+        assert "line" not in store.lines
+
+        now[0] = 31.0
+        store.handle_drawing_update("line", "user", {"new_finalized_segments": [SEGMENT]})
+        assert "line" in store.lines
+
+
+class TestSharedStore:
+    """여러 캔버스가 하나의 저장소를 공유하는지 테스트"""
+
+    def test_canvases_share_lines(self, qtbot: QtBot):
+        """같은 store를 쓰는 캔버스는 같은 라인/스케줄러를 봄"""
+        store = StrokeStore()
+        small = DrawingCanvas(store=store)
+        large = DrawingCanvas(store=store)
+        qtbot.addWidget(small)
+        qtbot.addWidget(large)
+
+        small.handle_drawing_start("line", "other", {})
+
+        assert large.remote_lines is small.remote_lines
+        assert "line" in large.remote_lines
+        assert large.animation_scheduler is small.animation_scheduler
+
+    def test_each_view_invalidates_own_rect(self, qtbot: QtBot, monkeypatch):
+        """store 변경 시 각 캔버스가 자신의 크기에 맞는 영역만 갱신"""
+        store = StrokeStore()
+        small = DrawingCanvas(store=store)
+        large = DrawingCanvas(store=store)
+        qtbot.addWidget(small)
+        qtbot.addWidget(large)
+        small.resize(100, 100)
+        large.resize(1000, 1000)
+
+        updates = {"small": [], "large": []}
+        monkeypatch.setattr(small, "update", lambda *args: updates["small"].append(args))
+        monkeypatch.setattr(large, "update", lambda *args: updates["large"].append(args))
+
+        store.handle_drawing_start("line", "other", {})
+        store.handle_drawing_update("line", "other", {"new_finalized_segments": [SEGMENT]})
+
+        ((small_rect,),) = updates["small"]
+        ((large_rect,),) = updates["large"]
+        assert small_rect.left() < 10 < small_rect.right() and small_rect.right() < 50
+        assert large_rect.left() < 100 < large_rect.right() and large_rect.right() > 400
+
+    def test_set_store_switches_subscription(self, qtbot: QtBot, monkeypatch):
+        """store 교체 후에는 이전 store 변경에 반응하지 않음"""
+        canvas = DrawingCanvas()
+        qtbot.addWidget(canvas)
+        old_store = canvas.store
+        new_store = StrokeStore()
+        canvas.set_store(new_store)
+
+        updates = []
+        monkeypatch.setattr(canvas, "update", lambda *args: updates.append(args))
+
+        old_store.handle_drawing_update("old", "other", {"new_finalized_segments": [SEGMENT]})
+        assert updates == []
+
+        new_store.handle_drawing_update("new", "other", {"new_finalized_segments": [SEGMENT]})
+        assert len(updates) == 1
+        assert list(canvas.remote_lines) == ["new"]
+
+
+class TestCanvasManagerSharedStore:
+    """CanvasManager가 메시지를 저장소에 한 번만 반영하는지 테스트"""
+
+    def test_overlay_uses_main_store(self, qtbot: QtBot):
+        """오버레이 캔버스가 메인 캔버스의 store를 공유"""
+        main_canvas = DrawingCanvas(user_id="me")
+        overlay_canvas = DrawingCanvas(user_id="me")
+        qtbot.addWidget(main_canvas)
+        qtbot.addWidget(overlay_canvas)
+
+        manager = CanvasManager(main_canvas)
+        manager.add_participant("other", QColor(0, 255, 0), alpha=0.5)
+        manager.set_overlay_canvas(overlay_canvas)
+
+        assert overlay_canvas.store is manager.store is main_canvas.store
+        assert overlay_canvas.user_colors["other"] == QColor(0, 255, 0)
+
+    def test_message_decoded_once(self, qtbot: QtBot, monkeypatch):
+        """drawing_update 하나당 세그먼트 디코딩은 한 번"""
+        from screen_party_client.drawing import stroke_store
+
+        main_canvas = DrawingCanvas()
+        overlay_canvas = DrawingCanvas()
+        qtbot.addWidget(main_canvas)
+        qtbot.addWidget(overlay_canvas)
+        manager = CanvasManager(main_canvas)
+        manager.set_overlay_canvas(overlay_canvas)
+
+        decoded = []
+        original = stroke_store.BezierSegment.from_dict
+        monkeypatch.setattr(
+            stroke_store.BezierSegment,
+            "from_dict",
+            staticmethod(lambda data: (decoded.append(data), original(data))[1]),
+        )
+
+        manager.handle_drawing_start("line", "other", {})
+        manager.handle_drawing_update("line", "other", {"new_finalized_segments": [SEGMENT]})
+        manager.handle_drawing_end("line", "other")
+
+        assert len(decoded) == 1
+        assert len(manager.store.lines) == 1
+        assert manager.store.lines["line"].is_complete
+
+    def test_remove_participant(self, qtbot: QtBot):
+        """참가자 제거 시 공유 store의 색상/알파값 제거"""
+        main_canvas = DrawingCanvas()
+        qtbot.addWidget(main_canvas)
+        manager = CanvasManager(main_canvas)
+
+        manager.add_participant("other", QColor(0, 255, 0))
+        manager.update_participant_alpha("other", -1.0)
+        assert main_canvas.user_alphas["other"] == pytest.approx(0.0)
+
+        manager.remove_participant("other")
+        assert "other" not in main_canvas.user_colors
+        assert "other" not in main_canvas.user_alphas
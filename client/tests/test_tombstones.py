@@ -0,0 +1,85 @@
+"""
+TombstoneSet 테스트
+"""
+
+import pytest
+
+from screen_party_client.drawing.tombstones import TombstoneSet
+
+
+class FakeClock:
+    """테스트용 수동 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTombstoneSet:
+    """TTL 기반 tombstone 테스트"""
+
+    def test_invalid_ttl(self):
+        """TTL은 양수여야 함"""
+        with pytest.raises(ValueError):
+            TombstoneSet(ttl=0)
+
+    def test_membership_until_expiry(self):
+        """TTL 동안만 포함됨"""
+        clock = FakeClock()
+        tombstones = TombstoneSet(ttl=10.0, clock=clock)
+        tombstones.add("line")
+
+        clock.now += 9.9
+        assert "line" in tombstones
+        assert len(tombstones) == 1
+
+        clock.now += 0.1
+        assert "line" not in tombstones
+        assert len(tombstones) == 0
+
+    def test_readd_extends_expiry(self):
+        """다시 추가하면 만료 시각이 연장됨 (이전 큐 항목은 무시)"""
+        clock = FakeClock()
+        tombstones = TombstoneSet(ttl=10.0, clock=clock)
+        tombstones.add("line")
+
+        clock.now += 5.0
+        tombstones.add("line")
+
+        clock.now += 6.0
+        assert tombstones.prune() == 0
+        assert "line" in tombstones
+
+        clock.now += 5.0
+        assert tombstones.prune() == 1
+        assert "line" not in tombstones
+
+    def test_size_bounded_by_ttl_window(self):
+        """계속 추가해도 크기는 TTL 동안 추가된 수로 제한됨"""
+        clock = FakeClock()
+        tombstones = TombstoneSet(ttl=10.0, clock=clock)
+
+        for i in range(1000):
+            tombstones.add(f"line-{i}")
+            clock.now += 1.0
+
+        assert len(tombstones) == 9
+        assert len(tombstones._queue) <= 11
+        assert list(tombstones) == [f"line-{i}" for i in range(991, 1000)]
+
+    def test_discard_and_clear(self):
+        """discard / clear"""
+        clock = FakeClock()
+        tombstones = TombstoneSet(ttl=10.0, clock=clock)
+        tombstones.add("a")
+        tombstones.add("b")
+
+        tombstones.discard("a")
+        tombstones.discard("missing")
+        assert "a" not in tombstones
+        assert "b" in tombstones
+
+        tombstones.clear()
+        assert len(tombstones) == 0
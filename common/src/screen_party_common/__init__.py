@@ -12,6 +12,8 @@ from .messages import (
     DrawingEndMessage,
     ColorChangeMessage,
 )
+from .latency import TRACE_STAGES, ClockSync, HopLatencyStats, LatencyHistogram
+from .log_pipeline import RateLimitedLogger, SampledLogger, setup_logging
 
 __all__ = [
     "Participant",
@@ -25,4 +27,11 @@ __all__ = [
     "DrawingUpdateMessage",
     "DrawingEndMessage",
     "ColorChangeMessage",
+    "TRACE_STAGES",
+    "ClockSync",
+    "HopLatencyStats",
+    "LatencyHistogram",
+    "RateLimitedLogger",
+    "SampledLogger",
+    "setup_logging",
 ]
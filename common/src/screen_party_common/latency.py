@@ -0,0 +1,189 @@
+"""
+스트로크 종단 간 지연 측정 (선택 기능)
+
+드로잉 업데이트 메시지의 "trace" 필드에 단계별 시각을 기록하고,
+구간(hop)별 지연을 히스토그램으로 모읍니다.
+
+단계 (TRACE_STAGES 순서):
+    input   - 송신 측: 이 패킷에 담긴 첫 마우스 입력 시각
+    send    - 송신 측: 패킷 생성 시각
+    relay   - 서버: 수신 후 브로드캐스트 직전 시각
+    receive - 수신 측: 메시지 디코딩 직후 시각
+    paint   - 수신 측: 패킷이 store에 적용된 뒤 첫 paintEvent 시각
+
+모든 시각은 서버의 monotonic 시계 기준(초)입니다. 클라이언트는 ping/pong으로
+서버 시계와의 차이(ClockSync)를 추정해서 자기 monotonic 시각에 더해 기록하므로,
+같은 기기 안의 구간(input→send, receive→paint)은 정확하고
+네트워크 구간(send→relay, relay→receive)은 왕복 시간의 절반 이내 오차를 가집니다.
+"""
+
+import math
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Mapping, Optional, Tuple
+
+TRACE_STAGES = ("input", "send", "relay", "receive", "paint")
+
+# 전체 구간 (입력 → 다른 클라이언트 화면)
+TOTAL_HOP = "input-paint"
+
+
+class LatencyHistogram:
+    """로그 간격 버킷 히스토그램 (고정 메모리, 기록 O(1))
+
+    버킷 i는 [base * ratio^i, base * ratio^(i+1)) 구간이고, 백분위수는
+    해당 버킷의 기하 평균으로 근사합니다 (상대 오차 ~4.5%).
+    """
+
+    def __init__(self, base: float = 0.0001, ratio: float = 2 ** (1 / 8), buckets: int = 160):
+        """
+        Args:
+            base: 첫 버킷의 하한 (초, 이보다 작은 값은 첫 버킷으로)
+            ratio: 버킷 경계 비율
+            buckets: 버킷 수 (기본값이면 0.1ms ~ 100초 이상)
+        """
+        self.base = base
+        self.ratio = ratio
+        self._log_ratio = math.log(ratio)
+        self.counts = [0] * buckets
+        self.count = 0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        """값 하나 기록 (음수는 시계 오차로 보고 0으로)"""
+        seconds = max(0.0, seconds)
+        if seconds <= self.base:
+            index = 0
+        else:
+            index = min(int(math.log(seconds / self.base) / self._log_ratio), len(self.counts) - 1)
+        self.counts[index] += 1
+        self.count += 1
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """백분위수 근사값 (초)
+
+        Args:
+            q: 0 ~ 100
+
+        Returns:
+            기록이 없으면 0.0
+        """
+        if self.count == 0:
+            return 0.0
+        if q >= 100:
+            return self.max
+        rank = max(1, math.ceil(self.count * q / 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= rank:
+                if index == 0:
+                    return min(self.base, self.max)
+                return min(self.base * self.ratio ** (index + 0.5), self.max)
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """요약 (JSON 직렬화용, 밀리초)"""
+        return {
+            "count": self.count,
+            "p50_ms": round(self.percentile(50) * 1000, 2),
+            "p95_ms": round(self.percentile(95) * 1000, 2),
+            "max_ms": round(self.max * 1000, 2),
+        }
+
+
+class HopLatencyStats:
+    """trace의 구간별 지연 히스토그램 모음"""
+
+    def __init__(self):
+        self.hops: Dict[str, LatencyHistogram] = {}
+
+    def record(self, trace: Mapping[str, float]):
+        """trace 하나 기록
+
+        TRACE_STAGES 순서로 기록된 단계들 사이의 구간과,
+        input과 paint가 모두 있으면 전체 구간(TOTAL_HOP)을 기록합니다.
+        """
+        previous: Optional[Tuple[str, float]] = None
+        for stage in TRACE_STAGES:
+            stamp = trace.get(stage)
+            if stamp is None:
+                continue
+            if previous is not None:
+                self._histogram(f"{previous[0]}-{stage}").record(stamp - previous[1])
+            previous = (stage, stamp)
+
+        if "input" in trace and "paint" in trace:
+            self._histogram(TOTAL_HOP).record(trace["paint"] - trace["input"])
+
+    def _histogram(self, hop: str) -> LatencyHistogram:
+        histogram = self.hops.get(hop)
+        if histogram is None:
+            histogram = self.hops[hop] = LatencyHistogram()
+        return histogram
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """구간 이름 -> 요약 (단계 순서, 전체 구간은 마지막)"""
+        order = {stage: index for index, stage in enumerate(TRACE_STAGES)}
+
+        def sort_key(hop: str) -> Tuple[int, int]:
+            if hop == TOTAL_HOP:
+                return (len(order), 0)
+            start, _, end = hop.partition("-")
+            return (order[start], order[end])
+
+        return {hop: self.hops[hop].summary() for hop in sorted(self.hops, key=sort_key)}
+
+
+class ClockSync:
+    """ping/pong 왕복으로 서버 monotonic 시계와의 차이 추정 (NTP 방식)
+
+    최근 샘플 중 왕복 시간이 가장 짧은 샘플의 차이를 사용합니다
+    (큐 대기가 가장 적어 비대칭 오차가 가장 작음).
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic, window: int = 8):
+        """
+        Args:
+            clock: 로컬 monotonic 시계
+            window: 기억할 최근 샘플 수
+        """
+        self._clock = clock
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=window)  # (rtt, offset)
+        self.offset = 0.0
+
+    @property
+    def synced(self) -> bool:
+        """샘플이 하나 이상 있는지"""
+        return bool(self._samples)
+
+    def observe(self, client_sent: float, server_time: float, client_received: float):
+        """왕복 샘플 하나 반영
+
+        Args:
+            client_sent: ping 송신 시각 (로컬 시계)
+            server_time: 서버가 pong에 기록한 시각 (서버 시계)
+            client_received: pong 수신 시각 (로컬 시계)
+        """
+        rtt = client_received - client_sent
+        if rtt < 0:
+            return
+        self._samples.append((rtt, server_time - (client_sent + client_received) / 2))
+        self.offset = min(self._samples)[1]
+
+    def local(self) -> float:
+        """로컬 시계 현재 시각"""
+        return self._clock()
+
+    def now(self) -> float:
+        """서버 시계 기준 현재 시각 추정"""
+        return self._clock() + self.offset
+
+
+def format_hops(summary: Mapping[str, Mapping[str, float]]) -> List[str]:
+    """구간 요약을 사람이 읽는 줄 목록으로 ("send-relay: p50 3.1ms / p95 8.0ms (n=120)")"""
+    return [
+        f"{hop}: p50 {stats['p50_ms']:g}ms / p95 {stats['p95_ms']:g}ms (n={stats['count']})"
+        for hop, stats in summary.items()
+    ]
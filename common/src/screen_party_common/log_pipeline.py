@@ -0,0 +1,235 @@
+"""
+이벤트 루프를 막지 않는 로깅 설정 (클라이언트/서버 공용)
+
+setup_logging()은 루트 로거에 QueueHandler 하나만 붙이고, 실제 출력(포맷팅, 스트림 쓰기)은
+QueueListener의 백그라운드 스레드에서 합니다. 이벤트 루프 쪽 비용은 LogRecord 생성과
+큐에 넣기뿐이고, 느린 콘솔/파이프 때문에 루프가 멈추지 않습니다.
+큐가 가득 차면 기다리지 않고 버리며, 버린 개수는 다음 기록 앞에 경고로 남깁니다.
+
+메시지마다 지나가는 경로(수신/송신/중계)에는 RateLimitedLogger / SampledLogger를 씁니다.
+    - RateLimitedLogger: 같은 메시지 종류는 interval초에 burst개까지만, 나머지는 개수만 세서
+      다음 기록에 "(N similar suppressed)"로 붙임 (오류/경고 폭주 방지)
+    - SampledLogger: 같은 메시지 종류는 every개 중 1개만 (디버그 추적용)
+둘 다 레벨이 꺼져 있으면 isEnabledFor() 한 번으로 끝나므로, 인자는 f-string 대신
+%-스타일로 넘겨서 실제로 기록할 때만 문자열을 만들도록 합니다.
+"""
+
+import atexit
+import logging
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Callable, Dict, Hashable, Optional, TextIO
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# 기록할 때 바로 문자열로 만들어 둘 인자 타입 (큐에서 기다리는 동안 바뀔 수 있는 값)
+_MUTABLE_ARG_TYPES = (dict, list, set, bytearray)
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional["NonBlockingQueueHandler"] = None
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    """가득 차면 기다리지 않고 버리는 QueueHandler
+
+    기본 QueueHandler.prepare()는 호출한 스레드에서 메시지를 포맷팅하지만,
+    여기서는 바뀔 수 있는 인자(dict/list 등)가 있을 때만 미리 문자열로 만들고
+    나머지 포맷팅은 리스너 스레드에 맡깁니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        args = record.args
+        if (
+            args
+            and isinstance(args, tuple)
+            and any(isinstance(arg, _MUTABLE_ARG_TYPES) for arg in args)
+        ):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            if self.dropped:
+                self.queue.put_nowait(self._dropped_record())
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def _dropped_record(self) -> logging.LogRecord:
+        return logging.LogRecord(
+            __name__,
+            logging.WARNING,
+            __file__,
+            0,
+            "Log queue full, dropped %d records",
+            (self.dropped,),
+            None,
+        )
+
+
+def setup_logging(
+    level: int = logging.INFO,
+    stream: Optional[TextIO] = None,
+    max_queue: int = 10000,
+    fmt: str = LOG_FORMAT,
+) -> QueueListener:
+    """루트 로거를 큐 + 백그라운드 리스너 스레드로 설정
+
+    이미 설정되어 있으면 레벨만 바꾸고 기존 리스너를 반환합니다.
+    프로세스 종료 시 남은 기록을 모두 출력하고 리스너를 멈춥니다. (atexit)
+
+    Args:
+        level: 루트 로거 레벨
+        stream: 출력 스트림 (기본 sys.stdout)
+        max_queue: 큐 최대 길이 (넘치면 버림)
+        fmt: 로그 포맷
+
+    Returns:
+        실행 중인 QueueListener
+    """
+    global _listener, _queue_handler
+
+    root = logging.getLogger()
+    root.setLevel(level)
+    if _listener is not None:
+        return _listener
+
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(logging.Formatter(fmt))
+
+    log_queue: queue.Queue = queue.Queue(max_queue)
+    _queue_handler = NonBlockingQueueHandler(log_queue)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(_queue_handler)
+
+    _listener = QueueListener(log_queue, output, respect_handler_level=True)
+    _listener.start()
+    atexit.register(shutdown_logging)
+    return _listener
+
+
+def shutdown_logging():
+    """남은 기록을 출력하고 리스너 스레드 종료 (루트 로거에서 큐 핸들러 제거)"""
+    global _listener, _queue_handler
+
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.flush()
+    _listener = None
+    _queue_handler = None
+
+
+class RateLimitedLogger:
+    """메시지 종류(key)별 기록 빈도 제한
+
+    interval초 동안 burst개까지 기록하고, 넘친 기록은 개수만 셉니다.
+    다음에 기록할 때 그동안 생략된 개수를 메시지 끝에 붙입니다.
+    """
+
+    def __init__(
+        self,
+        logger: logging.Logger,
+        interval: float = 1.0,
+        burst: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            logger: 실제로 기록할 로거
+            interval: 제한 구간 길이 (초)
+            burst: 구간마다 기록할 최대 개수
+            clock: 시간 함수 (테스트용 주입)
+        """
+        self.logger = logger
+        self.interval = interval
+        self.burst = burst
+        self.clock = clock
+        # key -> [구간 시작 시각, 구간 안 기록 수, 생략된 수]
+        self._windows: Dict[Hashable, list] = {}
+
+    def log(self, level: int, msg: str, *args, key: Optional[Hashable] = None, **kwargs):
+        """빈도 제한 안이면 기록 (key 기본값은 메시지 템플릿)"""
+        if not self.logger.isEnabledFor(level):
+            return
+        key = msg if key is None else key
+        now = self.clock()
+        window = self._windows.get(key)
+        if window is None or now - window[0] >= self.interval:
+            suppressed = window[2] if window else 0
+            window = self._windows[key] = [now, 0, suppressed]
+        if window[1] >= self.burst:
+            window[2] += 1
+            return
+
+        window[1] += 1
+        if window[2]:
+            msg, args = _with_suffix(msg, args, " (%d similar suppressed)", window[2])
+            window[2] = 0
+        kwargs.setdefault("stacklevel", 2)
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def debug(self, msg: str, *args, **kwargs):
+        self.log(logging.DEBUG, msg, *args, stacklevel=3, **kwargs)
+
+    def info(self, msg: str, *args, **kwargs):
+        self.log(logging.INFO, msg, *args, stacklevel=3, **kwargs)
+
+    def warning(self, msg: str, *args, **kwargs):
+        self.log(logging.WARNING, msg, *args, stacklevel=3, **kwargs)
+
+    def error(self, msg: str, *args, **kwargs):
+        self.log(logging.ERROR, msg, *args, stacklevel=3, **kwargs)
+
+
+class SampledLogger:
+    """메시지 종류(key)별로 every개 중 1개만 기록 (첫 번째는 항상 기록)"""
+
+    def __init__(self, logger: logging.Logger, every: int = 100):
+        """
+        Args:
+            logger: 실제로 기록할 로거
+            every: 샘플링 간격
+        """
+        self.logger = logger
+        self.every = every
+        self._counts: Dict[Hashable, int] = {}
+
+    def log(self, level: int, msg: str, *args, key: Optional[Hashable] = None, **kwargs):
+        """샘플에 해당하면 기록 (key 기본값은 메시지 템플릿)"""
+        if not self.logger.isEnabledFor(level):
+            return
+        key = msg if key is None else key
+        count = self._counts.get(key, 0)
+        self._counts[key] = count + 1
+        if count % self.every:
+            return
+        if self.every > 1:
+            msg, args = _with_suffix(msg, args, " [1/%d sampled, #%d]", self.every, count + 1)
+        kwargs.setdefault("stacklevel", 2)
+        self.logger.log(level, msg, *args, **kwargs)
+
+    def debug(self, msg: str, *args, **kwargs):
+        self.log(logging.DEBUG, msg, *args, stacklevel=3, **kwargs)
+
+    def info(self, msg: str, *args, **kwargs):
+        self.log(logging.INFO, msg, *args, stacklevel=3, **kwargs)
+
+
+def _with_suffix(msg: str, args: tuple, suffix: str, *values) -> tuple:
+    """%-스타일 메시지 끝에 suffix를 붙인 (메시지, 인자) 반환"""
+    if not args:
+        # 인자 없는 메시지는 %-포맷팅되지 않으므로 그대로 출력되도록 이스케이프
+        msg = msg.replace("%", "%%")
+    return msg + suffix, (*args, *values)
@@ -0,0 +1,158 @@
+"""
+이벤트 루프 지연(lag) 측정 (클라이언트 qasync 루프 / 서버 asyncio 루프 공용)
+
+LoopLagMonitor는 루프에서 interval마다 깨어나는 태스크를 돌리며
+"예정 시각 → 실제로 깨어난 시각" 차이(스케줄링 지연)를 LatencyHistogram에 기록합니다.
+루프가 콜백 하나에 묶여 있으면 그만큼 늦게 깨어나므로 이 값이 곧 루프가 막힌 시간입니다.
+
+느린 콜백의 위치는 감시 스레드가 잡습니다. 루프가 threshold 넘게 깨어나지 못하면
+감시 스레드가 그 순간 루프 스레드의 스택(sys._current_frames)을 복사해 두고,
+루프가 다시 깨어나면 실제 지연 시간과 함께 최근 느린 콜백 목록에 남깁니다.
+(루프가 깨어난 뒤에는 막고 있던 콜백이 이미 끝났으므로 막혀 있는 동안 잡아야 함)
+"""
+
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from .latency import LatencyHistogram
+from .log_pipeline import RateLimitedLogger
+
+logger = logging.getLogger(__name__)
+throttled_logger = RateLimitedLogger(logger, interval=10.0)
+
+# 느린 콜백 스택에 남길 최대 프레임 수 (안쪽 프레임부터)
+STACK_LIMIT = 25
+
+
+class LoopLagMonitor:
+    """이벤트 루프 스케줄링 지연 히스토그램 + 느린 콜백 스택 수집"""
+
+    def __init__(
+        self,
+        interval: float = 0.05,
+        threshold: float = 0.1,
+        max_reports: int = 10,
+        capture_stacks: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            interval: 측정 주기 (초)
+            threshold: 이 이상 늦으면 느린 콜백으로 기록 (초)
+            max_reports: 기억할 최근 느린 콜백 수
+            capture_stacks: 감시 스레드로 막힌 순간의 스택 수집 여부
+            clock: monotonic 시계 (테스트용 주입)
+        """
+        self.interval = interval
+        self.threshold = threshold
+        self.capture_stacks = capture_stacks
+        self.clock = clock
+        self.histogram = LatencyHistogram()
+        self.slow_count = 0
+        self.reports: Deque[Dict[str, Any]] = deque(maxlen=max_reports)
+
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self._loop_thread_id: Optional[int] = None
+        # 루프가 다음에 깨어나야 하는 시각 (감시 스레드가 읽음)
+        self._deadline = 0.0
+        # 감시 스레드가 잡은, 현재 막혀 있는 콜백의 스택
+        self._pending_stack: Optional[List[str]] = None
+
+    @property
+    def running(self) -> bool:
+        """측정 태스크가 돌고 있는지"""
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """측정 시작 (실행 중인 루프 안에서 호출)"""
+        if self.running:
+            return
+        loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._deadline = self.clock() + self.interval
+        self._stopped.clear()
+        self._task = loop.create_task(self._run())
+        if self.capture_stacks:
+            self._watchdog = threading.Thread(
+                target=self._watch, name="loop-lag-watchdog", daemon=True
+            )
+            self._watchdog.start()
+
+    def stop(self):
+        """측정 중지"""
+        self._stopped.set()
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1.0)
+            self._watchdog = None
+
+    async def _run(self):
+        while True:
+            self._deadline = self.clock() + self.interval
+            await asyncio.sleep(self.interval)
+            self.record(self.clock() - self._deadline)
+
+    def record(self, lag: float):
+        """지연 하나 기록 (threshold 이상이면 느린 콜백으로 남김)"""
+        lag = max(0.0, lag)
+        self.histogram.record(lag)
+        stack, self._pending_stack = self._pending_stack, None
+        if lag < self.threshold:
+            return
+        self.slow_count += 1
+        where = stack[-1].strip().splitlines()[0] if stack else "stack not captured"
+        throttled_logger.warning("Event loop blocked for %.0fms at %s", lag * 1000, where)
+        self.reports.append(
+            {
+                "at": time.time(),
+                "lag_ms": round(lag * 1000, 1),
+                "stack": stack or [],
+            }
+        )
+
+    def _watch(self):
+        """감시 스레드: 루프가 threshold 넘게 늦으면 루프 스레드 스택 복사 (막힘 한 번에 한 번)"""
+        poll = max(self.threshold / 4, 0.005)
+        captured_for = None
+        while not self._stopped.wait(poll):
+            deadline = self._deadline
+            if captured_for == deadline or self.clock() - deadline < self.threshold:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            self._pending_stack = traceback.format_stack(frame, limit=STACK_LIMIT)
+            captured_for = deadline
+
+    def summary(self, reports: int = 3) -> Dict[str, Any]:
+        """요약 (JSON 직렬화용): 지연 히스토그램, 느린 콜백 수, 최근 느린 콜백 (최신 순)"""
+        return {
+            "lag": self.histogram.summary(),
+            "threshold_ms": round(self.threshold * 1000, 1),
+            "slow_callbacks": self.slow_count,
+            "recent_slow": list(self.reports)[::-1][:reports],
+        }
+
+
+def format_slow_callbacks(summary: Dict[str, Any]) -> List[str]:
+    """summary()의 최근 느린 콜백을 사람이 읽는 줄 목록으로 (스택은 가장 안쪽 몇 프레임)"""
+    lines = []
+    for report in summary.get("recent_slow", []):
+        stamp = time.strftime("%H:%M:%S", time.localtime(report["at"]))
+        lines.append(f"[{stamp}] loop blocked {report['lag_ms']:g}ms")
+        stack = report.get("stack") or []
+        if not stack:
+            lines.append("  (stack not captured)")
+        for entry in stack[-6:]:
+            lines.extend("  " + line for line in entry.rstrip().splitlines())
+    return lines
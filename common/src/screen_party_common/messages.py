@@ -5,7 +5,7 @@
 """
 
 from dataclasses import dataclass, asdict, field
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from enum import Enum
 
 
@@ -22,11 +22,18 @@ class MessageType(str, Enum):
     PARTICIPANT_JOINED = "participant_joined"
     PARTICIPANT_LEFT = "participant_left"
     SESSION_EXPIRED = "session_expired"
+    RESUME_SESSION = "resume_session"
+    SESSION_RESUMED = "session_resumed"
+    SERVER_HANDOVER = "server_handover"  # 서버 → 클라이언트: 새 서버 프로세스로 이어가기 (교대)
+    WATCH_SESSION = "watch_session"  # 관전자로 참여 (참여자 목록에 없음, 받기만 함)
+    SESSION_WATCHING = "session_watching"
 
     # === Communication ===
     PING = "ping"
     PONG = "pong"
     ERROR = "error"
+    STATS = "stats"
+    PROFILE = "profile"  # 관리용 (localhost 전용): CPU/힙 프로파일링
 
     # === Drawing ===
     DRAWING_START = "drawing_start"
@@ -58,13 +65,22 @@ SESSION_MESSAGE_TYPES = {
     MessageType.PARTICIPANT_JOINED.value,
     MessageType.PARTICIPANT_LEFT.value,
     MessageType.SESSION_EXPIRED.value,
+    MessageType.RESUME_SESSION.value,
+    MessageType.SESSION_RESUMED.value,
+    MessageType.SERVER_HANDOVER.value,
+    MessageType.WATCH_SESSION.value,
+    MessageType.SESSION_WATCHING.value,
 }
 
 # 인증 불필요한 public 메시지
 PUBLIC_MESSAGE_TYPES = {
     MessageType.CREATE_SESSION.value,
     MessageType.JOIN_SESSION.value,
+    MessageType.RESUME_SESSION.value,
+    MessageType.WATCH_SESSION.value,
     MessageType.PING.value,
+    MessageType.STATS.value,
+    MessageType.PROFILE.value,  # 인증 대신 localhost 연결만 허용
 }
 
 # 인증 필요한 authenticated 메시지
@@ -130,12 +146,16 @@ class DrawingUpdateMessage(BaseMessage):
         user_id: 사용자 ID
         new_finalized_segments: 새로 확정된 베지어 세그먼트 리스트
         current_raw_points: 현재 raw 점들
+        sent_at: 송신 시각 (송신자 시계, 초) - 수신 측 지터 버퍼 재생용, 없으면 즉시 적용
+        trace: 종단 간 지연 측정용 단계별 시각 (latency.TRACE_STAGES, 측정할 때만)
     """
 
     line_id: str
     user_id: str
     new_finalized_segments: List[Dict[str, Any]]
     current_raw_points: List[Tuple[float, float]]
+    sent_at: Optional[float] = None
+    trace: Optional[Dict[str, float]] = None
     type: MessageType = field(default=MessageType.DRAWING_UPDATE, init=False)
 
 
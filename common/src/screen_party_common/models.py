@@ -1,5 +1,6 @@
 """데이터 모델 정의"""
 
+import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict
@@ -17,6 +18,8 @@ class Participant:
     name: str
     color: str = DEFAULT_COLOR  # 펜 색상 (hex 형식)
     joined_at: datetime = field(default_factory=datetime.now)
+    # 연결이 끊겼을 때 같은 참여자로 세션을 이어가기 위한 비밀 토큰 (본인에게만 전달)
+    resume_token: str = field(default_factory=lambda: secrets.token_urlsafe(16), repr=False)
 
 
 @dataclass
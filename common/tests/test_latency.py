@@ -0,0 +1,118 @@
+"""종단 간 지연 측정 유틸리티 테스트"""
+
+import pytest
+
+from screen_party_common.latency import (
+    TOTAL_HOP,
+    ClockSync,
+    HopLatencyStats,
+    LatencyHistogram,
+    format_hops,
+)
+
+
+class TestLatencyHistogram:
+    """로그 버킷 히스토그램 테스트"""
+
+    def test_empty(self):
+        """기록이 없으면 0"""
+        histogram = LatencyHistogram()
+
+        assert histogram.percentile(50) == 0.0
+        assert histogram.summary() == {"count": 0, "p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+
+    def test_percentiles_within_bucket_error(self):
+        """백분위수는 버킷 해상도(~9%) 이내로 근사"""
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.record(ms / 1000)
+
+        assert histogram.count == 100
+        assert histogram.percentile(50) == pytest.approx(0.050, rel=0.05)
+        assert histogram.percentile(95) == pytest.approx(0.095, rel=0.05)
+        assert histogram.percentile(100) == pytest.approx(0.100)
+
+    def test_negative_and_huge_values_clamped(self):
+        """시계 오차로 인한 음수는 0, 범위를 넘는 값은 마지막 버킷"""
+        histogram = LatencyHistogram()
+        histogram.record(-0.003)
+        histogram.record(10_000.0)
+
+        assert histogram.counts[0] == 1
+        assert histogram.counts[-1] == 1
+        assert histogram.percentile(1) <= histogram.base
+        assert histogram.max == 10_000.0
+
+
+class TestHopLatencyStats:
+    """구간별 집계 테스트"""
+
+    def test_consecutive_stages(self):
+        """단계 순서대로 인접한 구간과 전체 구간 기록"""
+        stats = HopLatencyStats()
+        stats.record(
+            {"input": 1.000, "send": 1.030, "relay": 1.040, "receive": 1.045, "paint": 1.060}
+        )
+
+        summary = stats.summary()
+        assert list(summary) == [
+            "input-send",
+            "send-relay",
+            "relay-receive",
+            "receive-paint",
+            TOTAL_HOP,
+        ]
+        assert summary["input-send"]["p50_ms"] == pytest.approx(30, rel=0.05)
+        assert summary[TOTAL_HOP]["max_ms"] == pytest.approx(60)
+
+    def test_missing_stage_skipped(self):
+        """빠진 단계는 건너뛰고 다음 단계와 이어서 계산 (전체 구간은 input/paint가 있을 때만)"""
+        stats = HopLatencyStats()
+        stats.record({"input": 1.0, "send": 1.01, "relay": 1.02})
+        stats.record({"send": 2.0, "receive": 2.05})
+
+        summary = stats.summary()
+        assert summary["send-receive"]["count"] == 1
+        assert TOTAL_HOP not in summary
+
+    def test_format_hops(self):
+        """사람이 읽는 요약 줄"""
+        stats = HopLatencyStats()
+        stats.record({"send": 0.0, "relay": 0.004})
+
+        (line,) = format_hops(stats.summary())
+        assert line.startswith("send-relay: p50 ")
+        assert line.endswith("(n=1)")
+
+
+class TestClockSync:
+    """서버 시계 차이 추정 테스트"""
+
+    def test_offset_from_symmetric_round_trip(self):
+        """대칭 왕복이면 차이를 정확히 추정"""
+        local = [10.0]
+        sync = ClockSync(clock=lambda: local[0])
+        assert not sync.synced
+
+        # 서버 시계가 로컬보다 100초 앞섬, 편도 5ms
+        sync.observe(client_sent=10.0, server_time=110.005, client_received=10.010)
+
+        assert sync.synced
+        assert sync.offset == pytest.approx(100.0)
+        assert sync.now() == pytest.approx(110.0)
+
+    def test_prefers_shortest_round_trip(self):
+        """큐 대기로 왕복이 긴 샘플보다 짧은 샘플을 신뢰"""
+        sync = ClockSync()
+        sync.observe(0.0, 100.005, 0.010)
+        sync.observe(1.0, 101.300, 1.400)  # 돌아오는 길에 오래 대기
+
+        assert sync.offset == pytest.approx(100.0)
+
+    def test_negative_round_trip_ignored(self):
+        """로컬 시각이 거꾸로 된 샘플은 무시"""
+        sync = ClockSync()
+        sync.observe(1.0, 50.0, 0.5)
+
+        assert not sync.synced
+        assert sync.offset == 0.0
@@ -0,0 +1,164 @@
+"""비차단 로깅 설정 / 빈도 제한·샘플링 로거 테스트"""
+
+import io
+import logging
+import queue
+
+import pytest
+
+from screen_party_common.log_pipeline import (
+    NonBlockingQueueHandler,
+    RateLimitedLogger,
+    SampledLogger,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+class FakeClock:
+    """수동으로 움직이는 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def records():
+    """테스트 로거에 남은 기록 목록"""
+    captured = []
+
+    class Collect(logging.Handler):
+        def emit(self, record):
+            captured.append(record.getMessage())
+
+    test_logger = logging.getLogger("test.log_pipeline")
+    handler = Collect()
+    test_logger.addHandler(handler)
+    test_logger.setLevel(logging.DEBUG)
+    test_logger.propagate = False
+    yield captured
+    test_logger.removeHandler(handler)
+
+
+class TestSetupLogging:
+    """큐 + 리스너 스레드 설정 테스트"""
+
+    def test_records_written_by_listener(self):
+        """기록은 리스너 스레드가 스트림에 쓰고, 종료 시 남은 기록을 모두 출력"""
+        stream = io.StringIO()
+        root = logging.getLogger()
+        saved_handlers, saved_level = list(root.handlers), root.level
+        try:
+            listener = setup_logging(logging.INFO, stream=stream)
+            assert setup_logging(logging.INFO, stream=stream) is listener
+            assert [type(h) for h in root.handlers] == [NonBlockingQueueHandler]
+
+            logging.getLogger("test.pipeline").info("hello %s", "world")
+            logging.getLogger("test.pipeline").debug("hidden")
+            shutdown_logging()
+        finally:
+            for handler in saved_handlers:
+                root.addHandler(handler)
+            root.setLevel(saved_level)
+
+        output = stream.getvalue()
+        assert "test.pipeline - INFO - hello world" in output
+        assert "hidden" not in output
+
+    def test_full_queue_drops_and_reports(self):
+        """큐가 가득 차면 기다리지 않고 버리고, 다음 기록 앞에 버린 개수를 남김"""
+        log_queue = queue.Queue(2)
+        handler = NonBlockingQueueHandler(log_queue)
+        make = lambda msg: logging.makeLogRecord({"msg": msg})  # noqa: E731
+
+        for index in range(5):
+            handler.handle(make(f"m{index}"))
+        assert handler.dropped == 3
+
+        log_queue.get_nowait()
+        log_queue.get_nowait()
+        handler.handle(make("after"))
+
+        assert log_queue.get_nowait().getMessage() == "Log queue full, dropped 3 records"
+        assert log_queue.get_nowait().getMessage() == "after"
+
+    def test_mutable_args_captured_at_call(self):
+        """dict/list 인자는 기록 시점의 값으로 고정, 나머지는 리스너에서 포맷팅"""
+        handler = NonBlockingQueueHandler(queue.Queue())
+        message = {"seq": 1}
+        record = handler.prepare(logging.makeLogRecord({"msg": "Sent: %s", "args": (message,)}))
+        message["seq"] = 2
+        assert record.getMessage() == "Sent: {'seq': 1}"
+
+        lazy = handler.prepare(logging.makeLogRecord({"msg": "count %d", "args": (3,)}))
+        assert lazy.args == (3,)
+
+
+class TestRateLimitedLogger:
+    """빈도 제한 로거 테스트"""
+
+    def test_burst_then_suppressed_count(self, records):
+        """구간마다 burst개까지, 생략된 개수는 다음 기록에 붙음"""
+        clock = FakeClock()
+        limited = RateLimitedLogger(
+            logging.getLogger("test.log_pipeline"), interval=1.0, burst=2, clock=clock
+        )
+
+        for user in range(5):
+            limited.warning("Failed to send to %s", f"user-{user}")
+        clock.now = 1.5
+        limited.warning("Failed to send to %s", "user-9")
+
+        assert records == [
+            "Failed to send to user-0",
+            "Failed to send to user-1",
+            "Failed to send to user-9 (3 similar suppressed)",
+        ]
+
+    def test_keys_independent_and_percent_escaped(self, records):
+        """메시지 종류마다 따로 제한, 인자 없는 메시지의 %는 그대로"""
+        clock = FakeClock()
+        limited = RateLimitedLogger(logging.getLogger("test.log_pipeline"), clock=clock)
+
+        limited.error("100% full")
+        limited.error("100% full")
+        limited.error("other")
+        clock.now = 2.0
+        limited.error("100% full")
+
+        assert records == ["100% full", "other", "100% full (1 similar suppressed)"]
+
+
+class TestSampledLogger:
+    """샘플링 로거 테스트"""
+
+    def test_one_in_every(self, records):
+        """every개 중 첫 번째만 기록"""
+        sampled = SampledLogger(logging.getLogger("test.log_pipeline"), every=10)
+
+        for index in range(25):
+            sampled.debug("Received: %d", index)
+
+        assert records == [
+            "Received: 0 [1/10 sampled, #1]",
+            "Received: 10 [1/10 sampled, #11]",
+            "Received: 20 [1/10 sampled, #21]",
+        ]
+
+    def test_disabled_level_does_nothing(self, records):
+        """레벨이 꺼져 있으면 세지도 포맷팅하지도 않음"""
+        test_logger = logging.getLogger("test.log_pipeline")
+        test_logger.setLevel(logging.INFO)
+        sampled = SampledLogger(test_logger, every=1)
+
+        class Explodes:
+            def __str__(self):
+                raise AssertionError("formatted")
+
+        sampled.debug("Received: %s", Explodes())
+
+        assert records == []
+        assert sampled._counts == {}
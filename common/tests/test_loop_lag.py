@@ -0,0 +1,64 @@
+"""이벤트 루프 지연 측정 테스트"""
+
+import asyncio
+import time
+
+from screen_party_common.loop_lag import LoopLagMonitor, format_slow_callbacks
+
+
+def _block_loop(seconds: float):
+    """루프를 막는 동기 콜백"""
+    time.sleep(seconds)
+
+
+class TestLoopLagMonitor:
+    """LoopLagMonitor 테스트"""
+
+    def test_record_threshold(self):
+        """threshold 미만은 히스토그램에만, 이상은 느린 콜백으로도 기록"""
+        monitor = LoopLagMonitor(threshold=0.1, capture_stacks=False)
+        monitor.record(0.002)
+        monitor.record(0.25)
+        monitor.record(-0.001)
+
+        summary = monitor.summary()
+        assert summary["lag"]["count"] == 3
+        assert summary["slow_callbacks"] == 1
+        assert summary["recent_slow"][0]["lag_ms"] == 250.0
+        assert summary["recent_slow"][0]["stack"] == []
+        assert format_slow_callbacks(summary)[1] == "  (stack not captured)"
+
+    def test_blocking_callback_stack_captured(self):
+        """루프를 막은 콜백의 스택을 막혀 있는 동안 잡아서 남김"""
+        monitor = LoopLagMonitor(interval=0.01, threshold=0.05)
+
+        async def scenario():
+            monitor.start()
+            await asyncio.sleep(0.05)
+            _block_loop(0.2)
+            await asyncio.sleep(0.05)
+            monitor.stop()
+
+        asyncio.run(scenario())
+
+        summary = monitor.summary()
+        assert summary["slow_callbacks"] == 1
+        report = summary["recent_slow"][0]
+        assert report["lag_ms"] >= 150
+        assert any("_block_loop" in entry for entry in report["stack"])
+        assert any("_block_loop" in line for line in format_slow_callbacks(summary))
+        assert not monitor.running
+
+    def test_idle_loop_has_small_lag(self):
+        """막는 콜백이 없으면 느린 콜백 없음"""
+        monitor = LoopLagMonitor(interval=0.005, threshold=0.5)
+
+        async def scenario():
+            monitor.start()
+            await asyncio.sleep(0.1)
+            monitor.stop()
+
+        asyncio.run(scenario())
+
+        assert monitor.histogram.count >= 5
+        assert monitor.slow_count == 0
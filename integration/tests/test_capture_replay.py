@@ -0,0 +1,91 @@
+"""통합 테스트: 실제 서버 트래픽 캡처 → 새 서버에 N배속 재생"""
+
+import asyncio
+import json
+
+import pytest
+import websockets
+
+from screen_party_server import ScreenPartyServer
+from screen_party_server.replay import CaptureReplayer
+from screen_party_server.traffic_capture import read_capture
+
+
+async def run_session(url: str) -> int:
+    """호스트 + 게스트 둘, 호스트가 드로잉 20개 전송 → 게스트들이 받은 드로잉 수"""
+    host = await websockets.connect(url)
+    await host.send(json.dumps({"type": "create_session", "host_name": "Host"}))
+    created = json.loads(await host.recv())
+
+    guests = []
+    for index in range(2):
+        guest = await websockets.connect(url)
+        await guest.send(
+            json.dumps(
+                {
+                    "type": "join_session",
+                    "session_id": created["session_id"],
+                    "guest_name": f"Guest{index}",
+                }
+            )
+        )
+        assert json.loads(await guest.recv())["type"] == "session_joined"
+        guests.append(guest)
+
+    for _ in range(20):
+        await host.send(
+            json.dumps(
+                {"type": "drawing_update", "line_id": "line-1", "user_id": created["host_id"]}
+            )
+        )
+        await asyncio.sleep(0.01)
+
+    received = 0
+    for guest in guests:
+        drawings = 0
+        while drawings < 20:
+            message = json.loads(await asyncio.wait_for(guest.recv(), 2.0))
+            drawings += message["type"] == "drawing_update"
+        received += drawings
+    for connection in [*guests, host]:
+        await connection.close()
+    return received
+
+
+@pytest.mark.asyncio
+async def test_capture_then_replay(tmp_path):
+    """
+    시나리오:
+    1. --capture로 서버 시작, 세션 하나(참여자 셋)의 트래픽 기록
+    2. 새 서버에 4배속 재생
+    3. 재생에서도 세션이 만들어지고 드로잉이 게스트들에게 중계됨
+    """
+    path = tmp_path / "traffic.spcap"
+    server = ScreenPartyServer("localhost", 8811, capture_path=str(path))
+    server_task = asyncio.create_task(server.start())
+    await asyncio.sleep(0.5)
+    try:
+        assert await run_session("ws://localhost:8811") == 40
+        await asyncio.sleep(0.1)
+    finally:
+        server_task.cancel()
+        await asyncio.gather(server_task, return_exceptions=True)
+
+    replay_server = ScreenPartyServer("localhost", 8812)
+    replay_task = asyncio.create_task(replay_server.start())
+    await asyncio.sleep(0.5)
+    try:
+        replayer = CaptureReplayer(read_capture(path), speed=4)
+        result = await replayer.run_websocket("ws://localhost:8812")
+    finally:
+        replay_task.cancel()
+        await asyncio.gather(replay_task, return_exceptions=True)
+
+    assert result["connections"] == 3
+    assert result["frames_sent"] == 23
+    assert result["errors"] == 0
+    assert result["unmapped_sessions"] == 0
+    assert result["wall_seconds"] < result["capture_seconds"]
+    # 생성/참여 응답 3개 + 게스트 둘이 받은 드로잉 40개 (+ 참여/퇴장 알림)
+    assert result["messages_received"] >= 3 + 40
+    assert len(replayer.session_map) == 1
@@ -0,0 +1,80 @@
+"""통합 테스트: 드로잉 중에 새 서버로 무중단 교대"""
+
+import asyncio
+
+import pytest
+
+from screen_party_client import WebSocketClient
+from screen_party_server import ScreenPartyServer
+
+
+@pytest.mark.asyncio
+async def test_handover_keeps_sessions_and_drawings(tmp_path):
+    """
+    시나리오:
+    1. 이전 서버(handover_socket)에 두 참여자가 연결, 참여자1이 드로잉을 계속 보냄
+    2. 같은 handover_socket으로 새 서버 시작 → listening 소켓과 세션을 넘겨받음
+    3. 이전 서버는 넘겨준 뒤 종료, 두 참여자는 같은 user_id로 새 서버에서 이어감
+    4. 참여자2는 교대 전후로 보낸 드로잉을 빠짐없이 순서대로 받음
+    """
+    path = str(tmp_path / "handover.sock")
+    old_server = ScreenPartyServer("localhost", 8813, handover_socket=path)
+    old_task = asyncio.create_task(old_server.start())
+    await asyncio.sleep(0.5)
+
+    sender = WebSocketClient("ws://localhost:8813")
+    receiver = WebSocketClient("ws://localhost:8813")
+    await sender.connect()
+    created = await sender.create_session("Sender")
+    await receiver.connect()
+    joined = await receiver.join_session(created["session_id"], "Receiver")
+    await sender.receive_message()  # participant_joined
+
+    received = []
+    states = []
+
+    async def on_message(message):
+        if message.get("type") == "drawing_update":
+            received.append(message["index"])
+
+    receiver.set_message_handler(on_message)
+    receiver.connection_state_callback = states.append
+    sender.set_message_handler(lambda message: asyncio.sleep(0))
+    listeners = [
+        asyncio.create_task(sender.listen()),
+        asyncio.create_task(receiver.listen()),
+    ]
+
+    new_server = ScreenPartyServer("localhost", 8813, handover_socket=path)
+    new_task = None
+    try:
+        for index in range(60):
+            if index == 20:
+                new_task = asyncio.create_task(new_server.start())
+            await sender.send_message(
+                {"type": "drawing_update", "line_id": "line-1", "index": index}
+            )
+            await asyncio.sleep(0.01)
+
+        # 이전 서버는 교대 후 start()가 반환됨
+        await asyncio.wait_for(old_task, 5.0)
+        for _ in range(50):
+            if len(received) == 60:
+                break
+            await asyncio.sleep(0.05)
+
+        assert received == list(range(60))
+        assert "resumed" in states and "lost" not in states
+        session = new_server.session_manager.get_session(created["session_id"])
+        assert set(session.participants) == {created["host_id"], joined["user_id"]}
+        assert set(new_server.clients) == set(session.participants)
+        assert new_server.relay_logs[created["session_id"]].last_seq == 60
+    finally:
+        await sender.disconnect()
+        await receiver.disconnect()
+        for task in listeners:
+            task.cancel()
+        for task in (old_task, new_task):
+            if task:
+                task.cancel()
+        await asyncio.gather(*listeners, old_task, new_task or old_task, return_exceptions=True)
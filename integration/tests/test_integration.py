@@ -430,3 +430,80 @@ async def test_color_change_broadcast():
             await server_task
         except asyncio.CancelledError:
             pass
+
+
+@pytest.mark.asyncio
+async def test_reconnect_resumes_session():
+    """
+    시나리오:
+    1. 참여자1이 세션 생성, 참여자2 참여 (참여자2는 listen 루프로 수신)
+    2. 참여자2의 연결을 강제로 끊음 (close 없이 transport 중단)
+    3. 끊긴 동안 참여자1이 드로잉 메시지 전송
+    4. 참여자2가 같은 user_id로 자동 재연결하고 놓친 메시지를 순서대로 받음
+    """
+    server = ScreenPartyServer("localhost", 8770)
+    server_task = asyncio.create_task(server.start())
+    await asyncio.sleep(0.5)
+
+    participant1_client = WebSocketClient("ws://localhost:8770")
+    participant2_client = WebSocketClient("ws://localhost:8770")
+    listen_task = None
+    try:
+        await participant1_client.connect()
+        response = await participant1_client.create_session("Participant_1")
+        session_id = response["session_id"]
+
+        await participant2_client.connect()
+        response = await participant2_client.join_session(session_id, "Participant_2")
+        participant2_id = response["user_id"]
+        assert participant2_client.resume_info["resume_token"]
+        await participant1_client.receive_message()  # participant_joined
+
+        received = []
+        states = []
+
+        async def collect(message):
+            received.append(message)
+
+        participant2_client.set_message_handler(collect)
+        participant2_client.connection_state_callback = states.append
+        listen_task = asyncio.create_task(participant2_client.listen())
+
+        await participant1_client.send_message({"type": "drawing_start", "line_id": "before"})
+        while not received:
+            await asyncio.sleep(0.01)
+
+        # 강제 끊김 후 끊긴 동안 드로잉
+        participant2_client.websocket.transport.abort()
+        for index in range(5):
+            await participant1_client.send_message(
+                {"type": "drawing_update", "line_id": "during", "index": index}
+            )
+
+        async def wait_for_updates():
+            while sum(1 for m in received if m.get("line_id") == "during") < 5:
+                await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(wait_for_updates(), timeout=10)
+
+        assert "reconnecting" in states and "resumed" in states
+        assert any(m["type"] == "session_resumed" for m in received)
+        during = [m["index"] for m in received if m.get("line_id") == "during"]
+        assert during == [0, 1, 2, 3, 4]
+        assert participant2_client.last_seq == 6
+
+        # 같은 참여자로 이어졌으므로 참여자1에게 participant_left 알림 없음
+        session = server.session_manager.get_session(session_id)
+        assert participant2_id in session.participants
+        print("✓ 강제 끊김 후 세션 이어가기 + 놓친 메시지 재전송 성공")
+
+    finally:
+        if listen_task:
+            listen_task.cancel()
+        await participant1_client.disconnect()
+        await participant2_client.disconnect()
+        server_task.cancel()
+        try:
+            await server_task
+        except asyncio.CancelledError:
+            pass
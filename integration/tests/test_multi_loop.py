@@ -0,0 +1,100 @@
+"""통합 테스트: 여러 이벤트 루프로 나눠 맡은 서버에서 세션 중계"""
+
+import asyncio
+import json
+
+import pytest
+import websockets
+
+from screen_party_server.multi_loop import MultiLoopServer, shard_of
+
+
+async def open_session(url: str, guests: int):
+    """세션 하나 생성 + 게스트 참여 → (세션 ID, 호스트 연결, 호스트 ID, 게스트 연결들)"""
+    host = await websockets.connect(url)
+    await host.send(json.dumps({"type": "create_session", "host_name": "Host"}))
+    created = json.loads(await host.recv())
+
+    connections = []
+    for index in range(guests):
+        guest = await websockets.connect(url)
+        await guest.send(
+            json.dumps(
+                {
+                    "type": "join_session",
+                    "session_id": created["session_id"],
+                    "guest_name": f"Guest{index}",
+                }
+            )
+        )
+        assert json.loads(await guest.recv())["type"] == "session_joined"
+        connections.append(guest)
+    return created["session_id"], host, created["host_id"], connections
+
+
+async def drawings(connection, count: int) -> list:
+    """드로잉 메시지 count개의 index (참여 알림 등은 건너뜀)"""
+    received = []
+    while len(received) < count:
+        message = json.loads(await asyncio.wait_for(connection.recv(), 5.0))
+        if message["type"] == "drawing_update":
+            received.append(message["index"])
+    return received
+
+
+@pytest.mark.asyncio
+async def test_sessions_relayed_across_loops():
+    """
+    시나리오:
+    1. 루프 3개로 서버 시작, 세션 4개(참여자 넷씩) - 연결은 여러 루프에 흩어짐
+    2. 각 호스트가 드로잉 30개 전송
+    3. 모든 게스트가 자기 세션의 드로잉만 순서대로 받음 (다른 루프의 연결 포함)
+    4. 게스트가 나가면 소유 루프의 세션에서도 빠짐
+    """
+    server = MultiLoopServer("localhost", 8814, loops=3)
+    server_task = asyncio.create_task(server.start())
+    await asyncio.sleep(0.5)
+    url = "ws://localhost:8814"
+    sessions = []
+    try:
+        for _ in range(4):
+            sessions.append(await open_session(url, guests=3))
+
+        for session_id, host, host_id, _ in sessions:
+            for index in range(30):
+                await host.send(
+                    json.dumps(
+                        {
+                            "type": "drawing_update",
+                            "line_id": session_id,
+                            "user_id": host_id,
+                            "index": index,
+                        }
+                    )
+                )
+
+        for _, _, _, guests in sessions:
+            for guest in guests:
+                assert await drawings(guest, 30) == list(range(30))
+
+        # 세션은 ID의 해시로 정해진 루프가 소유
+        for session_id, *_ in sessions:
+            owner = server.shards[shard_of(session_id, 3)]
+            assert len(owner.session_manager.sessions[session_id].participants) == 4
+        # 다른 루프가 소유한 세션에 들어간 연결이 있음 (루프 간 전달 경로)
+        assert sum(len(shard._routes) for shard in server.shards) > 0
+
+        session_id, host, _, guests = sessions[0]
+        await guests[0].close()
+        owner = server.shards[shard_of(session_id, 3)]
+        for _ in range(50):
+            if len(owner.session_manager.sessions[session_id].participants) == 3:
+                break
+            await asyncio.sleep(0.02)
+        assert len(owner.session_manager.sessions[session_id].participants) == 3
+    finally:
+        for _, host, _, guests in sessions:
+            for connection in [host, *guests]:
+                await connection.close()
+        server_task.cancel()
+        await asyncio.gather(server_task, return_exceptions=True)
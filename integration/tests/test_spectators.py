@@ -0,0 +1,144 @@
+"""통합 테스트: 관전자 모드 (참여자 목록 밖, fan-out 트리로 중계)"""
+
+import asyncio
+import json
+
+import pytest
+import websockets
+
+from screen_party_server.multi_loop import MultiLoopServer, shard_of
+from screen_party_server.server import ScreenPartyServer
+
+
+async def receive_type(connection, msg_type: str) -> dict:
+    """msg_type 메시지가 올 때까지 수신"""
+    while True:
+        message = json.loads(await asyncio.wait_for(connection.recv(), 5.0))
+        if message["type"] == msg_type:
+            return message
+
+
+async def watch(url: str, session_id: str, count: int) -> list:
+    """관전자 count명 연결"""
+    spectators = []
+    for _ in range(count):
+        spectator = await websockets.connect(url)
+        await spectator.send(json.dumps({"type": "watch_session", "session_id": session_id}))
+        assert (await receive_type(spectator, "session_watching"))["session_id"] == session_id
+        spectators.append(spectator)
+    return spectators
+
+
+async def draw(host, session_id: str, host_id: str, count: int):
+    """드로잉 메시지 count개 전송"""
+    for index in range(count):
+        await host.send(
+            json.dumps(
+                {
+                    "type": "drawing_update",
+                    "line_id": session_id,
+                    "user_id": host_id,
+                    "index": index,
+                }
+            )
+        )
+
+
+async def drawings(connection, count: int) -> list:
+    """드로잉 메시지 count개의 index"""
+    return [(await receive_type(connection, "drawing_update"))["index"] for _ in range(count)]
+
+
+@pytest.mark.asyncio
+async def test_spectators_receive_without_joining_roster():
+    """
+    시나리오:
+    1. 호스트가 세션 생성, 게스트 참여, 관전자 40명 (fan-out 너비 4 → 여러 단계)
+    2. 참여자 목록은 둘, participant_joined는 관전자 때문에 생기지 않음
+    3. 호스트의 드로잉 25개를 게스트와 모든 관전자가 순서대로 받음
+    4. 관전자의 드로잉은 거절 (읽기 전용)
+    5. 참여자가 모두 나가면 관전자는 session_expired를 받음
+    """
+    server = ScreenPartyServer("localhost", 8815, spectator_fanout=4)
+    server_task = asyncio.create_task(server.start())
+    await asyncio.sleep(0.5)
+    url = "ws://localhost:8815"
+    connections = []
+    try:
+        host = await websockets.connect(url)
+        connections.append(host)
+        await host.send(json.dumps({"type": "create_session", "host_name": "Host"}))
+        created = json.loads(await host.recv())
+        session_id, host_id = created["session_id"], created["host_id"]
+
+        guest = await websockets.connect(url)
+        connections.append(guest)
+        await guest.send(
+            json.dumps({"type": "join_session", "session_id": session_id, "guest_name": "Guest"})
+        )
+        await receive_type(guest, "session_joined")
+        await receive_type(host, "participant_joined")
+
+        spectators = await watch(url, session_id, 40)
+        connections.extend(spectators)
+        assert len(server.session_manager.sessions[session_id].participants) == 2
+        assert len(server.spectators[session_id]) == 40
+        assert server.spectators[session_id].depth >= 3
+        assert server.get_stats()["spectators"] == 40
+
+        await draw(host, session_id, host_id, 25)
+        assert await drawings(guest, 25) == list(range(25))
+        for spectator in spectators:
+            assert await drawings(spectator, 25) == list(range(25))
+
+        await spectators[0].send(json.dumps({"type": "drawing_update", "line_id": "x"}))
+        assert (await receive_type(spectators[0], "error"))["message"] == "Not authenticated"
+
+        await guest.close()
+        await host.close()
+        for spectator in spectators:
+            assert (await receive_type(spectator, "session_expired"))["type"] == "session_expired"
+        assert session_id not in server.spectators
+    finally:
+        for connection in connections:
+            await connection.close()
+        server_task.cancel()
+        await asyncio.gather(server_task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_spectators_on_other_loops():
+    """
+    시나리오:
+    1. 루프 3개로 서버 시작, 세션 하나에 관전자 12명 (연결은 여러 루프에 흩어짐)
+    2. 소유 루프는 관전자가 있는 다른 루프마다 프레임을 한 번씩 넘기고,
+       각 루프의 트리가 자기 관전자들에게 순서대로 전달
+    """
+    server = MultiLoopServer("localhost", 8816, loops=3, spectator_fanout=2)
+    server_task = asyncio.create_task(server.start())
+    await asyncio.sleep(0.5)
+    url = "ws://localhost:8816"
+    connections = []
+    try:
+        host = await websockets.connect(url)
+        connections.append(host)
+        await host.send(json.dumps({"type": "create_session", "host_name": "Host"}))
+        created = json.loads(await host.recv())
+        session_id, host_id = created["session_id"], created["host_id"]
+
+        spectators = await watch(url, session_id, 12)
+        connections.extend(spectators)
+        await draw(host, session_id, host_id, 25)
+        for spectator in spectators:
+            assert await drawings(spectator, 25) == list(range(25))
+
+        owner = server.shards[shard_of(session_id, 3)]
+        assert len(owner.session_manager.sessions[session_id].participants) == 1
+        assert sum(len(shard.watching) for shard in server.shards) == 12
+        # 다른 루프에 있는 관전자 - 소유 루프가 그 루프로 중계
+        assert owner._spectator_relays.get(session_id)
+    finally:
+        for connection in connections:
+            await connection.close()
+        server_task.cancel()
+        await asyncio.gather(server_task, return_exceptions=True)
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""멀티 루프 서버 중계 처리량 벤치마크 (GIL 빌드 vs free-threaded 빌드)
+
+인터프리터(--python)와 루프 수(--loops)의 조합마다 서버 프로세스를 띄우고, 부하 생성 프로세스들이
+세션마다 그리는 사람 한 명 + 보는 사람 --viewers명을 연결해서 --duration초 동안 드로잉을 보냅니다.
+그리는 사람은 첫 번째 보는 사람이 받지 못한 메시지가 --window개가 되면 기다리므로(closed loop)
+서버가 중계할 수 있는 만큼만 보내고, 초당 중계된(보는 사람이 받은) 메시지 수와 지연을 비교합니다.
+
+free-threaded 빌드(python3.13t 등)는 PYTHON_GIL=0으로 실행합니다 (GIL을 다시 켜는 C 확장 방지).
+부하 생성도 CPU를 쓰므로 코어가 충분한 기계에서 실행하세요.
+
+Usage:
+    uv run --directory server python scripts/bench_multi_loop.py [options]
+
+Example:
+    uv run --directory server python scripts/bench_multi_loop.py
+    uv run --directory server python scripts/bench_multi_loop.py \\
+        --python python3.13 --python python3.13t --loops 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import websockets
+
+SERVER_MAIN = Path(__file__).parent / "main.py"
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="멀티 루프 서버 중계 처리량 벤치마크")
+    parser.add_argument(
+        "--python",
+        action="append",
+        default=None,
+        help="서버를 실행할 인터프리터 (여러 번 지정 가능, 기본값: 현재 인터프리터)",
+    )
+    parser.add_argument("--loops", type=int, nargs="+", default=[1, 4], help="비교할 루프 수들")
+    parser.add_argument("--port", type=int, default=8797, help="서버 포트")
+    parser.add_argument("--sessions", type=int, default=32, help="세션 수")
+    parser.add_argument("--viewers", type=int, default=8, help="세션당 보는 사람 수")
+    parser.add_argument("--window", type=int, default=8, help="그리는 사람당 응답 대기 메시지 수")
+    parser.add_argument("--duration", type=float, default=5.0, help="측정 시간 (초)")
+    parser.add_argument("--generators", type=int, default=4, help="부하 생성 프로세스 수")
+    return parser.parse_args()
+
+
+def describe_build(python: str) -> dict:
+    """인터프리터 버전과 free-threaded 빌드 여부"""
+    script = (
+        "import json, sys, sysconfig; print(json.dumps({'version': sys.version.split()[0], "
+        "'free_threaded': bool(sysconfig.get_config_var('Py_GIL_DISABLED'))}))"
+    )
+    output = subprocess.run([python, "-c", script], capture_output=True, text=True, check=True)
+    return json.loads(output.stdout)
+
+
+def spawn_server(python: str, build: dict, port: int, loops: int) -> subprocess.Popen:
+    """서버 프로세스 시작"""
+    env = dict(os.environ)
+    if build["free_threaded"]:
+        env["PYTHON_GIL"] = "0"
+    return subprocess.Popen(
+        [python, str(SERVER_MAIN), "--host", "127.0.0.1", "--port", str(port)]
+        + ["--loops", str(loops)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        env=env,
+    )
+
+
+async def wait_for_port(port: int):
+    """서버가 accept를 시작할 때까지 대기"""
+    for _ in range(100):
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        return
+    raise RuntimeError(f"Server did not start on port {port}")
+
+
+async def server_stats(url: str) -> dict:
+    """서버 stats 응답"""
+    async with websockets.connect(url) as websocket:
+        await websocket.send(json.dumps({"type": "stats"}))
+        return json.loads(await websocket.recv())
+
+
+async def run_sessions(
+    url: str, sessions: int, viewers: int, window: int, start_at: float, duration: float
+):
+    """세션들을 만들고 start_at부터 duration초 동안 중계 측정
+
+    Returns:
+        (측정 시간 동안 보는 사람들이 받은 메시지 수, 첫 번째 보는 사람의 지연들 (초))
+    """
+    received = [0]
+    latencies = []
+    end_at = start_at + duration
+
+    async def run_session():
+        sender = await websockets.connect(url, max_queue=None)
+        await sender.send(json.dumps({"type": "create_session", "host_name": "Sender"}))
+        created = json.loads(await sender.recv())
+        watchers = []
+        for index in range(viewers):
+            viewer = await websockets.connect(url, max_queue=None)
+            await viewer.send(
+                json.dumps(
+                    {
+                        "type": "join_session",
+                        "session_id": created["session_id"],
+                        "guest_name": f"Viewer{index}",
+                    }
+                )
+            )
+            await viewer.recv()  # session_joined
+            watchers.append(viewer)
+
+        acked = [-1]
+        progressed = asyncio.Event()
+
+        async def watch(viewer, first: bool):
+            async for frame in viewer:
+                message = json.loads(frame)
+                if message.get("type") != "drawing_update":
+                    continue
+                now = time.perf_counter()
+                if message["sent"] >= start_at and now <= end_at:
+                    received[0] += 1
+                    if first:
+                        latencies.append(now - message["sent"])
+                if first:
+                    acked[0] = message["index"]
+                    progressed.set()
+
+        watch_tasks = [
+            asyncio.create_task(watch(viewer, index == 0)) for index, viewer in enumerate(watchers)
+        ]
+        await asyncio.sleep(max(0.0, start_at - time.perf_counter()))
+        index = 0
+        while time.perf_counter() < end_at:
+            if index - acked[0] > window:
+                progressed.clear()
+                try:
+                    await asyncio.wait_for(progressed.wait(), 1.0)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            message = {
+                "type": "drawing_update",
+                "line_id": created["session_id"],
+                "index": index,
+                "sent": time.perf_counter(),
+                "points": [[index % 500, index % 300]] * 8,
+            }
+            await sender.send(json.dumps(message))
+            index += 1
+
+        await asyncio.sleep(0.2)
+        for task in watch_tasks:
+            task.cancel()
+        for connection in [sender, *watchers]:
+            await connection.close()
+
+    await asyncio.gather(*(run_session() for _ in range(sessions)))
+    return received[0], latencies
+
+
+def generate_load(
+    url: str, sessions: int, viewers: int, window: int, start_at: float, duration: float
+):
+    """부하 생성 프로세스 하나 (ProcessPoolExecutor에서 실행)"""
+    return asyncio.run(run_sessions(url, sessions, viewers, window, start_at, duration))
+
+
+def measure(args, python: str, build: dict, loops: int) -> dict:
+    """서버 하나를 띄워 측정"""
+    url = f"ws://127.0.0.1:{args.port}"
+    server = spawn_server(python, build, args.port, loops)
+    try:
+        asyncio.run(wait_for_port(args.port))
+        # 연결/세션 준비 시간 뒤에 모든 부하 생성 프로세스가 동시에 시작
+        start_at = time.perf_counter() + 2.0 + args.sessions * args.viewers * 0.002
+        per_generator = [
+            args.sessions // args.generators + (index < args.sessions % args.generators)
+            for index in range(args.generators)
+        ]
+        with ProcessPoolExecutor(args.generators) as pool:
+            futures = [
+                pool.submit(
+                    generate_load, url, count, args.viewers, args.window, start_at, args.duration
+                )
+                for count in per_generator
+                if count
+            ]
+            results = [future.result() for future in futures]
+        stats = asyncio.run(server_stats(url))
+    finally:
+        server.terminate()
+        server.wait()
+
+    received = sum(count for count, _ in results)
+    latencies = sorted(latency for _, sample in results for latency in sample)
+    quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else [0.0] * 99
+    return {
+        "python": f"{build['version']}{'t' if build['free_threaded'] else ''}",
+        "loops": loops,
+        "gil": "on" if stats.get("gil_enabled", not build["free_threaded"]) else "off",
+        "relayed_per_second": received / args.duration,
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+    }
+
+
+def main():
+    """측정 실행 및 결과 출력"""
+    args = parse_args()
+    pythons = args.python or [sys.executable]
+
+    results = []
+    for python in pythons:
+        build = describe_build(python)
+        for loops in args.loops:
+            results.append(measure(args, python, build, loops))
+
+    print("=" * 72)
+    print(
+        f"Relay throughput: {args.sessions} sessions x (1 drawer + {args.viewers} viewers), "
+        f"window {args.window}, {args.duration:g}s, {os.cpu_count()} CPUs"
+    )
+    print("=" * 72)
+    print(f"  {'python':>10s} {'loops':>6s} {'GIL':>4s} {'relayed/s':>12s} {'p50':>9s} {'p99':>9s}")
+    for result in results:
+        print(
+            f"  {result['python']:>10s} {result['loops']:>6d} {result['gil']:>4s} "
+            f"{result['relayed_per_second']:>12.0f} {result['p50_ms']:>7.1f}ms "
+            f"{result['p99_ms']:>7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
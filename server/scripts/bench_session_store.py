@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""세션 레지스트리 영속화 벤치마크
+
+세션 N개(세션당 참여자 M명)를 만들면서 루프 쪽 비용(record())을 재고,
+저널만 있는 상태와 스냅샷으로 압축한 상태에서 각각 시작 시 복원 시간을 비교합니다.
+
+Usage:
+    uv run --directory server python scripts/bench_session_store.py [options]
+
+Example:
+    uv run --directory server python scripts/bench_session_store.py
+    uv run --directory server python scripts/bench_session_store.py --sessions 50000
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# server/src를 Python path에 추가
+server_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(server_dir / "src"))
+
+from screen_party_server.persistence import SessionStore  # noqa: E402
+from screen_party_server.session import SessionManager  # noqa: E402
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="세션 레지스트리 영속화 벤치마크")
+    parser.add_argument("--sessions", type=int, default=10_000, help="세션 수")
+    parser.add_argument("--participants", type=int, default=3, help="세션당 참여자 수")
+    return parser.parse_args()
+
+
+def restore_time(directory: Path) -> float:
+    """새 저장소로 복원하는 시간 (초)"""
+    start = time.perf_counter()
+    SessionStore(directory).load()
+    return time.perf_counter() - start
+
+
+def main():
+    """벤치마크 실행"""
+    args = parse_args()
+    logging.disable(logging.INFO)
+
+    with tempfile.TemporaryDirectory() as temporary:
+        directory = Path(temporary)
+        # 벤치마크 도중 쓰기 스레드가 압축하지 않도록
+        store = SessionStore(directory, compact_after=sys.maxsize, compact_interval=1e9)
+        store.load()
+        store.start()
+        manager = SessionManager(store=store)
+
+        start = time.perf_counter()
+        for index in range(args.sessions):
+            session, _ = manager.create_session(f"Host{index}")
+            for guest in range(args.participants - 1):
+                manager.add_participant(session.session_id, f"Guest{guest}")
+        elapsed = time.perf_counter() - start
+        changes = store._seq
+
+        # 같은 작업을 저장소 없이
+        plain = SessionManager()
+        start = time.perf_counter()
+        for index in range(args.sessions):
+            session, _ = plain.create_session(f"Host{index}")
+            for guest in range(args.participants - 1):
+                plain.add_participant(session.session_id, f"Guest{guest}")
+        baseline = time.perf_counter() - start
+
+        store._stopped.set()
+        store._thread.join()
+        store._flush()
+        journal_size = store.journal_path.stat().st_size
+        from_journal = restore_time(directory)
+
+        store._compact()
+        snapshot_size = store.snapshot_path.stat().st_size
+        from_snapshot = restore_time(directory)
+        store._journal.close()
+
+    print("=" * 64)
+    print(f"{args.sessions} sessions x {args.participants} participants ({changes} changes)")
+    print("=" * 64)
+    overhead = (elapsed - baseline) / changes * 1e6
+    print(f"  record() overhead on the loop: {overhead:.2f} µs/change")
+    print(f"  restore from journal:  {from_journal * 1000:8.1f} ms ({journal_size / 1024:.0f} KiB)")
+    print(
+        f"  restore from snapshot: {from_snapshot * 1000:8.1f} ms ({snapshot_size / 1024:.0f} KiB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""대규모 관전자 중계 벤치마크 (참여자로 받기 vs 관전자 fan-out 트리로 받기)
+
+서버 프로세스를 띄우고 그리는 사람 한 명과 보는 사람 --viewers명을 연결합니다. 보는 사람이
+참여자(join_session)일 때와 관전자(watch_session)일 때 각각, 그리는 사람이 --interval마다
+드로잉 업데이트를 보내며
+- 보낸 시각 → 마지막 보는 사람이 받은 시각 (fan-out 완료 지연)
+- 드로잉 사이에 보낸 ping의 왕복 시간 (중계하는 동안 그리는 사람의 연결이 막히는 정도)
+를 측정합니다.
+
+Usage:
+    uv run --directory server python scripts/bench_spectators.py [options]
+
+Example:
+    uv run --directory server python scripts/bench_spectators.py
+    uv run --directory server python scripts/bench_spectators.py --viewers 2000 --fanout 64
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import websockets
+
+SERVER_MAIN = Path(__file__).parent / "main.py"
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="대규모 관전자 중계 벤치마크")
+    parser.add_argument("--port", type=int, default=8796, help="서버 포트")
+    parser.add_argument("--viewers", type=int, default=1000, help="보는 사람 수")
+    parser.add_argument("--messages", type=int, default=100, help="드로잉 메시지 수")
+    parser.add_argument("--interval", type=float, default=0.02, help="드로잉 송신 간격 (초)")
+    parser.add_argument("--fanout", type=int, default=32, help="서버 --spectator-fanout")
+    return parser.parse_args()
+
+
+def spawn_server(port: int, fanout: int) -> subprocess.Popen:
+    """서버 프로세스 시작"""
+    return subprocess.Popen(
+        [sys.executable, str(SERVER_MAIN), "--host", "127.0.0.1", "--port", str(port)]
+        + ["--spectator-fanout", str(fanout)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+async def wait_for_port(port: int):
+    """서버가 accept를 시작할 때까지 대기"""
+    for _ in range(100):
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        return
+    raise RuntimeError(f"Server did not start on port {port}")
+
+
+async def run(args, mode: str) -> dict:
+    """보는 사람을 mode("participants" / "spectators")로 연결해서 측정"""
+    url = f"ws://127.0.0.1:{args.port}"
+    server = spawn_server(args.port, args.fanout)
+    connections = []
+    try:
+        await wait_for_port(args.port)
+        drawer = await websockets.connect(url, max_queue=None)
+        connections.append(drawer)
+        await drawer.send(json.dumps({"type": "create_session", "host_name": "Drawer"}))
+        session_id = json.loads(await drawer.recv())["session_id"]
+
+        for index in range(args.viewers):
+            viewer = await websockets.connect(url, max_queue=None)
+            if mode == "participants":
+                request = {
+                    "type": "join_session",
+                    "session_id": session_id,
+                    "guest_name": f"Viewer{index}",
+                }
+            else:
+                request = {"type": "watch_session", "session_id": session_id}
+            await viewer.send(json.dumps(request))
+            await viewer.recv()  # session_joined / session_watching
+            connections.append(viewer)
+
+        pongs: asyncio.Queue = asyncio.Queue()
+
+        async def drain_drawer():
+            # pong 외에는 참여자로 들어온 보는 사람들의 participant_joined 알림
+            async for frame in drawer:
+                if json.loads(frame)["type"] == "pong":
+                    pongs.put_nowait(time.perf_counter())
+
+        remaining = {}  # index -> 아직 받지 않은 보는 사람 수
+        completed = {}  # index -> 마지막 보는 사람이 받은 시각
+
+        async def watch(viewer):
+            async for frame in viewer:
+                message = json.loads(frame)
+                if message.get("type") != "drawing_update":
+                    continue
+                index = message["index"]
+                remaining[index] -= 1
+                if remaining[index] == 0:
+                    completed[index] = time.perf_counter()
+
+        tasks = [asyncio.create_task(drain_drawer())]
+        tasks += [asyncio.create_task(watch(viewer)) for viewer in connections[1:]]
+        await asyncio.sleep(0.5)
+
+        sent_at = {}
+        ping_rtts = []
+        for index in range(args.messages):
+            remaining[index] = args.viewers
+            sent_at[index] = time.perf_counter()
+            await drawer.send(
+                json.dumps(
+                    {
+                        "type": "drawing_update",
+                        "line_id": "bench",
+                        "index": index,
+                        "points": [[index, index]] * 8,
+                    }
+                )
+            )
+            ping_sent = time.perf_counter()
+            await drawer.send(json.dumps({"type": "ping"}))
+            ping_rtts.append(await asyncio.wait_for(pongs.get(), 30.0) - ping_sent)
+            await asyncio.sleep(args.interval)
+
+        deadline = time.perf_counter() + 30.0
+        while len(completed) < args.messages and time.perf_counter() < deadline:
+            await asyncio.sleep(0.05)
+        for task in tasks:
+            task.cancel()
+    finally:
+        for connection in connections:
+            await connection.close()
+        server.terminate()
+        server.wait()
+
+    fanout_ms = sorted((completed[i] - sent_at[i]) * 1000 for i in completed)
+    ping_ms = sorted(rtt * 1000 for rtt in ping_rtts)
+    return {
+        "mode": mode,
+        "delivered": len(completed),
+        "fanout_p50": statistics.median(fanout_ms),
+        "fanout_p99": fanout_ms[int(len(fanout_ms) * 0.99) - 1],
+        "ping_p50": statistics.median(ping_ms),
+        "ping_p99": ping_ms[int(len(ping_ms) * 0.99) - 1],
+    }
+
+
+def main():
+    """측정 실행 및 결과 출력"""
+    args = parse_args()
+    results = [asyncio.run(run(args, mode)) for mode in ("participants", "spectators")]
+
+    print("=" * 72)
+    print(
+        f"Fan-out to {args.viewers} viewers: {args.messages} drawings every "
+        f"{args.interval * 1000:g}ms, spectator fan-out width {args.fanout} (localhost)"
+    )
+    print("=" * 72)
+    print(f"  {'viewers as':>12s} {'delivered':>9s} {'last viewer p50/p99':>22s} {'ping':>20s}")
+    for result in results:
+        print(
+            f"  {result['mode']:>12s} {result['delivered']:>9d} "
+            f"{result['fanout_p50']:>9.1f}/{result['fanout_p99']:>7.1f}ms "
+            f"{result['ping_p50']:>9.1f}/{result['ping_p99']:>7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
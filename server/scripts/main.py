@@ -5,6 +5,7 @@
 
 import argparse
 import asyncio
+import logging
 import os
 import sys
 from pathlib import Path
@@ -16,6 +17,7 @@ def main():
     project_root = Path(__file__).parent.parent.parent
     sys.path.insert(0, str(project_root / "server" / "src"))
 
+    from screen_party_common.log_pipeline import setup_logging
     from screen_party_server.server import ScreenPartyServer
 
     parser = argparse.ArgumentParser(
@@ -31,6 +33,28 @@ def main():
 환경 변수:
   SCREEN_PARTY_HOST    서버 호스트 주소 (기본값: 0.0.0.0)
   SCREEN_PARTY_PORT    서버 포트 번호 (기본값: 8765)
+  SCREEN_PARTY_PROFILE_DIR  런타임 프로파일링 결과 디렉토리 (기본값: profiles)
+  SCREEN_PARTY_CAPTURE      수신 트래픽 캡처 파일 (설정하면 기록)
+  SCREEN_PARTY_STATE_DIR    세션 레지스트리 저장 디렉토리 (설정하면 재시작 후 세션 복원)
+  SCREEN_PARTY_HANDOVER_SOCKET  무중단 교대용 Unix 소켓 경로 (설정하면 배포 시 연결 유지)
+  SCREEN_PARTY_LOOPS        이벤트 루프(스레드) 수 (기본값: 1, free-threaded 빌드에서 멀티코어 중계)
+  SCREEN_PARTY_SPECTATOR_FANOUT  관전자 fan-out 트리 노드당 자식/연결 수 (기본값: 32)
+
+런타임 프로파일링 (재시작 없이):
+  kill -USR1 <pid>                    # 10초 동안 CPU 프로파일 + 힙 스냅샷
+  python scripts/profile_server.py    # localhost에서 관리 메시지로 요청 (결과 요약 출력)
+
+트래픽 캡처 / 재생:
+  %(prog)s --capture traffic.spcap                   # 수신 프레임 기록
+  python scripts/replay_capture.py traffic.spcap --speed 4   # 로컬 서버에 4배속 재생
+
+무중단 교대 (새 버전 배포):
+  %(prog)s --handover-socket /run/screen-party.sock   # 이전 프로세스
+  %(prog)s --handover-socket /run/screen-party.sock   # 새 프로세스: 포트/세션을 넘겨받음,
+                                                      # 이전 프로세스는 넘겨준 뒤 종료
+
+멀티 루프 (free-threaded Python, 예: python3.13t):
+  python3.13t scripts/main.py --loops 8   # 루프 8개가 세션을 나눠 맡음 (GIL 빌드에서는 이득 없음)
         """,
     )
 
@@ -48,11 +72,60 @@ def main():
         help="서버 포트 번호 (기본값: 8765)",
     )
 
+    parser.add_argument(
+        "--profile-dir",
+        type=str,
+        default=os.getenv("SCREEN_PARTY_PROFILE_DIR", "profiles"),
+        help="런타임 프로파일링 결과 디렉토리 (기본값: profiles)",
+    )
+
+    parser.add_argument(
+        "--capture",
+        type=str,
+        default=os.getenv("SCREEN_PARTY_CAPTURE") or None,
+        help="수신 프레임을 연결 ID/시각과 함께 기록할 캡처 파일 (재생으로 부하 재현)",
+    )
+
+    parser.add_argument(
+        "--state-dir",
+        type=str,
+        default=os.getenv("SCREEN_PARTY_STATE_DIR") or None,
+        help="세션 레지스트리 저널/스냅샷 디렉토리 (재시작해도 세션 코드 유지)",
+    )
+
+    parser.add_argument(
+        "--handover-socket",
+        type=str,
+        default=os.getenv("SCREEN_PARTY_HANDOVER_SOCKET") or None,
+        help="무중단 교대용 Unix 소켓 경로 (같은 경로로 새 프로세스를 띄우면 연결/세션을 넘김)",
+    )
+
+    parser.add_argument(
+        "--loops",
+        type=int,
+        default=int(os.getenv("SCREEN_PARTY_LOOPS", "1")),
+        help="이벤트 루프(스레드) 수, 0이면 CPU 수 (기본값: 1, 2 이상은 free-threaded 빌드용)",
+    )
+
+    parser.add_argument(
+        "--spectator-fanout",
+        type=int,
+        default=int(os.getenv("SCREEN_PARTY_SPECTATOR_FANOUT", "32")),
+        help="관전자 fan-out 트리 노드 하나가 맡는 자식 노드/연결 수 (기본값: 32)",
+    )
+
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="자세한 로그 출력"
     )
 
     args = parser.parse_args()
+    if args.loops != 1 and (args.capture or args.state_dir or args.handover_socket):
+        parser.error("--loops cannot be combined with --capture, --state-dir or --handover-socket")
+    if args.spectator_fanout < 2:
+        parser.error("--spectator-fanout must be at least 2")
+
+    # 로그 출력은 백그라운드 스레드에서 (이벤트 루프를 막지 않도록)
+    setup_logging(logging.DEBUG if args.verbose else logging.INFO)
 
     # 환경 변수 설정
     os.environ["SCREEN_PARTY_HOST"] = args.host
@@ -70,9 +143,30 @@ def main():
     print("서버가 실행 중입니다. 종료하려면 Ctrl+C를 누르세요.")
     print()
 
+    if args.loops != 1:
+        from screen_party_server.multi_loop import MultiLoopServer
+
+        server = MultiLoopServer(
+            args.host, args.port, loops=args.loops, spectator_fanout=args.spectator_fanout
+        )
+        try:
+            asyncio.run(server.start())
+        except KeyboardInterrupt:
+            print("\n서버 종료")
+        return
+
     try:
-        server = ScreenPartyServer(host=args.host, port=args.port)
+        server = ScreenPartyServer(
+            host=args.host,
+            port=args.port,
+            profile_dir=args.profile_dir,
+            capture_path=args.capture,
+            state_dir=args.state_dir,
+            handover_socket=args.handover_socket,
+            spectator_fanout=args.spectator_fanout,
+        )
         asyncio.run(server.start())
+        print("\n새 서버 프로세스에게 교대 완료, 종료")
     except KeyboardInterrupt:
         print("\n서버 종료")
     except Exception as e:
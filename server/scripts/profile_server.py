@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""실행 중인 서버에 프로파일링 요청 (재시작 없이)
+
+localhost의 서버에 profile 관리 메시지를 보내고, 캡처가 끝나면 결과 파일 위치와
+CPU 상위 함수 / 힙 상위 할당 위치 / 세션·참여자·연결별 메모리 요약을 출력합니다.
+(서버는 localhost 연결에서 온 요청만 받습니다)
+
+Usage:
+    uv run --directory server python scripts/profile_server.py [options]
+
+Example:
+    uv run --directory server python scripts/profile_server.py --duration 30
+    uv run --directory server python scripts/profile_server.py --no-heap --json
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# server/src를 Python path에 추가
+server_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(server_dir / "src"))
+
+import websockets  # noqa: E402
+from screen_party_common import MessageType  # noqa: E402
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="실행 중인 서버에 프로파일링 요청")
+    parser.add_argument("--port", type=int, default=8765, help="서버 포트 (기본값: 8765)")
+    parser.add_argument("--duration", type=float, default=10.0, help="캡처 시간 (초)")
+    parser.add_argument("--no-heap", action="store_true", help="힙 스냅샷 없이 CPU만")
+    parser.add_argument("--json", action="store_true", help="응답 전체를 JSON으로 출력")
+    return parser.parse_args()
+
+
+async def request_profile(port: int, duration: float, heap: bool) -> dict:
+    """profile 메시지를 보내고 결과 응답(또는 error)을 기다림"""
+    async with websockets.connect(f"ws://127.0.0.1:{port}", max_size=None) as websocket:
+        await websocket.send(
+            json.dumps({"type": MessageType.PROFILE.value, "duration": duration, "heap": heap})
+        )
+        async with asyncio.timeout(duration + 60):
+            while True:
+                response = json.loads(await websocket.recv())
+                if response.get("type") in (MessageType.PROFILE.value, MessageType.ERROR.value):
+                    return response
+
+
+def print_summary(result: dict):
+    """사람이 읽는 요약 출력"""
+    print(f"Profile: {result['dir']} ({result['duration']:g}s)")
+    for name, path in result["files"].items():
+        print(f"  {name:<12s} {path}")
+
+    print("\nCPU (tottime):")
+    for row in result["cpu_top"][:10]:
+        print(f"  {row['tottime_ms']:>9.1f}ms {row['calls']:>8d}  {row['function']}")
+
+    heap = result.get("heap")
+    if heap:
+        print(f"\nHeap (traced {heap['traced_kb']:g}KB):")
+        for row in heap["top"][:10]:
+            print(f"  {row['size_kb']:>9.1f}KB {row['count']:>8d}  {row['where']}")
+        packages = ", ".join(f"{name} {kb:g}KB" for name, kb in heap["by_package_kb"].items())
+        print(f"  by package: {packages}")
+
+    owners = result["owners"]
+    totals = owners["totals"]
+    print(
+        f"\nOwners: {totals['sessions']} sessions {totals['session_bytes'] / 1024:.1f}KB, "
+        f"{totals['participants']} participants {totals['participant_bytes'] / 1024:.1f}KB, "
+        f"{totals['connections']} connections (send buffer {totals['send_buffer_bytes']}B, "
+        f"recv queue {totals['recv_queue_bytes']}B)"
+    )
+    for session in owners["sessions"][:5]:
+        print(
+            f"  session {session['session_id']}: {session['bytes'] / 1024:.1f}KB "
+            f"({session['participants']} participants, "
+            f"relay log {session['relay_log_messages']} msgs "
+            f"{session['relay_log_bytes'] / 1024:.1f}KB)"
+        )
+    for connection in owners["connections"][:5]:
+        print(
+            f"  connection {connection['user_id']} {connection['remote']}: "
+            f"send {connection['send_buffer_bytes']}B, "
+            f"recv {connection['recv_queue_frames']} frames {connection['recv_queue_bytes']}B"
+        )
+
+
+def main():
+    """프로파일링 요청 및 결과 출력"""
+    args = parse_args()
+    result = asyncio.run(request_profile(args.port, args.duration, not args.no_heap))
+    if result.get("type") == MessageType.ERROR.value:
+        print(f"❌ {result.get('message')}")
+        sys.exit(1)
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        print_summary(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""캡처한 트래픽 재생 (부하 재현 / handle_message·broadcast 회귀 벤치마크)
+
+서버를 --capture로 실행해 남긴 캡처 파일의 연결들을 같은 시각 간격(--speed배)으로 다시 보냅니다.
+
+    기본      - 실행 중인 서버(--url)에 실제 WebSocket 연결로 재생하고, 끝나면 서버의
+                이벤트 루프 지연 통계를 받아 출력 (부하 상황 재현)
+    --direct  - 네트워크 없이 이 프로세스 안의 새 ScreenPartyServer.handle_message를 직접 호출,
+                프레임당 처리 시간(중계 broadcast 포함)을 측정 (--speed 0이면 최대 속도)
+
+Usage:
+    uv run --directory server python scripts/replay_capture.py CAPTURE [options]
+
+Example:
+    uv run --directory server python scripts/replay_capture.py traffic.spcap --speed 4
+    uv run --directory server python scripts/replay_capture.py traffic.spcap --direct --speed 0
+    uv run --directory server python scripts/replay_capture.py traffic.spcap --direct --speed 0 \\
+        --max-p99-us 200
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+
+# server/src를 Python path에 추가
+server_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(server_dir / "src"))
+
+import websockets  # noqa: E402
+from screen_party_common import MessageType  # noqa: E402
+from screen_party_server.replay import CaptureReplayer  # noqa: E402
+from screen_party_server.server import ScreenPartyServer  # noqa: E402
+from screen_party_server.traffic_capture import read_capture  # noqa: E402
+
+
+def parse_args():
+    """명령줄 인자 파싱"""
+    parser = argparse.ArgumentParser(description="캡처한 트래픽 재생")
+    parser.add_argument("capture", help="캡처 파일 (서버 --capture)")
+    parser.add_argument(
+        "--url", default="ws://127.0.0.1:8765", help="재생할 서버 (기본값: ws://127.0.0.1:8765)"
+    )
+    parser.add_argument(
+        "--speed", type=float, default=1.0, help="재생 배속 (기본값: 1, 0이면 기다리지 않음)"
+    )
+    parser.add_argument(
+        "--direct", action="store_true", help="네트워크 없이 handle_message 직접 호출 (벤치마크)"
+    )
+    parser.add_argument(
+        "--max-p99-us",
+        type=float,
+        default=None,
+        help="--direct에서 handle_message p99가 이 값(us)을 넘으면 실패 (exit 1)",
+    )
+    parser.add_argument("--json", action="store_true", help="결과를 JSON으로 출력")
+    return parser.parse_args()
+
+
+async def fetch_server_stats(url: str) -> dict:
+    """재생이 끝난 서버의 stats 응답"""
+    async with websockets.connect(url, max_size=None) as websocket:
+        await websocket.send(json.dumps({"type": MessageType.STATS.value}))
+        return json.loads(await websocket.recv())
+
+
+async def replay(args) -> dict:
+    """재생 실행"""
+    replayer = CaptureReplayer(read_capture(args.capture), speed=args.speed)
+    if args.direct:
+        # 재생 중 로그 출력이 처리 시간에 섞이지 않도록
+        logging.disable(logging.WARNING)
+        return await replayer.run_direct(ScreenPartyServer(host="127.0.0.1", port=0))
+
+    result = await replayer.run_websocket(args.url)
+    stats = await fetch_server_stats(args.url)
+    result["server_loop_lag"] = stats.get("loop_lag", {}).get("lag")
+    return result
+
+
+def main():
+    """재생 및 결과 출력"""
+    args = parse_args()
+    result = asyncio.run(replay(args))
+
+    if args.json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    else:
+        mode = "direct handle_message" if args.direct else args.url
+        print("=" * 64)
+        print(f"Replay {args.capture} -> {mode} at {args.speed:g}x")
+        print("=" * 64)
+        print(
+            f"  {result['connections']} connections, {result['frames_sent']} frames sent, "
+            f"{result['messages_received']} messages received, {result['errors']} errors, "
+            f"{result['unmapped_sessions']} unmapped sessions"
+        )
+        print(
+            f"  capture {result['capture_seconds']:g}s -> replay {result['wall_seconds']:g}s, "
+            f"send lag p95 {result['send_lag']['p95_ms']:g}ms"
+        )
+        handle = result.get("handle_message_us")
+        if handle:
+            print(
+                f"  handle_message: p50 {handle['p50']:g}us / p99 {handle['p99']:g}us / "
+                f"max {handle['max']:g}us ({handle['count']} frames)"
+            )
+        lag = result.get("server_loop_lag")
+        if lag:
+            print(
+                f"  server loop lag: p50 {lag['p50_ms']:g}ms / p95 {lag['p95_ms']:g}ms / "
+                f"max {lag['max_ms']:g}ms"
+            )
+
+    if args.max_p99_us is not None:
+        p99 = result.get("handle_message_us", {}).get("p99", 0.0)
+        if p99 > args.max_p99_us:
+            print(f"❌ handle_message p99 {p99:g}us > {args.max_p99_us:g}us")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
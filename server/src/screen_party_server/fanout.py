@@ -0,0 +1,190 @@
+"""관전자 fan-out 트리 (대규모 관전자에게 세션 브로드캐스트 중계)
+
+관전자는 세션 참여자 목록에 들어가지 않고 브로드캐스트만 받습니다. 관전자가 수백~수천 명이어도
+중계하는 쪽(드로잉 메시지를 처리하는 태스크)은 루트 노드의 큐에 프레임 하나를 넣고 바로
+돌아갑니다. 프레임은 노드마다 하나씩 있는 워커 태스크를 거쳐 아래로 전달됩니다:
+
+    루트 → 중간 노드(최대 width개 자식) → ... → 잎 노드(최대 width개 연결) → 관전자 연결
+
+한 태스크가 한 번에 하는 일은 최대 width개로 제한되므로 1,000명에게 보내는 동안에도 다른
+세션의 중계와 연결 처리가 그 사이사이에 끼어들 수 있습니다. 프레임은 루트에서 한 번만
+UTF-8로 인코딩하고, 잎 노드는 websockets.broadcast로 소켓 버퍼에 바로 씁니다(전송 완료를
+기다리지 않음). 쓰기 버퍼가 max_buffer를 넘긴 느린 관전자는 메모리가 쌓이지 않도록 끊습니다.
+"""
+
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional, Set
+
+import websockets
+from websockets.asyncio.server import ServerConnection
+
+from screen_party_common.log_pipeline import RateLimitedLogger
+
+logger = logging.getLogger(__name__)
+throttled_logger = RateLimitedLogger(logger, interval=5.0, burst=3)
+
+# 너무 느려서 끊는 관전자 연결의 close 코드 (1013: Try Again Later)
+SLOW_SPECTATOR_CLOSE_CODE = 1013
+
+
+class RelayNode:
+    """fan-out 트리의 노드 하나 (받은 프레임을 자식 노드 또는 관전자 연결에 전달하는 워커)"""
+
+    def __init__(self, tree: "SpectatorFanout"):
+        self.tree = tree
+        self.children: List["RelayNode"] = []
+        # 잎 노드만 연결을 가짐
+        self.connections: Set[ServerConnection] = set()
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self.task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            frame = await self.queue.get()
+            # 이 노드에서 아래로: 중간 노드는 자식 큐에 넣기만, 잎 노드는 연결에 쓰기
+            for child in self.children:
+                child.queue.put_nowait(frame)
+            if frame is None:
+                return
+            if self.connections:
+                self.tree._deliver(self, frame)
+
+
+class SpectatorFanout:
+    """세션 하나의 관전자 연결들을 width개씩 묶은 fan-out 트리"""
+
+    def __init__(
+        self,
+        width: int = 32,
+        max_buffer: int = 1 << 20,
+        on_drop: Optional[Callable[[ServerConnection], None]] = None,
+    ):
+        """
+        Args:
+            width: 노드 하나의 자식 수 / 잎 노드 하나의 연결 수 상한
+            max_buffer: 관전자 연결 쓰기 버퍼 상한 (바이트, 넘으면 연결을 끊음)
+            on_drop: 느려서 끊은 연결을 트리에서 뺀 뒤 호출 (서버의 관전 기록 정리용)
+        """
+        if width < 2:
+            raise ValueError("width must be at least 2")
+        self.width = width
+        self.max_buffer = max_buffer
+        self.on_drop = on_drop
+        # 단계별 노드 (0단계 = 잎, 맨 위 단계에는 루트 하나)
+        self._levels: List[List[RelayNode]] = []
+        self._leaf_of: Dict[ServerConnection, RelayNode] = {}
+        self.root: Optional[RelayNode] = None
+        self.published = 0
+        self.dropped = 0
+        self.closed = False
+        # 느린 관전자 연결을 닫는 태스크 (루프는 약한 참조만 두므로 끝날 때까지 보관)
+        self._closing: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._leaf_of)
+
+    def __contains__(self, websocket) -> bool:
+        return websocket in self._leaf_of
+
+    @property
+    def depth(self) -> int:
+        """루트에서 잎까지 노드 단계 수 (트리가 비었으면 0)"""
+        return len(self._levels)
+
+    def add(self, websocket: ServerConnection):
+        """관전자 연결 추가 (빈자리가 있는 잎 노드, 없으면 새 잎 노드)"""
+        if websocket in self._leaf_of:
+            return
+        leaf = None
+        if self._levels:
+            leaf = next(
+                (node for node in self._levels[0] if len(node.connections) < self.width), None
+            )
+        if leaf is None:
+            leaf = RelayNode(self)
+            self._attach(leaf, 0)
+        leaf.connections.add(websocket)
+        self._leaf_of[websocket] = leaf
+
+    def remove(self, websocket: ServerConnection) -> bool:
+        """관전자 연결 제거 (잎 노드는 남겨 두고 다음 관전자가 빈자리를 채움)
+
+        Returns:
+            관전 중이던 연결이면 True
+        """
+        leaf = self._leaf_of.pop(websocket, None)
+        if leaf is None:
+            return False
+        leaf.connections.discard(websocket)
+        return True
+
+    def _attach(self, node: RelayNode, level: int):
+        """level 단계에 node 추가 (위 단계에 빈자리가 없으면 위로 새 노드/새 루트)"""
+        if level == len(self._levels):
+            self._levels.append([node])
+            self.root = node
+            return
+        self._levels[level].append(node)
+        if level == len(self._levels) - 1:
+            # 맨 위 단계가 둘이 됨 - 기존 루트와 node를 자식으로 갖는 새 루트
+            root = RelayNode(self)
+            root.children = [self.root, node]
+            self._levels.append([root])
+            self.root = root
+            return
+        parent = next((p for p in self._levels[level + 1] if len(p.children) < self.width), None)
+        if parent is None:
+            parent = RelayNode(self)
+            self._attach(parent, level + 1)
+        parent.children.append(node)
+
+    def publish(self, frame: str):
+        """프레임을 모든 관전자에게 (루트 큐에 넣고 바로 반환)"""
+        if self.root is None or self.closed:
+            return
+        self.published += 1
+        self.root.queue.put_nowait(frame.encode())
+
+    def close(self):
+        """이미 넣은 프레임을 다 전달한 뒤 워커 태스크 종료 (연결은 닫지 않음)"""
+        if self.closed:
+            return
+        self.closed = True
+        if self.root is not None:
+            self.root.queue.put_nowait(None)
+
+    def _deliver(self, leaf: RelayNode, frame: bytes):
+        """잎 노드의 연결들에 쓰기 (쓰기 버퍼가 넘친 연결은 끊고 제외)"""
+        for websocket in [ws for ws in leaf.connections if self._overflowing(ws)]:
+            self.remove(websocket)
+            self.dropped += 1
+            if self.on_drop is not None:
+                self.on_drop(websocket)
+            throttled_logger.warning("Dropping slow spectator %s", websocket.remote_address)
+            task = asyncio.create_task(
+                websocket.close(SLOW_SPECTATOR_CLOSE_CODE, "spectator too slow")
+            )
+            self._closing.add(task)
+            task.add_done_callback(self._on_closed)
+        websockets.broadcast(leaf.connections, frame, text=True)
+
+    def _on_closed(self, task: asyncio.Task):
+        """닫기 태스크 정리 (실패했으면 기록)"""
+        self._closing.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            throttled_logger.warning("Failed to close slow spectator: %s", task.exception())
+
+    def _overflowing(self, websocket: ServerConnection) -> bool:
+        transport = getattr(websocket, "transport", None)
+        return transport is not None and transport.get_write_buffer_size() > self.max_buffer
+
+    def summary(self) -> dict:
+        """통계용 요약"""
+        return {
+            "spectators": len(self),
+            "depth": self.depth,
+            "nodes": sum(len(level) for level in self._levels),
+            "published": self.published,
+            "dropped": self.dropped,
+        }
@@ -0,0 +1,116 @@
+"""서버 프로세스 간 무중단 교대 (배포 시 드레인 + 핫 핸드오버, Unix 전용)
+
+모든 서버 프로세스를 같은 --handover-socket 경로로 실행합니다. 시작할 때 그 경로에서
+기다리는 이전 프로세스가 있으면 교대를 요청하고, 교대가 끝나면 다음 프로세스를 위해
+직접 그 경로에서 기다립니다.
+
+    1. 이전 프로세스가 listening 소켓 fd를 SCM_RIGHTS로 넘김
+       → 새 프로세스가 같은 소켓에서 accept 시작 (포트가 닫히는 순간 없음)
+    2. 이전 프로세스가 accept를 멈추고 기존 연결마다 server_handover 알림 후 close(1012)
+       연결 처리 루프가 모두 끝날 때까지 기다림 (이미 받은 프레임은 모두 중계/기록됨)
+    3. 이전 프로세스가 세션 레지스트리 + 중계 로그를 넘기고 종료
+       → 새 프로세스가 가져온 뒤에야 연결들의 메시지를 처리 (그 전에 온 재연결은 대기)
+    4. 클라이언트는 끊김을 감지하면 바로 resume_session → 같은 user_id로 이어가고
+       중계 seq가 그대로 이어지므로 last_seq 이후 놓친 메시지를 돌려받음
+
+채널 메시지: 길이 (uint32) + JSON, fd는 첫 바이트에 함께 전달.
+"""
+
+import json
+import socket
+import struct
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Tuple
+
+from .persistence import session_from_record, session_record
+from .relay_log import RelayLog
+
+if TYPE_CHECKING:
+    from .server import ScreenPartyServer
+
+# WebSocket close code 1012 (Service Restart): 클라이언트는 바로 재연결
+HANDOVER_CLOSE_CODE = 1012
+LENGTH = struct.Struct("<I")
+MAX_FDS = 16
+
+# 채널 메시지 type
+LISTENERS = "listeners"
+ACCEPTING = "accepting"
+REGISTRY = "registry"
+DONE = "done"
+
+
+def supported() -> bool:
+    """이 플랫폼에서 fd 전달이 가능한지 (Unix 도메인 소켓 + SCM_RIGHTS)"""
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+class HandoverChannel:
+    """두 서버 프로세스 사이의 Unix 도메인 소켓 (블로킹, asyncio.to_thread로 호출)"""
+
+    def __init__(self, sock: socket.socket):
+        self.sock = sock
+        self.sock.setblocking(True)
+
+    def send(self, message: Dict[str, Any], fds: Sequence[int] = ()):
+        """메시지 하나 전송 (fds가 있으면 함께 넘김)"""
+        payload = json.dumps(message, ensure_ascii=False).encode()
+        data = LENGTH.pack(len(payload)) + payload
+        sent = socket.send_fds(self.sock, [data], list(fds)) if fds else 0
+        self.sock.sendall(data[sent:])
+
+    def receive(self) -> Tuple[Dict[str, Any], List[int]]:
+        """메시지 하나 수신
+
+        Returns:
+            (메시지, 함께 받은 fd들)
+
+        Raises:
+            ConnectionError: 상대가 중간에 연결을 끊음
+        """
+        header, fds, _, _ = socket.recv_fds(self.sock, LENGTH.size, MAX_FDS)
+        header += self._read_exact(LENGTH.size - len(header))
+        (length,) = LENGTH.unpack(header)
+        return json.loads(self._read_exact(length)), fds
+
+    def _read_exact(self, size: int) -> bytes:
+        chunks = []
+        while size > 0:
+            chunk = self.sock.recv(min(size, 1 << 20))
+            if not chunk:
+                raise ConnectionError("Handover peer closed the channel")
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def close(self):
+        self.sock.close()
+
+
+def export_registry(server: "ScreenPartyServer") -> Dict[str, Any]:
+    """넘겨줄 세션 레지스트리 (활성 세션의 참여자 + 중계 로그)"""
+    sessions = {
+        session_id: session_record(session)
+        for session_id, session in server.session_manager.sessions.items()
+        if session.is_active and session.participants
+    }
+    relay_logs = {
+        session_id: relay_log.export()
+        for session_id, relay_log in server.relay_logs.items()
+        if session_id in sessions
+    }
+    return {"type": REGISTRY, "sessions": sessions, "relay_logs": relay_logs}
+
+
+def import_registry(server: "ScreenPartyServer", registry: Dict[str, Any]) -> int:
+    """넘겨받은 세션 레지스트리 등록
+
+    Returns:
+        가져온 세션 수
+    """
+    sessions = {
+        session_id: session_from_record(session_id, data)
+        for session_id, data in registry["sessions"].items()
+    }
+    for session_id, data in registry["relay_logs"].items():
+        server.relay_logs[session_id] = RelayLog.from_export(data)
+    return server.session_manager.restore(sessions)
@@ -0,0 +1,396 @@
+"""한 프로세스 안의 여러 이벤트 루프로 중계 (free-threaded Python용 멀티코어 모드)
+
+스레드마다 이벤트 루프 하나와 ShardServer 하나를 두고, 모든 루프가 같은 listening 소켓에서
+accept합니다. 세션은 session_id 해시로 루프 하나가 소유하며(생성하는 루프가 자기 몫의 ID를
+고름), 세션 상태(참여자, 중계 로그)는 소유 루프의 스레드만 읽고 씁니다 - 잠금이 필요 없습니다.
+
+연결은 accept한 루프에 그대로 남습니다. 다른 루프가 소유한 세션의 연결이면:
+
+    수신: 연결의 루프 → 소유 루프의 inbox (연결 순서 유지, 소유 루프가 차례로 처리)
+    송신: 소유 루프 → 연결의 루프의 outbox (소켓 쓰기는 연결의 루프가 함)
+
+그래서 drawing_update 하나의 fan-out은 소유 루프에서는 큐에 넣기만 하고, 실제 프레임
+생성/소켓 쓰기는 수신자들의 루프에 나뉘어 여러 코어에서 동시에 일어납니다. 루프 사이의
+큐는 비어 있다가 처음 넣을 때만 상대 루프를 깨우므로 몰릴수록 묶음으로 처리됩니다.
+
+관전자(watch_session)는 연결의 루프마다 세션별 fan-out 트리를 두고, 소유 루프는 관전자가 있는
+루프들에 프레임을 한 번씩만 넘깁니다 (소유 루프 → 루프별 트리 → 관전자 연결).
+
+GIL이 있는 빌드에서도 동작하지만 루프들이 코어 하나를 나눠 쓰므로 빨라지지 않습니다
+(python3.13t 등 free-threaded 빌드, C 확장이 GIL을 다시 켜면 PYTHON_GIL=0).
+프로파일링 시그널, 트래픽 캡처, 세션 영속화, 무중단 교대는 이 모드에서 지원하지 않습니다.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import socket
+import sys
+import threading
+import zlib
+from collections import deque
+from typing import Any, Callable, Coroutine, Deque, Dict, List, Optional, Set
+
+import websockets
+from websockets.asyncio.server import ServerConnection
+from websockets.exceptions import ConnectionClosed
+
+from .server import ScreenPartyServer
+from .session import SessionManager
+from screen_party_common import MessageType, DRAWING_MESSAGE_TYPES
+from screen_party_common.log_pipeline import RateLimitedLogger
+
+logger = logging.getLogger(__name__)
+throttled_logger = RateLimitedLogger(logger, interval=5.0, burst=3)
+
+# 연결이 끊겼음을 소유 루프에 알리는 inbox 항목
+DISCONNECTED = object()
+
+
+def shard_of(session_id: str, shard_count: int) -> int:
+    """세션을 소유하는 루프 번호 (모든 루프에서 같은 값)"""
+    return zlib.crc32(session_id.encode()) % shard_count
+
+
+def gil_enabled() -> bool:
+    """GIL이 켜져 있는지 (3.13 미만이나 일반 빌드는 항상 True)"""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled() if is_gil_enabled else True
+
+
+class LoopQueue:
+    """다른 스레드에서 넣고 주인 루프에서 차례로 처리하는 큐
+
+    비어 있다가 처음 넣을 때만 주인 루프를 깨우고(call_soon_threadsafe), 깨어난 처리 태스크는
+    큐가 빌 때까지 묶음으로 꺼내 처리합니다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, handler: Callable[[Any], Coroutine]):
+        """
+        Args:
+            loop: 처리할 루프
+            handler: 항목 하나를 처리하는 코루틴 함수 (주인 루프에서 하나씩 차례로 실행)
+        """
+        self.loop = loop
+        self.handler = handler
+        self._items: Deque[Any] = deque()
+        self._lock = threading.Lock()
+        self._scheduled = False
+        self.wakeups = 0
+
+    def put(self, item: Any):
+        """항목 추가 (아무 스레드에서나)"""
+        with self._lock:
+            self._items.append(item)
+            if self._scheduled:
+                return
+            self._scheduled = True
+            self.wakeups += 1
+        self.loop.call_soon_threadsafe(self._start)
+
+    def _start(self):
+        self.loop.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            with self._lock:
+                if not self._items:
+                    self._scheduled = False
+                    return
+                batch = list(self._items)
+                self._items.clear()
+            for item in batch:
+                await self.handler(item)
+
+
+class RemoteConnection:
+    """다른 루프에 있는 연결 (소유 루프의 clients에 등록되는 대리 객체)
+
+    send()는 연결의 루프 outbox에 넣기만 하므로 소유 루프를 막지 않습니다.
+    """
+
+    def __init__(self, websocket: ServerConnection, home: "ShardServer"):
+        self.websocket = websocket
+        self.home = home
+        self.remote_address = websocket.remote_address
+
+    @property
+    def close_code(self) -> Optional[int]:
+        return self.websocket.close_code
+
+    async def send(self, message: str):
+        self.home.outbox.put((self.websocket, message))
+
+
+class _Route:
+    """다른 루프가 소유한 세션에 들어간 연결의 경로"""
+
+    __slots__ = ("owner", "proxy", "user_id")
+
+    def __init__(self, owner: "ShardServer", proxy: RemoteConnection, user_id: str):
+        self.owner = owner
+        self.proxy = proxy
+        self.user_id = user_id
+
+
+class ShardSessionManager(SessionManager):
+    """이 루프가 소유하는 세션만 만드는 SessionManager"""
+
+    def __init__(self, shard_index: int, shard_count: int, **kwargs):
+        super().__init__(**kwargs)
+        self.shard_index = shard_index
+        self.shard_count = shard_count
+
+    def _generate_session_id(self) -> str:
+        """이 루프 몫으로 해시되는 세션 ID"""
+        while True:
+            session_id = super()._generate_session_id()
+            if shard_of(session_id, self.shard_count) == self.shard_index:
+                return session_id
+
+
+class ShardServer(ScreenPartyServer):
+    """루프 하나를 맡는 서버 (자기 세션은 직접 처리, 나머지는 소유 루프로 전달)"""
+
+    def __init__(self, shards: List["ShardServer"], index: int, shard_count: int, **kwargs):
+        """
+        Args:
+            shards: 같은 프로세스의 모든 루프 서버 (이 서버 포함, 번호 순)
+            index: 이 서버의 번호
+            shard_count: 루프 수
+            **kwargs: ScreenPartyServer 인자
+        """
+        super().__init__(**kwargs)
+        self.shards = shards
+        self.index = index
+        self.session_manager = ShardSessionManager(index, shard_count)
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        # 다른 루프에서 온 (연결, 메시지, 응답 future) / 다른 루프가 보내 달라는 (연결, 프레임)
+        self.inbox: Optional[LoopQueue] = None
+        self.outbox: Optional[LoopQueue] = None
+        # 다른 루프가 소유한 세션의 관전자 등록/프레임/트리 종료 (session_id, 연결, 프레임)
+        self.spectator_box: Optional[LoopQueue] = None
+        # 이 루프의 연결 → 다른 루프가 소유한 세션으로의 경로
+        self._routes: Dict[ServerConnection, _Route] = {}
+        # 이 루프가 소유한 session_id -> 그 세션의 관전자가 있는 다른 루프들
+        self._spectator_relays: Dict[str, Set["ShardServer"]] = {}
+        self._stop: Optional[asyncio.Future] = None
+        # 이 루프의 큐가 만들어짐 (모든 루프가 ready가 된 뒤에 accept 시작)
+        self.ready = threading.Event()
+
+    async def serve(self, listener: socket.socket):
+        """이 루프에서 listener로 accept하며 stop()까지 실행"""
+        self.loop = asyncio.get_running_loop()
+        self.inbox = LoopQueue(self.loop, self._handle_forwarded)
+        self.outbox = LoopQueue(self.loop, self._send_forwarded)
+        self.spectator_box = LoopQueue(self.loop, self._handle_spectator_item)
+        self._stop = self.loop.create_future()
+        self.ready.set()
+        # 먼저 시작한 루프가 받은 연결이 아직 큐가 없는 루프로 전달되지 않도록 모두 기다림
+        for shard in self.shards:
+            if not shard.ready.is_set():
+                await asyncio.to_thread(shard.ready.wait)
+        cleanup = asyncio.create_task(self.session_manager.start_cleanup_task(interval_minutes=5))
+        self.loop_lag.start()
+        try:
+            async with websockets.serve(self.handle_client, sock=listener):
+                await self._stop
+        finally:
+            self.loop_lag.stop()
+            cleanup.cancel()
+
+    def stop(self):
+        """serve() 종료 요청 (아무 스레드에서나)"""
+        if self.loop is not None and self._stop is not None:
+            self.loop.call_soon_threadsafe(lambda: self._stop.done() or self._stop.set_result(None))
+
+    def _owner_for(self, websocket, data: dict) -> "ShardServer":
+        """메시지를 처리할 루프"""
+        msg_type = data.get("type")
+        if msg_type in (
+            MessageType.JOIN_SESSION.value,
+            MessageType.RESUME_SESSION.value,
+            MessageType.WATCH_SESSION.value,
+        ):
+            session_id = data.get("session_id")
+            if isinstance(session_id, str) and session_id:
+                return self.shards[shard_of(session_id, len(self.shards))]
+        elif msg_type in DRAWING_MESSAGE_TYPES:
+            route = self._routes.get(websocket)
+            if route is not None:
+                return route.owner
+        return self
+
+    async def handle_message(self, websocket, data: dict) -> Optional[str]:
+        """소유 루프로 라우팅 (이 루프의 세션이면 그대로 처리)
+
+        세션에 들어가는 메시지(join/resume)는 결과 user_id를 기다리고,
+        드로잉 메시지는 소유 루프의 inbox에 넣고 바로 반환합니다.
+        """
+        owner = self._owner_for(websocket, data)
+        route = self._routes.get(websocket)
+        if owner is self:
+            user_id = await super().handle_message(websocket, data)
+            if route is not None and user_id and user_id != route.user_id:
+                # 이 루프의 세션으로 옮김 - 이전 세션에서는 끊긴 것으로
+                self._routes.pop(websocket, None)
+                route.owner.inbox.put((route.proxy, DISCONNECTED, None))
+            return user_id or (route.user_id if route else None)
+
+        if route is not None and route.owner is owner:
+            owner.inbox.put((route.proxy, data, None))
+            return route.user_id
+
+        proxy = RemoteConnection(websocket, self)
+        result: concurrent.futures.Future = concurrent.futures.Future()
+        owner.inbox.put((proxy, data, result))
+        user_id = await asyncio.wrap_future(result)
+        if user_id:
+            if route is not None:
+                route.owner.inbox.put((route.proxy, DISCONNECTED, None))
+            self._routes[websocket] = _Route(owner, proxy, user_id)
+            return user_id
+        return route.user_id if route else None
+
+    async def handle_disconnect(self, websocket, user_id: str):
+        """다른 루프가 소유한 세션의 연결이면 소유 루프에 끊김을 알림"""
+        route = self._routes.pop(websocket, None)
+        if route is None:
+            await super().handle_disconnect(websocket, user_id)
+            return
+        route.owner.inbox.put((route.proxy, DISCONNECTED, None))
+
+    async def _handle_forwarded(self, item):
+        """다른 루프의 연결에서 온 메시지 처리 (이 루프에서 차례로)"""
+        proxy, data, result = item
+        if data is DISCONNECTED:
+            user_id = self.websocket_to_user.get(proxy)
+            if user_id:
+                await self.handle_disconnect(proxy, user_id)
+            return
+        user_id = None
+        try:
+            user_id = await self.handle_message(proxy, data)
+        except Exception as e:
+            throttled_logger.error("Error handling forwarded message: %s", e, exc_info=True)
+            await self.send_error(proxy, str(e))
+        finally:
+            if result is not None:
+                result.set_result(user_id)
+
+    async def _send_forwarded(self, item):
+        """다른 루프가 보낸 프레임을 이 루프의 연결로 전송"""
+        websocket, message = item
+        try:
+            await websocket.send(message)
+        except ConnectionClosed:
+            throttled_logger.warning("Failed to send forwarded message: connection closed")
+
+    async def add_spectator(self, session_id: str, websocket, response: str):
+        """다른 루프의 연결이면 그 루프가 자기 트리에 관전자를 추가하고 프레임을 중계하도록"""
+        if not isinstance(websocket, RemoteConnection):
+            await super().add_spectator(session_id, websocket, response)
+            return
+        home = websocket.home
+        self._spectator_relays.setdefault(session_id, set()).add(home)
+        # 응답도 같은 큐로 보내야 이후 프레임보다 먼저 도착
+        home.spectator_box.put((session_id, websocket.websocket, response))
+
+    def publish_to_spectators(self, session_id: str, message_json: str):
+        """이 루프의 관전자 트리 + 관전자가 있는 다른 루프마다 한 번씩"""
+        super().publish_to_spectators(session_id, message_json)
+        for home in self._spectator_relays.get(session_id, ()):
+            home.spectator_box.put((session_id, None, message_json))
+
+    def close_spectators(self, session_id: str):
+        """이 루프와 중계하던 다른 루프들의 관전자 트리 종료"""
+        super().close_spectators(session_id)
+        for home in self._spectator_relays.pop(session_id, ()):
+            home.spectator_box.put((session_id, None, None))
+
+    async def _handle_spectator_item(self, item):
+        """소유 루프가 보낸 관전자 등록(연결 있음)/프레임/트리 종료(프레임 없음) 처리"""
+        session_id, websocket, frame = item
+        if websocket is not None:
+            try:
+                await self.add_spectator(session_id, websocket, frame)
+            except ConnectionClosed:
+                pass
+        elif frame is None:
+            self.close_spectators(session_id)
+        else:
+            super().publish_to_spectators(session_id, frame)
+
+    def get_stats(self) -> dict:
+        """이 루프의 통계 + 모든 루프의 세션/클라이언트 수"""
+        stats = super().get_stats()
+        stats["loop"] = self.index
+        stats["loops"] = [
+            {
+                "sessions": len(shard.session_manager.sessions),
+                "clients": len(shard.clients),
+                "routes": len(shard._routes),
+                "spectators": len(shard.watching),
+            }
+            for shard in self.shards
+        ]
+        stats["gil_enabled"] = gil_enabled()
+        return stats
+
+
+class MultiLoopServer:
+    """스레드마다 이벤트 루프 하나씩, loops개의 ShardServer로 같은 포트를 서비스"""
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 8765, loops: int = 0, **kwargs):
+        """
+        Args:
+            host: 바인딩 주소
+            port: 포트
+            loops: 이벤트 루프(스레드) 수 (0이면 CPU 수)
+            **kwargs: 각 ShardServer에 넘길 ScreenPartyServer 인자 (resume_grace 등)
+        """
+        self.host = host
+        self.port = port
+        self.loop_count = loops or os.cpu_count() or 1
+        self.shards: List[ShardServer] = []
+        for index in range(self.loop_count):
+            self.shards.append(
+                ShardServer(self.shards, index, self.loop_count, host=host, port=port, **kwargs)
+            )
+        self._threads: List[threading.Thread] = []
+
+    async def start(self):
+        """서버 시작 (0번 루프는 호출한 루프, 나머지는 스레드, 취소되면 모두 종료)"""
+        listener = socket.create_server((self.host, self.port), backlog=1024)
+        listener.setblocking(False)
+        if gil_enabled() and self.loop_count > 1:
+            logger.warning(
+                "GIL is enabled: %d loops will share one core (use a free-threaded build)",
+                self.loop_count,
+            )
+        logger.info(
+            f"Starting Screen Party server on {self.host}:{self.port} "
+            f"with {self.loop_count} event loops"
+        )
+
+        for shard in self.shards[1:]:
+            # 루프마다 같은 소켓의 복제본으로 accept (커널이 accept를 나눠 줌)
+            shard_listener = socket.socket(fileno=os.dup(listener.fileno()))
+            thread = threading.Thread(
+                target=asyncio.run,
+                args=(shard.serve(shard_listener),),
+                name=f"loop-{shard.index}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+        try:
+            await self.shards[0].serve(listener)
+        finally:
+            for shard in self.shards[1:]:
+                shard.stop()
+            for thread in self._threads:
+                await asyncio.to_thread(thread.join, 5.0)
+            self._threads.clear()
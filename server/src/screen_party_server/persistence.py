@@ -0,0 +1,340 @@
+"""세션 레지스트리 영속화 (선택 기능: write-behind 저널 + 주기적 스냅샷)
+
+서버가 재시작해도 세션 코드와 참여자(resume_token 포함)가 살아 있어서 클라이언트가
+resume_session으로 이어갈 수 있게 합니다. 드로잉 중계 메시지는 저장하지 않습니다.
+
+    journal.log     - 변경 하나당 JSON 한 줄 ({"seq", "op", ...}), append-only
+    snapshot.pickle - 어느 seq까지 반영한 전체 레지스트리 (저널 압축 결과)
+
+이벤트 루프는 record()로 변경을 큐에 넣기만 하고(deque append, 파일 I/O 없음),
+쓰기 스레드가 flush_interval마다 모아서 저널에 쓰고 fsync 한 번으로 묶습니다.
+쓰기 스레드는 저널을 적용한 자체 사본을 가지고 있어서, 저널이 compact_after줄을 넘거나
+compact_interval이 지나면 루프의 자료구조를 건드리지 않고 그 사본으로 스냅샷을 만듭니다.
+(임시 파일 → fsync → rename 후 저널 비우기, 그 사이에 죽어도 seq로 중복 적용을 건너뜀)
+
+시작할 때는 스냅샷을 mmap으로 열어 바로 역직렬화하고(내장 타입만 허용), 그 뒤의 저널을
+적용합니다. 잘린 마지막 저널 줄(쓰는 도중 종료)은 잘라 냅니다.
+서버가 죽으면 마지막 flush_interval 동안의 변경은 잃습니다.
+
+주의: resume_token이 들어 있으므로 파일은 소유자만 읽을 수 있게(0600) 만듭니다.
+"""
+
+import json
+import logging
+import mmap
+import os
+import pickle
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Union
+
+from screen_party_common import Participant, Session
+from screen_party_common.log_pipeline import RateLimitedLogger
+
+logger = logging.getLogger(__name__)
+throttled_logger = RateLimitedLogger(logger, interval=30.0)
+
+JOURNAL_NAME = "journal.log"
+SNAPSHOT_NAME = "snapshot.pickle"
+SNAPSHOT_VERSION = 1
+
+# 저널 op
+SESSION_CREATED = "session_created"
+SESSION_REMOVED = "session_removed"
+PARTICIPANT_JOINED = "participant_joined"
+PARTICIPANT_LEFT = "participant_left"
+COLOR_CHANGED = "color_changed"
+
+
+class SessionStore:
+    """세션/참여자 변경 저널 + 스냅샷"""
+
+    def __init__(
+        self,
+        directory: Union[str, Path],
+        flush_interval: float = 0.2,
+        compact_after: int = 10_000,
+        compact_interval: float = 300.0,
+    ):
+        """
+        Args:
+            directory: 저널/스냅샷을 둘 디렉토리
+            flush_interval: 저널 쓰기 + fsync 간격 (초, 죽으면 이만큼의 변경을 잃을 수 있음)
+            compact_after: 저널이 이 줄 수를 넘으면 스냅샷으로 압축
+            compact_interval: 저널에 변경이 있으면 이 간격(초)마다 압축
+        """
+        self.directory = Path(directory)
+        self.journal_path = self.directory / JOURNAL_NAME
+        self.snapshot_path = self.directory / SNAPSHOT_NAME
+        self.flush_interval = flush_interval
+        self.compact_after = compact_after
+        self.compact_interval = compact_interval
+
+        # 루프 → 쓰기 스레드 (deque append/popleft는 스레드 안전)
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._seq = 0
+        # 사본에 반영했지만 아직 저널에 쓰지 못한 줄 (쓰기가 성공할 때까지 보관)
+        self._unwritten: List[bytes] = []
+        # 쓰기 스레드의 레지스트리 사본: session_id -> {"created_at", "participants": {...}}
+        self._state: Dict[str, Dict[str, Any]] = {}
+        self._snapshot_seq = 0
+        # 사본에 반영된 마지막 seq (쓰기 스레드만 갱신)
+        self._applied_seq = 0
+        self._journal_lines = 0
+        self._last_compact = 0.0
+        self._journal = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+    # === 시작 시 복원 ===
+
+    def load(self) -> Dict[str, Session]:
+        """스냅샷 + 저널에서 세션 복원 (start() 전에 호출)
+
+        Returns:
+            session_id -> Session (last_activity는 지금, 재연결 대기는 서버가 처리)
+        """
+        started = time.perf_counter()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._state, self._snapshot_seq = _read_snapshot(self.snapshot_path)
+        self._seq = self._snapshot_seq
+
+        replayed = 0
+        if self.journal_path.exists():
+            with open(self.journal_path, "r+b") as journal:
+                valid_end = 0
+                for line in journal:
+                    try:
+                        entry = json.loads(line) if line.endswith(b"\n") else None
+                    except ValueError:
+                        entry = None
+                    if entry is None:
+                        # 쓰는 도중 종료된 마지막 줄 - 이어서 쓸 자리에서 잘라 냄
+                        journal.truncate(valid_end)
+                        break
+                    valid_end += len(line)
+                    self._journal_lines += 1
+                    if entry["seq"] <= self._snapshot_seq:
+                        continue
+                    _apply(self._state, entry)
+                    self._seq = entry["seq"]
+                    replayed += 1
+        self._applied_seq = self._seq
+
+        sessions = {
+            session_id: session_from_record(session_id, data)
+            for session_id, data in self._state.items()
+        }
+        logger.info(
+            "Restored %d sessions (%d participants) in %.1fms "
+            "(snapshot seq %d + %d journal entries)",
+            len(sessions),
+            sum(len(s.participants) for s in sessions.values()),
+            (time.perf_counter() - started) * 1000,
+            self._snapshot_seq,
+            replayed,
+        )
+        return sessions
+
+    # === 루프에서 호출 ===
+
+    def record(self, op: str, **fields):
+        """변경 하나를 큐에 넣음 (파일 I/O 없음, 쓰기 스레드가 나중에 기록)"""
+        self._seq += 1
+        fields["seq"] = self._seq
+        fields["op"] = op
+        self._pending.append(fields)
+
+    def start(self):
+        """쓰기 스레드 시작"""
+        if self._thread is not None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._journal = _open_private(self.journal_path, "ab")
+        self._last_compact = time.monotonic()
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, name="session-journal", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        """남은 변경을 기록하고 스냅샷으로 압축한 뒤 쓰기 스레드 종료"""
+        if self._thread is None:
+            return
+        self._stopped.set()
+        self._thread.join()
+        self._thread = None
+        self._flush()
+        if self._journal_lines:
+            self._compact()
+        self._journal.close()
+        self._journal = None
+
+    # === 쓰기 스레드 ===
+
+    def _run(self):
+        while not self._stopped.wait(self.flush_interval):
+            try:
+                self._flush()
+                if self._journal_lines >= self.compact_after or (
+                    self._journal_lines
+                    and time.monotonic() - self._last_compact >= self.compact_interval
+                ):
+                    self._compact()
+            except OSError as e:
+                throttled_logger.error("Session journal write failed: %s", e)
+            except Exception:
+                # 쓰기 스레드가 죽으면 이후 변경이 기록되지 않으므로 기록만 하고 계속
+                throttled_logger.error("Session journal thread error", exc_info=True)
+
+    def _flush(self):
+        """큐에 쌓인 변경을 저널에 쓰고 fsync 한 번
+
+        쓰기가 실패하면 저널을 쓰기 전 길이로 되돌리고 줄들을 보관해 두었다가
+        다음 flush에서 다시 씁니다 (깨진 줄 뒤에 이어 쓰면 복원 시 그 뒤가 모두 버려짐).
+        """
+        while self._pending:
+            entry = self._pending.popleft()
+            _apply(self._state, entry)
+            self._applied_seq = entry["seq"]
+            self._unwritten.append(json.dumps(entry, ensure_ascii=False).encode() + b"\n")
+        if not self._unwritten:
+            return
+
+        fd = self._journal.fileno()
+        size = os.fstat(fd).st_size
+        try:
+            data = memoryview(b"".join(self._unwritten))
+            while data:
+                data = data[os.write(fd, data) :]
+            os.fsync(fd)
+        except OSError:
+            try:
+                os.ftruncate(fd, size)
+            except OSError:
+                pass
+            raise
+        self._journal_lines += len(self._unwritten)
+        self._unwritten.clear()
+
+    def _compact(self):
+        """사본을 스냅샷으로 저장하고 저널 비우기"""
+        # _flush 이후에 큐에 들어온 변경은 아직 사본에 없음 - 사본이 반영한 seq까지만 기록
+        snapshot = {
+            "version": SNAPSHOT_VERSION,
+            "seq": self._applied_seq,
+            "saved_at": time.time(),
+            "sessions": self._state,
+        }
+        temporary = self.snapshot_path.with_suffix(".tmp")
+        with _open_private(temporary, "wb") as output:
+            pickle.dump(snapshot, output, protocol=pickle.HIGHEST_PROTOCOL)
+            output.flush()
+            os.fsync(output.fileno())
+        os.replace(temporary, self.snapshot_path)
+        _fsync_directory(self.directory)
+
+        self._journal.truncate(0)
+        self._journal.seek(0)
+        os.fsync(self._journal.fileno())
+        self._snapshot_seq = self._applied_seq
+        self._journal_lines = 0
+        self._last_compact = time.monotonic()
+
+
+def _apply(state: Dict[str, Dict[str, Any]], entry: Dict[str, Any]):
+    """저널 변경 하나를 사본에 적용"""
+    op = entry["op"]
+    session_id = entry["session_id"]
+    if op == SESSION_CREATED:
+        state[session_id] = {"created_at": entry["created_at"], "participants": {}}
+    elif op == SESSION_REMOVED:
+        state.pop(session_id, None)
+    elif session_id in state:
+        participants = state[session_id]["participants"]
+        if op == PARTICIPANT_JOINED:
+            participants[entry["user_id"]] = {
+                "name": entry["name"],
+                "color": entry["color"],
+                "joined_at": entry["joined_at"],
+                "resume_token": entry["resume_token"],
+            }
+        elif op == PARTICIPANT_LEFT:
+            participants.pop(entry["user_id"], None)
+        elif op == COLOR_CHANGED and entry["user_id"] in participants:
+            participants[entry["user_id"]]["color"] = entry["color"]
+
+
+def session_record(session: Session) -> Dict[str, Any]:
+    """Session 객체를 사본(스냅샷/교대 전달) 형식으로"""
+    return {
+        "created_at": session.created_at.timestamp(),
+        "participants": {
+            user_id: {
+                "name": participant.name,
+                "color": participant.color,
+                "joined_at": participant.joined_at.timestamp(),
+                "resume_token": participant.resume_token,
+            }
+            for user_id, participant in session.participants.items()
+        },
+    }
+
+
+def session_from_record(session_id: str, data: Dict[str, Any]) -> Session:
+    """사본의 세션 하나를 Session 객체로"""
+    session = Session(session_id=session_id, created_at=datetime.fromtimestamp(data["created_at"]))
+    for user_id, participant in data["participants"].items():
+        session.participants[user_id] = Participant(
+            user_id=user_id,
+            name=participant["name"],
+            color=participant["color"],
+            joined_at=datetime.fromtimestamp(participant["joined_at"]),
+            resume_token=participant["resume_token"],
+        )
+    return session
+
+
+class _BuiltinsUnpickler(pickle.Unpickler):
+    """내장 타입(dict/list/str/숫자)만 허용하는 언피클러 (스냅샷 파일로 코드 실행 방지)"""
+
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError(f"Unexpected object in snapshot: {module}.{name}")
+
+
+def _read_snapshot(path: Path):
+    """스냅샷을 mmap으로 읽어 (사본, seq) 반환 (없거나 깨졌으면 빈 상태)"""
+    if not path.exists() or path.stat().st_size == 0:
+        return {}, 0
+    try:
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            snapshot = _BuiltinsUnpickler(data).load()
+    except (OSError, pickle.UnpicklingError, EOFError) as e:
+        logger.error("Ignoring unreadable session snapshot %s: %s", path, e)
+        return {}, 0
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        logger.error("Ignoring session snapshot with version %s", snapshot.get("version"))
+        return {}, 0
+    return snapshot["sessions"], snapshot["seq"]
+
+
+def _open_private(path: Path, mode: str):
+    """소유자만 읽고 쓸 수 있는 파일 열기"""
+    flags = os.O_WRONLY | os.O_CREAT | (os.O_APPEND if "a" in mode else os.O_TRUNC)
+    return os.fdopen(os.open(path, flags, 0o600), mode)
+
+
+def _fsync_directory(directory: Path):
+    """rename이 디스크에 남도록 디렉토리 fsync (지원하지 않는 플랫폼은 건너뜀)"""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
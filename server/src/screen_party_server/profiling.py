@@ -0,0 +1,383 @@
+"""실행 중인 서버의 CPU / 힙 프로파일링 (재시작 없이)
+
+SIGUSR1 또는 localhost에서 보낸 profile 관리 메시지로 시작합니다.
+정해진 시간 동안 cProfile로 CPU 프로파일을, tracemalloc으로 시작/끝 힙 스냅샷을 떠서
+output_dir/profile-<시각>/ 아래에 파일로 남기고, 세션/참여자/연결별 메모리 요약을 함께 돌려줍니다.
+
+    cpu.prof                 - cProfile 원본 (python -m pstats, snakeviz 등으로 열기)
+    cpu.txt                  - 누적 시간 기준 상위 함수
+    heap-start.tracemalloc   - 시작 스냅샷 (tracemalloc.Snapshot.load로 열기)
+    heap-end.tracemalloc     - 끝 스냅샷
+    summary.json             - capture()가 돌려주는 요약과 같은 내용
+
+tracemalloc은 켜진 뒤의 할당만 추적합니다. 서버가 이미 추적 중이 아니면 캡처 동안만 켜므로
+힙 통계는 그 구간의 할당이고, 시작 전부터 있던 객체까지 보려면
+서버를 PYTHONTRACEMALLOC=<프레임 수>로 실행하세요.
+세션/참여자/연결별 요약은 객체를 직접 따라가서 재므로 tracemalloc과 무관합니다.
+"""
+
+import asyncio
+import cProfile
+import io
+import ipaddress
+import json
+import logging
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from .server import ScreenPartyServer
+
+logger = logging.getLogger(__name__)
+
+# 캡처 시간 (초)
+DEFAULT_DURATION = 10.0
+MIN_DURATION = 0.1
+MAX_DURATION = 120.0
+# 요약에 남길 상위 항목 수
+TOP_N = 20
+# tracemalloc이 할당마다 기억할 프레임 수 (캡처 동안만 켤 때)
+HEAP_FRAMES = 5
+# 객체 하나의 크기를 잴 때 따라갈 최대 객체 수 (루프를 오래 막지 않도록)
+SIZEOF_LIMIT = 200_000
+
+# 힙 통계에서 뺄 할당 위치 (프로파일러 자신)
+_HEAP_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+]
+# 할당 위치를 묶을 패키지 (파일 경로에 포함된 이름)
+_HEAP_PACKAGES = ("screen_party_server", "screen_party_common", "websockets", "asyncio", "json")
+
+
+class ProfilerBusy(RuntimeError):
+    """이미 캡처가 진행 중"""
+
+
+class RuntimeProfiler:
+    """실행 중인 ScreenPartyServer의 CPU 프로파일 + 힙 스냅샷 캡처 (한 번에 하나)"""
+
+    def __init__(self, server: "ScreenPartyServer", output_dir: str = "profiles", top: int = TOP_N):
+        """
+        Args:
+            server: 프로파일링할 서버 (세션/참여자/연결별 메모리 요약용)
+            output_dir: 결과 파일을 남길 디렉토리 (캡처마다 하위 디렉토리 생성)
+            top: 요약에 남길 상위 항목 수
+        """
+        self.server = server
+        self.output_dir = Path(output_dir)
+        self.top = top
+        self._running = False
+        # 시그널로 시작한 캡처 태스크 (GC되지 않도록 참조 유지)
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def busy(self) -> bool:
+        """캡처가 진행 중인지"""
+        return self._running
+
+    def trigger(self, duration: float = DEFAULT_DURATION):
+        """시그널 핸들러용: 캡처를 백그라운드 태스크로 시작 (진행 중이면 무시)"""
+        if self._running:
+            logger.warning("Profile requested but a capture is already running")
+            return
+        self._task = asyncio.get_running_loop().create_task(self._capture_and_log(duration))
+
+    async def _capture_and_log(self, duration: float):
+        try:
+            result = await self.capture(duration)
+        except Exception as e:
+            logger.error("Profile capture failed: %s", e, exc_info=True)
+            return
+        logger.info("Profile owners: %s", result["owners"]["totals"])
+
+    async def capture(
+        self, duration: float = DEFAULT_DURATION, heap: bool = True
+    ) -> Dict[str, Any]:
+        """CPU 프로파일(+힙 스냅샷)을 duration초 동안 캡처해 파일로 남기고 요약 반환
+
+        Args:
+            duration: 캡처 시간 (초, MIN_DURATION~MAX_DURATION로 제한)
+            heap: tracemalloc 힙 스냅샷도 뜰지
+
+        Returns:
+            요약 (JSON 직렬화 가능): dir, duration, files, cpu_top, heap, owners
+
+        Raises:
+            ProfilerBusy: 이미 캡처가 진행 중
+        """
+        if self._running:
+            raise ProfilerBusy("Profiling already in progress")
+        self._running = True
+        try:
+            duration = min(max(float(duration), MIN_DURATION), MAX_DURATION)
+            run_dir = self._make_run_dir()
+            logger.info("Profiling for %.1fs (heap=%s) into %s", duration, heap, run_dir)
+
+            started_tracing = heap and not tracemalloc.is_tracing()
+            if started_tracing:
+                tracemalloc.start(HEAP_FRAMES)
+            before = tracemalloc.take_snapshot() if heap else None
+
+            profile = cProfile.Profile()
+            profile.enable()
+            try:
+                await asyncio.sleep(duration)
+            finally:
+                profile.disable()
+                after = tracemalloc.take_snapshot() if heap else None
+                if started_tracing:
+                    tracemalloc.stop()
+
+            # 서버 자료구조는 루프 스레드에서만 읽고, 파일 쓰기/통계 정리는 스레드에서
+            owners = owner_summary(self.server, self.top)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(
+                None, self._write_results, run_dir, duration, profile, before, after, owners
+            )
+            logger.info("Profile written to %s", run_dir)
+            return result
+        finally:
+            self._running = False
+
+    def _make_run_dir(self) -> Path:
+        """캡처별 디렉토리 (같은 초에 여러 번이면 번호를 붙임)"""
+        stamp = time.strftime("profile-%Y%m%d-%H%M%S")
+        run_dir = self.output_dir / stamp
+        index = 1
+        while run_dir.exists():
+            index += 1
+            run_dir = self.output_dir / f"{stamp}-{index}"
+        run_dir.mkdir(parents=True)
+        return run_dir
+
+    def _write_results(
+        self,
+        run_dir: Path,
+        duration: float,
+        profile: cProfile.Profile,
+        before: Optional[tracemalloc.Snapshot],
+        after: Optional[tracemalloc.Snapshot],
+        owners: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """결과 파일 쓰기 + 요약 생성 (executor 스레드)"""
+        files = {"cpu_profile": str(run_dir / "cpu.prof"), "cpu_text": str(run_dir / "cpu.txt")}
+        profile.dump_stats(files["cpu_profile"])
+
+        text = io.StringIO()
+        stats = pstats.Stats(profile, stream=text)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top * 2)
+        Path(files["cpu_text"]).write_text(text.getvalue(), encoding="utf-8")
+
+        heap = None
+        if before is not None and after is not None:
+            files["heap_start"] = str(run_dir / "heap-start.tracemalloc")
+            files["heap_end"] = str(run_dir / "heap-end.tracemalloc")
+            before.dump(files["heap_start"])
+            after.dump(files["heap_end"])
+            heap = _heap_summary(before, after, self.top)
+
+        result = {
+            "dir": str(run_dir),
+            "duration": duration,
+            "files": files,
+            "cpu_top": _cpu_top(stats, self.top),
+            "heap": heap,
+            "owners": owners,
+        }
+        files["summary"] = str(run_dir / "summary.json")
+        Path(files["summary"]).write_text(
+            json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        return result
+
+
+def _cpu_top(stats: pstats.Stats, top: int) -> List[Dict[str, Any]]:
+    """자체 시간(tottime) 기준 상위 함수"""
+    rows = []
+    for (filename, lineno, name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        rows.append(
+            {
+                "function": f"{filename}:{lineno}({name})",
+                "calls": ncalls,
+                "tottime_ms": round(tottime * 1000, 2),
+                "cumtime_ms": round(cumtime * 1000, 2),
+            }
+        )
+    rows.sort(key=lambda row: row["tottime_ms"], reverse=True)
+    return rows[:top]
+
+
+def _heap_summary(
+    before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, top: int
+) -> Dict[str, Any]:
+    """끝 스냅샷의 상위 할당 위치, 캡처 동안 늘어난 위치, 패키지별 합계"""
+    before = before.filter_traces(_HEAP_FILTERS)
+    after = after.filter_traces(_HEAP_FILTERS)
+
+    def where(trace: tracemalloc.Traceback) -> str:
+        frame = trace[0]
+        return f"{frame.filename}:{frame.lineno}"
+
+    by_package: Dict[str, int] = {}
+    for stat in after.statistics("filename"):
+        filename = stat.traceback[0].filename
+        package = next((name for name in _HEAP_PACKAGES if name in filename), "other")
+        by_package[package] = by_package.get(package, 0) + stat.size
+
+    return {
+        "traced_kb": round(sum(stat.size for stat in after.statistics("filename")) / 1024, 1),
+        "top": [
+            {
+                "where": where(stat.traceback),
+                "size_kb": round(stat.size / 1024, 1),
+                "count": stat.count,
+            }
+            for stat in after.statistics("lineno")[:top]
+        ],
+        "growth": [
+            {
+                "where": where(stat.traceback),
+                "size_diff_kb": round(stat.size_diff / 1024, 1),
+                "count_diff": stat.count_diff,
+            }
+            for stat in after.compare_to(before, "lineno")[:top]
+            if stat.size_diff
+        ],
+        "by_package_kb": {
+            name: round(size / 1024, 1)
+            for name, size in sorted(by_package.items(), key=lambda item: -item[1])
+        },
+    }
+
+
+def owner_summary(server: "ScreenPartyServer", top: int = TOP_N) -> Dict[str, Any]:
+    """세션/참여자/연결별 메모리 사용량 (큰 순서)
+
+    세션 크기에는 세션 객체(참여자 포함)와 그 세션의 중계 로그(RelayLog)가 들어가고,
+    연결은 송신 버퍼(transport)와 아직 읽지 않은 수신 프레임을 셉니다.
+    """
+    sessions = []
+    participants = []
+    for session_id, session in server.session_manager.sessions.items():
+        relay_log = server.relay_logs.get(session_id)
+        relay_bytes = deep_sizeof(relay_log) if relay_log is not None else 0
+        session_participants = [
+            {
+                "session_id": session_id,
+                "user_id": participant.user_id,
+                "name": participant.name,
+                "bytes": deep_sizeof(participant),
+            }
+            for participant in session.participants.values()
+        ]
+        participants.extend(session_participants)
+        sessions.append(
+            {
+                "session_id": session_id,
+                "participants": len(session_participants),
+                "participant_bytes": sum(p["bytes"] for p in session_participants),
+                "relay_log_messages": len(relay_log) if relay_log is not None else 0,
+                "relay_log_bytes": relay_bytes,
+                "bytes": deep_sizeof(session) + relay_bytes,
+            }
+        )
+
+    connections = [
+        {"user_id": user_id, **connection_buffers(websocket)}
+        for user_id, websocket in server.clients.items()
+    ]
+
+    sessions.sort(key=lambda item: item["bytes"], reverse=True)
+    participants.sort(key=lambda item: item["bytes"], reverse=True)
+    connections.sort(
+        key=lambda item: item["send_buffer_bytes"] + item["recv_queue_bytes"], reverse=True
+    )
+    return {
+        "totals": {
+            "sessions": len(sessions),
+            "session_bytes": sum(item["bytes"] for item in sessions),
+            "participants": len(participants),
+            "participant_bytes": sum(item["bytes"] for item in participants),
+            "connections": len(connections),
+            "send_buffer_bytes": sum(item["send_buffer_bytes"] for item in connections),
+            "recv_queue_bytes": sum(item["recv_queue_bytes"] for item in connections),
+        },
+        "sessions": sessions[:top],
+        "participants": participants[:top],
+        "connections": connections[:top],
+    }
+
+
+def connection_buffers(websocket: Any) -> Dict[str, Any]:
+    """연결 하나가 붙잡고 있는 버퍼 크기 (송신 대기 바이트, 읽지 않은 수신 프레임)"""
+    transport = getattr(websocket, "transport", None)
+    send_bytes = 0
+    if isinstance(transport, asyncio.WriteTransport):
+        send_bytes = transport.get_write_buffer_size()
+
+    # websockets.asyncio의 수신 Assembler: frames(SimpleQueue).queue가 deque[Frame]
+    assembler = getattr(websocket, "recv_messages", None)
+    frames = getattr(getattr(assembler, "frames", None), "queue", None)
+    if not isinstance(frames, deque):
+        frames = ()
+    return {
+        "remote": str(getattr(websocket, "remote_address", "")),
+        "send_buffer_bytes": send_bytes,
+        "recv_queue_frames": len(frames),
+        "recv_queue_bytes": sum(len(frame.data) for frame in frames),
+    }
+
+
+def deep_sizeof(obj: Any, limit: int = SIZEOF_LIMIT) -> int:
+    """객체와 그 객체가 가진 컨테이너/서버 객체의 대략적인 총 크기 (바이트)
+
+    dict/list/tuple/set/deque와 이 프로젝트(screen_party_*) 객체의 속성만 따라갑니다.
+    (연결, 루프, 모듈 같은 바깥 객체로 번지지 않도록) 최대 limit개 객체까지만 셉니다.
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack and len(seen) < limit:
+        current = stack.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        elif _is_own_object(current):
+            attributes = getattr(current, "__dict__", None)
+            if attributes is not None:
+                stack.append(attributes)
+    return total
+
+
+def _is_own_object(obj: Any) -> bool:
+    """따라가도 되는 이 프로젝트의 객체인지 (Session, Participant, RelayLog 등)"""
+    return not isinstance(obj, type) and type(obj).__module__.startswith("screen_party_")
+
+
+def is_loopback(remote_address: Any) -> bool:
+    """연결 상대 주소가 localhost인지 (IPv4-mapped IPv6 포함)"""
+    if not remote_address:
+        return False
+    host = remote_address[0] if isinstance(remote_address, (tuple, list)) else remote_address
+    try:
+        address = ipaddress.ip_address(str(host).split("%", 1)[0])
+    except ValueError:
+        return False
+    mapped = getattr(address, "ipv4_mapped", None)
+    return (mapped or address).is_loopback
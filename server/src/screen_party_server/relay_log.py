@@ -0,0 +1,76 @@
+"""세션별 최근 중계 메시지 링 버퍼 (재연결 시 놓친 메시지 재전송용)"""
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+class RelayLog:
+    """세션 하나의 최근 중계 메시지 (고정 크기)
+
+    중계하는 메시지마다 세션 안에서 증가하는 seq를 붙입니다. 클라이언트는 마지막으로 받은
+    seq를 기억했다가 재연결할 때 보내고, 그 이후의 메시지 중 자신이 받았어야 할 것만
+    돌려받습니다.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        """
+        Args:
+            capacity: 기억할 최근 메시지 수 (넘치면 오래된 것부터 버림)
+        """
+        # (seq, 제외할 user_id, 메시지)
+        self._entries: Deque[Tuple[int, Optional[str], dict]] = deque(maxlen=capacity)
+        self.last_seq = 0
+
+    def __len__(self) -> int:
+        """기억하고 있는 메시지 수"""
+        return len(self._entries)
+
+    def append(self, message: dict, exclude_user_id: Optional[str] = None) -> int:
+        """메시지에 seq를 붙여서 기록
+
+        Args:
+            message: 중계할 메시지 (seq 필드가 추가됨)
+            exclude_user_id: 이 메시지를 받지 않는 사용자 (송신자)
+
+        Returns:
+            붙인 seq
+        """
+        self.last_seq += 1
+        message["seq"] = self.last_seq
+        self._entries.append((self.last_seq, exclude_user_id, message))
+        return self.last_seq
+
+    def since(self, last_seq: int, user_id: str) -> Tuple[List[dict], bool]:
+        """last_seq 이후 user_id가 받았어야 할 메시지
+
+        Args:
+            last_seq: 클라이언트가 마지막으로 받은 seq
+            user_id: 재연결한 사용자
+
+        Returns:
+            (메시지 목록 (seq 순), 빠짐없이 돌려줬는지 - 이미 버려진 메시지가 있으면 False)
+        """
+        oldest = self._entries[0][0] if self._entries else self.last_seq + 1
+        complete = last_seq >= oldest - 1
+        missed = [
+            message
+            for seq, exclude_user_id, message in self._entries
+            if seq > last_seq and exclude_user_id != user_id
+        ]
+        return missed, complete
+
+    def export(self) -> Dict[str, Any]:
+        """다른 서버 프로세스로 넘길 수 있는 형태 (JSON 직렬화 가능)"""
+        return {
+            "capacity": self._entries.maxlen,
+            "last_seq": self.last_seq,
+            "entries": [list(entry) for entry in self._entries],
+        }
+
+    @classmethod
+    def from_export(cls, data: Dict[str, Any]) -> "RelayLog":
+        """export()로 넘겨받은 로그 복원 (seq가 그대로 이어짐)"""
+        relay_log = cls(data["capacity"])
+        relay_log._entries.extend(tuple(entry) for entry in data["entries"])
+        relay_log.last_seq = data["last_seq"]
+        return relay_log
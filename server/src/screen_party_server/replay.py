@@ -0,0 +1,296 @@
+"""캡처한 트래픽 재생 (1배속 또는 N배속)
+
+캡처의 레코드를 순서대로, 같은 시각(speed배 빠르게)에 연결을 열고 프레임을 보내고 연결을 닫습니다.
+(연결 사이의 순서가 유지되므로 speed 0으로 최대한 빠르게 보내도 참여 → 드로잉 → 퇴장 순서는 같음)
+새 서버는 다른 세션 ID/user_id/resume_token을 주므로, 캡처의 IDENTITY 레코드와 재생 중 받은
+session_created/session_joined/session_resumed 응답을 짝지어 이후 프레임의 ID를 바꿔 보냅니다.
+(캡처에서 만든 세션에 참여하는 프레임은 재생에서 그 세션이 만들어질 때까지 기다림)
+
+    run_websocket(url) - 실행 중인 서버에 실제 WebSocket 연결로 재생 (부하 재현)
+    run_direct(server) - 서버 객체의 handle_message를 직접 호출 (네트워크 없이
+                         handle_message + broadcast 처리 시간만 측정하는 회귀 벤치마크)
+"""
+
+import asyncio
+import json
+import time
+from collections import defaultdict, deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+import websockets
+from websockets.exceptions import ConnectionClosed, InvalidHandshake
+
+from screen_party_common import LatencyHistogram, MessageType
+
+from .traffic_capture import BINARY, CLOSE, FRAME, IDENTITY, OPEN, CaptureRecord
+
+# 신원을 알려주는 응답 (user_id 필드 이름)
+_IDENTITY_RESPONSES = {
+    MessageType.SESSION_CREATED.value: "host_id",
+    MessageType.SESSION_JOINED.value: "user_id",
+    MessageType.SESSION_RESUMED.value: "user_id",
+}
+
+
+class CaptureReplayer:
+    """캡처 레코드 재생"""
+
+    def __init__(
+        self, records: Iterable[CaptureRecord], speed: float = 1.0, wait_timeout: float = 5.0
+    ):
+        """
+        Args:
+            records: read_capture()의 레코드
+            speed: 재생 배속 (0 이하면 기다리지 않고 최대한 빠르게)
+            wait_timeout: 아직 만들어지지 않은 세션을 기다리는 최대 시간 (초)
+        """
+        self.speed = speed
+        self.wait_timeout = wait_timeout
+        self.records: List[CaptureRecord] = []
+        # 연결별로 캡처에서 받은 신원 (응답을 받을 때마다 앞에서부터 짝지음)
+        self._identities: Dict[int, Deque[dict]] = defaultdict(deque)
+        self._captured_sessions = set()
+        self.capture_seconds = 0.0
+        for record in records:
+            self.capture_seconds = record.at
+            if record.kind == IDENTITY:
+                identity = json.loads(record.data)
+                self._identities[record.connection].append(identity)
+                self._captured_sessions.add(identity["session_id"])
+            else:
+                self.records.append(record)
+
+        # 캡처 ID -> 재생 ID
+        self.session_map: Dict[str, str] = {}
+        self.user_map: Dict[str, str] = {}
+        self.token_map: Dict[str, str] = {}
+        self._session_ready: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
+
+        self.frames_sent = 0
+        self.messages_received = 0
+        self.errors = 0
+        self.unmapped = 0
+        # 예정 시각보다 늦게 보낸 정도 (재생 충실도)
+        self.send_lag = LatencyHistogram()
+        # run_direct: 프레임 하나의 handle_message 처리 시간
+        self.handle_time = LatencyHistogram(base=1e-6)
+        self._start = 0.0
+
+    async def run_websocket(self, url: str) -> Dict[str, Any]:
+        """실행 중인 서버에 WebSocket 연결로 재생"""
+
+        async def open_transport(connection: int):
+            websocket = await websockets.connect(url, max_size=None)
+            return _WebSocketTransport(self, connection, websocket)
+
+        return await self._run(open_transport)
+
+    async def run_direct(self, server) -> Dict[str, Any]:
+        """서버 객체에 직접 재생 (ScreenPartyServer.handle_message 호출)"""
+
+        async def open_transport(connection: int):
+            return _DirectTransport(self, connection, server)
+
+        return await self._run(open_transport)
+
+    async def _run(self, open_transport: Callable) -> Dict[str, Any]:
+        self._start = asyncio.get_running_loop().time()
+        wall_start = time.perf_counter()
+        transports: Dict[int, Any] = {}
+        # 닫은 연결 (종료 핸드셰이크는 기다리지 않고 다음 레코드로, 끝에서 모두 기다림)
+        closed = []
+        connections = 0
+        for record in self.records:
+            await self._sleep_until(record.at)
+            if record.kind == OPEN:
+                connections += 1
+                try:
+                    transports[record.connection] = await open_transport(record.connection)
+                except (OSError, InvalidHandshake):
+                    self.errors += 1
+            elif record.kind in (FRAME, BINARY):
+                transport = transports.get(record.connection)
+                if transport is None:
+                    continue
+                try:
+                    await transport.send(await self._rewrite(record))
+                    self.frames_sent += 1
+                except ConnectionClosed:
+                    self.errors += 1
+                    transport = transports.pop(record.connection)
+                    await transport.close(1000)
+                    closed.append(transport)
+            elif record.kind == CLOSE:
+                transport = transports.pop(record.connection, None)
+                if transport is not None:
+                    await transport.close(int(record.data) if record.data else 1006)
+                    closed.append(transport)
+        for transport in transports.values():
+            await transport.close(1000)
+            closed.append(transport)
+        await asyncio.gather(*(transport.wait_closed() for transport in closed))
+
+        result = {
+            "connections": connections,
+            "frames_sent": self.frames_sent,
+            "messages_received": self.messages_received,
+            "errors": self.errors,
+            "unmapped_sessions": self.unmapped,
+            "capture_seconds": round(self.capture_seconds, 3),
+            "wall_seconds": round(time.perf_counter() - wall_start, 3),
+            "speed": self.speed,
+            "send_lag": self.send_lag.summary(),
+        }
+        if self.handle_time.count:
+            result["handle_message_us"] = {
+                "count": self.handle_time.count,
+                "p50": round(self.handle_time.percentile(50) * 1e6, 1),
+                "p99": round(self.handle_time.percentile(99) * 1e6, 1),
+                "max": round(self.handle_time.max * 1e6, 1),
+            }
+        return result
+
+    async def _sleep_until(self, at: float):
+        """캡처 시각 at을 재생 시각으로 바꿔 그때까지 대기 (늦은 정도는 send_lag에 기록)"""
+        if self.speed <= 0:
+            await asyncio.sleep(0)
+            return
+        loop = asyncio.get_running_loop()
+        target = self._start + at / self.speed
+        delay = target - loop.time()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.send_lag.record(loop.time() - target)
+
+    async def _rewrite(self, record: CaptureRecord):
+        """프레임 안의 캡처 ID를 재생 ID로 (바꿀 것이 없으면 원문 그대로)"""
+        if record.kind == BINARY:
+            return record.data
+        text = record.data.decode("utf-8", errors="replace")
+        try:
+            data = json.loads(text)
+        except ValueError:
+            return text
+        if not isinstance(data, dict):
+            return text
+
+        changed = False
+        session_id = data.get("session_id")
+        if isinstance(session_id, str) and session_id in self._captured_sessions:
+            if session_id not in self.session_map:
+                try:
+                    await asyncio.wait_for(
+                        self._session_ready[session_id].wait(), self.wait_timeout
+                    )
+                except TimeoutError:
+                    self.unmapped += 1
+            if session_id in self.session_map:
+                data["session_id"] = self.session_map[session_id]
+                changed = True
+
+        user_id = data.get("user_id")
+        if isinstance(user_id, str):
+            if "resume_token" in data and user_id in self.token_map:
+                data["resume_token"] = self.token_map[user_id]
+                changed = True
+            if user_id in self.user_map:
+                data["user_id"] = self.user_map[user_id]
+                changed = True
+        return json.dumps(data) if changed else text
+
+    def on_response(self, connection: int, message):
+        """서버가 보낸 메시지 (신원 응답이면 캡처 ID와 짝지음)"""
+        self.messages_received += 1
+        # 대부분은 중계 메시지 - 신원 응답일 수 있는 것만 파싱
+        if not isinstance(message, str) or '"session_' not in message[:40]:
+            return
+        data = json.loads(message)
+        user_field = _IDENTITY_RESPONSES.get(data.get("type"))
+        identities = self._identities.get(connection)
+        if user_field is None or not identities:
+            return
+        captured = identities.popleft()
+        self.user_map[captured["user_id"]] = data[user_field]
+        if data.get("resume_token"):
+            self.token_map[captured["user_id"]] = data["resume_token"]
+        if captured["session_id"]:
+            self.session_map[captured["session_id"]] = data["session_id"]
+            self._session_ready[captured["session_id"]].set()
+
+
+class _WebSocketTransport:
+    """실제 WebSocket 연결 (응답은 백그라운드에서 읽어 on_response로)"""
+
+    def __init__(self, replayer: CaptureReplayer, connection: int, websocket):
+        self.websocket = websocket
+        self._reader = asyncio.create_task(self._read(replayer, connection))
+        self._closing: Optional[asyncio.Task] = None
+
+    async def _read(self, replayer: CaptureReplayer, connection: int):
+        try:
+            async for message in self.websocket:
+                replayer.on_response(connection, message)
+        except ConnectionClosed:
+            pass
+
+    async def send(self, payload):
+        await self.websocket.send(payload)
+
+    async def close(self, code: int):
+        """종료 시작 (정상 종료 핸드셰이크는 wait_closed에서 기다림)"""
+        if code in (1000, 1001):
+            self._closing = asyncio.create_task(self.websocket.close(code))
+        else:
+            # 비정상 끊김 재현 (서버가 재연결 대기 후 resume_session을 받도록)
+            self.websocket.transport.abort()
+
+    async def wait_closed(self):
+        if self._closing is not None:
+            await self._closing
+        await self._reader
+
+
+class _FakeWebSocket:
+    """run_direct용 연결 객체 (서버가 보낸 메시지를 on_response로)"""
+
+    def __init__(self, on_send: Callable[[str], None], remote_address):
+        self.on_send = on_send
+        self.remote_address = remote_address
+        self.close_code: Optional[int] = None
+
+    async def send(self, message):
+        self.on_send(message)
+
+
+class _DirectTransport:
+    """서버 객체의 handle_message를 직접 호출하고 처리 시간 기록"""
+
+    def __init__(self, replayer: CaptureReplayer, connection: int, server):
+        self.replayer = replayer
+        self.server = server
+        self.websocket = _FakeWebSocket(
+            lambda message: replayer.on_response(connection, message), ("replay", connection)
+        )
+        self.user_id: Optional[str] = None
+
+    async def send(self, payload):
+        start = time.perf_counter()
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            await self.server.send_error(self.websocket, "Invalid JSON format")
+        else:
+            try:
+                self.user_id = await self.server.handle_message(self.websocket, data)
+            except Exception as e:
+                self.replayer.errors += 1
+                await self.server.send_error(self.websocket, str(e))
+        self.replayer.handle_time.record(time.perf_counter() - start)
+
+    async def close(self, code: int):
+        self.websocket.close_code = code
+        if self.user_id:
+            await self.server.handle_disconnect(self.websocket, self.user_id)
+
+    async def wait_closed(self):
+        pass
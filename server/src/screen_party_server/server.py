@@ -1,69 +1,339 @@
 """WebSocket 서버 구현"""
 
 import asyncio
+import contextlib
 import json
 import logging
-from typing import Dict, Optional
+import os
+import secrets
+import signal
+import socket
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
 import websockets
-from websockets.asyncio.server import ServerConnection
+from websockets.asyncio.server import Server, ServerConnection
 from websockets.exceptions import ConnectionClosed
 
+from . import handover
+from .fanout import SpectatorFanout
+from .handover import HandoverChannel
+from .persistence import SessionStore
+from .profiling import DEFAULT_DURATION, RuntimeProfiler, is_loopback
+from .relay_log import RelayLog
 from .session import SessionManager
-from screen_party_common import MessageType, DRAWING_MESSAGE_TYPES
+from .traffic_capture import TrafficRecorder
+from screen_party_common import MessageType, DRAWING_MESSAGE_TYPES, HopLatencyStats
+from screen_party_common.log_pipeline import RateLimitedLogger
+from screen_party_common.loop_lag import LoopLagMonitor
 from screen_party_common.models import DEFAULT_COLOR
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# 로깅 설정은 진입점(scripts/main.py)에서 setup_logging()으로
 logger = logging.getLogger(__name__)
+# 메시지마다 반복될 수 있는 경고/오류 (끊긴 연결로 전송 실패, 잘못된 메시지 폭주)
+throttled_logger = RateLimitedLogger(logger, interval=5.0, burst=3)
 
 
 class ScreenPartyServer:
     """Screen Party WebSocket 서버"""
 
-    def __init__(self, host: str = "0.0.0.0", port: int = 8765):
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8765,
+        resume_grace: float = 30.0,
+        profile_dir: str = "profiles",
+        capture_path: Optional[str] = None,
+        state_dir: Optional[str] = None,
+        handover_socket: Optional[str] = None,
+        spectator_fanout: int = 32,
+    ):
+        """
+        Args:
+            host: 바인딩 주소
+            port: 포트
+            resume_grace: 비정상 연결 끊김 후 참여자를 유지하는 시간 (초, 이 안에 재연결하면 이어감)
+            profile_dir: 런타임 프로파일링 결과를 남길 디렉토리
+            capture_path: 수신 프레임을 기록할 캡처 파일 (재생으로 부하 재현, None이면 기록 안 함)
+            state_dir: 세션 레지스트리 저널/스냅샷 디렉토리 (재시작 후 복원, None이면 메모리에만)
+            handover_socket: 무중단 교대용 Unix 소켓 경로 (이전 프로세스가 있으면 연결/세션을
+                넘겨받고, 이후 다음 프로세스에게 넘겨줌, None이면 교대 안 함)
+            spectator_fanout: 관전자 fan-out 트리 노드 하나가 맡는 자식 노드/연결 수
+        """
         self.host = host
         self.port = port
-        self.session_manager = SessionManager()
+        self.resume_grace = resume_grace
+        # 세션/참여자 변경 저널 (start()에서 복원 후 쓰기 스레드 시작)
+        self.store = SessionStore(state_dir) if state_dir else None
+        self.session_manager = SessionManager(store=self.store)
         # user_id -> websocket 매핑
         self.clients: Dict[str, ServerConnection] = {}
         # websocket -> user_id 역매핑 (빠른 조회용)
         self.websocket_to_user: Dict[ServerConnection, str] = {}
+        # 드로잉 메시지 trace의 구간별 지연 (클라이언트가 측정을 켰을 때만 기록됨)
+        self.latency = HopLatencyStats()
+        # 이벤트 루프 스케줄링 지연 + 루프를 막은 콜백 스택 (start()에서 측정 시작)
+        self.loop_lag = LoopLagMonitor()
+        # 실행 중 CPU/힙 프로파일링 (SIGUSR1 또는 localhost의 profile 메시지로 시작)
+        self.profiler = RuntimeProfiler(self, profile_dir)
+        # 수신 프레임 캡처 (start()에서 파일을 열고 끝날 때 닫음)
+        self.recorder = TrafficRecorder(capture_path) if capture_path else None
+        # session_id -> 관전자 fan-out 트리 (관전자는 참여자 목록/clients에 없음)
+        self.spectators: Dict[str, SpectatorFanout] = {}
+        self.spectator_fanout = spectator_fanout
+        # 관전자 websocket -> 관전 중인 session_id
+        self.watching: Dict[ServerConnection, str] = {}
+        # session_id -> 최근 중계 메시지 (재연결한 클라이언트에게 놓친 메시지 재전송)
+        self.relay_logs: Dict[str, RelayLog] = {}
+        # user_id -> 재연결 대기 후 참여자를 제거할 태스크
+        self._pending_removals: Dict[str, asyncio.Task] = {}
+        self.handover_socket = handover_socket
+        # 교대로 시작한 경우 이전 프로세스의 레지스트리를 가져올 때까지 메시지 처리를 미룸
+        self._registry_ready = asyncio.Event()
+        self._registry_ready.set()
 
     async def start(self):
-        """서버 시작"""
+        """서버 시작 (handover_socket이 있으면 다음 프로세스에게 교대하고 반환)"""
+        takeover = await self._request_takeover() if self.handover_socket else None
+        if self.store and takeover is None:
+            self.restore_sessions()
+
         # 백그라운드 cleanup 태스크 시작
         _ = asyncio.create_task(self.session_manager.start_cleanup_task(interval_minutes=5))
+        self.loop_lag.start()
+        profile_signal = self._install_profile_signal()
+        if self.recorder:
+            self.recorder.open()
+            logger.info(f"Capturing inbound traffic to {self.recorder.path}")
+
+        try:
+            async with contextlib.AsyncExitStack() as stack:
+                if takeover:
+                    channel, listeners = takeover
+                    self._registry_ready.clear()
+                    ws_servers = [
+                        await stack.enter_async_context(
+                            websockets.serve(self.handle_client, sock=listener)
+                        )
+                        for listener in listeners
+                    ]
+                    await self._finish_takeover(channel)
+                else:
+                    logger.info(f"Starting Screen Party server on {self.host}:{self.port}")
+                    ws_servers = [
+                        await stack.enter_async_context(
+                            websockets.serve(self.handle_client, self.host, self.port)
+                        )
+                    ]
+
+                if self.handover_socket and handover.supported():
+                    await self._hand_over_when_requested(ws_servers)
+                else:
+                    await asyncio.Future()  # run forever
+        finally:
+            self.loop_lag.stop()
+            if self.store:
+                self.store.close()
+            if self.recorder:
+                self.recorder.close()
+            if profile_signal:
+                asyncio.get_running_loop().remove_signal_handler(profile_signal)
+
+    def restore_sessions(self) -> int:
+        """저장소에서 세션 레지스트리 복원 후 저널 쓰기 시작
+
+        복원된 참여자는 연결이 없으므로 비정상 끊김과 같이 resume_grace 동안
+        resume_session을 기다렸다가 돌아오지 않으면 정리합니다.
+
+        Returns:
+            복원한 세션 수
+        """
+        restored = self.session_manager.restore(self.store.load())
+        self.store.start()
+        self._await_returning_participants()
+        return restored
+
+    def _await_returning_participants(self):
+        """연결이 없는 참여자마다 resume_grace 후 정리하는 태스크 예약 (복원/교대 직후)"""
+        for session in self.session_manager.sessions.values():
+            for user_id in session.participants:
+                if user_id not in self.clients and user_id not in self._pending_removals:
+                    self._pending_removals[user_id] = asyncio.create_task(
+                        self._remove_after_grace(user_id)
+                    )
+
+    # === 무중단 교대 (handover.py) ===
+
+    async def _request_takeover(self) -> Optional[Tuple[HandoverChannel, List[socket.socket]]]:
+        """handover_socket에서 기다리는 이전 프로세스에게 listening 소켓을 넘겨받음
+
+        Returns:
+            (이전 프로세스와의 채널, 넘겨받은 listening 소켓들), 이전 프로세스가 없으면 None
+        """
+        if not handover.supported():
+            logger.warning("Server handover is not supported on this platform")
+            return None
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.connect(self.handover_socket)
+        except (FileNotFoundError, ConnectionRefusedError):
+            sock.close()
+            return None
+
+        channel = HandoverChannel(sock)
+        message, fds = await asyncio.to_thread(channel.receive)
+        listeners = [socket.socket(fileno=fd) for fd in fds]
+        logger.info(
+            "Taking over %d listening socket(s) from server pid %s",
+            len(listeners),
+            message.get("pid"),
+        )
+        return channel, listeners
+
+    async def _finish_takeover(self, channel: HandoverChannel):
+        """accept 시작을 알리고 이전 프로세스가 드레인 후 넘긴 세션 레지스트리를 가져옴
+
+        가져오기에 실패하면(이전 프로세스가 중간에 죽음 등) state_dir이 있을 때만 디스크에서 복원.
+        """
+        started = time.perf_counter()
+        registry = None
+        try:
+            await asyncio.to_thread(channel.send, {"type": handover.ACCEPTING})
+            registry, _ = await asyncio.to_thread(channel.receive)
+            await asyncio.to_thread(channel.send, {"type": handover.DONE})
+        except (OSError, ValueError) as e:
+            logger.error("Handover from the previous server failed: %s", e)
+        finally:
+            channel.close()
+
+        if registry is None:
+            if self.store:
+                self.restore_sessions()
+        else:
+            imported = handover.import_registry(self, registry)
+            if self.store:
+                # 이전 프로세스가 닫으면서 남긴 저널/스냅샷으로 쓰기 스레드의 사본을 맞춤
+                self.store.load()
+                self.store.start()
+            self._await_returning_participants()
+            logger.info(
+                "Took over %d sessions in %.1fms",
+                imported,
+                (time.perf_counter() - started) * 1000,
+            )
+        self._registry_ready.set()
+
+    async def _hand_over_when_requested(self, ws_servers: List[Server]):
+        """다음 프로세스의 교대 요청을 기다렸다가 연결과 세션 레지스트리를 넘김 (넘긴 뒤 반환)"""
+        loop = asyncio.get_running_loop()
+        path = Path(self.handover_socket)
+        path.unlink(missing_ok=True)  # 비정상 종료한 이전 프로세스가 남긴 경로
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(path))
+        os.chmod(path, 0o600)  # 연결하면 listening 소켓과 resume_token을 넘겨받으므로
+        listener.listen(1)
+        listener.setblocking(False)
+        logger.info(f"Waiting for server handover requests on {path}")
+
+        fds = [sock.fileno() for ws_server in ws_servers for sock in ws_server.sockets]
+        try:
+            while True:
+                connection, _ = await loop.sock_accept(listener)
+                channel = HandoverChannel(connection)
+                try:
+                    message = {"type": handover.LISTENERS, "pid": os.getpid()}
+                    await asyncio.to_thread(channel.send, message, fds)
+                    await asyncio.to_thread(channel.receive)  # accepting
+                    break
+                except (OSError, ValueError) as e:
+                    logger.error("Handover request failed, still serving: %s", e)
+                    channel.close()
+        finally:
+            listener.close()
+            path.unlink(missing_ok=True)
 
-        logger.info(f"Starting Screen Party server on {self.host}:{self.port}")
+        try:
+            await self._drain(ws_servers)
+            registry = handover.export_registry(self)
+            if self.store:
+                # 새 프로세스가 디스크의 저널/스냅샷을 이어 쓰도록 먼저 닫음
+                self.store.close()
+            await asyncio.to_thread(channel.send, registry)
+            await asyncio.to_thread(channel.receive)  # done
+            logger.info(f"Handed over {len(registry['sessions'])} sessions")
+        except (OSError, ValueError) as e:
+            logger.error("Handover to the next server failed: %s", e)
+        finally:
+            channel.close()
+
+    async def _drain(self, ws_servers: List[Server]):
+        """accept를 멈추고 모든 연결에 교대를 알린 뒤 닫고, 연결 처리 루프가 끝날 때까지 대기"""
+        started = time.perf_counter()
+        notice = json.dumps({"type": MessageType.SERVER_HANDOVER.value})
+        for ws_server in ws_servers:
+            websockets.broadcast(ws_server.connections, notice)
+            ws_server.close(code=handover.HANDOVER_CLOSE_CODE, reason="server handover")
+        for ws_server in ws_servers:
+            await ws_server.wait_closed()
+
+        # 참여자는 새 프로세스에서 재연결을 기다림
+        for task in self._pending_removals.values():
+            task.cancel()
+        self._pending_removals.clear()
+        logger.info("Drained connections in %.1fms", (time.perf_counter() - started) * 1000)
+
+    def _install_profile_signal(self) -> Optional[int]:
+        """SIGUSR1로 프로파일링 시작 (지원하지 않는 플랫폼/스레드면 건너뜀)
 
-        async with websockets.serve(self.handle_client, self.host, self.port):
-            await asyncio.Future()  # run forever
+        Returns:
+            등록한 시그널 번호 (등록하지 못했으면 None)
+        """
+        profile_signal = getattr(signal, "SIGUSR1", None)
+        if profile_signal is None:
+            return None
+        try:
+            asyncio.get_running_loop().add_signal_handler(profile_signal, self.profiler.trigger)
+        except (NotImplementedError, RuntimeError, ValueError):
+            return None
+        logger.info("Send SIGUSR1 to profile for %.0fs", DEFAULT_DURATION)
+        return profile_signal
 
     async def handle_client(self, websocket: ServerConnection):
         """클라이언트 연결 처리"""
         user_id = None
+        recorder = self.recorder
+        connection = recorder.connection_opened(websocket.remote_address) if recorder else 0
         try:
             logger.info(f"New client connected: {websocket.remote_address}")
+            # 교대 중이면 이전 프로세스의 세션을 가져온 뒤에 처리 (resume_session이 거절되지 않도록)
+            await self._registry_ready.wait()
 
             async for message in websocket:
+                if recorder:
+                    recorder.frame(connection, message)
                 try:
                     data = json.loads(message)
+                    previous_user_id = user_id
                     user_id = await self.handle_message(websocket, data)
+                    if recorder and user_id and user_id != previous_user_id:
+                        recorder.identity(connection, user_id, self.find_user_session(user_id))
                 except json.JSONDecodeError:
                     await self.send_error(websocket, "Invalid JSON format")
                 except Exception as e:
-                    logger.error(f"Error handling message: {e}", exc_info=True)
+                    throttled_logger.error("Error handling message: %s", e, exc_info=True)
                     await self.send_error(websocket, str(e))
 
         except ConnectionClosed:
             logger.info(f"Client disconnected: {websocket.remote_address}")
         finally:
+            if recorder:
+                recorder.connection_closed(connection, websocket.close_code)
+            self.stop_watching(websocket)
             # 연결 종료 시 정리
             if user_id:
-                await self.cleanup_client(user_id)
+                await self.handle_disconnect(websocket, user_id)
 
     async def handle_message(self, websocket: ServerConnection, data: dict) -> Optional[str]:
         """메시지 라우팅 및 처리
@@ -85,8 +355,16 @@ class ScreenPartyServer:
             user_id = await self.handle_create_session(websocket, data)
         elif msg_type == MessageType.JOIN_SESSION.value:
             user_id = await self.handle_join_session(websocket, data)
+        elif msg_type == MessageType.RESUME_SESSION.value:
+            user_id = await self.handle_resume_session(websocket, data) or user_id
+        elif msg_type == MessageType.WATCH_SESSION.value:
+            await self.handle_watch_session(websocket, data)
         elif msg_type == MessageType.PING.value:
-            await self.handle_ping(websocket)
+            await self.handle_ping(websocket, data)
+        elif msg_type == MessageType.STATS.value:
+            await websocket.send(json.dumps({"type": MessageType.STATS.value, **self.get_stats()}))
+        elif msg_type == MessageType.PROFILE.value:
+            await self.handle_profile(websocket, data)
 
         # Color change 메시지 (인증 필요, 특별 처리)
         elif msg_type == MessageType.COLOR_CHANGE.value:
@@ -147,6 +425,7 @@ class ScreenPartyServer:
                     "host_id": participant_id,  # Keep for backward compat (actually participant_id)
                     "host_name": participant_name,  # Keep for backward compat
                     "participants": participants_info,  # 모든 참여자 정보
+                    "resume_token": participant.resume_token,  # 재연결용 (본인에게만)
                 }
             )
         )
@@ -217,6 +496,7 @@ class ScreenPartyServer:
                         first_participant.name if first_participant else "Unknown"
                     ),  # Keep for backward compat
                     "participants": participants_info,  # 모든 참여자 정보
+                    "resume_token": participant.resume_token,  # 재연결용 (본인에게만)
                 }
             )
         )
@@ -235,9 +515,181 @@ class ScreenPartyServer:
 
         return participant_id
 
-    async def handle_ping(self, websocket: ServerConnection):
-        """핑 처리"""
-        await websocket.send(json.dumps({"type": "pong"}))
+    async def handle_resume_session(self, websocket: ServerConnection, data: dict) -> Optional[str]:
+        """세션 이어가기 (연결이 끊겼던 참여자가 재연결)
+
+        resume_token이 맞으면 같은 user_id로 다시 등록하고, 클라이언트가 마지막으로 받은
+        seq(last_seq) 이후의 중계 메시지를 session_resumed 응답 하나에 담아 돌려줍니다.
+        (응답 전송 전에 await가 없으므로 재전송분과 이후 실시간 메시지의 순서가 섞이지 않음)
+        """
+        session_id = data.get("session_id")
+        user_id = data.get("user_id")
+        token = data.get("resume_token") or ""
+
+        session = self.session_manager.get_session(session_id) if session_id else None
+        participant = session.participants.get(user_id) if session else None
+        if not participant or not secrets.compare_digest(participant.resume_token, token):
+            await self.send_error(websocket, "Cannot resume session")
+            return None
+
+        # 재연결 대기 중이던 제거 취소, 이전 연결이 아직 남아 있으면 새 연결로 교체
+        pending = self._pending_removals.pop(user_id, None)
+        if pending:
+            pending.cancel()
+        old_websocket = self.clients.get(user_id)
+        if old_websocket is not None:
+            self.websocket_to_user.pop(old_websocket, None)
+        self.clients[user_id] = websocket
+        self.websocket_to_user[websocket] = user_id
+        session.last_activity = datetime.now()
+
+        client_seq = int(data.get("last_seq", 0))
+        relay_log = self.relay_logs.get(session_id)
+        last_seq = relay_log.last_seq if relay_log else 0
+        if client_seq > last_seq:
+            # 서버가 붙인 적 없는 seq (재시작으로 중계 로그가 사라졌거나 잘못된 값):
+            # 재전송할 것이 없음. 클라이언트 값은 로그에 쓰지 않고 서버 seq를 알려 줌
+            missed, complete = [], False
+        elif relay_log:
+            missed, complete = relay_log.since(client_seq, user_id)
+        else:
+            missed, complete = [], True
+
+        logger.info(
+            f"Participant {user_id} resumed session {session_id} "
+            f"({len(missed)} missed messages, complete={complete})"
+        )
+
+        participants_info = [
+            {"user_id": p.user_id, "name": p.name, "color": p.color}
+            for p in session.participants.values()
+        ]
+        await websocket.send(
+            json.dumps(
+                {
+                    "type": MessageType.SESSION_RESUMED.value,
+                    "session_id": session_id,
+                    "user_id": user_id,
+                    "participants": participants_info,
+                    "missed": missed,
+                    "replay_complete": complete,
+                    "last_seq": last_seq,
+                }
+            )
+        )
+        return user_id
+
+    async def handle_watch_session(self, websocket: ServerConnection, data: dict):
+        """관전자로 세션 보기 (읽기 전용)
+
+        관전자는 참여자 목록에 들어가지 않고 user_id도 없으므로 드로잉 메시지를 보낼 수 없고
+        participant_joined/left도 생기지 않습니다. 이후 세션 브로드캐스트(드로잉 중계, 참여자
+        변경, 세션 만료)를 fan-out 트리로 받습니다.
+        """
+        session_id = data.get("session_id")
+        session = self.session_manager.get_session(session_id) if session_id else None
+        if not session:
+            await self.send_error(websocket, f"Session not found: {session_id}")
+            return
+
+        participants_info = [
+            {"user_id": p.user_id, "name": p.name, "color": p.color}
+            for p in session.participants.values()
+        ]
+        # 이미 관전 중인 연결이면 먼저 빼고 셈 (다시 보기가 두 명으로 세지지 않도록)
+        self.stop_watching(websocket)
+        fanout = self.spectators.get(session_id)
+        response = json.dumps(
+            {
+                "type": MessageType.SESSION_WATCHING.value,
+                "session_id": session_id,
+                "participants": participants_info,
+                "spectators": (len(fanout) if fanout else 0) + 1,
+            }
+        )
+        await self.add_spectator(session_id, websocket, response)
+
+    async def add_spectator(self, session_id: str, websocket: ServerConnection, response: str):
+        """응답을 보낸 뒤 연결을 세션의 관전자 fan-out 트리에 추가 (보던 세션이 있으면 옮김)"""
+        self.stop_watching(websocket)
+        await websocket.send(response)
+        fanout = self.spectators.get(session_id)
+        if fanout is None:
+            fanout = self.spectators[session_id] = SpectatorFanout(
+                self.spectator_fanout, on_drop=self.stop_watching
+            )
+        fanout.add(websocket)
+        self.watching[websocket] = session_id
+        logger.info(
+            f"Spectator {websocket.remote_address} watching session {session_id} "
+            f"({len(fanout)} spectators)"
+        )
+
+    def stop_watching(self, websocket: ServerConnection):
+        """관전 중인 연결을 트리에서 제거 (마지막 관전자면 트리 종료)"""
+        session_id = self.watching.pop(websocket, None)
+        fanout = self.spectators.get(session_id) if session_id else None
+        if fanout is None:
+            return
+        fanout.remove(websocket)
+        if not fanout:
+            fanout.close()
+            del self.spectators[session_id]
+
+    def close_spectators(self, session_id: str):
+        """세션이 끝나면 관전자 트리 종료 (이미 넣은 session_expired까지 전달, 연결은 유지)"""
+        fanout = self.spectators.pop(session_id, None)
+        if fanout is None:
+            return
+        fanout.close()
+        for websocket in [ws for ws, watched in self.watching.items() if watched == session_id]:
+            del self.watching[websocket]
+
+    def publish_to_spectators(self, session_id: str, message_json: str):
+        """세션의 관전자들에게 프레임 전달 (fan-out 트리 루트에 넣기만 함)"""
+        fanout = self.spectators.get(session_id)
+        if fanout is not None:
+            fanout.publish(message_json)
+
+    async def handle_ping(self, websocket: ServerConnection, data: Optional[dict] = None):
+        """핑 처리
+
+        client_time이 있으면 그대로 돌려주고 서버 monotonic 시각을 함께 보냄
+        (클라이언트가 지연 측정용으로 서버 시계와의 차이를 추정)
+        """
+        response = {"type": "pong"}
+        if data and "client_time" in data:
+            response["client_time"] = data["client_time"]
+            response["server_time"] = time.monotonic()
+        await websocket.send(json.dumps(response))
+
+    def get_stats(self) -> dict:
+        """서버 통계 (세션/클라이언트 수, 드로잉 메시지 구간별 지연, 이벤트 루프 지연)"""
+        return {
+            "sessions": len(self.session_manager.sessions),
+            "clients": len(self.clients),
+            "spectators": len(self.watching),
+            "latency": self.latency.summary(),
+            "loop_lag": self.loop_lag.summary(),
+        }
+
+    async def handle_profile(self, websocket: ServerConnection, data: dict):
+        """프로파일링 관리 메시지 처리 (localhost 연결만 허용)
+
+        duration초 동안 CPU 프로파일(+heap이면 힙 스냅샷)을 캡처한 뒤 같은 type으로
+        결과 파일 경로와 요약을 돌려줍니다. 캡처가 끝날 때까지 이 연결의 다음 메시지는 기다립니다.
+        """
+        if not is_loopback(websocket.remote_address):
+            await self.send_error(websocket, "Profiling is only allowed from localhost")
+            return
+        if self.profiler.busy:
+            await self.send_error(websocket, "Profiling already in progress")
+            return
+
+        result = await self.profiler.capture(
+            float(data.get("duration", DEFAULT_DURATION)), heap=bool(data.get("heap", True))
+        )
+        await websocket.send(json.dumps({"type": MessageType.PROFILE.value, **result}))
 
     async def handle_color_change(self, websocket: ServerConnection, user_id: str, data: dict):
         """색상 변경 메시지 처리"""
@@ -258,8 +710,7 @@ class ScreenPartyServer:
         color = data.get("color", DEFAULT_COLOR)
 
         # 세션에 색상 업데이트
-        if user_id in session.participants:
-            session.participants[user_id].color = color
+        if self.session_manager.change_color(session_id, user_id, color):
             logger.info(f"Participant {user_id} changed color to {color} in session {session_id}")
         else:
             await self.send_error(websocket, "User not in session")
@@ -269,7 +720,7 @@ class ScreenPartyServer:
         session.last_activity = datetime.now()
 
         # 세션 내 모든 클라이언트에게 브로드캐스트 (송신자 포함!)
-        await self.broadcast(session_id, data, exclude_user_id=None)
+        await self.relay(session_id, data, exclude_user_id=None)
 
     async def handle_drawing_message(self, websocket: ServerConnection, user_id: str, data: dict):
         """드로잉 메시지 처리 (line_start, line_update, line_end, line_remove)"""
@@ -285,8 +736,28 @@ class ScreenPartyServer:
         if session:
             session.last_activity = datetime.now()
 
+        # 지연 측정 중인 메시지: 중계 시각 기록 (송신자 구간 집계 후 그대로 전달)
+        trace = data.get("trace")
+        if trace:
+            trace["relay"] = time.monotonic()
+            self.latency.record(trace)
+
         # 세션 내 모든 클라이언트에게 브로드캐스트 (송신자 제외)
-        await self.broadcast(session_id, data, exclude_user_id=user_id)
+        await self.relay(session_id, data, exclude_user_id=user_id)
+
+    async def relay(self, session_id: str, message: dict, exclude_user_id: Optional[str] = None):
+        """중계 메시지 브로드캐스트 (seq를 붙여 재연결용 링 버퍼에도 기록)
+
+        Args:
+            session_id: 세션 ID
+            message: 중계할 메시지 (seq 필드가 추가됨)
+            exclude_user_id: 제외할 사용자 ID (optional)
+        """
+        relay_log = self.relay_logs.get(session_id)
+        if relay_log is None:
+            relay_log = self.relay_logs[session_id] = RelayLog()
+        relay_log.append(message, exclude_user_id)
+        await self.broadcast(session_id, message, exclude_user_id=exclude_user_id)
 
     async def broadcast(
         self, session_id: str, message: dict, exclude_user_id: Optional[str] = None
@@ -310,23 +781,24 @@ class ScreenPartyServer:
         if exclude_user_id:
             user_ids.discard(exclude_user_id)
 
-        # 메시지 전송
+        # 메시지 전송 (관전자에게는 fan-out 트리로, 참여자 전송을 기다리지 않음)
         message_json = json.dumps(message)
+        self.publish_to_spectators(session_id, message_json)
         for user_id in user_ids:
             websocket = self.clients.get(user_id)
             if websocket:
                 try:
                     await websocket.send(message_json)
                 except ConnectionClosed:
-                    logger.warning(f"Failed to send to {user_id}: connection closed")
+                    throttled_logger.warning("Failed to send to %s: connection closed", user_id)
 
     async def send_error(self, websocket: ServerConnection, message: str):
         """에러 메시지 전송"""
-        logger.warning(f"Sending error: {message}")
+        throttled_logger.warning("Sending error: %s", message)
         try:
             await websocket.send(json.dumps({"type": "error", "message": message}))
         except ConnectionClosed:
-            logger.warning("Failed to send error: connection closed")
+            throttled_logger.warning("Failed to send error: connection closed")
 
     def find_user_session(self, user_id: str) -> Optional[str]:
         """사용자가 속한 세션 ID 찾기"""
@@ -335,6 +807,33 @@ class ScreenPartyServer:
                 return session_id
         return None
 
+    async def handle_disconnect(self, websocket: ServerConnection, user_id: str):
+        """연결 종료 처리
+
+        정상 종료(close 1000/1001)면 바로 정리하고, 비정상 끊김이면 resume_grace 동안
+        참여자를 유지하며 재연결(resume_session)을 기다립니다.
+        """
+        if self.clients.get(user_id) is not websocket:
+            # 이미 새 연결로 이어간 참여자 - 이전 연결 매핑만 정리
+            self.websocket_to_user.pop(websocket, None)
+            return
+
+        if websocket.close_code in (1000, 1001) or self.resume_grace <= 0:
+            await self.cleanup_client(user_id)
+            return
+
+        logger.info(f"Client {user_id} dropped, keeping seat for {self.resume_grace}s")
+        self.clients.pop(user_id, None)
+        self.websocket_to_user.pop(websocket, None)
+        self._pending_removals[user_id] = asyncio.create_task(self._remove_after_grace(user_id))
+
+    async def _remove_after_grace(self, user_id: str):
+        """재연결 대기 시간이 지나도 돌아오지 않은 참여자 정리"""
+        await asyncio.sleep(self.resume_grace)
+        self._pending_removals.pop(user_id, None)
+        if user_id not in self.clients:
+            await self.cleanup_client(user_id)
+
     async def cleanup_client(self, user_id: str):
         """클라이언트 연결 종료 시 정리"""
         logger.info(f"Cleaning up client: {user_id}")
@@ -363,10 +862,12 @@ class ScreenPartyServer:
             if not updated_session or not updated_session.is_active:
                 # 세션이 만료됨 (마지막 참여자가 나감)
                 logger.info(f"Session {session_id} expired (no participants remaining)")
-                # 남은 클라이언트에게 알림 (이미 다 나갔으므로 실제로는 전송되지 않음)
+                self.relay_logs.pop(session_id, None)
+                # 남은 클라이언트에게 알림 (참여자는 다 나갔으므로 관전자에게만 전달됨)
                 await self.broadcast(
                     session_id, {"type": "session_expired", "message": "All participants left"}
                 )
+                self.close_spectators(session_id)
             else:
                 # 세션이 계속됨 (다른 참여자 존재)
                 # 세션 내 다른 클라이언트들에게 알림
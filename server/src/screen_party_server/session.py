@@ -5,23 +5,55 @@ import random
 import string
 import uuid
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional
 
 from screen_party_common import Participant, Session
 
+from . import persistence
+
+if TYPE_CHECKING:
+    from .persistence import SessionStore
+
 
 class SessionManager:
     """세션 생성, 조회, 만료 관리"""
 
-    def __init__(self, session_timeout_minutes: int = 60):
+    def __init__(self, session_timeout_minutes: int = 60, store: Optional["SessionStore"] = None):
         """
         Args:
             session_timeout_minutes: 세션 만료 시간 (분), 기본 60분
+            store: 세션/참여자 변경을 저널에 남길 저장소 (None이면 메모리에만)
         """
         self.sessions: Dict[str, Session] = {}
         self.session_timeout = timedelta(minutes=session_timeout_minutes)
+        self.store = store
         self._cleanup_task: Optional[asyncio.Task] = None
 
+    def _journal(self, op: str, **fields):
+        """변경을 저장소 큐에 넣기 (store가 없으면 아무것도 안 함, 파일 I/O 없음)"""
+        if self.store is not None:
+            self.store.record(op, **fields)
+
+    def _journal_participant(self, session_id: str, participant: Participant):
+        self._journal(
+            persistence.PARTICIPANT_JOINED,
+            session_id=session_id,
+            user_id=participant.user_id,
+            name=participant.name,
+            color=participant.color,
+            joined_at=participant.joined_at.timestamp(),
+            resume_token=participant.resume_token,
+        )
+
+    def restore(self, sessions: Dict[str, Session]) -> int:
+        """저장소에서 복원한 세션 등록 (서버 시작 시)
+
+        Returns:
+            복원한 세션 수
+        """
+        self.sessions.update(sessions)
+        return len(sessions)
+
     def _generate_session_id(self) -> str:
         """
         6자리 세션 ID 생성 (대문자 + 숫자)
@@ -64,6 +96,12 @@ class SessionManager:
         session.add_participant(participant)
 
         self.sessions[session_id] = session
+        self._journal(
+            persistence.SESSION_CREATED,
+            session_id=session_id,
+            created_at=session.created_at.timestamp(),
+        )
+        self._journal_participant(session_id, participant)
         return session, participant
 
     def get_session(self, session_id: str) -> Optional[Session]:
@@ -102,6 +140,7 @@ class SessionManager:
         )
 
         session.add_participant(participant)
+        self._journal_participant(session_id, participant)
         return participant
 
     def remove_participant(self, session_id: str, user_id: str) -> bool:
@@ -120,6 +159,8 @@ class SessionManager:
             return False
 
         result = session.remove_participant(user_id)
+        if result:
+            self._journal(persistence.PARTICIPANT_LEFT, session_id=session_id, user_id=user_id)
 
         # 참여자가 모두 나간 경우 세션 만료
         if not session.has_participants():
@@ -136,6 +177,29 @@ class SessionManager:
         """
         if session_id in self.sessions:
             self.sessions[session_id].is_active = False
+            self._journal(persistence.SESSION_REMOVED, session_id=session_id)
+
+    def change_color(self, session_id: str, user_id: str, color: str) -> bool:
+        """
+        참여자 펜 색상 변경
+
+        Args:
+            session_id: 세션 ID
+            user_id: 참여자 user_id
+            color: 새 색상 (hex 형식)
+
+        Returns:
+            성공 여부 (세션이나 참여자가 없으면 False)
+        """
+        session = self.get_session(session_id)
+        participant = session.participants.get(user_id) if session else None
+        if not participant:
+            return False
+        participant.color = color
+        self._journal(
+            persistence.COLOR_CHANGED, session_id=session_id, user_id=user_id, color=color
+        )
+        return True
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -149,6 +213,7 @@ class SessionManager:
         """
         if session_id in self.sessions:
             del self.sessions[session_id]
+            self._journal(persistence.SESSION_REMOVED, session_id=session_id)
             return True
         return False
 
@@ -169,6 +234,7 @@ class SessionManager:
 
         for session_id in expired_sessions:
             del self.sessions[session_id]
+            self._journal(persistence.SESSION_REMOVED, session_id=session_id)
 
         return len(expired_sessions)
 
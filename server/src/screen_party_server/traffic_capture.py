@@ -0,0 +1,191 @@
+"""인바운드 트래픽 캡처 (부하 상황 재현용, 재생은 replay.py)
+
+서버가 받은 모든 프레임을 연결 ID, monotonic 시각과 함께 append-only 바이너리 파일로 남깁니다.
+
+파일 형식 (little-endian):
+    MAGIC (8 bytes), 이후 레코드의 연속
+    레코드: 시각 (double, 구간 시작 후 초) + 연결 ID (uint32) + 종류 (uint8)
+            + 데이터 길이 (uint32) + 데이터
+
+종류별 데이터:
+    START     - 캡처 구간 시작 (서버가 시작할 때마다 하나, {"unix_time", "pid"} JSON)
+    OPEN      - 연결 수락 (원격 주소)
+    FRAME     - 수신 텍스트 프레임 원문 (UTF-8)
+    BINARY    - 수신 바이너리 프레임 원문
+    IDENTITY  - 이 연결이 받은 신원 ({"user_id", "session_id"} JSON, 재생 시 ID 대응용)
+    CLOSE     - 연결 종료 (close code, 없으면 빈 데이터)
+
+같은 파일에 이어서 캡처하면 구간(START)이 늘어나고,
+read_capture()는 구간들을 시간순으로 이어 붙입니다.
+서버가 비정상 종료해 마지막 레코드가 잘렸으면 그 앞까지만 읽습니다.
+
+주의: 프레임 원문이므로 참여자 이름과 resume_token이 그대로 들어 있습니다.
+"""
+
+import asyncio
+import json
+import os
+import struct
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator, NamedTuple, Optional, Union
+
+MAGIC = b"SPCAP\x00\x01\n"
+RECORD_HEADER = struct.Struct("<dIBI")
+
+START = 0
+OPEN = 1
+FRAME = 2
+BINARY = 3
+IDENTITY = 4
+CLOSE = 5
+
+
+class CaptureRecord(NamedTuple):
+    """캡처 레코드 하나"""
+
+    at: float  # 첫 구간 시작 후 초 (구간을 이어 붙인 시각)
+    connection: int  # 구간마다 겹치지 않는 연결 ID
+    kind: int
+    data: bytes
+
+
+class TrafficRecorder:
+    """수신 프레임을 캡처 파일 끝에 기록
+
+    기록은 버퍼에 쌓였다가 flush_interval마다(또는 버퍼가 차면) 파일로 나갑니다.
+    이벤트 루프에서 호출되므로 fsync는 하지 않습니다 (서버가 죽으면 마지막 flush_interval만큼 잃음).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        flush_interval: float = 1.0,
+        buffer_size: int = 256 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Args:
+            path: 캡처 파일 경로 (없으면 만들고, 있으면 이어서 기록)
+            flush_interval: 버퍼를 파일로 내보내는 최대 간격 (초)
+            buffer_size: 쓰기 버퍼 크기 (바이트)
+            clock: monotonic 시계 (테스트용 주입)
+        """
+        self.path = Path(path)
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self.clock = clock
+        self.frames = 0
+        self._file: Optional[BinaryIO] = None
+        self._started = 0.0
+        self._last_flush = 0.0
+        self._dirty = False
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._next_connection = 1
+
+    def open(self):
+        """파일을 열고 구간 시작 레코드 기록"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "ab", buffering=self.buffer_size)
+        if self._file.tell() == 0:
+            self._file.write(MAGIC)
+        self._started = self._last_flush = self.clock()
+        meta = {"unix_time": time.time(), "pid": os.getpid()}
+        self._write(START, 0, json.dumps(meta).encode())
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        """트래픽이 멈춰도 버퍼가 오래 남지 않도록 주기적으로 flush (루프 안에서 열었을 때)"""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._flush_timer = loop.call_later(self.flush_interval, self._periodic_flush)
+
+    def _periodic_flush(self):
+        if self._file is None:
+            return
+        if self._dirty:
+            self._flush(self.clock())
+        self._schedule_flush()
+
+    def _flush(self, now: float):
+        self._file.flush()
+        self._last_flush = now
+        self._dirty = False
+
+    def close(self):
+        """남은 기록을 내보내고 파일 닫기"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def connection_opened(self, remote_address) -> int:
+        """새 연결 기록
+
+        Returns:
+            이 연결의 ID (이후 frame/identity/connection_closed에 넘김)
+        """
+        connection = self._next_connection
+        self._next_connection += 1
+        self._write(OPEN, connection, str(remote_address).encode())
+        return connection
+
+    def frame(self, connection: int, message: Union[str, bytes]):
+        """수신 프레임 기록"""
+        self.frames += 1
+        if isinstance(message, str):
+            self._write(FRAME, connection, message.encode())
+        else:
+            self._write(BINARY, connection, message)
+
+    def identity(self, connection: int, user_id: str, session_id: Optional[str]):
+        """연결이 세션 생성/참여/재연결로 받은 신원 기록"""
+        data = json.dumps({"user_id": user_id, "session_id": session_id})
+        self._write(IDENTITY, connection, data.encode())
+
+    def connection_closed(self, connection: int, code: Optional[int]):
+        """연결 종료 기록"""
+        self._write(CLOSE, connection, b"" if code is None else str(code).encode())
+
+    def _write(self, kind: int, connection: int, data: bytes):
+        if self._file is None:
+            return
+        now = self.clock()
+        self._file.write(RECORD_HEADER.pack(now - self._started, connection, kind, len(data)))
+        self._file.write(data)
+        self._dirty = True
+        if now - self._last_flush >= self.flush_interval:
+            self._flush(now)
+
+
+def read_capture(path: Union[str, Path]) -> Iterator[CaptureRecord]:
+    """캡처 파일의 레코드 (START 제외, 시간순)
+
+    Raises:
+        ValueError: 캡처 파일이 아님
+    """
+    with open(path, "rb") as capture:
+        if capture.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a traffic capture file: {path}")
+
+        segment = -1
+        offset = 0.0
+        last = 0.0
+        while True:
+            header = capture.read(RECORD_HEADER.size)
+            if len(header) < RECORD_HEADER.size:
+                return
+            at, connection, kind, length = RECORD_HEADER.unpack(header)
+            data = capture.read(length)
+            if len(data) < length:
+                return
+            if kind == START:
+                segment += 1
+                offset = last
+                continue
+            last = offset + at
+            yield CaptureRecord(last, (segment << 32) | connection, kind, data)
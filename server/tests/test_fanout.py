@@ -0,0 +1,94 @@
+"""관전자 fan-out 트리 테스트"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import websockets
+
+from screen_party_server.fanout import SpectatorFanout
+
+
+class TestTreeShape:
+    """트리 구성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_nodes_never_exceed_width(self):
+        """연결이 늘면 위로 단계가 생기고, 어느 노드도 width개를 넘지 않음"""
+        fanout = SpectatorFanout(width=4)
+        connections = [object() for _ in range(100)]
+        for connection in connections:
+            fanout.add(connection)
+
+        # 잎 25개 → 7개 → 2개 → 루트
+        assert len(fanout) == 100
+        assert fanout.depth == 4
+        assert all(len(leaf.connections) <= 4 for leaf in fanout._levels[0])
+        for level in fanout._levels[1:]:
+            assert all(1 <= len(node.children) <= 4 for node in level)
+        assert fanout._levels[-1] == [fanout.root]
+
+        # 나간 자리는 새 잎을 만들지 않고 채움
+        fanout.remove(connections[5])
+        fanout.add(object())
+        assert len(fanout._levels[0]) == 25
+        fanout.close()
+
+    def test_width_must_allow_branching(self):
+        """width가 2보다 작으면 트리가 자라지 않으므로 거절"""
+        with pytest.raises(ValueError):
+            SpectatorFanout(width=1)
+
+
+class TestDelivery:
+    """프레임 전달 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_frames_reach_every_spectator_in_order(self):
+        """여러 단계를 거쳐도 모든 관전자가 넣은 순서대로 받고, close 후 워커가 끝남"""
+        fanout = SpectatorFanout(width=2)
+
+        async def handler(websocket):
+            fanout.add(websocket)
+            await websocket.wait_closed()
+            fanout.remove(websocket)
+
+        async with websockets.serve(handler, "localhost", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            clients = [await websockets.connect(f"ws://localhost:{port}") for _ in range(9)]
+            while len(fanout) < 9:
+                await asyncio.sleep(0.01)
+            assert fanout.depth == 4  # 잎 5개 → 3개 → 2개 → 루트
+
+            for index in range(20):
+                fanout.publish(f'{{"index": {index}}}')
+            for client in clients:
+                received = [await asyncio.wait_for(client.recv(), 5.0) for _ in range(20)]
+                assert received == [f'{{"index": {index}}}' for index in range(20)]
+
+            tasks = [node.task for level in fanout._levels for node in level]
+            fanout.close()
+            await asyncio.wait_for(asyncio.gather(*tasks), 5.0)
+            for client in clients:
+                await client.close()
+
+    @pytest.mark.asyncio
+    async def test_slow_spectator_close_tracked(self):
+        """느린 관전자를 닫는 태스크는 끝날 때까지 트리가 보관하고, 실패해도 기록만 함"""
+        dropped = []
+        fanout = SpectatorFanout(width=2, max_buffer=10, on_drop=dropped.append)
+        slow = AsyncMock()
+        slow.transport = MagicMock()
+        slow.transport.get_write_buffer_size.return_value = 100
+        slow.close.side_effect = OSError("reset")
+        fanout.add(slow)
+
+        fanout._deliver(fanout._leaf_of[slow], b"frame")
+        assert len(fanout._closing) == 1
+        await asyncio.gather(*fanout._closing, return_exceptions=True)
+        await asyncio.sleep(0)
+
+        assert dropped == [slow]
+        assert fanout._closing == set()
+        assert fanout.dropped == 1
+        fanout.close()
@@ -0,0 +1,83 @@
+"""서버 프로세스 간 교대 테스트"""
+
+import os
+import socket
+import threading
+
+import pytest
+
+from screen_party_server import handover
+from screen_party_server.handover import HandoverChannel
+from screen_party_server.relay_log import RelayLog
+from screen_party_server.server import ScreenPartyServer
+
+pytestmark = pytest.mark.skipif(not handover.supported(), reason="Unix only")
+
+
+class TestHandoverChannel:
+    """Unix 소켓 채널 테스트"""
+
+    def test_message_with_fds(self):
+        """메시지와 함께 넘긴 fd는 받는 쪽에서 같은 파일을 가리킴"""
+        left, right = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        sender, receiver = HandoverChannel(left), HandoverChannel(right)
+        read_end, write_end = os.pipe()
+        try:
+            sender.send({"type": handover.LISTENERS, "pid": 1}, [write_end])
+            message, fds = receiver.receive()
+
+            assert message == {"type": handover.LISTENERS, "pid": 1}
+            assert len(fds) == 1
+            os.write(fds[0], b"ok")
+            assert os.read(read_end, 2) == b"ok"
+            os.close(fds[0])
+        finally:
+            os.close(read_end)
+            os.close(write_end)
+            sender.close()
+            receiver.close()
+
+    def test_large_message_and_closed_peer(self):
+        """소켓 버퍼보다 큰 메시지도 온전히 받고, 상대가 닫으면 ConnectionError"""
+        left, right = socket.socketpair(socket.AF_UNIX, socket.SOCK_STREAM)
+        sender, receiver = HandoverChannel(left), HandoverChannel(right)
+        payload = {"type": handover.REGISTRY, "data": "x" * (4 << 20)}
+
+        thread = threading.Thread(target=sender.send, args=(payload,))
+        thread.start()
+        message, fds = receiver.receive()
+        thread.join()
+        sender.close()
+
+        assert message == payload and fds == []
+        with pytest.raises(ConnectionError):
+            receiver.receive()
+        receiver.close()
+
+
+class TestRegistryTransfer:
+    """세션 레지스트리 내보내기/가져오기 테스트"""
+
+    def test_round_trip_keeps_tokens_and_seq(self):
+        """참여자(토큰 포함)와 중계 로그가 그대로 넘어가서 seq가 이어짐"""
+        old = ScreenPartyServer(host="localhost", port=0)
+        session, host = old.session_manager.create_session("Host")
+        guest = old.session_manager.add_participant(session.session_id, "Guest")
+        old.relay_logs[session.session_id] = relay_log = RelayLog(capacity=4)
+        for index in range(6):
+            relay_log.append({"type": "drawing_update", "index": index}, host.user_id)
+        # 만료된 세션은 넘기지 않음
+        expired, _ = old.session_manager.create_session("Gone")
+        old.session_manager.expire_session(expired.session_id)
+
+        new = ScreenPartyServer(host="localhost", port=0)
+        assert handover.import_registry(new, handover.export_registry(old)) == 1
+
+        moved = new.session_manager.get_session(session.session_id)
+        assert moved.participants[guest.user_id].resume_token == guest.resume_token
+        assert moved.participants[host.user_id].name == "Host"
+        moved_log = new.relay_logs[session.session_id]
+        missed, complete = moved_log.since(3, guest.user_id)
+        assert [m["index"] for m in missed] == [3, 4, 5]
+        assert complete is True
+        assert moved_log.append({"type": "drawing_update"}) == 7
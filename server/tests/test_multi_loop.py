@@ -0,0 +1,92 @@
+"""멀티 루프 서버 모드 테스트"""
+
+import asyncio
+import socket
+import threading
+
+import pytest
+import websockets
+
+from screen_party_server.multi_loop import (
+    LoopQueue,
+    MultiLoopServer,
+    ShardSessionManager,
+    gil_enabled,
+    shard_of,
+)
+
+
+class TestSharding:
+    """세션 → 루프 배정 테스트"""
+
+    def test_shard_of_is_stable(self):
+        """같은 ID는 항상 같은 루프, 범위 안의 번호"""
+        assert shard_of("ABC123", 4) == shard_of("ABC123", 4)
+        assert {shard_of(f"S{index:05d}", 4) for index in range(200)} == {0, 1, 2, 3}
+
+    def test_session_ids_belong_to_creating_shard(self):
+        """루프마다 자기 몫으로 해시되는 세션 ID만 만듦"""
+        for index in range(3):
+            manager = ShardSessionManager(index, 3)
+            for _ in range(20):
+                session, _ = manager.create_session("Host")
+                assert shard_of(session.session_id, 3) == index
+
+    def test_gil_enabled_reports_bool(self):
+        """일반 빌드에서는 True, free-threaded 빌드에서는 실행 상태"""
+        assert isinstance(gil_enabled(), bool)
+
+
+class TestLoopQueue:
+    """루프 간 큐 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_items_from_other_threads_in_order(self):
+        """다른 스레드에서 넣은 항목을 넣은 순서대로 처리하고, 깨우기는 묶음마다 한 번"""
+        handled = []
+        done = asyncio.Event()
+
+        async def handler(item):
+            handled.append(item)
+            if len(handled) == 1000:
+                done.set()
+
+        queue = LoopQueue(asyncio.get_running_loop(), handler)
+
+        def produce():
+            for index in range(1000):
+                queue.put(index)
+
+        thread = threading.Thread(target=produce)
+        thread.start()
+        await asyncio.wait_for(done.wait(), 5.0)
+        thread.join()
+
+        assert handled == list(range(1000))
+        assert 1 <= queue.wakeups < 1000
+
+
+class TestShardStartup:
+    """루프 시작 순서 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_accept_waits_for_every_shard(self):
+        """다른 루프의 큐가 만들어지기 전에는 accept하지 않음"""
+        server = MultiLoopServer("localhost", 8817, loops=2)
+        first, second = server.shards
+        listener = socket.create_server(("localhost", 8817))
+        listener.setblocking(False)
+        serving = asyncio.create_task(first.serve(listener))
+        try:
+            await asyncio.sleep(0.1)
+            assert first.ready.is_set() and first.inbox is not None
+            with pytest.raises(TimeoutError):
+                await websockets.connect("ws://localhost:8817", open_timeout=0.3)
+
+            second.ready.set()
+            connection = await websockets.connect("ws://localhost:8817", open_timeout=5.0)
+            await connection.close()
+        finally:
+            second.ready.set()
+            first.stop()
+            await asyncio.wait_for(serving, 5.0)
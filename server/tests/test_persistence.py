@@ -0,0 +1,184 @@
+"""세션 레지스트리 영속화 테스트"""
+
+import json
+import os
+import pickle
+from unittest.mock import AsyncMock
+
+import pytest
+
+from screen_party_server.persistence import SessionStore
+from screen_party_server.server import ScreenPartyServer
+from screen_party_server.session import SessionManager
+
+
+def open_store(path, **kwargs) -> SessionStore:
+    """복원 후 쓰기 스레드를 시작한 저장소 (테스트에서는 close()로 flush)"""
+    store = SessionStore(path, flush_interval=60.0, **kwargs)
+    store.load()
+    store.start()
+    return store
+
+
+class TestSessionStore:
+    """저널/스냅샷 테스트"""
+
+    def test_journal_round_trip(self, tmp_path):
+        """생성/참여/색상 변경/퇴장이 재시작 후 그대로 복원됨 (resume_token 포함)"""
+        store = open_store(tmp_path)
+        manager = SessionManager(store=store)
+        session, host = manager.create_session("Host")
+        guest = manager.add_participant(session.session_id, "Guest")
+        leaving = manager.add_participant(session.session_id, "Leaving")
+        manager.change_color(session.session_id, guest.user_id, "#00FF00")
+        manager.remove_participant(session.session_id, leaving.user_id)
+        store._flush()
+        store._stopped.set()  # 비정상 종료 흉내: 압축 없이 저널만 남김
+        store._thread.join()
+
+        restored = SessionStore(tmp_path).load()
+
+        assert list(restored) == [session.session_id]
+        participants = restored[session.session_id].participants
+        assert set(participants) == {host.user_id, guest.user_id}
+        assert participants[guest.user_id].color == "#00FF00"
+        assert participants[guest.user_id].name == "Guest"
+        assert participants[host.user_id].resume_token == host.resume_token
+        assert restored[session.session_id].created_at == session.created_at
+
+    def test_record_does_no_io(self, tmp_path):
+        """record()는 큐에만 넣고 파일은 쓰기 스레드가 flush할 때 기록"""
+        store = open_store(tmp_path)
+        manager = SessionManager(store=store)
+        manager.create_session("Host")
+
+        assert len(store._pending) == 2
+        assert store.journal_path.stat().st_size == 0
+
+        store.close()
+        assert not store._pending
+
+    def test_compaction_skips_journaled_entries(self, tmp_path):
+        """압축 후 스냅샷 seq 이하의 저널 줄은 다시 적용하지 않음"""
+        store = open_store(tmp_path, compact_after=1)
+        manager = SessionManager(store=store)
+        session, host = manager.create_session("Host")
+        store._flush()
+        store._compact()
+        assert store.journal_path.stat().st_size == 0
+        assert oct(store.snapshot_path.stat().st_mode & 0o777) == oct(0o600)
+
+        # 스냅샷 교체 직후, 저널 비우기 전에 죽은 경우: 이미 반영한 줄이 남아 있음
+        manager.remove_participant(session.session_id, host.user_id)
+        store._flush()
+        store._stopped.set()
+        store._thread.join()
+        with open(store.journal_path, "rb") as journal:
+            leftover = journal.read()
+        with open(store.snapshot_path, "rb") as snapshot:
+            snapshot_seq = pickle.load(snapshot)["seq"]
+        stale = {"seq": snapshot_seq, "op": "session_removed", "session_id": session.session_id}
+        with open(store.journal_path, "wb") as journal:
+            journal.write(json.dumps(stale).encode() + b"\n" + leftover)
+
+        reopened = SessionStore(tmp_path)
+        restored = reopened.load()
+
+        # seq가 스냅샷 이하인 삭제는 건너뛰고, 그 뒤의 퇴장(+ 세션 만료)만 적용
+        assert session.session_id not in restored
+        assert reopened._seq == snapshot_seq + 2
+
+    def test_torn_last_line_truncated(self, tmp_path):
+        """쓰다 만 마지막 줄은 무시하고 잘라 내서 이어 쓴 줄과 섞이지 않음"""
+        store = open_store(tmp_path)
+        manager = SessionManager(store=store)
+        session, _ = manager.create_session("Host")
+        store._stopped.set()
+        store._thread.join()
+        store._flush()
+        intact = store.journal_path.stat().st_size
+        with open(store.journal_path, "ab") as journal:
+            journal.write(b'{"seq": 3, "op": "participant_jo')
+
+        reopened = SessionStore(tmp_path)
+        restored = reopened.load()
+
+        assert list(restored) == [session.session_id]
+        assert store.journal_path.stat().st_size == intact
+        assert reopened._seq == 2
+
+    def test_failed_write_retried(self, tmp_path, monkeypatch):
+        """쓰기가 실패한 변경은 버리지 않고 다음 flush에서 다시 씀 (저널에 중복/깨진 줄 없음)"""
+        store = open_store(tmp_path)
+        manager = SessionManager(store=store)
+        session, host = manager.create_session("Host")
+        real_fsync = os.fsync
+
+        def failing_fsync(fd):
+            monkeypatch.setattr(os, "fsync", real_fsync)
+            raise OSError("disk full")
+
+        monkeypatch.setattr(os, "fsync", failing_fsync)
+        with pytest.raises(OSError):
+            store._flush()
+        assert store.journal_path.stat().st_size == 0
+
+        store._flush()
+        store._stopped.set()
+        store._thread.join()
+        with open(store.journal_path, "rb") as journal:
+            assert [json.loads(line)["seq"] for line in journal] == [1, 2]
+        restored = SessionStore(tmp_path).load()
+        assert set(restored[session.session_id].participants) == {host.user_id}
+
+    def test_unpickler_rejects_objects(self, tmp_path):
+        """스냅샷에 내장 타입 이외의 객체가 있으면 무시하고 빈 상태로 시작"""
+        with open(tmp_path / "snapshot.pickle", "wb") as snapshot:
+            pickle.dump({"version": 1, "seq": 5, "sessions": {"X": os.getcwd}}, snapshot)
+
+        assert SessionStore(tmp_path).load() == {}
+
+
+class TestServerRestart:
+    """서버 재시작 후 이어가기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_resume_after_restart(self, tmp_path):
+        """재시작한 서버에 원래 토큰으로 이어가고, 클라이언트 seq는 무시한 채 서버 seq에서 계속됨"""
+        server = ScreenPartyServer(host="localhost", port=8765, state_dir=str(tmp_path))
+        server.restore_sessions()
+        session, host = server.session_manager.create_session("Host")
+        guest = server.session_manager.add_participant(session.session_id, "Guest")
+        server.store.close()
+
+        restarted = ScreenPartyServer(host="localhost", port=8765, state_dir=str(tmp_path))
+        assert restarted.restore_sessions() == 1
+        # 복원된 참여자는 재연결 대기 중
+        assert set(restarted._pending_removals) == {host.user_id, guest.user_id}
+
+        host_ws = AsyncMock()
+        user_id = await restarted.handle_message(
+            host_ws,
+            {
+                "type": "resume_session",
+                "session_id": session.session_id,
+                "user_id": host.user_id,
+                "resume_token": host.resume_token,
+                "last_seq": 7,
+            },
+        )
+
+        assert user_id == host.user_id
+        assert host.user_id not in restarted._pending_removals
+        response = json.loads(host_ws.send.call_args[0][0])
+        assert response["type"] == "session_resumed"
+        assert response["replay_complete"] is False
+        assert response["missed"] == []
+        assert response["last_seq"] == 0
+
+        await restarted.handle_drawing_message(host_ws, host.user_id, {"type": "drawing_update"})
+        assert restarted.relay_logs[session.session_id].last_seq == 1
+
+        for task in restarted._pending_removals.values():
+            task.cancel()
+        restarted.store.close()
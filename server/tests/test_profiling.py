@@ -0,0 +1,163 @@
+"""런타임 프로파일링 테스트"""
+
+import asyncio
+import json
+import tracemalloc
+from collections import deque
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from screen_party_server.profiling import (
+    ProfilerBusy,
+    connection_buffers,
+    deep_sizeof,
+    is_loopback,
+    owner_summary,
+)
+from screen_party_server.server import ScreenPartyServer
+
+
+class FakeTransport(asyncio.WriteTransport):
+    """송신 버퍼 크기만 돌려주는 transport"""
+
+    def __init__(self, buffered: int):
+        super().__init__()
+        self.buffered = buffered
+
+    def get_write_buffer_size(self) -> int:
+        return self.buffered
+
+
+def fake_connection(buffered: int, frames: list) -> SimpleNamespace:
+    """websockets ServerConnection의 버퍼 관련 속성만 흉내"""
+    queue = SimpleNamespace(queue=deque(SimpleNamespace(data=data) for data in frames))
+    return SimpleNamespace(
+        remote_address=("10.0.0.5", 40000),
+        transport=FakeTransport(buffered),
+        recv_messages=SimpleNamespace(frames=queue),
+    )
+
+
+@pytest.fixture
+def server(tmp_path):
+    """결과를 임시 디렉토리에 남기는 서버"""
+    return ScreenPartyServer(host="localhost", port=8765, profile_dir=str(tmp_path))
+
+
+@pytest.fixture
+def mock_websocket():
+    """localhost에서 연결한 Mock WebSocket"""
+    ws = AsyncMock()
+    ws.remote_address = ("127.0.0.1", 12345)
+    return ws
+
+
+class TestProfileMessage:
+    """profile 관리 메시지 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_capture_writes_files(self, server, mock_websocket, tmp_path):
+        """CPU 프로파일/힙 스냅샷 파일을 남기고 요약을 같은 type으로 돌려줌"""
+        was_tracing = tracemalloc.is_tracing()
+        await server.handle_message(mock_websocket, {"type": "profile", "duration": 0.1})
+
+        response = json.loads(mock_websocket.send.call_args[0][0])
+        assert response["type"] == "profile"
+        assert set(response["files"]) == {
+            "cpu_profile",
+            "cpu_text",
+            "heap_start",
+            "heap_end",
+            "summary",
+        }
+        for path in response["files"].values():
+            assert Path(path).parent.parent == tmp_path
+            assert Path(path).exists()
+        summary = json.loads(Path(response["files"]["summary"]).read_text(encoding="utf-8"))
+        assert summary["dir"] == response["dir"]
+        assert response["cpu_top"]
+        assert "top" in response["heap"]
+        # 캡처 동안만 켠 tracemalloc은 원래대로
+        assert tracemalloc.is_tracing() == was_tracing
+        assert not server.profiler.busy
+
+    @pytest.mark.asyncio
+    async def test_remote_connection_rejected(self, server, mock_websocket, tmp_path):
+        """localhost가 아닌 연결의 요청은 거절하고 아무것도 남기지 않음"""
+        mock_websocket.remote_address = ("203.0.113.7", 5555)
+
+        await server.handle_message(mock_websocket, {"type": "profile", "duration": 0.1})
+
+        response = json.loads(mock_websocket.send.call_args[0][0])
+        assert response == {"type": "error", "message": "Profiling is only allowed from localhost"}
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_one_capture_at_a_time(self, server):
+        """진행 중인 캡처가 있으면 다음 요청은 ProfilerBusy"""
+        first = asyncio.create_task(server.profiler.capture(0.2, heap=False))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ProfilerBusy):
+            await server.profiler.capture(0.1)
+        result = await first
+
+        assert result["heap"] is None
+        assert "heap_start" not in result["files"]
+
+    def test_is_loopback(self):
+        """IPv4/IPv6 loopback과 IPv4-mapped 주소만 허용"""
+        assert is_loopback(("127.0.0.1", 1))
+        assert is_loopback(("::1", 1, 0, 0))
+        assert is_loopback(("::ffff:127.0.0.1", 1, 0, 0))
+        assert not is_loopback(("192.168.0.2", 1))
+        assert not is_loopback(None)
+
+
+class TestOwnerSummary:
+    """세션/참여자/연결별 메모리 요약 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_sessions_participants_connections(self, server, mock_websocket):
+        """세션은 중계 로그 포함 크기 순, 연결은 버퍼 크기 순으로 정렬"""
+        busy_id = await server.handle_create_session(mock_websocket, {"host_name": "Busy"})
+        busy_session = server.find_user_session(busy_id)
+        for index in range(50):
+            message = {"type": "drawing_update", "points": [[index, 1]] * 20}
+            await server.relay(busy_session, message)
+        idle_id = await server.handle_create_session(AsyncMock(), {"host_name": "Idle"})
+
+        server.clients[busy_id] = fake_connection(4096, [b"x" * 100, b"y" * 50])
+        server.clients[idle_id] = fake_connection(0, [])
+
+        summary = owner_summary(server)
+
+        assert [s["session_id"] for s in summary["sessions"]][0] == busy_session
+        assert summary["sessions"][0]["relay_log_messages"] == 50
+        assert summary["sessions"][0]["bytes"] > summary["sessions"][1]["bytes"]
+        assert summary["totals"]["participants"] == 2
+        assert summary["connections"][0] == {
+            "user_id": busy_id,
+            "remote": "('10.0.0.5', 40000)",
+            "send_buffer_bytes": 4096,
+            "recv_queue_frames": 2,
+            "recv_queue_bytes": 150,
+        }
+        assert summary["totals"]["send_buffer_bytes"] == 4096
+        json.dumps(summary)
+
+    def test_mock_connection_has_no_buffers(self, mock_websocket):
+        """transport/수신 큐가 없는 연결은 0으로 셈"""
+        buffers = connection_buffers(mock_websocket)
+        assert buffers["send_buffer_bytes"] == 0
+        assert buffers["recv_queue_frames"] == 0
+
+    def test_deep_sizeof_bounded(self):
+        """컨테이너를 따라가되 공유 객체는 한 번만, limit에서 멈춤"""
+        shared = "s" * 1000
+        assert deep_sizeof([shared, shared]) < deep_sizeof([shared, "t" * 1000])
+        nested = [[i] for i in range(1000)]
+        assert deep_sizeof(nested, limit=10) < deep_sizeof(nested)
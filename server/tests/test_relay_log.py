@@ -0,0 +1,51 @@
+"""중계 메시지 링 버퍼 테스트"""
+
+from screen_party_server.relay_log import RelayLog
+
+
+class TestRelayLog:
+    """RelayLog 테스트"""
+
+    def test_seq_assigned(self):
+        """중계 메시지마다 1부터 증가하는 seq"""
+        log = RelayLog()
+        first = {"type": "drawing_start"}
+        second = {"type": "drawing_end"}
+
+        assert log.append(first) == 1
+        assert log.append(second) == 2
+        assert first["seq"] == 1
+        assert log.last_seq == 2
+
+    def test_since_excludes_own_messages(self):
+        """송신자 본인에게는 보내지 않았던 메시지는 돌려주지 않음"""
+        log = RelayLog()
+        log.append({"type": "a"}, exclude_user_id="alice")
+        log.append({"type": "b"}, exclude_user_id="bob")
+        log.append({"type": "c"})
+
+        missed, complete = log.since(0, "alice")
+
+        assert [m["type"] for m in missed] == ["b", "c"]
+        assert complete
+
+    def test_overflow_reported_incomplete(self):
+        """이미 버려진 메시지가 필요하면 불완전 표시"""
+        log = RelayLog(capacity=3)
+        for index in range(5):
+            log.append({"type": str(index)})
+
+        missed, complete = log.since(1, "alice")
+        assert [m["seq"] for m in missed] == [3, 4, 5]
+        assert not complete
+
+        missed, complete = log.since(2, "alice")
+        assert complete
+
+    def test_up_to_date(self):
+        """놓친 메시지가 없으면 빈 목록"""
+        log = RelayLog()
+        log.append({"type": "a"})
+
+        assert log.since(1, "alice") == ([], True)
+        assert RelayLog().since(0, "alice") == ([], True)
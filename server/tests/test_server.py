@@ -1,8 +1,10 @@
 """WebSocket 서버 유닛 테스트"""
 
+import asyncio
 import json
+import time
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 from screen_party_server.server import ScreenPartyServer
 
@@ -133,6 +135,16 @@ class TestScreenPartyServer:
         response = json.loads(mock_websocket.send.call_args[0][0])
         assert response["type"] == "pong"
 
+    @pytest.mark.asyncio
+    async def test_ping_pong_clock_sync(self, server, mock_websocket):
+        """client_time이 있으면 그대로 돌려주고 서버 시각을 함께 보냄 (지연 측정용)"""
+        await server.handle_message(mock_websocket, {"type": "ping", "client_time": 12.5})
+
+        response = json.loads(mock_websocket.send.call_args[0][0])
+        assert response["type"] == "pong"
+        assert response["client_time"] == 12.5
+        assert isinstance(response["server_time"], float)
+
     @pytest.mark.asyncio
     async def test_broadcast(self, server):
         """브로드캐스트 테스트"""
@@ -381,3 +393,264 @@ class TestScreenPartyServer:
         assert response["type"] == "line_start"
         assert response["line_id"] == "line1"
         assert response["color"] == "#FF0000"
+
+    @pytest.mark.asyncio
+    async def test_drawing_trace_relay_stamped(self, server):
+        """trace가 있는 드로잉 메시지: 중계 시각을 기록해서 전달하고 구간 지연 집계"""
+        session, first_participant = server.session_manager.create_session("FirstParticipant")
+        first_ws = AsyncMock()
+        server.clients[first_participant.user_id] = first_ws
+        participant2 = server.session_manager.add_participant(
+            session.session_id, "SecondParticipant"
+        )
+        participant2_ws = AsyncMock()
+        server.clients[participant2.user_id] = participant2_ws
+
+        now = time.monotonic()
+        data = {
+            "type": "drawing_update",
+            "line_id": "line1",
+            "trace": {"input": now - 0.03, "send": now - 0.01},
+        }
+        await server.handle_drawing_message(participant2_ws, participant2.user_id, data)
+
+        relayed = json.loads(first_ws.send.call_args[0][0])
+        assert relayed["trace"]["relay"] >= now
+        latency = server.get_stats()["latency"]
+        assert latency["input-send"]["count"] == 1
+        assert latency["send-relay"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_drawing_without_trace_not_recorded(self, server):
+        """trace가 없으면 (측정 꺼짐) 메시지를 바꾸지 않고 집계도 하지 않음"""
+        session, first_participant = server.session_manager.create_session("FirstParticipant")
+        first_ws = AsyncMock()
+        server.clients[first_participant.user_id] = first_ws
+        participant2 = server.session_manager.add_participant(
+            session.session_id, "SecondParticipant"
+        )
+
+        data = {"type": "drawing_update", "line_id": "line1"}
+        await server.handle_drawing_message(AsyncMock(), participant2.user_id, data)
+
+        assert "trace" not in json.loads(first_ws.send.call_args[0][0])
+        assert server.get_stats()["latency"] == {}
+
+    @pytest.mark.asyncio
+    async def test_stats_message(self, server, mock_websocket):
+        """stats 요청에 세션/클라이언트 수와 지연 통계로 응답 (인증 불필요)"""
+        server.session_manager.create_session("Host")
+
+        await server.handle_message(mock_websocket, {"type": "stats"})
+
+        response = json.loads(mock_websocket.send.call_args[0][0])
+        assert response["type"] == "stats"
+        assert response["sessions"] == 1
+        assert response["clients"] == 0
+        assert response["latency"] == {}
+        assert response["loop_lag"]["lag"]["count"] == 0
+        assert response["loop_lag"]["recent_slow"] == []
+
+
+class TestSessionResume:
+    """재연결 후 세션 이어가기 테스트"""
+
+    def _join_two(self, server):
+        session, first = server.session_manager.create_session("First")
+        first_ws = AsyncMock()
+        server.clients[first.user_id] = first_ws
+        server.websocket_to_user[first_ws] = first.user_id
+        second = server.session_manager.add_participant(session.session_id, "Second")
+        second_ws = AsyncMock()
+        server.clients[second.user_id] = second_ws
+        server.websocket_to_user[second_ws] = second.user_id
+        return session, first, first_ws, second, second_ws
+
+    @pytest.mark.asyncio
+    async def test_resume_token_issued(self, server, mock_websocket):
+        """세션 생성/참여 응답에 본인의 resume_token 포함"""
+        user_id = await server.handle_create_session(mock_websocket, {"host_name": "Host"})
+        response = json.loads(mock_websocket.send.call_args[0][0])
+        session = server.session_manager.get_session(response["session_id"])
+
+        assert response["resume_token"] == session.participants[user_id].resume_token
+        assert all("resume_token" not in p for p in response["participants"])
+
+    @pytest.mark.asyncio
+    async def test_dropped_client_kept_during_grace(self, server):
+        """비정상 끊김: 참여자는 유지되고 그동안의 중계 메시지는 기록됨"""
+        session, first, first_ws, second, second_ws = self._join_two(server)
+        second_ws.close_code = 1006
+
+        await server.handle_disconnect(second_ws, second.user_id)
+
+        assert second.user_id in session.participants
+        assert second.user_id not in server.clients
+        first_ws.send.assert_not_called()  # participant_left 알림 없음
+        server._pending_removals[second.user_id].cancel()
+
+    @pytest.mark.asyncio
+    async def test_clean_close_removes_immediately(self, server):
+        """정상 종료는 기존처럼 바로 정리"""
+        session, first, first_ws, second, second_ws = self._join_two(server)
+        second_ws.close_code = 1000
+
+        await server.handle_disconnect(second_ws, second.user_id)
+
+        assert second.user_id not in session.participants
+        notification = json.loads(first_ws.send.call_args[0][0])
+        assert notification["type"] == "participant_left"
+
+    @pytest.mark.asyncio
+    async def test_grace_expiry_removes_participant(self, server):
+        """재연결 대기 시간이 지나면 정리"""
+        server.resume_grace = 0.01
+        session, first, first_ws, second, second_ws = self._join_two(server)
+        second_ws.close_code = 1006
+
+        await server.handle_disconnect(second_ws, second.user_id)
+        await server._pending_removals[second.user_id]
+
+        assert second.user_id not in session.participants
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_missed_messages(self, server):
+        """올바른 토큰으로 이어가면 last_seq 이후 받았어야 할 메시지를 한 번에 돌려받음"""
+        session, first, first_ws, second, second_ws = self._join_two(server)
+        await server.handle_drawing_message(first_ws, first.user_id, {"type": "drawing_start"})
+        second_ws.close_code = 1006
+        await server.handle_disconnect(second_ws, second.user_id)
+
+        # 끊긴 동안: 첫 참여자의 드로잉 (받았어야 함) + 본인이 보낸 것으로 기록된 메시지 (제외)
+        await server.handle_drawing_message(first_ws, first.user_id, {"type": "drawing_update"})
+        await server.relay(session.session_id, {"type": "drawing_end"}, second.user_id)
+
+        new_ws = AsyncMock()
+        user_id = await server.handle_message(
+            new_ws,
+            {
+                "type": "resume_session",
+                "session_id": session.session_id,
+                "user_id": second.user_id,
+                "resume_token": second.resume_token,
+                "last_seq": 1,
+            },
+        )
+
+        assert user_id == second.user_id
+        assert server.clients[second.user_id] is new_ws
+        assert second.user_id not in server._pending_removals
+        response = json.loads(new_ws.send.call_args[0][0])
+        assert response["type"] == "session_resumed"
+        assert [m["type"] for m in response["missed"]] == ["drawing_update"]
+        assert response["missed"][0]["seq"] == 2
+        assert response["replay_complete"] is True
+        assert response["last_seq"] == 3
+
+    @pytest.mark.asyncio
+    async def test_resume_ahead_of_server_does_not_advance_seq(self, server):
+        """서버가 붙인 적 없는 last_seq로 이어가도 중계 seq는 그대로"""
+        session, first, first_ws, second, second_ws = self._join_two(server)
+        await server.handle_drawing_message(first_ws, first.user_id, {"type": "drawing_start"})
+        second_ws.close_code = 1006
+        await server.handle_disconnect(second_ws, second.user_id)
+
+        new_ws = AsyncMock()
+        await server.handle_message(
+            new_ws,
+            {
+                "type": "resume_session",
+                "session_id": session.session_id,
+                "user_id": second.user_id,
+                "resume_token": second.resume_token,
+                "last_seq": 1000,
+            },
+        )
+
+        response = json.loads(new_ws.send.call_args[0][0])
+        assert response["missed"] == []
+        assert response["replay_complete"] is False
+        assert response["last_seq"] == 1
+        await server.handle_drawing_message(first_ws, first.user_id, {"type": "drawing_update"})
+        assert server.relay_logs[session.session_id].last_seq == 2
+
+    @pytest.mark.asyncio
+    async def test_resume_with_wrong_token_rejected(self, server):
+        """토큰이 틀리면 거절"""
+        session, first, first_ws, second, second_ws = self._join_two(server)
+        new_ws = AsyncMock()
+
+        user_id = await server.handle_message(
+            new_ws,
+            {
+                "type": "resume_session",
+                "session_id": session.session_id,
+                "user_id": second.user_id,
+                "resume_token": "wrong",
+            },
+        )
+
+        assert user_id is None
+        response = json.loads(new_ws.send.call_args[0][0])
+        assert response["type"] == "error"
+        assert server.clients[second.user_id] is second_ws
+
+    @pytest.mark.asyncio
+    async def test_stale_connection_close_ignored(self, server):
+        """이미 새 연결로 이어간 뒤 이전 연결이 닫혀도 참여자를 정리하지 않음"""
+        session, first, first_ws, second, second_ws = self._join_two(server)
+        new_ws = AsyncMock()
+        await server.handle_resume_session(
+            new_ws,
+            {
+                "session_id": session.session_id,
+                "user_id": second.user_id,
+                "resume_token": second.resume_token,
+            },
+        )
+
+        second_ws.close_code = 1000
+        await server.handle_disconnect(second_ws, second.user_id)
+
+        assert second.user_id in session.participants
+        assert server.clients[second.user_id] is new_ws
+
+
+class TestSpectators:
+    """관전자 등록/정리 테스트"""
+
+    def _watch(self, session_id):
+        websocket = AsyncMock()
+        websocket.remote_address = ("127.0.0.1", 12345)
+        return websocket, {"type": "watch_session", "session_id": session_id}
+
+    @pytest.mark.asyncio
+    async def test_rewatch_counted_once(self, server):
+        """같은 연결이 다시 관전 요청을 보내도 관전자 수는 한 명"""
+        session, _ = server.session_manager.create_session("Host")
+        websocket, request = self._watch(session.session_id)
+
+        await server.handle_watch_session(websocket, request)
+        await server.handle_watch_session(websocket, request)
+
+        response = json.loads(websocket.send.call_args[0][0])
+        assert response["spectators"] == 1
+        assert len(server.spectators[session.session_id]) == 1
+        server.close_spectators(session.session_id)
+
+    @pytest.mark.asyncio
+    async def test_slow_spectator_forgotten(self, server):
+        """쓰기 버퍼가 넘쳐 트리에서 끊긴 관전자는 서버의 관전 기록에서도 빠짐"""
+        session, _ = server.session_manager.create_session("Host")
+        websocket, request = self._watch(session.session_id)
+        websocket.transport = MagicMock()
+        websocket.transport.get_write_buffer_size.return_value = 1 << 30
+        await server.handle_watch_session(websocket, request)
+
+        server.publish_to_spectators(session.session_id, '{"type": "drawing_update"}')
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        assert websocket not in server.watching
+        assert session.session_id not in server.spectators
+        websocket.close.assert_awaited_once()
@@ -0,0 +1,136 @@
+"""트래픽 캡처 / 재생 테스트"""
+
+import json
+
+import pytest
+
+from screen_party_server.replay import CaptureReplayer
+from screen_party_server.server import ScreenPartyServer
+from screen_party_server.traffic_capture import (
+    BINARY,
+    CLOSE,
+    FRAME,
+    IDENTITY,
+    OPEN,
+    TrafficRecorder,
+    read_capture,
+)
+
+
+class FakeClock:
+    """수동으로 움직이는 시계"""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def record_session(path, clock: FakeClock):
+    """캡처된 세션: 호스트 생성 → 게스트 참여 → 호스트 드로잉 3개 → 둘 다 종료"""
+    recorder = TrafficRecorder(path, clock=clock)
+    recorder.open()
+    host = recorder.connection_opened(("127.0.0.1", 1000))
+    recorder.frame(host, json.dumps({"type": "create_session", "host_name": "Host"}))
+    recorder.identity(host, "host-orig", "ORIG01")
+
+    clock.now += 0.5
+    guest = recorder.connection_opened(("127.0.0.1", 1001))
+    recorder.frame(
+        guest, json.dumps({"type": "join_session", "session_id": "ORIG01", "guest_name": "G"})
+    )
+    recorder.identity(guest, "guest-orig", "ORIG01")
+
+    for index in range(3):
+        clock.now += 0.1
+        recorder.frame(
+            host,
+            json.dumps({"type": "drawing_update", "line_id": f"l{index}", "user_id": "host-orig"}),
+        )
+    clock.now += 0.1
+    recorder.connection_closed(guest, 1000)
+    recorder.connection_closed(host, 1000)
+    recorder.close()
+
+
+class TestTrafficRecorder:
+    """캡처 파일 기록/읽기 테스트"""
+
+    def test_round_trip(self, tmp_path):
+        """레코드는 시각(구간 시작 기준), 연결 ID, 종류, 원문 그대로"""
+        path = tmp_path / "traffic.spcap"
+        clock = FakeClock()
+        record_session(path, clock)
+
+        records = list(read_capture(path))
+
+        assert [r.kind for r in records[:3]] == [OPEN, FRAME, IDENTITY]
+        assert records[0].at == 0.0
+        assert records[-1].kind == CLOSE and records[-1].data == b"1000"
+        assert records[-1].at == pytest.approx(0.9)
+        assert json.loads(records[1].data)["host_name"] == "Host"
+        assert len({r.connection for r in records}) == 2
+
+    def test_segments_appended_and_truncated_tail(self, tmp_path):
+        """이어서 캡처한 구간은 시간/연결 ID가 겹치지 않고, 잘린 마지막 레코드는 무시"""
+        path = tmp_path / "traffic.spcap"
+        clock = FakeClock()
+        record_session(path, clock)
+
+        recorder = TrafficRecorder(path, clock=clock)
+        recorder.open()
+        connection = recorder.connection_opened(("127.0.0.1", 2000))
+        clock.now += 1.0
+        recorder.frame(connection, b"\x00\x01")
+        recorder.close()
+        with open(path, "ab") as capture:
+            capture.write(b"\x01\x02\x03")
+
+        records = list(read_capture(path))
+
+        first_segment = {r.connection for r in records[:-2]}
+        assert records[-2].connection not in first_segment
+        assert records[-1].kind == BINARY and records[-1].data == b"\x00\x01"
+        assert records[-1].at == pytest.approx(0.9 + 1.0)
+
+    def test_rejects_other_files(self, tmp_path):
+        """캡처 파일이 아니면 ValueError"""
+        path = tmp_path / "other.bin"
+        path.write_bytes(b"not a capture")
+        with pytest.raises(ValueError):
+            list(read_capture(path))
+
+
+class TestCaptureReplayer:
+    """재생 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_direct_replay_remaps_ids(self, tmp_path):
+        """새 서버가 준 세션 ID/user_id로 바꿔 보내서 게스트가 호스트의 드로잉을 모두 받음"""
+        path = tmp_path / "traffic.spcap"
+        record_session(path, FakeClock())
+        server = ScreenPartyServer(host="localhost", port=0)
+        replayer = CaptureReplayer(read_capture(path), speed=0)
+
+        received = []
+        on_response = replayer.on_response
+        replayer.on_response = lambda connection, message: (
+            received.append(json.loads(message)),
+            on_response(connection, message),
+        )
+        result = await replayer.run_direct(server)
+
+        assert result["connections"] == 2
+        assert result["frames_sent"] == 5
+        assert result["errors"] == 0 and result["unmapped_sessions"] == 0
+        assert result["handle_message_us"]["count"] == 5
+        new_session = replayer.session_map["ORIG01"]
+        assert new_session != "ORIG01"
+        assert [m["type"] for m in received].count("session_joined") == 1
+
+        drawings = [m for m in received if m["type"] == "drawing_update"]
+        assert [m["line_id"] for m in drawings] == ["l0", "l1", "l2"]
+        assert {m["user_id"] for m in drawings} == {replayer.user_map["host-orig"]}
+        # 둘 다 정상 종료 → 세션 정리
+        assert not server.clients